@@ -9,30 +9,55 @@ Components:
 - Analysis Pipeline: End-to-end integration (NEW in v0.3.0)
 - Report Generator: Multi-format conformity reports (NEW in v0.3.0)
 - Vector Store: FAISS (local) or Pinecone (cloud)
-- Embeddings Manager: sentence-transformers (local) or OpenAI (cloud)
+- Embeddings Manager: sentence-transformers or int8 ONNX Runtime (local) or OpenAI (cloud)
 - Ingestion Pipeline: Document ingestion and indexing
 """
 
 __version__ = "0.3.0"
 __author__ = "BidAnalyzee Team"
 
-from .config import RAGConfig
-from .rag_engine import RAGEngine
-from .query_processor import (
-    QueryProcessor,
-    ConformityVerdict,
-    ConformityAnalysis,
-    Evidence
-)
-from .vector_store import (
-    VectorStoreInterface,
-    FAISSVectorStore,
-    create_vector_store
-)
-from .embeddings_manager import EmbeddingsManager
-from .ingestion_pipeline import IngestionPipeline
-from .pipeline import AnalysisPipeline
-from .report import ConformityReport, ReportExporter
+from importlib import import_module
+
+# Public names -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so `import agents.technical_analyst` or
+# importing one light submodule (e.g. search_daemon) does not pull in
+# NumPy, the RAG engine, the pipeline and the report modules.
+_LAZY_ATTRIBUTES = {
+    'RAGConfig': '.config',
+    'RAGEngine': '.rag_engine',
+    'QueryProcessor': '.query_processor',
+    'ConformityVerdict': '.query_processor',
+    'ConformityAnalysis': '.query_processor',
+    'Evidence': '.query_processor',
+    'VectorStoreInterface': '.vector_store',
+    'FAISSVectorStore': '.vector_store',
+    'create_vector_store': '.vector_store',
+    'EmbeddingsManager': '.embeddings_manager',
+    'IngestionPipeline': '.ingestion_pipeline',
+    'AnalysisPipeline': '.pipeline',
+    'BatchPipeline': '.batch_pipeline',
+    'AnalysisJournal': '.analysis_journal',
+    'VerdictCache': '.verdict_cache',
+    'SearchClient': '.search_daemon',
+    'SearchDaemon': '.search_daemon',
+    'ConformityReport': '.report',
+    'ReportExporter': '.report',
+    'RunningSummary': '.report',
+    'StreamingReportWriter': '.report',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 __all__ = [
@@ -50,8 +75,17 @@ __all__ = [
 
     # Analysis Pipeline (NEW in v0.3.0)
     'AnalysisPipeline',
+    'BatchPipeline',
     'ConformityReport',
     'ReportExporter',
+    'RunningSummary',
+    'StreamingReportWriter',
+    'AnalysisJournal',
+    'VerdictCache',
+
+    # Search Daemon
+    'SearchDaemon',
+    'SearchClient',
 
     # Vector Store
     'VectorStoreInterface',
@@ -0,0 +1,180 @@
+"""
+Analysis Journal for Technical Analyst
+
+Append-only JSONL journal of an AnalysisPipeline run: one line per analyzed
+requirement, written (and flushed) as soon as the analysis completes. When a
+long run crashes or is interrupted, restarting it with resume=True skips the
+journaled requirements and rebuilds the report from the journal.
+
+Entries are keyed by requirement ID, a hash of the requirement (plus the
+analysis settings) and the knowledge base index version, so an edited
+requirement, changed thresholds or a re-ingested index are analyzed again.
+A line truncated by a crash mid-write is ignored.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
+
+from .query_processor import ConformityAnalysis
+
+
+def requirement_hash(requirement: Dict[str, Any], settings: Optional[Dict[str, Any]] = None) -> str:
+    """SHA-256 of a requirement (and the settings it is analyzed with)"""
+    payload = json.dumps(
+        {"requirement": requirement, "settings": settings or {}},
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnalysisJournal:
+    """
+    Per-run journal: (requirement id, requirement hash) -> analysis
+
+    Example:
+        >>> journal = AnalysisJournal("output/analysis/edital.journal.jsonl",
+        ...                           index_version=rag.index_version(), settings={"top_k": 5})
+        >>> journal.open(resume=True)           # loads matching entries
+        >>> cached = journal.get(requirement)    # ConformityAnalysis or None
+        >>> journal.append(requirement, analysis)
+        >>> journal.close()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        index_version: str,
+        settings: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize journal
+
+        Args:
+            path: Path of the JSONL journal
+            index_version: Knowledge base index version of this run
+            settings: Analysis settings folded into the requirement hash
+        """
+        self.path = Path(path)
+        self.index_version = index_version
+        self.settings = settings or {}
+
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._file = None
+
+        self.loaded = 0
+        self.stale = 0
+        self.corrupt = 0
+        self.appended = 0
+
+    def _key(self, requirement: Dict[str, Any]) -> Tuple[str, str]:
+        return str(requirement.get("id", "")), requirement_hash(requirement, self.settings)
+
+    def load(self) -> int:
+        """
+        Load the entries recorded with the current index version
+
+        Returns:
+            Number of usable entries
+        """
+        self._entries = {}
+        self.loaded = self.stale = self.corrupt = 0
+
+        if not self.path.exists():
+            return 0
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    key = (entry["requirement_id"], entry["requirement_hash"])
+                    version = entry["index_version"]
+                    analysis = entry["analysis"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    self.corrupt += 1  # e.g. last line cut short by a crash
+                    continue
+
+                if version != self.index_version:
+                    self.stale += 1
+                    continue
+
+                self._entries[key] = analysis
+
+        self.loaded = len(self._entries)
+        return self.loaded
+
+    def open(self, resume: bool = False) -> int:
+        """
+        Open the journal for appending
+
+        Args:
+            resume: Keep and load existing entries (otherwise start a new journal)
+
+        Returns:
+            Number of usable entries loaded
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if resume:
+            self.load()
+            if self.stale or self.corrupt:
+                # Rewrite without unusable lines (e.g. a truncated tail) so appends start on a fresh line
+                self._rewrite()
+        else:
+            self._entries = {}
+            self.loaded = self.stale = self.corrupt = 0
+            self.path.write_text("", encoding="utf-8")
+
+        self._file = open(self.path, "a", encoding="utf-8")
+        return self.loaded
+
+    def _rewrite(self) -> None:
+        """Atomically rewrite the journal with the loaded entries only"""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for (requirement_id, digest), analysis in self._entries.items():
+                f.write(self._line(requirement_id, digest, analysis))
+        tmp_path.replace(self.path)
+
+    def _line(self, requirement_id: str, digest: str, analysis: Dict[str, Any]) -> str:
+        return json.dumps({
+            "requirement_id": requirement_id,
+            "requirement_hash": digest,
+            "index_version": self.index_version,
+            "analysis": analysis
+        }, ensure_ascii=False) + "\n"
+
+    def __contains__(self, requirement: Dict[str, Any]) -> bool:
+        return self._key(requirement) in self._entries
+
+    def get(self, requirement: Dict[str, Any]) -> Optional[ConformityAnalysis]:
+        """Journaled analysis of a requirement, or None"""
+        analysis = self._entries.get(self._key(requirement))
+        return ConformityAnalysis.from_dict(analysis) if analysis is not None else None
+
+    def append(self, requirement: Dict[str, Any], analysis: ConformityAnalysis) -> None:
+        """Record a completed analysis (flushed immediately)"""
+        requirement_id, digest = self._key(requirement)
+
+        # Not kept in memory: only loaded entries are ever looked up
+        self._file.write(self._line(requirement_id, digest, analysis.to_dict()))
+        self._file.flush()
+        self.appended += 1
+
+    def close(self) -> None:
+        """Close the journal file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get journal statistics"""
+        return {
+            "path": str(self.path),
+            "index_version": self.index_version,
+            "resumed": self.loaded,
+            "appended": self.appended,
+            "stale": self.stale,
+            "corrupt": self.corrupt
+        }
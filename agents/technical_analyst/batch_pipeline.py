@@ -0,0 +1,309 @@
+"""
+Batch Pipeline - Multi-Edital Analysis
+
+Analyzes a directory (or glob) of Document Structurer requirement CSVs, such
+as the weekly batch of new public tenders, against a single warm RAG engine:
+the embedding model and the FAISS index are loaded once instead of once per
+edital.
+
+- Editais are analyzed concurrently (one AnalysisPipeline per edital, all
+  sharing the engine and the verdict cache)
+- Report exports run in a background thread pool while the next editais
+  are analyzed
+- A consolidated throughput report (editais/hour, requirements/s) is written
+  to <output_dir>/batch_report.json
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import glob
+import json
+import threading
+import time
+
+from agents.technical_analyst import RAGEngine
+from agents.technical_analyst.pipeline import AnalysisPipeline
+from agents.technical_analyst.report import ConformityReport, ReportExporter
+from agents.technical_analyst.verdict_cache import VerdictCache
+
+
+def find_requirement_csvs(source: str) -> List[Path]:
+    """
+    Requirement CSVs of a batch
+
+    Args:
+        source: Directory (its *.csv files) or glob pattern (e.g. "data/deliveries/*/outputs/*.csv")
+
+    Returns:
+        Sorted CSV paths
+    """
+    path = Path(source)
+    if path.is_dir():
+        return sorted(path.glob("*.csv"))
+    if path.is_file():
+        return [path]
+    return sorted(Path(match) for match in glob.glob(source, recursive=True) if match.endswith(".csv"))
+
+
+def output_basenames(csv_paths: List[Path]) -> List[str]:
+    """
+    Unique output basenames: the CSV stem, prefixed with its folder name when
+    stems repeat (e.g. several deliveries/*/outputs/requirements.csv)
+    """
+    stems = [path.stem for path in csv_paths]
+    names = []
+    for path, stem in zip(csv_paths, stems):
+        if stems.count(stem) > 1:
+            parent = path.parent.name
+            if parent == "outputs" and path.parent.parent.name:
+                parent = path.parent.parent.name
+            stem = f"{parent}_{stem}"
+        names.append(stem)
+
+    seen: Dict[str, int] = {}
+    unique = []
+    for name in names:
+        seen[name] = seen.get(name, 0) + 1
+        unique.append(name if seen[name] == 1 else f"{name}_{seen[name]}")
+    return unique
+
+
+@dataclass
+class EditalRun:
+    """
+    Outcome of one edital of a batch
+
+    Attributes:
+        csv_path: Requirements CSV
+        basename: Output basename
+        requirements: Requirements loaded
+        analyzed: Requirements with an analysis
+        analysis_time: Seconds spent loading and analyzing
+        export_time: Seconds spent exporting (in the background)
+        compliance_rate: Overall compliance rate (%)
+        outputs: Exported files
+        error: Error message if the edital (or an export) failed
+    """
+    csv_path: str
+    basename: str
+    requirements: int = 0
+    analyzed: int = 0
+    analysis_time: float = 0.0
+    export_time: float = 0.0
+    compliance_rate: float = 0.0
+    outputs: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class BatchPipeline:
+    """
+    Analyze many editais with one shared RAG engine
+
+    Example:
+        >>> batch = BatchPipeline(output_dir="output/analysis/weekly", workers=2)
+        >>> report = batch.run("data/deliveries/*/outputs/requirements.csv")
+        >>> print(f"{report['throughput']['editais_per_hour']:.0f} editais/hour")
+    """
+
+    def __init__(
+        self,
+        rag_engine: Optional[RAGEngine] = None,
+        output_dir: str = "output/analysis/batch",
+        workers: int = 2,
+        export_workers: int = 1,
+        verdict_cache: Optional[VerdictCache] = None,
+        cluster_threshold: Optional[float] = None,
+        warm_up: bool = False
+    ):
+        """
+        Initialize batch pipeline (loads the RAG engine once)
+
+        Args:
+            rag_engine: Shared RAG engine (will create default if not provided)
+            output_dir: Directory for every edital's outputs and the batch report
+            workers: Editais analyzed concurrently
+            export_workers: Background threads exporting finished reports
+            verdict_cache: Shared verdict cache (default: from RAG_VERDICT_CACHE_PATH)
+            cluster_threshold: Requirement clustering threshold (see AnalysisPipeline)
+            warm_up: Load the default RAG engine in a background thread while the
+                first CSVs are being read (see RAGEngine.start_warm_up)
+        """
+        start = time.time()
+        self.engine_load_time = 0.0
+        if rag_engine is None and warm_up:
+            self._rag = RAGEngine.start_warm_up()
+            self._rag.add_done_callback(
+                lambda _: setattr(self, 'engine_load_time', time.time() - start)
+            )
+        else:
+            self._rag = rag_engine or RAGEngine.from_config()
+            self.engine_load_time = time.time() - start
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = max(1, workers)
+        self.export_workers = max(1, export_workers)
+        self.verdict_cache = verdict_cache if verdict_cache is not None else VerdictCache.from_config()
+        self.cluster_threshold = cluster_threshold
+
+        self._print_lock = threading.Lock()
+
+    @property
+    def rag(self) -> RAGEngine:
+        """Shared RAG engine (waits for a background warm-up to finish)"""
+        if isinstance(self._rag, Future):
+            self._rag = self._rag.result()
+        return self._rag
+
+    def run(
+        self,
+        source: str,
+        export_formats: List[str] = ['json', 'csv', 'markdown'],
+        resume: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Analyze every requirements CSV of a batch
+
+        Args:
+            source: Directory or glob of requirement CSVs
+            export_formats: Export formats of each edital's report
+            resume: Resume each edital from its journal (see AnalysisPipeline)
+
+        Returns:
+            Batch report (also written to <output_dir>/batch_report.json)
+        """
+        csv_paths = find_requirement_csvs(source)
+        runs = [EditalRun(csv_path=str(path), basename=name)
+                for path, name in zip(csv_paths, output_basenames(csv_paths))]
+
+        print(f"\n{'='*70}")
+        print(f"📦 ANÁLISE EM LOTE - {len(runs)} editais")
+        print(f"{'='*70}")
+        print(f"📂 Origem: {source}")
+        print(f"⚙️  Workers: {self.workers} análise / {self.export_workers} exportação")
+        if isinstance(self._rag, Future) and not self._rag.done():
+            print(f"🔥 RAG engine aquecendo em segundo plano (compartilhado)")
+        else:
+            print(f"🔥 RAG engine carregado em {self.engine_load_time:.1f}s (compartilhado)")
+        print(f"{'='*70}\n")
+
+        start = time.time()
+        exports: List[Future] = []
+
+        with ThreadPoolExecutor(max_workers=self.export_workers) as export_pool:
+            with ThreadPoolExecutor(max_workers=self.workers) as analysis_pool:
+                futures = {
+                    analysis_pool.submit(self._analyze_edital, run, resume): run
+                    for run in runs
+                }
+                # Export each edital as soon as it is analyzed
+                for future in as_completed(futures):
+                    run, report = futures[future], future.result()
+                    if report is not None and export_formats:
+                        exports.append(export_pool.submit(self._export_edital, run, report, export_formats))
+
+            for future in exports:
+                future.result()
+
+        wall_time = time.time() - start
+        report = self._batch_report(source, runs, wall_time)
+        self._print_report(report)
+
+        return report
+
+    def _analyze_edital(self, run: EditalRun, resume: bool) -> Optional[ConformityReport]:
+        """Analyze one edital (worker thread); exports are left to the export pool"""
+        pipeline = AnalysisPipeline(
+            rag_engine=self._rag,
+            output_dir=str(self.output_dir),
+            verdict_cache=self.verdict_cache,
+            cluster_threshold=self.cluster_threshold,
+            show_progress=False
+        )
+
+        start = time.time()
+        try:
+            report = pipeline.analyze_from_csv(
+                run.csv_path, output_basename=run.basename, export_formats=[], resume=resume
+            )
+        except Exception as e:
+            run.error = f"{type(e).__name__}: {e}"
+            self._log(f"❌ {run.basename}: {run.error}")
+            return None
+        finally:
+            run.analysis_time = time.time() - start
+
+        summary = report.get_summary()
+        run.requirements = len(report.requirements)
+        run.analyzed = summary['total_requirements']
+        run.compliance_rate = summary['overall_compliance_rate']
+        self._log(f"✅ {run.basename}: {run.analyzed}/{run.requirements} requisitos "
+                  f"em {run.analysis_time:.1f}s ({run.compliance_rate:.1f}% conformidade)")
+        return report
+
+    def _export_edital(self, run: EditalRun, report: ConformityReport, formats: List[str]) -> None:
+        """Export one edital's report (export thread)"""
+        start = time.time()
+        exporter = ReportExporter(report, self.output_dir)
+        for fmt in formats:
+            try:
+                run.outputs.append(str(exporter.export(run.basename, fmt)))
+            except Exception as e:
+                run.error = f"export {fmt}: {type(e).__name__}: {e}"
+                self._log(f"❌ {run.basename}: {run.error}")
+        run.export_time = time.time() - start
+
+    def _batch_report(self, source: str, runs: List[EditalRun], wall_time: float) -> Dict[str, Any]:
+        """Consolidated throughput report (written to batch_report.json)"""
+        completed = [run for run in runs if run.error is None]
+        requirements = sum(run.analyzed for run in runs)
+
+        report = {
+            'source': source,
+            'timestamp': datetime.now().isoformat(),
+            'workers': self.workers,
+            'export_workers': self.export_workers,
+            'engine_load_time': round(self.engine_load_time, 3),
+            'wall_time': round(wall_time, 3),
+            'throughput': {
+                'editais': len(runs),
+                'editais_completed': len(completed),
+                'editais_failed': len(runs) - len(completed),
+                'requirements': requirements,
+                'editais_per_hour': round(len(completed) * 3600 / wall_time, 2) if wall_time else 0.0,
+                'requirements_per_second': round(requirements / wall_time, 2) if wall_time else 0.0
+            },
+            'editais': [asdict(run) for run in runs]
+        }
+        if self.verdict_cache is not None:
+            report['verdict_cache'] = self.verdict_cache.get_stats()
+
+        filepath = self.output_dir / "batch_report.json"
+        filepath.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+        report['report_path'] = str(filepath)
+        return report
+
+    def _print_report(self, report: Dict[str, Any]) -> None:
+        """Print the batch throughput summary"""
+        throughput = report['throughput']
+        print(f"\n{'='*70}")
+        print(f"📊 RESUMO DO LOTE")
+        print(f"{'='*70}")
+        print(f"📋 Editais: {throughput['editais_completed']}/{throughput['editais']} concluídos")
+        if throughput['editais_failed']:
+            print(f"❌ Com erro: {throughput['editais_failed']}")
+        print(f"🔍 Requisitos analisados: {throughput['requirements']}")
+        print(f"⏱️  Tempo total: {report['wall_time']:.1f}s "
+              f"(+ {report['engine_load_time']:.1f}s carregando o RAG engine)")
+        print(f"🚀 Vazão: {throughput['editais_per_hour']:.1f} editais/hora, "
+              f"{throughput['requirements_per_second']:.1f} requisitos/s")
+        print(f"💾 Relatório do lote: {report['report_path']}")
+        print(f"{'='*70}\n")
+
+    def _log(self, message: str) -> None:
+        """Print from worker threads without interleaving lines"""
+        with self._print_lock:
+            print(message)
@@ -0,0 +1,539 @@
+"""
+Chunk Store for RAG system
+
+Columnar, memory-mapped storage for chunk texts and metadata, used by
+FAISSVectorStore instead of pickling every chunk into one file.
+
+On-disk layout (one directory per saved generation):
+- texts.bin: UTF-8 text of every chunk, concatenated
+- text_offsets.npy: int64 offsets into texts.bin (n + 1 entries)
+- ids.npy: int64 stable chunk ID of every row
+- deleted.npy: int64 positions of deleted rows (tombstones until compaction)
+- columns.json: metadata schema (column name, kind, file prefix)
+- col_<i>.npy: one array per metadata column
+    - "int" columns: int64 values (INT_ABSENT when the key is missing)
+    - "dict" columns: int32 codes into a value dictionary (-1 when missing),
+      with the JSON-encoded values in col_<i>.values.bin / col_<i>.values_offsets.npy
+
+Arrays are opened with mmap, so loading is O(1) in the corpus size and only
+the rows that are actually read (e.g. search hits) become Python objects.
+Rows added after loading are kept in memory until the next write().
+"""
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+INT_ABSENT = np.iinfo(np.int64).min
+_MISSING = object()
+
+
+def _is_int(value: Any) -> bool:
+    """True for plain ints that fit in an int64 column"""
+    return (
+        isinstance(value, int)
+        and not isinstance(value, bool)
+        and INT_ABSENT < value <= np.iinfo(np.int64).max
+    )
+
+
+def make_chunk_id(text: str, metadata: Dict[str, Any]) -> int:
+    """
+    Derive the stable ID of a chunk from its source and position
+
+    The ID depends on (source_path, chunk_index), so re-ingesting a changed
+    file maps each chunk onto the row it replaces. Chunks without a source
+    fall back to a hash of their text.
+
+    Returns:
+        Non-negative int64 chunk ID
+    """
+    source = metadata.get("source_path") or metadata.get("filename")
+    if not source:
+        source = "text:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+    key = f"{source}#{metadata.get('chunk_index', 0)}"
+
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") & 0x7FFF_FFFF_FFFF_FFFF
+
+
+def _encode_value(value: Any) -> str:
+    """Encode a metadata value for a dictionary column"""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def _open_blob(path: Path):
+    """Memory-map a byte blob (empty files cannot be mapped)"""
+    if path.stat().st_size == 0:
+        return np.zeros(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r")
+
+
+def _write_array(path: Path, array: np.ndarray) -> None:
+    """Write a .npy file (fsynced by ChunkStore.write)"""
+    with open(path, "wb") as f:
+        np.save(f, array)
+
+
+def fsync_path(path: Path) -> None:
+    """
+    Flush a file's data, or a directory's entries, to stable storage
+
+    Directories cannot be opened for fsync on Windows; there the file
+    fsyncs are the only guarantee.
+    """
+    path = Path(path)
+    if path.is_dir() and os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _BlobColumn:
+    """Read-only view over a (blob, offsets) pair of variable-length strings"""
+
+    def __init__(self, blob_path: Path, offsets_path: Path):
+        self.blob = _open_blob(blob_path)
+        self.offsets = np.load(offsets_path, mmap_mode="r")
+
+    def __len__(self) -> int:
+        return max(len(self.offsets) - 1, 0)
+
+    def get(self, i: int) -> str:
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        return bytes(self.blob[start:end]).decode("utf-8")
+
+    def raw(self, i: int) -> memoryview:
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+        return memoryview(self.blob[start:end])
+
+
+class _RowView(Sequence):
+    """Lazy sequence over chunk store rows (texts or metadatas)"""
+
+    def __init__(self, getter, store: "ChunkStore"):
+        self._getter = getter
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._getter(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("chunk index out of range")
+        return self._getter(index)
+
+
+class ChunkStore:
+    """
+    Columnar store for chunk texts and metadata
+
+    Rows are addressed by position, which matches the position of the vector
+    in the FAISS index. Each row also carries a stable chunk ID; deleting a row
+    only marks it as a tombstone until the store is rewritten with a keep mask.
+
+    Example:
+        >>> store = ChunkStore()
+        >>> store.append(["texto"], [{"filename": "doc.md", "chunk_index": 0}], [42])
+        >>> store.write(Path("data/vector_store/faiss/chunks-1"))
+        >>> store = ChunkStore(Path("data/vector_store/faiss/chunks-1"))
+        >>> store.text(0)
+        'texto'
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        Initialize chunk store
+
+        Args:
+            directory: Directory written by write() to open lazily (empty store if None)
+        """
+        self.directory = Path(directory) if directory else None
+        self._base_texts: Optional[_BlobColumn] = None
+        self._base_count = 0
+        self._columns: Dict[str, Dict[str, Any]] = {}
+
+        self._base_ids = np.zeros(0, dtype=np.int64)
+        self._id_lookup: Optional[tuple] = None
+
+        # Rows added since the store was opened (not yet written)
+        self._pending_texts: List[str] = []
+        self._pending_metadatas: List[Dict[str, Any]] = []
+        self._pending_id_list: List[int] = []
+        self._pending_ids: Dict[int, int] = {}  # chunk ID -> latest pending row
+
+        # Deleted rows, skipped by search until the next compaction
+        self._deleted: set = set()
+
+        if self.directory is not None:
+            self._open(self.directory)
+
+        self.texts = _RowView(self.text, self)
+        self.metadatas = _RowView(self.metadata, self)
+
+    def _open(self, directory: Path) -> None:
+        """Memory-map a written store"""
+        self._base_texts = _BlobColumn(directory / "texts.bin", directory / "text_offsets.npy")
+        self._base_count = len(self._base_texts)
+
+        with open(directory / "columns.json", "r", encoding="utf-8") as f:
+            schema = json.load(f)
+
+        for name, info in schema["columns"]:
+            prefix = info["file"]
+            column = {"kind": info["kind"], "data": np.load(directory / f"{prefix}.npy", mmap_mode="r")}
+            if info["kind"] == "dict":
+                column["values"] = _BlobColumn(
+                    directory / f"{prefix}.values.bin",
+                    directory / f"{prefix}.values_offsets.npy"
+                )
+            self._columns[name] = column
+
+        if (directory / "ids.npy").exists():
+            self._base_ids = np.load(directory / "ids.npy", mmap_mode="r")
+            self._deleted = set(np.load(directory / "deleted.npy").tolist())
+        else:
+            # Written before stable IDs existed
+            self._base_ids = np.fromiter(
+                (make_chunk_id(self.text(i), self.metadata(i)) for i in range(self._base_count)),
+                dtype=np.int64, count=self._base_count
+            )
+
+    @classmethod
+    def from_lists(
+        cls,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: Optional[List[int]] = None
+    ) -> "ChunkStore":
+        """Create an in-memory store from plain lists (e.g. a legacy metadata.pkl)"""
+        store = cls()
+        store.append(texts, metadatas, ids)
+        return store
+
+    def __len__(self) -> int:
+        return self._base_count + len(self._pending_texts)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of rows not yet written to disk"""
+        return len(self._pending_texts)
+
+    @property
+    def deleted_count(self) -> int:
+        """Number of tombstoned rows"""
+        return len(self._deleted)
+
+    @property
+    def live_count(self) -> int:
+        """Number of rows that are not deleted"""
+        return len(self) - len(self._deleted)
+
+    def append(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: Optional[List[int]] = None
+    ) -> None:
+        """
+        Append rows (kept in memory until write())
+
+        Args:
+            texts: Chunk texts
+            metadatas: Chunk metadata dicts
+            ids: Stable chunk IDs (derived with make_chunk_id() if omitted)
+        """
+        if ids is None:
+            ids = [make_chunk_id(text, meta) for text, meta in zip(texts, metadatas)]
+        if len(texts) != len(metadatas) or len(texts) != len(ids):
+            raise ValueError(
+                f"Mismatch: {len(texts)} texts, {len(metadatas)} metadatas, {len(ids)} ids"
+            )
+
+        first_row = len(self)
+        for offset, chunk_id in enumerate(ids):
+            self._pending_ids[int(chunk_id)] = first_row + offset
+            self._pending_id_list.append(int(chunk_id))
+
+        self._pending_texts.extend(texts)
+        self._pending_metadatas.extend(metadatas)
+
+    def find_rows(self, name: str, value: Any) -> np.ndarray:
+        """
+        Find rows whose metadata column equals value (without materializing rows)
+
+        Args:
+            name: Metadata key
+            value: Value to match
+
+        Returns:
+            Sorted array of row positions
+        """
+        matches = []
+        column = self._columns.get(name)
+
+        if column is not None and self._base_count:
+            if column["kind"] == "int":
+                if _is_int(value):
+                    matches.append(np.flatnonzero(column["data"] == value))
+            else:
+                encoded = _encode_value(value)
+                for code in range(len(column["values"])):
+                    if column["values"].get(code) == encoded:
+                        matches.append(np.flatnonzero(column["data"] == code))
+                        break
+
+        pending = [
+            self._base_count + i
+            for i, metadata in enumerate(self._pending_metadatas)
+            if name in metadata and metadata[name] == value
+        ]
+        matches.append(np.asarray(pending, dtype=np.int64))
+
+        return np.sort(np.concatenate(matches)).astype(np.int64)
+
+    def chunk_id(self, row: int) -> int:
+        """Get the stable chunk ID of a row"""
+        if row < self._base_count:
+            return int(self._base_ids[row])
+        return self._pending_id_list[row - self._base_count]
+
+    def is_deleted(self, row: int) -> bool:
+        """True if the row has been deleted"""
+        return row in self._deleted
+
+    def deleted_mask(self) -> np.ndarray:
+        """Boolean mask of deleted rows"""
+        mask = np.zeros(len(self), dtype=bool)
+        if self._deleted:
+            mask[np.fromiter(self._deleted, dtype=np.int64)] = True
+        return mask
+
+    def delete_rows(self, rows) -> int:
+        """
+        Mark rows as deleted
+
+        Returns:
+            Number of rows newly marked as deleted
+        """
+        before = len(self._deleted)
+        self._deleted.update(int(row) for row in rows)
+        return len(self._deleted) - before
+
+    def rows_for_ids(self, ids) -> np.ndarray:
+        """
+        Find the live rows holding the given chunk IDs
+
+        Args:
+            ids: Iterable of chunk IDs
+
+        Returns:
+            Array of live row positions (IDs without a live row are skipped)
+        """
+        rows = []
+        remaining = []
+
+        for chunk_id in ids:
+            row = self._pending_ids.get(int(chunk_id))
+            if row is not None and row not in self._deleted:
+                rows.append(row)
+            else:
+                remaining.append(int(chunk_id))
+
+        if remaining and self._base_count:
+            if self._id_lookup is None:
+                order = np.argsort(self._base_ids, kind="stable")
+                self._id_lookup = (np.asarray(self._base_ids)[order], order)
+            sorted_ids, order = self._id_lookup
+
+            wanted = np.asarray(remaining, dtype=np.int64)
+            lo = np.searchsorted(sorted_ids, wanted, side="left")
+            hi = np.searchsorted(sorted_ids, wanted, side="right")
+            for start, end in zip(lo, hi):
+                # An ID can appear more than once (old copies are tombstoned)
+                for row in order[start:end]:
+                    if int(row) not in self._deleted:
+                        rows.append(int(row))
+
+        return np.asarray(sorted(rows), dtype=np.int64)
+
+    def text(self, row: int) -> str:
+        """Get the text of a row"""
+        if row < self._base_count:
+            return self._base_texts.get(row)
+        return self._pending_texts[row - self._base_count]
+
+    def metadata(self, row: int) -> Dict[str, Any]:
+        """Get the metadata dict of a row (a fresh dict on every call)"""
+        if row >= self._base_count:
+            return dict(self._pending_metadatas[row - self._base_count])
+
+        metadata = {}
+        for name, column in self._columns.items():
+            value = column["data"][row]
+            if column["kind"] == "int":
+                if value != INT_ABSENT:
+                    metadata[name] = int(value)
+            elif value >= 0:
+                metadata[name] = json.loads(column["values"].get(int(value)))
+        return metadata
+
+    def write(self, directory: Path, keep: Optional[np.ndarray] = None) -> None:
+        """
+        Write all rows (on-disk and pending) to a new directory
+
+        Every file and the directory itself are fsynced before returning, so
+        a caller can durably point at the directory afterwards.
+
+        Args:
+            directory: Target directory (must not be the directory this store was opened from)
+            keep: Optional boolean mask of rows to keep (used for compaction)
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if keep is not None:
+            keep = np.asarray(keep, dtype=bool)
+            if len(keep) != len(self):
+                raise ValueError(f"Mismatch: keep mask has {len(keep)} rows, store has {len(self)}")
+
+        self._write_texts(directory, keep)
+        self._write_ids(directory, keep)
+
+        schema = []
+        for i, name in enumerate(self._column_names()):
+            prefix = f"col_{i}"
+            kind = self._write_column(directory, prefix, name, keep)
+            schema.append([name, {"kind": kind, "file": prefix}])
+
+        with open(directory / "columns.json", "w", encoding="utf-8") as f:
+            json.dump({"format": 1, "count": int(keep.sum()) if keep is not None else len(self),
+                       "columns": schema}, f, ensure_ascii=False)
+
+        for path in directory.iterdir():
+            fsync_path(path)
+        fsync_path(directory)
+
+    def _write_ids(self, directory: Path, keep: Optional[np.ndarray]) -> None:
+        """Write ids.npy and deleted.npy"""
+        ids = np.concatenate([
+            np.asarray(self._base_ids, dtype=np.int64),
+            np.asarray(self._pending_id_list, dtype=np.int64)
+        ])
+        deleted = self.deleted_mask()
+
+        if keep is not None:
+            ids = ids[keep]
+            deleted = deleted[keep]
+
+        _write_array(directory / "ids.npy", ids)
+        _write_array(directory / "deleted.npy", np.flatnonzero(deleted).astype(np.int64))
+
+    def _column_names(self) -> List[str]:
+        """Column names in first-seen order"""
+        names = dict.fromkeys(self._columns)
+        for metadata in self._pending_metadatas:
+            names.update(dict.fromkeys(metadata))
+        return list(names)
+
+    def _write_texts(self, directory: Path, keep: Optional[np.ndarray]) -> None:
+        """Write texts.bin and text_offsets.npy"""
+        pending = [t.encode("utf-8") for t in self._pending_texts]
+        lengths = np.zeros(len(self), dtype=np.int64)
+        if self._base_count:
+            lengths[:self._base_count] = np.diff(self._base_texts.offsets)
+        lengths[self._base_count:] = [len(b) for b in pending]
+
+        with open(directory / "texts.bin", "wb") as f:
+            if keep is None:
+                if self._base_count:
+                    f.write(memoryview(self._base_texts.blob))
+                for data in pending:
+                    f.write(data)
+            else:
+                for row in np.flatnonzero(keep):
+                    if row < self._base_count:
+                        f.write(self._base_texts.raw(row))
+                    else:
+                        f.write(pending[row - self._base_count])
+            f.flush()
+
+        if keep is not None:
+            lengths = lengths[keep]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        _write_array(directory / "text_offsets.npy", offsets)
+
+    def _write_column(
+        self,
+        directory: Path,
+        prefix: str,
+        name: str,
+        keep: Optional[np.ndarray]
+    ) -> str:
+        """Write one metadata column, returning its kind ("int" or "dict")"""
+        base = self._columns.get(name)
+        pending = [m.get(name, _MISSING) for m in self._pending_metadatas]
+        present = [v for v in pending if v is not _MISSING]
+
+        if (base is None or base["kind"] == "int") and all(_is_int(v) for v in present):
+            data = np.full(len(self), INT_ABSENT, dtype=np.int64)
+            if base is not None:
+                data[:self._base_count] = base["data"]
+            for i, value in enumerate(pending):
+                if value is not _MISSING:
+                    data[self._base_count + i] = value
+            _write_array(directory / f"{prefix}.npy", data if keep is None else data[keep])
+            return "int"
+
+        # Dictionary-encoded column: existing codes stay valid, new values are appended
+        values: List[str] = []
+        codes_by_value: Dict[str, int] = {}
+        data = np.full(len(self), -1, dtype=np.int32)
+
+        def code_for(encoded: str) -> int:
+            if encoded not in codes_by_value:
+                codes_by_value[encoded] = len(values)
+                values.append(encoded)
+            return codes_by_value[encoded]
+
+        if base is not None and base["kind"] == "dict":
+            for i in range(len(base["values"])):
+                code_for(base["values"].get(i))
+            data[:self._base_count] = base["data"]
+        elif base is not None:
+            # int column that now also holds other types: re-encode its values
+            base_ints = np.asarray(base["data"])
+            for value in np.unique(base_ints[base_ints != INT_ABSENT]):
+                code = code_for(_encode_value(int(value)))
+                data[:self._base_count][base_ints == value] = code
+
+        for i, value in enumerate(pending):
+            if value is not _MISSING:
+                data[self._base_count + i] = code_for(_encode_value(value))
+
+        _write_array(directory / f"{prefix}.npy", data if keep is None else data[keep])
+
+        encoded = [v.encode("utf-8") for v in values]
+        with open(directory / f"{prefix}.values.bin", "wb") as f:
+            for value in encoded:
+                f.write(value)
+            f.flush()
+        value_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(v) for v in encoded], out=value_offsets[1:])
+        _write_array(directory / f"{prefix}.values_offsets.npy", value_offsets)
+
+        return "dict"
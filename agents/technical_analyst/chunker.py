@@ -0,0 +1,176 @@
+"""
+Text Chunker for RAG system
+
+Splits documents into overlapping chunks that end on paragraph or sentence
+boundaries. Sizes are measured in characters or, when a tokenizer is given,
+in tokens of the embedding model (which truncates its input by tokens).
+
+The chunker runs in linear time: paragraph and sentence boundary offsets
+are collected in one pass over the text (and the text is tokenized once),
+then every chunk end is found with a binary search. Text is only sliced
+when a chunk is emitted.
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+import bisect
+import re
+
+import numpy as np
+
+
+_PARAGRAPH_BREAK = re.compile(r"(?=\n\n)")  # Lookahead: overlapping "\n\n\n" matches twice
+
+
+def hf_token_starts(tokenizer) -> Callable[[str], np.ndarray]:
+    """
+    Adapt a Hugging Face fast tokenizer (e.g. SentenceTransformer.tokenizer)
+
+    Returns:
+        Function mapping a text to the start offsets of its tokens
+    """
+    def token_starts(text: str) -> np.ndarray:
+        encoding = tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+            verbose=False
+        )
+        return np.fromiter(
+            (start for start, _ in encoding["offset_mapping"]), dtype=np.int64
+        )
+
+    return token_starts
+
+
+class TextChunker:
+    """
+    Boundary-aware text chunker with a character or token budget
+
+    A chunk ends at the last paragraph break ("\\n\\n") inside the budget,
+    else at the last ".", else at the budget itself. Consecutive chunks
+    overlap by chunk_overlap units, and every chunk ends past the previous
+    one (so a boundary inside the overlap never yields near-duplicate chunks).
+
+    Example:
+        >>> chunker = TextChunker(chunk_size=1000, chunk_overlap=200)
+        >>> for start, end, text in chunker.split(document): ...
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        token_starts: Optional[Callable[[str], Any]] = None
+    ):
+        """
+        Initialize chunker
+
+        Args:
+            chunk_size: Maximum characters (or tokens) per chunk
+            chunk_overlap: Characters (or tokens) shared by consecutive chunks
+            token_starts: Function returning the start offset of every token of
+                a text (see hf_token_starts); sizes are in tokens when given
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.token_starts = token_starts
+
+    @property
+    def unit(self) -> str:
+        """Unit of chunk_size / chunk_overlap: "tokens" or "chars" """
+        return "tokens" if self.token_starts is not None else "chars"
+
+    @staticmethod
+    def boundaries(text: str) -> Tuple[List[int], List[int]]:
+        """
+        Collect candidate chunk ends in one pass
+
+        Returns:
+            Tuple of sorted (paragraph_ends, sentence_ends): offsets just after
+            each "\\n\\n" and each "."
+        """
+        paragraph_ends = [m.start() + 2 for m in _PARAGRAPH_BREAK.finditer(text)]
+        sentence_ends = [m.start() + 1 for m in re.finditer(r"\.", text)]
+        return paragraph_ends, sentence_ends
+
+    def spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Compute chunk spans without slicing the text
+
+        Returns:
+            List of (start, end) character offsets (end exclusive, unstripped)
+        """
+        if not text:
+            return []
+
+        length = len(text)
+        paragraph_ends, sentence_ends = self.boundaries(text)
+
+        if self.token_starts is not None:
+            starts = np.asarray(self.token_starts(text), dtype=np.int64)
+            if len(starts) == 0:
+                return [(0, length)]
+            # Position i = character offset where token i starts (sentinel: end of text)
+            token_offsets = np.append(starts, length).tolist()
+            n_tokens = len(starts)
+
+        spans = []
+        start = 0
+        previous_end = 0
+
+        while start < length:
+            if self.token_starts is None:
+                limit = start + self.chunk_size
+            else:
+                # Budget ends where token (first + chunk_size) starts
+                budget_end = bisect.bisect_left(token_offsets, start) + self.chunk_size
+                limit = length if budget_end >= n_tokens else token_offsets[budget_end]
+
+            end = limit
+            if end < length:
+                # Last paragraph break in (floor, limit], else last "." in (floor, limit].
+                # Boundaries at or before the previous end would re-emit the same
+                # text shifted by one character, so they do not count.
+                floor = max(start, previous_end)
+                i = bisect.bisect_right(paragraph_ends, limit) - 1
+                if i >= 0 and paragraph_ends[i] > max(start + 2, floor):
+                    end = paragraph_ends[i]
+                else:
+                    j = bisect.bisect_right(sentence_ends, limit) - 1
+                    if j >= 0 and sentence_ends[j] > max(start + 1, floor):
+                        end = sentence_ends[j]
+
+            spans.append((start, end))
+            previous_end = end
+
+            if end >= length:
+                break
+
+            # Move start position (with overlap), always advancing
+            if self.token_starts is None:
+                next_start = end - self.chunk_overlap
+            else:
+                last = bisect.bisect_left(token_offsets, end)
+                next_start = token_offsets[max(last - self.chunk_overlap, 0)]
+            start = max(next_start, start + 1)
+
+        return spans
+
+    def split(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Split text into chunks
+
+        Returns:
+            List of (start, end, chunk_text) with whitespace-stripped, non-empty texts
+        """
+        chunks = []
+        for start, end in self.spans(text):
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append((start, end, chunk))
+        return chunks
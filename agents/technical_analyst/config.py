@@ -26,6 +26,17 @@ class RAGConfig:
     # FAISS Configuration (Local)
     FAISS_INDEX_PATH: str = os.getenv("RAG_FAISS_INDEX_PATH", "data/vector_store/faiss")
 
+    # FAISS Index Type: "flat" (exact), "ivf" (IVF-Flat) or "hnsw" (HNSW graph)
+    FAISS_INDEX_TYPE: Literal["flat", "ivf", "hnsw"] = os.getenv("RAG_FAISS_INDEX_TYPE", "flat")
+    FAISS_IVF_NLIST: int = int(os.getenv("RAG_FAISS_IVF_NLIST", "100"))
+    FAISS_IVF_NPROBE: int = int(os.getenv("RAG_FAISS_IVF_NPROBE", "8"))
+    FAISS_HNSW_M: int = int(os.getenv("RAG_FAISS_HNSW_M", "32"))
+    FAISS_HNSW_EF_CONSTRUCTION: int = int(os.getenv("RAG_FAISS_HNSW_EF_CONSTRUCTION", "40"))
+    FAISS_HNSW_EF_SEARCH: int = int(os.getenv("RAG_FAISS_HNSW_EF_SEARCH", "64"))
+
+    # Fraction of deleted chunks above which save() compacts the index
+    FAISS_COMPACT_THRESHOLD: float = float(os.getenv("RAG_FAISS_COMPACT_THRESHOLD", "0.2"))
+
     # Pinecone Configuration (Future - Cloud)
     PINECONE_API_KEY: str = os.getenv("PINECONE_API_KEY", "")
     PINECONE_ENVIRONMENT: str = os.getenv("PINECONE_ENVIRONMENT", "")
@@ -34,23 +45,63 @@ class RAGConfig:
     PINECONE_METRIC: str = os.getenv("PINECONE_METRIC", "cosine")
 
     # Embeddings Configuration
-    EMBEDDINGS_PROVIDER: Literal["local", "openai"] = os.getenv("RAG_EMBEDDINGS_PROVIDER", "local")
+    EMBEDDINGS_PROVIDER: Literal["local", "onnx", "openai"] = os.getenv("RAG_EMBEDDINGS_PROVIDER", "local")
     EMBEDDINGS_MODEL: str = os.getenv("RAG_EMBEDDINGS_MODEL", "all-MiniLM-L6-v2")
     EMBEDDINGS_DIMENSION: int = int(os.getenv("RAG_EMBEDDINGS_DIMENSION", "384"))
 
+    # Persistent document embedding cache (empty path disables it)
+    EMBEDDINGS_CACHE_PATH: str = os.getenv("RAG_EMBEDDINGS_CACHE_PATH", "data/vector_store/embeddings_cache")
+    EMBEDDINGS_CACHE_MAX_ENTRIES: int = int(os.getenv("RAG_EMBEDDINGS_CACHE_MAX_ENTRIES", "200000"))
+    EMBEDDINGS_CACHE_DTYPE: Literal["float16", "float32"] = os.getenv("RAG_EMBEDDINGS_CACHE_DTYPE", "float16")
+
+    # ONNX Runtime provider: exported model per name under this path (int8 unless disabled)
+    ONNX_MODEL_PATH: str = os.getenv("RAG_ONNX_MODEL_PATH", "data/models/onnx")
+    ONNX_QUANTIZE: bool = os.getenv("RAG_ONNX_QUANTIZE", "int8").lower() in ("int8", "true")  # else fp32
+    ONNX_THREADS: int = int(os.getenv("RAG_ONNX_THREADS", "0"))  # 0 = one per physical core
+
     # OpenAI Configuration (Future)
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_EMBEDDINGS_MODEL: str = os.getenv("OPENAI_EMBEDDINGS_MODEL", "text-embedding-3-small")
     OPENAI_EMBEDDINGS_DIMENSION: int = int(os.getenv("OPENAI_EMBEDDINGS_DIMENSION", "1536"))
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    # Requests are packed up to this many tokens and run this many at a time
+    OPENAI_EMBEDDINGS_MAX_BATCH_TOKENS: int = int(os.getenv("OPENAI_EMBEDDINGS_MAX_BATCH_TOKENS", "100000"))
+    OPENAI_EMBEDDINGS_CONCURRENCY: int = int(os.getenv("OPENAI_EMBEDDINGS_CONCURRENCY", "4"))
+    OPENAI_EMBEDDINGS_MAX_RETRIES: int = int(os.getenv("OPENAI_EMBEDDINGS_MAX_RETRIES", "6"))
 
     # Knowledge Base Configuration
     KNOWLEDGE_BASE_PATH: str = os.getenv("RAG_KNOWLEDGE_BASE_PATH", "data/knowledge_base/mock")
     CHUNK_SIZE: int = int(os.getenv("RAG_CHUNK_SIZE", "1000"))
     CHUNK_OVERLAP: int = int(os.getenv("RAG_CHUNK_OVERLAP", "200"))
+    CHUNK_UNIT: str = os.getenv("RAG_CHUNK_UNIT", "chars")  # chars | tokens (embedding model tokenizer)
+
+    # Streaming ingestion: chunks embedded/added per batch and batch memory ceiling
+    INGEST_BATCH_SIZE: int = int(os.getenv("RAG_INGEST_BATCH_SIZE", "256"))
+    INGEST_MAX_BATCH_MB: int = int(os.getenv("RAG_INGEST_MAX_BATCH_MB", "256"))
+    INGEST_WORKERS: int = int(os.getenv("RAG_INGEST_WORKERS", "1"))  # 0 = one per CPU core
+    # Near-duplicate chunks (estimated Jaccard >= threshold) are not embedded; 0 disables
+    INGEST_DEDUP_THRESHOLD: float = float(os.getenv("RAG_INGEST_DEDUP_THRESHOLD", "0.9"))
+    # Save the index and a resumable checkpoint every N batches; 0 disables
+    INGEST_CHECKPOINT_EVERY: int = int(os.getenv("RAG_INGEST_CHECKPOINT_EVERY", "20"))
 
     # Search Configuration
     TOP_K: int = int(os.getenv("RAG_TOP_K", "5"))
     SIMILARITY_THRESHOLD: float = float(os.getenv("RAG_SIMILARITY_THRESHOLD", "0.7"))
+    # In-memory LRU caches of query embeddings and search results; 0 disables
+    QUERY_CACHE_SIZE: int = int(os.getenv("RAG_QUERY_CACHE_SIZE", "1024"))
+    # Reuse cached results of a query with cosine similarity >= threshold; 0 disables
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("RAG_SEMANTIC_CACHE_THRESHOLD", "0"))
+    # Persistent cross-edital verdict cache (SQLite file; empty path disables it)
+    VERDICT_CACHE_PATH: str = os.getenv("RAG_VERDICT_CACHE_PATH", "")
+    VERDICT_CACHE_TTL_DAYS: float = float(os.getenv("RAG_VERDICT_CACHE_TTL_DAYS", "30"))  # 0 = never expire
+    # Analyze one representative of requirements with query cosine >= threshold; 0 disables
+    CLUSTER_THRESHOLD: float = float(os.getenv("RAG_CLUSTER_THRESHOLD", "0"))
+
+    # Local search daemon (scripts/rag_search_daemon.py); empty URL disables the client
+    SEARCH_DAEMON_URL: str = os.getenv("RAG_SEARCH_DAEMON_URL", "http://127.0.0.1:8765")
+    # Requests arriving within this window are answered by one batched search
+    SEARCH_DAEMON_MAX_WAIT_MS: float = float(os.getenv("RAG_SEARCH_DAEMON_MAX_WAIT_MS", "5"))
+    SEARCH_DAEMON_MAX_BATCH: int = int(os.getenv("RAG_SEARCH_DAEMON_MAX_BATCH", "64"))
 
     # n8n Configuration (Future)
     N8N_BASE_URL: str = os.getenv("N8N_BASE_URL", "")
@@ -66,6 +117,10 @@ class RAGConfig:
         if cls.VECTOR_STORE == "faiss":
             if not cls.FAISS_INDEX_PATH:
                 errors.append("FAISS_INDEX_PATH is required when using FAISS vector store")
+            if cls.FAISS_INDEX_TYPE not in ("flat", "ivf", "hnsw"):
+                errors.append(
+                    f"Unknown FAISS_INDEX_TYPE: {cls.FAISS_INDEX_TYPE}. Use 'flat', 'ivf' or 'hnsw'"
+                )
         elif cls.VECTOR_STORE == "pinecone":
             if not cls.PINECONE_API_KEY:
                 errors.append("PINECONE_API_KEY is required when using Pinecone")
@@ -77,6 +132,17 @@ class RAGConfig:
             if not cls.OPENAI_API_KEY:
                 errors.append("OPENAI_API_KEY is required when using OpenAI embeddings")
 
+        if cls.CHUNK_UNIT not in ("chars", "tokens"):
+            errors.append(f"Invalid CHUNK_UNIT: {cls.CHUNK_UNIT}. Must be 'chars' or 'tokens'")
+
+        if not 0 <= cls.SEMANTIC_CACHE_THRESHOLD <= 1:
+            errors.append(
+                f"Invalid SEMANTIC_CACHE_THRESHOLD: {cls.SEMANTIC_CACHE_THRESHOLD}. Must be in [0, 1]"
+            )
+
+        if not 0 <= cls.CLUSTER_THRESHOLD <= 1:
+            errors.append(f"Invalid CLUSTER_THRESHOLD: {cls.CLUSTER_THRESHOLD}. Must be in [0, 1]")
+
         # Check knowledge base path exists
         kb_path = Path(cls.KNOWLEDGE_BASE_PATH)
         if not kb_path.exists():
@@ -99,18 +165,44 @@ class RAGConfig:
 
         if cls.VECTOR_STORE == "faiss":
             print(f"  FAISS Index Path: {cls.FAISS_INDEX_PATH}")
+            print(f"  FAISS Index Type: {cls.FAISS_INDEX_TYPE}")
+            if cls.FAISS_INDEX_TYPE == "ivf":
+                print(f"    nlist: {cls.FAISS_IVF_NLIST}, nprobe: {cls.FAISS_IVF_NPROBE}")
+            elif cls.FAISS_INDEX_TYPE == "hnsw":
+                print(f"    M: {cls.FAISS_HNSW_M}, efConstruction: {cls.FAISS_HNSW_EF_CONSTRUCTION}, "
+                      f"efSearch: {cls.FAISS_HNSW_EF_SEARCH}")
+            print(f"  FAISS Compact Threshold: {cls.FAISS_COMPACT_THRESHOLD}")
 
         print(f"Embeddings Provider: {cls.EMBEDDINGS_PROVIDER}")
         print(f"  Model: {cls.EMBEDDINGS_MODEL}")
         print(f"  Dimension: {cls.EMBEDDINGS_DIMENSION}")
+        print(f"  Cache: {cls.EMBEDDINGS_CACHE_PATH or 'disabled'}")
+        if cls.EMBEDDINGS_PROVIDER == "onnx":
+            print(f"  ONNX: {cls.ONNX_MODEL_PATH} ({'int8' if cls.ONNX_QUANTIZE else 'fp32'}, "
+                  f"{cls.ONNX_THREADS or 'one per core'} threads)")
+        if cls.EMBEDDINGS_PROVIDER == "openai":
+            print(f"  OpenAI: {cls.OPENAI_BASE_URL} ({cls.OPENAI_EMBEDDINGS_MAX_BATCH_TOKENS} tokens/request, "
+                  f"{cls.OPENAI_EMBEDDINGS_CONCURRENCY} concurrent, {cls.OPENAI_EMBEDDINGS_MAX_RETRIES} retries)")
 
         print(f"Knowledge Base: {cls.KNOWLEDGE_BASE_PATH}")
         print(f"  Chunk Size: {cls.CHUNK_SIZE}")
         print(f"  Chunk Overlap: {cls.CHUNK_OVERLAP}")
+        print(f"  Chunk Unit: {cls.CHUNK_UNIT}")
+        print(f"  Ingest Batch: {cls.INGEST_BATCH_SIZE} chunks / {cls.INGEST_MAX_BATCH_MB} MB")
+        print(f"  Ingest Workers: {cls.INGEST_WORKERS or 'one per core'}")
+        print(f"  Ingest Dedup Threshold: {cls.INGEST_DEDUP_THRESHOLD or 'disabled'}")
+        print(f"  Ingest Checkpoint: {f'every {cls.INGEST_CHECKPOINT_EVERY} batches' if cls.INGEST_CHECKPOINT_EVERY else 'disabled'}")
 
         print(f"Search Configuration:")
         print(f"  Top K: {cls.TOP_K}")
         print(f"  Similarity Threshold: {cls.SIMILARITY_THRESHOLD}")
+        print(f"  Query Cache: {cls.QUERY_CACHE_SIZE or 'disabled'}")
+        print(f"  Semantic Cache Threshold: {cls.SEMANTIC_CACHE_THRESHOLD or 'disabled'}")
+        print(f"  Verdict Cache: {cls.VERDICT_CACHE_PATH or 'disabled'}"
+              f"{f' (TTL {cls.VERDICT_CACHE_TTL_DAYS:g} days)' if cls.VERDICT_CACHE_PATH else ''}")
+        print(f"  Requirement Clustering: {cls.CLUSTER_THRESHOLD or 'disabled'}")
+        print(f"  Search Daemon: {cls.SEARCH_DAEMON_URL or 'disabled'}"
+              f"{f' ({cls.SEARCH_DAEMON_MAX_WAIT_MS:g} ms / {cls.SEARCH_DAEMON_MAX_BATCH} per batch)' if cls.SEARCH_DAEMON_URL else ''}")
         print("=" * 60)
 
 
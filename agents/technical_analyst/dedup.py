@@ -0,0 +1,187 @@
+"""
+Near-Duplicate Detection for RAG system
+
+MinHash signatures with locality-sensitive hashing (LSH) find chunks whose
+word shingles overlap almost completely with a chunk seen earlier, such as
+cookie banners, navigation menus and legal footers repeated across scraped
+pages. IngestionPipeline drops them before embedding and points each one at
+the chunk that represents it in the index.
+
+Candidates share at least one LSH band (num_perm / bands signature rows);
+they are confirmed by the estimated Jaccard similarity of the full signatures
+and must contain the same numbers, so datasheets that differ only in a value
+("4 MP" vs "8 MP") are never collapsed however similar their words are.
+Numbers keep their sign, comparison operator and decimal separator ("-20",
+"≥4", "4,5"). Exact duplicates (same words after whitespace/case
+normalization, same numbers) are found with a digest lookup before any
+hashing.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import re
+import zlib
+
+import numpy as np
+
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_WORD = re.compile(r"\w+", re.UNICODE)
+# Optional comparison operator and sign: "≥ 4", "-20", but "20-30" is two numbers
+_NUMBER = re.compile(r"(?:[≥≤<>]=?\s*)?(?<![\w.,])[-−+]?\d+(?:[.,]\d+)*")
+_OPERATORS = {">=": "≥", "<=": "≤", "−": "-"}
+
+
+def number_signature(text: str) -> Tuple[str, ...]:
+    """
+    Standalone numbers of a text, in order, with their sign and comparison
+    operator ("4 MP, -20 °C, ≥ 30 dias" -> ("4", "-20", "≥30"))
+    """
+    numbers = []
+    for number in _NUMBER.findall(text):
+        number = re.sub(r"\s+", "", number)
+        for spelling, canonical in _OPERATORS.items():
+            number = number.replace(spelling, canonical)
+        numbers.append(number)
+    return tuple(numbers)
+
+
+class NearDuplicateDetector:
+    """
+    Streaming near-duplicate detector
+
+    Every text that is not a duplicate becomes a representative; later texts
+    are compared against representatives only.
+
+    Example:
+        >>> detector = NearDuplicateDetector(threshold=0.9)
+        >>> detector.add("Aceitar cookies ...", ref={"id": 1})       # None: new text
+        >>> detector.add("Aceitar  cookies ...", ref={"id": 2})      # ({"id": 1}, 1.0)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        seed: int = 1
+    ):
+        """
+        Initialize detector
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity of word shingles (0-1]
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must be a multiple)
+            shingle_size: Words per shingle
+            seed: Seed of the hash permutations
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        # h(x) = (a * x + b) mod p; a < 2^31 and x < 2^32 keep a * x within uint64
+        self._a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)[:, None]
+
+        self._exact: Dict[bytes, int] = {}
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        self._signatures: List[np.ndarray] = []
+        self._numbers: List[Tuple[str, ...]] = []
+        self._refs: List[Any] = []
+
+        self.exact_duplicates = 0
+        self.near_duplicates = 0
+
+    def __len__(self) -> int:
+        """Number of representatives"""
+        return len(self._refs)
+
+    def signature(self, words: List[str]) -> np.ndarray:
+        """MinHash signature (uint32) of a text's word shingles"""
+        k = min(self.shingle_size, len(words))
+        shingles = {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        permuted = (self._a * hashes[None, :] + self._b) % _MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def add(self, text: str, ref: Any) -> Optional[Tuple[Any, float]]:
+        """
+        Check a text against the representatives seen so far
+
+        Args:
+            text: Chunk text
+            ref: Reference returned for later duplicates of this text
+
+        Returns:
+            (representative ref, estimated similarity) if text is a duplicate,
+            else None (text becomes a representative)
+        """
+        words = _WORD.findall(text.lower())
+        numbers = number_signature(text)
+        # Words drop signs, operators and decimal separators: the numbers keep them
+        exact_key = " ".join(words) + "\0" + "|".join(numbers)
+        digest = hashlib.blake2b(exact_key.encode("utf-8"), digest_size=16).digest()
+
+        exact = self._exact.get(digest)
+        if exact is not None:
+            self.exact_duplicates += 1
+            return self._refs[exact], 1.0
+
+        if not words:
+            return None  # No words to compare (never a representative either)
+
+        signature = self.signature(words)
+        band_keys = [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+        best, best_similarity = None, 0.0
+        checked = set()
+        for buckets, key in zip(self._buckets, band_keys):
+            for candidate in buckets.get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if self._numbers[candidate] != numbers:
+                    continue  # Different values: never a duplicate
+                similarity = float(np.mean(self._signatures[candidate] == signature))
+                if similarity > best_similarity:
+                    best, best_similarity = candidate, similarity
+
+        if best is not None and best_similarity >= self.threshold:
+            self.near_duplicates += 1
+            return self._refs[best], round(best_similarity, 4)
+
+        index = len(self._refs)
+        self._refs.append(ref)
+        self._signatures.append(signature)
+        self._numbers.append(numbers)
+        self._exact[digest] = index
+        for buckets, key in zip(self._buckets, band_keys):
+            buckets.setdefault(key, []).append(index)
+
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get detector statistics"""
+        return {
+            "threshold": self.threshold,
+            "representatives": len(self._refs),
+            "exact_duplicates": self.exact_duplicates,
+            "near_duplicates": self.near_duplicates
+        }
@@ -0,0 +1,348 @@
+"""
+Embedding Cache for RAG system
+
+Persistent, content-addressed cache of document embeddings, keyed by
+(provider, model, sha256(text)). Re-chunking with the same parameters,
+rebuilding the index or switching the FAISS index type then costs almost no
+model inference.
+
+On-disk layout (one directory per provider/model):
+- vectors.bin: fixed-size rows (float16 by default) in a memory-mapped file
+- index.npz: sha256 digests, row slots and last-use ticks of cached entries
+- meta.json: dimension, dtype and capacity of vectors.bin
+
+The cache is bounded by max_entries; the least recently used entries are
+evicted when it is full. Slots freed by eviction are only reused after the
+next save(), so a crash never leaves the saved index pointing at a row that
+was overwritten with another text's vector.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+
+def text_digest(text: str) -> bytes:
+    """SHA-256 digest of a chunk text (the cache key within a provider/model)"""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """
+    On-disk embedding cache for one (provider, model) pair
+
+    Example:
+        >>> cache = EmbeddingCache("data/vector_store/embeddings_cache", "local",
+        ...                        "all-MiniLM-L6-v2", dimension=384)
+        >>> vectors, missing = cache.get_many(texts)
+        >>> cache.put_many([texts[i] for i in missing], new_vectors)
+        >>> cache.save()
+    """
+
+    DTYPES = ("float16", "float32")
+    EVICT_FRACTION = 0.1  # Share of entries evicted at once when the cache is full
+
+    def __init__(
+        self,
+        cache_dir: str,
+        provider: str,
+        model: str,
+        dimension: int,
+        max_entries: int = 200000,
+        dtype: str = "float16"
+    ):
+        """
+        Initialize embedding cache (opens an existing cache if compatible)
+
+        Args:
+            cache_dir: Root cache directory (one subdirectory per provider/model)
+            provider: Embeddings provider ("local", "openai", ...)
+            model: Embeddings model name
+            dimension: Embedding dimension
+            max_entries: Maximum number of cached embeddings
+            dtype: "float16" (half the disk/RAM, ~1e-3 precision) or "float32"
+        """
+        if dtype not in self.DTYPES:
+            raise ValueError(f"Unknown cache dtype: {dtype}. Use one of: {', '.join(self.DTYPES)}")
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{provider}__{model}")
+        self.directory = Path(cache_dir) / slug
+        self.provider = provider
+        self.model = model
+        self.dimension = dimension
+        self.max_entries = max_entries
+        self.dtype = dtype
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._slots: Dict[bytes, int] = {}
+        self._last_used = np.zeros(0, dtype=np.int64)
+        self._free: List[int] = []
+        self._pending_free: List[int] = []
+        self._tick = 0
+        self._capacity = 0
+        self._vectors: Optional[np.memmap] = None
+        self._dirty = False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._open()
+
+    @property
+    def _vectors_file(self) -> Path:
+        return self.directory / "vectors.bin"
+
+    def _open(self) -> None:
+        """Open the cache on disk, starting over if it is missing or incompatible"""
+        meta_file = self.directory / "meta.json"
+        index_file = self.directory / "index.npz"
+
+        try:
+            with open(meta_file, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["dimension"] != self.dimension or meta["dtype"] != self.dtype:
+                print(f"⚠️  Embedding cache {self.directory} has a different dimension/dtype: "
+                      f"starting a new cache")
+                raise ValueError("incompatible cache")
+
+            with np.load(index_file) as index:
+                digests = index["digests"]
+                slots = index["slots"]
+                last_used = index["last_used"]
+
+            row_bytes = self.dimension * np.dtype(self.dtype).itemsize
+            if self._vectors_file.stat().st_size < meta["capacity"] * row_bytes:
+                raise ValueError("truncated vectors file")
+        except (OSError, ValueError, KeyError, json.JSONDecodeError):
+            self._reset_files()
+            return
+
+        self._capacity = int(meta["capacity"])
+        self._tick = int(meta["tick"])
+        self._vectors = self._map_vectors(self._capacity)
+
+        self._slots = {bytes(digest): int(slot) for digest, slot in zip(digests, slots)}
+        self._last_used = np.zeros(self._capacity, dtype=np.int64)
+        self._last_used[slots] = last_used
+
+        used = np.zeros(self._capacity, dtype=bool)
+        used[slots] = True
+        self._free = np.flatnonzero(~used).tolist()[::-1]  # pop() yields lowest slots first
+
+    def _reset_files(self) -> None:
+        """Start an empty cache"""
+        for name in ("vectors.bin", "index.npz", "meta.json"):
+            (self.directory / name).unlink(missing_ok=True)
+
+        self._slots = {}
+        self._last_used = np.zeros(0, dtype=np.int64)
+        self._free = []
+        self._pending_free = []
+        self._capacity = 0
+        self._tick = 0
+        self._vectors = None
+
+    def _map_vectors(self, capacity: int) -> Optional[np.memmap]:
+        """Memory-map vectors.bin with room for capacity rows"""
+        if capacity == 0:
+            return None
+
+        row_bytes = self.dimension * np.dtype(self.dtype).itemsize
+        with open(self._vectors_file, "ab") as f:
+            if f.tell() < capacity * row_bytes:
+                f.truncate(capacity * row_bytes)
+
+        return np.memmap(self._vectors_file, dtype=self.dtype, mode="r+",
+                         shape=(capacity, self.dimension))
+
+    def _grow(self, needed: int) -> None:
+        """Grow vectors.bin (doubling, up to max_entries rows)"""
+        capacity = min(max(self._capacity * 2, self._capacity + needed, 1024), self.max_entries)
+        if capacity <= self._capacity:
+            return
+
+        if self._vectors is not None:
+            self._vectors.flush()
+            del self._vectors
+
+        self._free.extend(range(capacity - 1, self._capacity - 1, -1))
+        self._last_used = np.concatenate([
+            self._last_used, np.zeros(capacity - self._capacity, dtype=np.int64)
+        ])
+        self._capacity = capacity
+        self._vectors = self._map_vectors(capacity)
+
+    def _evict(self, needed: int) -> None:
+        """Evict the least recently used entries"""
+        count = min(max(needed, int(self.max_entries * self.EVICT_FRACTION)), len(self._slots))
+        if count == 0:
+            return
+
+        digests = list(self._slots)
+        slots = np.fromiter((self._slots[d] for d in digests), dtype=np.int64, count=len(digests))
+        oldest = np.argpartition(self._last_used[slots], count - 1)[:count]
+
+        for i in oldest:
+            del self._slots[digests[i]]
+            self._pending_free.append(int(slots[i]))
+
+        self.evictions += count
+        self._dirty = True
+
+    def _take_slots(self, count: int) -> List[int]:
+        """Reserve free slots for new entries, growing or evicting as needed"""
+        if len(self._free) < count:
+            self._grow(count - len(self._free))
+        if len(self._free) < count:
+            # Evicted slots are released once the index without them is saved
+            self._evict(count - len(self._free))
+            self.save()
+
+        count = min(count, len(self._free))
+        return [self._free.pop() for _ in range(count)]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_many(self, texts: List[str]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Look up cached embeddings
+
+        Args:
+            texts: Chunk texts
+
+        Returns:
+            Tuple of (float32 array of shape (len(texts), dimension) with cached
+            rows filled in, indexes of the texts that were not cached)
+        """
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        missing = []
+        hit_rows, hit_slots = [], []
+
+        for i, text in enumerate(texts):
+            slot = self._slots.get(text_digest(text))
+            if slot is None:
+                missing.append(i)
+            else:
+                hit_rows.append(i)
+                hit_slots.append(slot)
+
+        if hit_slots:
+            self._tick += 1
+            slots = np.asarray(hit_slots, dtype=np.int64)
+            vectors[hit_rows] = self._vectors[slots]
+            self._last_used[slots] = self._tick
+            self._dirty = True
+
+        self.hits += len(hit_rows)
+        self.misses += len(missing)
+        return vectors, missing
+
+    def put_many(self, texts: List[str], vectors) -> int:
+        """
+        Store embeddings (texts already cached are refreshed in place)
+
+        Args:
+            texts: Chunk texts
+            vectors: Embeddings, one row per text
+
+        Returns:
+            Number of embeddings stored
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dimension)
+        if len(vectors) != len(texts):
+            raise ValueError(f"Mismatch: {len(texts)} texts but {len(vectors)} vectors")
+
+        # Last occurrence of a text wins; the cache can only hold max_entries rows
+        rows = {text_digest(text): i for i, text in enumerate(texts)}
+        items = list(rows.items())[-self.max_entries:]
+
+        # Mark entries being refreshed as recently used so eviction spares them
+        self._tick += 1
+        cached = [self._slots[digest] for digest, _ in items if digest in self._slots]
+        self._last_used[np.asarray(cached, dtype=np.int64)] = self._tick
+
+        new = [digest for digest, _ in items if digest not in self._slots]
+        slots = self._take_slots(len(new))
+        for digest, slot in zip(new, slots):
+            self._slots[digest] = slot
+
+        stored = [(self._slots[digest], row) for digest, row in items if digest in self._slots]
+        if not stored:
+            return 0
+
+        slot_array = np.asarray([slot for slot, _ in stored], dtype=np.int64)
+        self._vectors[slot_array] = vectors[[row for _, row in stored]].astype(self.dtype)
+        self._last_used[slot_array] = self._tick
+        self._dirty = True
+
+        return len(stored)
+
+    def save(self) -> None:
+        """Flush vectors and atomically write the key index"""
+        if not self._dirty:
+            return
+
+        if self._vectors is not None:
+            self._vectors.flush()
+
+        digests = list(self._slots)
+        slots = np.fromiter((self._slots[d] for d in digests), dtype=np.int64, count=len(digests))
+        digest_array = np.frombuffer(b"".join(digests), dtype="S32") if digests else np.zeros(0, dtype="S32")
+
+        tmp_index = self.directory / "index.tmp.npz"
+        with open(tmp_index, "wb") as f:
+            np.savez(f, digests=digest_array, slots=slots, last_used=self._last_used[slots])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_index, self.directory / "index.npz")
+
+        tmp_meta = self.directory / "meta.json.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump({
+                "provider": self.provider,
+                "model": self.model,
+                "dimension": self.dimension,
+                "dtype": self.dtype,
+                "capacity": self._capacity,
+                "tick": self._tick
+            }, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_meta, self.directory / "meta.json")
+
+        # Evicted slots are no longer referenced on disk
+        self._free.extend(self._pending_free)
+        self._pending_free = []
+        self._dirty = False
+
+    def clear(self) -> None:
+        """Delete every cached embedding"""
+        self._reset_files()
+        self.evictions = 0
+        self._dirty = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        row_bytes = self.dimension * np.dtype(self.dtype).itemsize
+
+        return {
+            "path": str(self.directory),
+            "entries": len(self._slots),
+            "max_entries": self.max_entries,
+            "dtype": self.dtype,
+            "size_mb": round(self._capacity * row_bytes / (1024 * 1024), 2),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions
+        }
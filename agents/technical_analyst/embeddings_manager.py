@@ -4,48 +4,168 @@ Embeddings Manager for RAG system
 Supports:
 - sentence-transformers (local, free, multilingual) - current implementation
 - OpenAI embeddings (cloud, paid, high quality) - future migration
+- ONNX Runtime (local, int8-quantized export of the sentence-transformers
+  model, faster on CPU) - see onnx_embeddings
 
 Architecture allows easy switching between implementations by changing config.
+
+Embeddings are returned as contiguous float32 NumPy arrays (one row per text),
+never as nested Python lists: a list of floats costs ~8x the memory of the
+array and every conversion boxes each value.
 """
 
-from typing import List, Literal
+from typing import List, Literal, Optional
 from pathlib import Path
+import threading
+
+import numpy as np
+
+from .embedding_cache import EmbeddingCache
+
+
+def as_float32(vectors) -> np.ndarray:
+    """Contiguous float32 array from an encoder output or API response (no copy if already one)"""
+    return np.ascontiguousarray(vectors, dtype=np.float32)
 
 
 class EmbeddingsManager:
     """
     Manages embeddings generation with multiple providers
 
-    Supports both local (sentence-transformers) and cloud (OpenAI) providers.
-    Configuration determines which provider to use.
+    Supports local (sentence-transformers or its quantized ONNX export) and
+    cloud (OpenAI) providers. Configuration determines which provider to use.
+
+    Document embeddings can be cached on disk (see EmbeddingCache), so texts
+    that were already embedded by the same provider/model are not recomputed.
+
+    With lazy=True the model is loaded by the first embed call (or load(),
+    e.g. from a warm-up thread) instead of by the constructor.
     """
 
     def __init__(
         self,
-        provider: Literal["local", "openai"] = "local",
-        model: str = "all-MiniLM-L6-v2"
+        provider: Literal["local", "onnx", "openai"] = "local",
+        model: str = "all-MiniLM-L6-v2",
+        cache_dir: Optional[str] = None,
+        cache_max_entries: int = 200000,
+        cache_dtype: str = "float16",
+        lazy: bool = False,
+        config=None
     ):
         """
         Initialize embeddings manager
 
         Args:
-            provider: "local" (sentence-transformers) or "openai"
+            provider: "local" (sentence-transformers), "onnx" (ONNX Runtime) or "openai"
             model: Model name
-                - local: "all-MiniLM-L6-v2" (384 dim, fast)
+                - local/onnx: "all-MiniLM-L6-v2" (384 dim, fast)
                         "paraphrase-multilingual-mpnet-base-v2" (768 dim, better quality)
                 - openai: "text-embedding-3-small" (1536 dim)
+            cache_dir: Directory of the persistent document embedding cache (None disables it)
+            cache_max_entries: Maximum number of cached embeddings (LRU eviction)
+            cache_dtype: Storage type of cached vectors ("float16" or "float32")
+            lazy: Defer loading the model (and opening the cache) to first use
+            config: RAGConfig instance with the onnx/openai provider settings
+                (default: RAGConfig)
         """
         self.provider = provider
         self.model = model
-        self.embedder = None
-        self.dimension = None
+        self.config = config
+        self._embedder = None
+        self._dimension = None
+        self._cache = None
+        self._cache_settings = (cache_dir, cache_max_entries, cache_dtype)
+        self._onnx_variant = None  # "int8" or "fp32", set when the ONNX model loads
+        self._pool = None  # sentence-transformers multi-process pool (see start_pool)
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._loader = None  # thread running _initialize_embeddings
+
+        if not lazy:
+            self.load()
+
+    def load(self) -> "EmbeddingsManager":
+        """
+        Load the embeddings model and open the cache (once; thread-safe)
 
-        self._initialize_embeddings()
+        Returns:
+            self
+        """
+        if self._loaded:
+            return self
+
+        with self._load_lock:
+            if not self._loaded:
+                self._loader = threading.current_thread()
+                try:
+                    self._initialize_embeddings()
+                finally:
+                    self._loader = None
+
+                cache_dir, cache_max_entries, cache_dtype = self._cache_settings
+                if cache_dir:
+                    self._cache = EmbeddingCache(
+                        cache_dir,
+                        provider=self.provider,
+                        model=self._cache_model(),
+                        dimension=self._dimension,
+                        max_entries=cache_max_entries,
+                        dtype=cache_dtype
+                    )
+                self._loaded = True
+
+        return self
+
+    def _cache_model(self) -> str:
+        """Model key of the embedding cache (the ONNX variant embeds differently per quantization)"""
+        if self.provider == "onnx":
+            return f"{self.model}:{self._onnx_variant}"
+        return self.model
+
+    def _setting(self, name: str):
+        """Provider setting from the config passed in (RAGConfig default for missing ones)"""
+        from .config import RAGConfig
+
+        return getattr(self.config, name, getattr(RAGConfig, name))
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model has been loaded"""
+        return self._loaded
+
+    @property
+    def embedder(self):
+        """Provider client (SentenceTransformer, OnnxEncoder or OpenAI), loaded on first access"""
+        if not self._loaded and self._loader is not threading.current_thread():
+            self.load()
+        return self._embedder
+
+    @embedder.setter
+    def embedder(self, embedder) -> None:
+        self._embedder = embedder
+
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension (loads the model)"""
+        if not self._loaded and self._loader is not threading.current_thread():
+            self.load()
+        return self._dimension
+
+    @dimension.setter
+    def dimension(self, dimension: int) -> None:
+        self._dimension = dimension
+
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        """Persistent document embedding cache (opened with the model)"""
+        return self.load()._cache
 
     def _initialize_embeddings(self) -> None:
         """Initialize the embeddings model based on provider"""
         if self.provider == "local":
             self._initialize_local()
+        elif self.provider == "onnx":
+            self._initialize_onnx()
         elif self.provider == "openai":
             self._initialize_openai()
         else:
@@ -59,15 +179,15 @@ class EmbeddingsManager:
             print(f"🔄 Loading local embeddings model: {self.model}")
             print("   (First time may take a few minutes to download model...)")
 
-            self.embedder = SentenceTransformer(self.model)
+            self._embedder = SentenceTransformer(self.model)
 
             # Get embedding dimension
-            self.dimension = self.embedder.get_sentence_embedding_dimension()
+            self._dimension = self._embedder.get_sentence_embedding_dimension()
 
             print(f"✅ Local embeddings loaded successfully!")
             print(f"   Model: {self.model}")
-            print(f"   Dimension: {self.dimension}")
-            print(f"   Device: {self.embedder.device}")
+            print(f"   Dimension: {self._dimension}")
+            print(f"   Device: {self._embedder.device}")
 
         except ImportError:
             print("❌ sentence-transformers not installed. Run: pip install sentence-transformers")
@@ -76,20 +196,54 @@ class EmbeddingsManager:
             print(f"❌ Error loading local embeddings: {e}")
             raise
 
+    def _initialize_onnx(self) -> None:
+        """Initialize the ONNX Runtime encoder (exports the model on first use)"""
+        try:
+            from .onnx_embeddings import CONFIG_FILE, INT8_FILE, OnnxEncoder, export_onnx_model, model_dir_for
+
+            quantize = self._setting("ONNX_QUANTIZE")
+            model_dir = model_dir_for(self._setting("ONNX_MODEL_PATH"), self.model)
+            if not (model_dir / CONFIG_FILE).exists():
+                print(f"   No ONNX export of {self.model} yet (one-off, needs sentence-transformers and torch)")
+                export_onnx_model(self.model, model_dir, quantize=quantize)
+
+            self._embedder = OnnxEncoder(model_dir, quantized=quantize, threads=self._setting("ONNX_THREADS"))
+            self._dimension = self._embedder.get_sentence_embedding_dimension()
+            # An fp32-only export runs fp32 even when int8 is requested
+            self._onnx_variant = "int8" if Path(self._embedder.model_path).name == INT8_FILE else "fp32"
+
+            print(f"✅ ONNX embeddings loaded successfully!")
+            print(f"   Model: {self._embedder.model_path}")
+            print(f"   Dimension: {self._dimension}")
+
+        except ImportError:
+            print("❌ onnxruntime not installed. Run: pip install onnxruntime tokenizers")
+            raise
+        except Exception as e:
+            print(f"❌ Error loading ONNX embeddings: {e}")
+            raise
+
     def _initialize_openai(self) -> None:
-        """Initialize OpenAI embeddings (cloud, future)"""
+        """Initialize the batched OpenAI embeddings client (see openai_embeddings)"""
         try:
-            from openai import OpenAI
             import os
+            from .openai_embeddings import OpenAIEmbeddingsClient
 
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = self._setting("OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError(
                     "OPENAI_API_KEY not found in environment. "
                     "Set it in .env file or export OPENAI_API_KEY=your-key"
                 )
 
-            self.embedder = OpenAI(api_key=api_key)
+            self._embedder = OpenAIEmbeddingsClient(
+                api_key,
+                model=self.model,
+                base_url=self._setting("OPENAI_BASE_URL"),
+                max_batch_tokens=self._setting("OPENAI_EMBEDDINGS_MAX_BATCH_TOKENS"),
+                max_concurrency=self._setting("OPENAI_EMBEDDINGS_CONCURRENCY"),
+                max_retries=self._setting("OPENAI_EMBEDDINGS_MAX_RETRIES")
+            )
 
             # Set dimension based on model
             dimension_map = {
@@ -97,20 +251,17 @@ class EmbeddingsManager:
                 "text-embedding-3-large": 3072,
                 "text-embedding-ada-002": 1536,
             }
-            self.dimension = dimension_map.get(self.model, 1536)
+            self._dimension = dimension_map.get(self.model, 1536)
 
             print(f"✅ OpenAI embeddings initialized!")
             print(f"   Model: {self.model}")
-            print(f"   Dimension: {self.dimension}")
+            print(f"   Dimension: {self._dimension}")
 
-        except ImportError:
-            print("❌ OpenAI SDK not installed. Run: pip install openai")
-            raise
         except Exception as e:
             print(f"❌ Error initializing OpenAI embeddings: {e}")
             raise
 
-    def embed_documents(self, texts: List[str], show_progress: bool = True) -> List[List[float]]:
+    def embed_documents(self, texts: List[str], show_progress: bool = True) -> np.ndarray:
         """
         Generate embeddings for multiple documents
 
@@ -119,64 +270,127 @@ class EmbeddingsManager:
             show_progress: Show progress bar (only for local)
 
         Returns:
-            List of embedding vectors (one per text)
+            float32 array of shape (len(texts), dimension)
         """
         if not texts:
-            return []
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+
+        if self.cache is None:
+            return self._embed_documents_uncached(texts, show_progress)
 
+        vectors, missing = self.cache.get_many(texts)
+        print(f"💾 Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            new_vectors = self._embed_documents_uncached(missing_texts, show_progress)
+            vectors[missing] = new_vectors
+            self.cache.put_many(missing_texts, new_vectors)
+        self.cache.save()
+
+        return vectors
+
+    def _embed_documents_uncached(self, texts: List[str], show_progress: bool) -> np.ndarray:
+        """Embed documents with the configured provider"""
         if self.provider == "local":
             return self._embed_documents_local(texts, show_progress)
+        elif self.provider == "onnx":
+            return self._embed_documents_onnx(texts)
         elif self.provider == "openai":
             return self._embed_documents_openai(texts)
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
 
-    def _embed_documents_local(self, texts: List[str], show_progress: bool) -> List[List[float]]:
+    def start_pool(self, workers: int) -> bool:
+        """
+        Start a multi-process encoder pool (one CPU worker process per core)
+
+        While the pool is running, embed_documents() splits its input across
+        the workers; results keep the input order.
+
+        Args:
+            workers: Number of encoder processes
+
+        Returns:
+            True if a pool was started (only the local provider supports it)
+        """
+        if self.provider != "local" or workers < 2:
+            return False
+        if self._pool is None:
+            print(f"🔄 Starting {workers} encoder processes...")
+            self._pool = self.embedder.start_multi_process_pool(target_devices=["cpu"] * workers)
+        return True
+
+    def get_tokenizer(self):
+        """
+        Get the tokenizer of the embedding model
+
+        Returns:
+            Hugging Face tokenizer (local provider, or onnx with transformers
+            installed), or None
+        """
+        if self.provider == "onnx":
+            return self.embedder.hf_tokenizer()
+        if self.provider != "local":
+            return None
+        return getattr(self.embedder, "tokenizer", None)
+
+    def stop_pool(self) -> None:
+        """Stop the multi-process encoder pool"""
+        if self._pool is not None:
+            self.embedder.stop_multi_process_pool(self._pool)
+            self._pool = None
+
+    def _embed_documents_local(self, texts: List[str], show_progress: bool) -> np.ndarray:
         """Embed documents using sentence-transformers"""
         try:
             print(f"🔄 Generating embeddings for {len(texts)} documents...")
 
-            embeddings = self.embedder.encode(
-                texts,
-                convert_to_numpy=True,
-                show_progress_bar=show_progress,
-                batch_size=32  # Process in batches for efficiency
-            )
+            if self._pool is not None:
+                embeddings = self.embedder.encode_multi_process(texts, self._pool, batch_size=32)
+            else:
+                embeddings = self.embedder.encode(
+                    texts,
+                    convert_to_numpy=True,
+                    show_progress_bar=show_progress,
+                    batch_size=32  # Process in batches for efficiency
+                )
 
-            # Convert numpy arrays to Python lists
-            embeddings_list = embeddings.tolist()
+            embeddings = as_float32(embeddings)
 
-            print(f"✅ Generated {len(embeddings_list)} embeddings")
+            print(f"✅ Generated {len(embeddings)} embeddings")
 
-            return embeddings_list
+            return embeddings
 
         except Exception as e:
             print(f"❌ Error generating local embeddings: {e}")
             raise
 
-    def _embed_documents_openai(self, texts: List[str]) -> List[List[float]]:
-        """Embed documents using OpenAI API"""
+    def _embed_documents_onnx(self, texts: List[str]) -> np.ndarray:
+        """Embed documents using ONNX Runtime"""
         try:
-            print(f"🔄 Generating OpenAI embeddings for {len(texts)} documents...")
+            print(f"🔄 Generating ONNX embeddings for {len(texts)} documents...")
 
-            # OpenAI has a limit of ~8000 tokens per request
-            # For large batches, we'd need to split into chunks
-            # For MVP, assuming reasonable batch sizes
+            embeddings = self.embedder.encode(texts, batch_size=32)
 
-            embeddings = []
+            print(f"✅ Generated {len(embeddings)} embeddings")
 
-            for i, text in enumerate(texts):
-                response = self.embedder.embeddings.create(
-                    input=text,
-                    model=self.model
-                )
-                embedding = response.data[0].embedding
-                embeddings.append(embedding)
+            return embeddings
 
-                if (i + 1) % 10 == 0:
-                    print(f"   Progress: {i + 1}/{len(texts)}")
+        except Exception as e:
+            print(f"❌ Error generating ONNX embeddings: {e}")
+            raise
+
+    def _embed_documents_openai(self, texts: List[str]) -> np.ndarray:
+        """Embed documents using OpenAI API (token-packed, concurrent requests)"""
+        try:
+            print(f"🔄 Generating OpenAI embeddings for {len(texts)} documents...")
+
+            embeddings = self.embedder.embed(texts)
 
-            print(f"✅ Generated {len(embeddings)} OpenAI embeddings")
+            stats = self.embedder.get_stats()
+            print(f"✅ Generated {len(embeddings)} OpenAI embeddings "
+                  f"({stats['requests']} requests, {stats['retries']} retries so far)")
 
             return embeddings
 
@@ -184,7 +398,7 @@ class EmbeddingsManager:
             print(f"❌ Error generating OpenAI embeddings: {e}")
             raise
 
-    def embed_query(self, text: str) -> List[float]:
+    def embed_query(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single query
 
@@ -192,19 +406,21 @@ class EmbeddingsManager:
             text: Query text to embed
 
         Returns:
-            Embedding vector
+            float32 array of shape (dimension,)
         """
         if not text:
             raise ValueError("Query text cannot be empty")
 
         if self.provider == "local":
             return self._embed_query_local(text)
+        elif self.provider == "onnx":
+            return self._embed_query_onnx(text)
         elif self.provider == "openai":
             return self._embed_query_openai(text)
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
 
-    def _embed_query_local(self, text: str) -> List[float]:
+    def _embed_query_local(self, text: str) -> np.ndarray:
         """Embed query using sentence-transformers"""
         try:
             embedding = self.embedder.encode(
@@ -212,24 +428,87 @@ class EmbeddingsManager:
                 convert_to_numpy=True
             )
 
-            return embedding.tolist()
+            return as_float32(embedding)
 
         except Exception as e:
             print(f"❌ Error generating local query embedding: {e}")
             raise
 
-    def _embed_query_openai(self, text: str) -> List[float]:
+    def _embed_query_onnx(self, text: str) -> np.ndarray:
+        """Embed query using ONNX Runtime"""
+        try:
+            return self.embedder.encode(text)
+
+        except Exception as e:
+            print(f"❌ Error generating ONNX query embedding: {e}")
+            raise
+
+    def _embed_query_openai(self, text: str) -> np.ndarray:
         """Embed query using OpenAI API"""
         try:
-            response = self.embedder.embeddings.create(
-                input=text,
-                model=self.model
+            return self.embedder.embed([text])[0]
+
+        except Exception as e:
+            print(f"❌ Error generating OpenAI query embedding: {e}")
+            raise
+
+    def embed_queries(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for several queries in one batch
+
+        Args:
+            texts: Query texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dimension), same order
+        """
+        if not texts:
+            return np.zeros((0, self.dimension or 0), dtype=np.float32)
+
+        if any(not text for text in texts):
+            raise ValueError("Query text cannot be empty")
+
+        if self.provider == "local":
+            return self._embed_queries_local(texts)
+        elif self.provider == "onnx":
+            return self._embed_queries_onnx(texts)
+        elif self.provider == "openai":
+            return self._embed_queries_openai(texts)
+        else:
+            raise ValueError(f"Unknown provider: {self.provider}")
+
+    def _embed_queries_local(self, texts: List[str]) -> np.ndarray:
+        """Embed a batch of queries using sentence-transformers"""
+        try:
+            embeddings = self.embedder.encode(
+                texts,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+                batch_size=32
             )
 
-            return response.data[0].embedding
+            return as_float32(embeddings)
 
         except Exception as e:
-            print(f"❌ Error generating OpenAI query embedding: {e}")
+            print(f"❌ Error generating local query embeddings: {e}")
+            raise
+
+    def _embed_queries_onnx(self, texts: List[str]) -> np.ndarray:
+        """Embed a batch of queries using ONNX Runtime"""
+        try:
+            return self.embedder.encode(texts, batch_size=32)
+
+        except Exception as e:
+            print(f"❌ Error generating ONNX query embeddings: {e}")
+            raise
+
+    def _embed_queries_openai(self, texts: List[str]) -> np.ndarray:
+        """Embed a batch of queries using OpenAI API (one request unless over the token budget)"""
+        try:
+            return self.embedder.embed(texts)
+
+        except Exception as e:
+            print(f"❌ Error generating OpenAI query embeddings: {e}")
             raise
 
     def get_dimension(self) -> int:
@@ -238,13 +517,18 @@ class EmbeddingsManager:
 
     def get_info(self) -> dict:
         """Get information about the embeddings manager"""
-        return {
+        info = {
             "provider": self.provider,
             "model": self.model,
             "dimension": self.dimension,
             "device": str(self.embedder.device) if hasattr(self.embedder, "device") else "cloud"
         }
 
+        if self.cache is not None:
+            info["cache"] = self.cache.get_stats()
+
+        return info
+
 
 if __name__ == "__main__":
     # Test embeddings manager
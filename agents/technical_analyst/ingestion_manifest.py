@@ -0,0 +1,305 @@
+"""
+Ingestion Manifest for RAG system
+
+Records, for every ingested file, the content hash, mtime, size and chunk IDs
+it produced. Persisted next to the vector index (manifest.json), it lets
+IngestionPipeline re-process only the files that were added or modified and
+remove the chunks of files that were deleted.
+
+While a run is in progress, IngestionCheckpoint (checkpoint.json) records the
+chunks already committed to the saved index, so an interrupted run can resume.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import os
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class IngestionManifest:
+    """
+    Manifest of ingested files: path -> {sha256, mtime, size, chunk_ids}
+
+    A file whose mtime and size match the manifest is considered unchanged
+    without reading it; otherwise its content hash decides. Changing the
+    chunking settings invalidates every entry. A file whose chunks were
+    dropped as duplicates of another file's chunks is re-processed when that
+    file changes, since its content is no longer indexed anywhere else.
+
+    Example:
+        >>> manifest = IngestionManifest("data/vector_store/faiss/manifest.json")
+        >>> diff = manifest.diff(files, chunk_settings={"chunk_size": 1000, "chunk_overlap": 200})
+        >>> diff["added"], diff["updated"], diff["removed"], diff["unchanged"]
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path: str):
+        """
+        Initialize manifest (loads it if the file exists)
+
+        Args:
+            path: Path of the manifest JSON file
+        """
+        self.path = Path(path)
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.settings: Dict[str, Any] = {}
+        self.load()
+
+    def load(self) -> bool:
+        """Load manifest from disk (an unreadable manifest is treated as empty)"""
+        if not self.path.exists():
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") != self.FORMAT:
+                return False
+            self.files = data["files"]
+            self.settings = data.get("settings", {})
+            return True
+        except (json.JSONDecodeError, IOError, KeyError) as e:
+            print(f"⚠️  Could not read ingestion manifest {self.path}: {e}")
+            self.files = {}
+            self.settings = {}
+            return False
+
+    def save(self) -> None:
+        """Atomically write the manifest"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path.with_suffix(".json.tmp")
+
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "format": self.FORMAT,
+                "settings": self.settings,
+                "files": self.files
+            }, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_file, self.path)
+
+    def clear(self) -> None:
+        """Forget every file (next diff reports all files as added)"""
+        self.files = {}
+
+    def diff(
+        self,
+        paths: List[Path],
+        chunk_settings: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Compare files on disk with the manifest
+
+        Args:
+            paths: Files currently in the knowledge base
+            chunk_settings: Chunking parameters; if they differ from the ones
+                recorded, every known file is reported as updated
+
+        Returns:
+            Dict of path lists: {added, updated, removed, unchanged}
+        """
+        settings_changed = chunk_settings is not None and chunk_settings != self.settings
+        result = {"added": [], "updated": [], "removed": [], "unchanged": []}
+        seen = set()
+
+        for path in paths:
+            key = str(path)
+            seen.add(key)
+            entry = self.files.get(key)
+
+            if entry is None:
+                result["added"].append(key)
+                continue
+
+            if settings_changed:
+                result["updated"].append(key)
+                continue
+
+            stat = path.stat()
+            if entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+                result["unchanged"].append(key)
+            elif entry["sha256"] == file_sha256(path):
+                # Touched but not modified: refresh the cheap check for next time
+                entry["mtime"] = stat.st_mtime
+                entry["size"] = stat.st_size
+                result["unchanged"].append(key)
+            else:
+                result["updated"].append(key)
+
+        result["removed"] = [key for key in self.files if key not in seen]
+
+        changed = set(result["updated"]) | set(result["removed"])
+        if changed:
+            dependents = [
+                key for key in result["unchanged"]
+                if any(dup["representative"]["source_path"] in changed
+                       for dup in self.files[key].get("duplicates", ()))
+            ]
+            result["unchanged"] = [key for key in result["unchanged"] if key not in dependents]
+            result["updated"].extend(dependents)
+
+        return result
+
+    def record(
+        self,
+        path: Path,
+        sha256: str,
+        chunk_ids: List[int],
+        duplicates: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Record the state of an ingested file
+
+        Args:
+            path: File path
+            sha256: Hash of the content that was actually ingested
+            chunk_ids: Stable IDs of the chunks it produced
+            duplicates: Chunks dropped as near-duplicates, each pointing to its
+                representative ({chunk_id, chunk_index, similarity, representative})
+        """
+        stat = Path(path).stat()
+        entry = {
+            "sha256": sha256,
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "chunk_ids": [int(chunk_id) for chunk_id in chunk_ids]
+        }
+        if duplicates:
+            entry["duplicates"] = duplicates
+        self.files[str(path)] = entry
+
+    def remove(self, path: str) -> None:
+        """Forget a file"""
+        self.files.pop(path, None)
+
+
+class IngestionCheckpoint:
+    """
+    Progress of an in-progress ingestion run: path -> {sha256, chunk_ids,
+    committed, duplicates, complete}
+
+    Written atomically right after the vector store is saved, so every chunk
+    ID it lists as committed is in the saved index (a crash between the two
+    writes only leaves an older, smaller checkpoint). Removed once the run
+    completes and the manifest is updated.
+
+    Example:
+        >>> checkpoint = IngestionCheckpoint("data/vector_store/faiss/checkpoint.json")
+        >>> checkpoint.compatible(settings)  # True if a resumable run was interrupted
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path: str):
+        """
+        Initialize checkpoint (loads it if the file exists)
+
+        Args:
+            path: Path of the checkpoint JSON file
+        """
+        self.path = Path(path)
+        self.settings: Dict[str, Any] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.removed: List[str] = []
+        self.batches = 0
+        self.load()
+
+    def exists(self) -> bool:
+        """Whether an interrupted run left a checkpoint"""
+        return self.path.exists()
+
+    def load(self) -> bool:
+        """Load checkpoint from disk (an unreadable checkpoint is treated as empty)"""
+        if not self.path.exists():
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") != self.FORMAT:
+                return False
+            self.settings = data["settings"]
+            self.files = data["files"]
+            self.removed = data.get("removed", [])
+            self.batches = data.get("batches", 0)
+            return True
+        except (json.JSONDecodeError, IOError, KeyError) as e:
+            print(f"⚠️  Could not read ingestion checkpoint {self.path}: {e}")
+            self.settings, self.files, self.removed, self.batches = {}, {}, [], 0
+            return False
+
+    def compatible(self, settings: Dict[str, Any]) -> bool:
+        """Whether the checkpoint was written with the same chunking settings"""
+        return self.exists() and bool(self.files or self.removed) and self.settings == settings
+
+    def start(self, settings: Dict[str, Any], removed: List[str]) -> None:
+        """Begin a new run (nothing is written until save)"""
+        self.settings = settings
+        self.files = {}
+        self.removed = list(removed)
+        self.batches = 0
+
+    def record(
+        self,
+        path: str,
+        sha256: str,
+        chunk_ids: List[int],
+        committed: List[int],
+        duplicates: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Record the committed chunks of a file
+
+        Args:
+            path: File path
+            sha256: Hash of the content being ingested
+            chunk_ids: Stable IDs of every chunk of the file
+            committed: IDs of the chunks already in the saved index
+            duplicates: Chunks dropped as near-duplicates (never indexed)
+        """
+        duplicates = duplicates or []
+        accounted = set(committed) | {dup["chunk_id"] for dup in duplicates}
+
+        self.files[path] = {
+            "sha256": sha256,
+            "chunk_ids": [int(chunk_id) for chunk_id in chunk_ids],
+            "committed": [int(chunk_id) for chunk_id in committed],
+            "duplicates": duplicates,
+            "complete": accounted.issuperset(chunk_ids)
+        }
+
+    def save(self) -> None:
+        """Atomically write the checkpoint"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path.with_suffix(".json.tmp")
+
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "format": self.FORMAT,
+                "settings": self.settings,
+                "removed": self.removed,
+                "batches": self.batches,
+                "files": self.files
+            }, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_file, self.path)
+
+    def clear(self) -> None:
+        """Forget the run and delete the checkpoint file"""
+        self.settings, self.files, self.removed, self.batches = {}, {}, [], 0
+        self.path.unlink(missing_ok=True)
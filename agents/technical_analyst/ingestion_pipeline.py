@@ -9,14 +9,63 @@ Supports:
 - Text chunking with overlap
 - Batch processing
 - Progress tracking
+- Incremental re-ingestion (only added/modified files, via a manifest)
+- Streaming, bounded-memory batches
+- Parallel mode: process pool for loading/chunking, multi-process encoder
+- Near-duplicate chunk elimination (MinHash) before embedding
+- Periodic checkpoints and resuming of interrupted runs
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
+import hashlib
+import os
 import time
 import re
 
+from .chunk_store import make_chunk_id
+from .chunker import TextChunker, hf_token_starts
+from .dedup import NearDuplicateDetector
+from .ingestion_manifest import IngestionCheckpoint, IngestionManifest, file_sha256
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """Number of worker processes (0 or None = one per CPU core)"""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(workers, 1)
+
+
+def _ordered_pool_map(fn: Callable, items: Iterable, workers: int) -> Iterator:
+    """
+    Map fn over items in a process pool, yielding results in input order
+
+    At most a few tasks per worker are in flight, so results of a large
+    knowledge base are never all held in memory at once.
+    """
+    window = workers * 4
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _load_and_chunk_worker(task: Tuple[str, int, int, Any]):
+    """Process pool entry point: load and chunk one file"""
+    path, chunk_size, chunk_overlap, tokenizer = task
+    pipeline = IngestionPipeline(
+        None, None, chunk_size=chunk_size, chunk_overlap=chunk_overlap, tokenizer=tokenizer
+    )
+    return pipeline._load_and_chunk(path)
+
 
 class IngestionPipeline:
     """
@@ -27,22 +76,86 @@ class IngestionPipeline:
     2. Split into chunks (with overlap for context)
     3. Generate embeddings for each chunk
     4. Store in vector store with metadata
+
+    When the vector store lives on disk, a manifest (manifest.json next to the
+    index) records what each file produced, so re-runs only process added or
+    modified files and remove the chunks of deleted ones. A checkpoint
+    (checkpoint.json next to the manifest) lets an interrupted run resume.
     """
 
-    def __init__(self, vector_store, embeddings_manager, chunk_size: int = 1000, chunk_overlap: int = 200):
+    MANIFEST_FILE = "manifest.json"
+    CHECKPOINT_FILE = "checkpoint.json"
+    EMBEDDING_VALUE_BYTES = 8  # float32 embedding (4) + the vector store's normalized copy (4)
+
+    def __init__(
+        self,
+        vector_store,
+        embeddings_manager,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        manifest_path: Optional[str] = None,
+        batch_size: int = 256,
+        max_batch_memory_mb: float = 256,
+        workers: int = 1,
+        tokenizer=None,
+        dedup_threshold: float = 0.0,
+        checkpoint_every: int = 0
+    ):
         """
         Initialize ingestion pipeline
 
         Args:
             vector_store: VectorStoreInterface implementation
             embeddings_manager: EmbeddingsManager instance
-            chunk_size: Maximum characters per chunk
-            chunk_overlap: Characters to overlap between chunks
+            chunk_size: Maximum characters (tokens with a tokenizer) per chunk
+            chunk_overlap: Characters (tokens with a tokenizer) to overlap between chunks
+            manifest_path: Ingestion manifest file (default: manifest.json in the
+                vector store's index_path; None disables incremental ingestion
+                for stores without an index_path)
+            batch_size: Maximum chunks embedded and added per batch
+            max_batch_memory_mb: Memory ceiling of one batch (texts + embeddings)
+            workers: Worker processes for loading/chunking and local embedding
+                (1 = single process, 0 = one per CPU core)
+            tokenizer: Hugging Face fast tokenizer of the embedding model; when
+                given, chunk_size and chunk_overlap are token budgets
+            dedup_threshold: Drop chunks whose estimated Jaccard similarity to an
+                earlier chunk of the run reaches this value (0 disables)
+            checkpoint_every: Save the vector store and a checkpoint every N
+                batches, so an interrupted run can resume (0 disables; needs a
+                manifest)
         """
+        if batch_size < 1 or max_batch_memory_mb <= 0:
+            raise ValueError("batch_size and max_batch_memory_mb must be positive")
+        if not 0 <= dedup_threshold <= 1:
+            raise ValueError("dedup_threshold must be between 0 and 1")
+        if checkpoint_every < 0:
+            raise ValueError("checkpoint_every must not be negative")
+
         self.vector_store = vector_store
         self.embeddings = embeddings_manager
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.batch_size = batch_size
+        self.max_batch_memory_mb = max_batch_memory_mb
+        self.workers = workers
+        self.tokenizer = tokenizer
+        self.dedup_threshold = dedup_threshold
+        self.checkpoint_every = checkpoint_every
+        self.chunker = TextChunker(
+            chunk_size,
+            chunk_overlap,
+            token_starts=hf_token_starts(tokenizer) if tokenizer is not None else None
+        )
+
+        if manifest_path is None:
+            index_path = getattr(vector_store, "index_path", None)
+            if isinstance(index_path, (str, Path)):
+                manifest_path = Path(index_path) / self.MANIFEST_FILE
+        self.manifest = IngestionManifest(manifest_path) if manifest_path else None
+        self.checkpoint = (
+            IngestionCheckpoint(Path(manifest_path).parent / self.CHECKPOINT_FILE)
+            if manifest_path else None
+        )
 
     def _extract_frontmatter(self, content: str) -> tuple[Dict[str, str], str]:
         """
@@ -109,45 +222,64 @@ class IngestionPipeline:
 
         documents = []
         for file_path in sorted(markdown_files):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    raw_content = f.read()
-
-                # Extract frontmatter metadata (title, url, etc.)
-                frontmatter, content = self._extract_frontmatter(raw_content)
-
-                doc = {
-                    "filename": file_path.name,
-                    "content": content,  # Content without frontmatter
-                    "path": str(file_path),
-                    "title": frontmatter.get("title", file_path.stem),  # Use filename if no title
-                    "url": frontmatter.get("url", ""),  # Empty if no URL
-                    "source": frontmatter.get("source", ""),
-                    "category": frontmatter.get("category", ""),  # Category from source
-                    "date": frontmatter.get("date", "")
-                }
-
+            doc = self.load_markdown_file(file_path)
+            if doc is not None:
                 documents.append(doc)
 
-                # Display info
-                title_display = doc['title'][:50] + '...' if len(doc['title']) > 50 else doc['title']
-                url_display = f" | {doc['url']}" if doc['url'] else ""
-                print(f"Loaded: {title_display}{url_display}")
-                print(f"   File: {file_path.name} ({len(content)} chars)")
-
-            except Exception as e:
-                print(f"ERROR loading {file_path.name}: {e}")
-
         print(f"\nLoaded {len(documents)} documents")
         return documents
 
+    def load_markdown_file(self, file_path: Path) -> Optional[Dict[str, str]]:
+        """
+        Load a single markdown file
+
+        Args:
+            file_path: Path to the .md file
+
+        Returns:
+            Dict with keys: {filename, content, path, title, url, source, category,
+            date, sha256}, or None if the file could not be read
+        """
+        file_path = Path(file_path)
+
+        try:
+            with open(file_path, 'rb') as f:
+                raw_bytes = f.read()
+            raw_content = raw_bytes.decode('utf-8')
+
+            # Extract frontmatter metadata (title, url, etc.)
+            frontmatter, content = self._extract_frontmatter(raw_content)
+
+            doc = {
+                "filename": file_path.name,
+                "content": content,  # Content without frontmatter
+                "path": str(file_path),
+                "title": frontmatter.get("title", file_path.stem),  # Use filename if no title
+                "url": frontmatter.get("url", ""),  # Empty if no URL
+                "source": frontmatter.get("source", ""),
+                "category": frontmatter.get("category", ""),  # Category from source
+                "date": frontmatter.get("date", ""),
+                "sha256": hashlib.sha256(raw_bytes).hexdigest()  # Recorded in the manifest
+            }
+
+            # Display info
+            title_display = doc['title'][:50] + '...' if len(doc['title']) > 50 else doc['title']
+            url_display = f" | {doc['url']}" if doc['url'] else ""
+            print(f"Loaded: {title_display}{url_display}")
+            print(f"   File: {file_path.name} ({len(content)} chars)")
+
+            return doc
+
+        except Exception as e:
+            print(f"ERROR loading {file_path.name}: {e}")
+            return None
+
     def chunk_text(self, text: str, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Split text into overlapping chunks
 
-        Uses simple character-based chunking with overlap.
-        For production, could use langchain's RecursiveCharacterTextSplitter
-        with smart splitting on paragraphs/sentences.
+        Chunks end at paragraph or sentence boundaries (see TextChunker), with
+        sizes in characters or, when the pipeline has a tokenizer, in tokens.
 
         Args:
             text: Text to chunk
@@ -156,63 +288,63 @@ class IngestionPipeline:
         Returns:
             List of dicts with keys: {text, metadata}
         """
-        if not text:
-            return []
-
         chunks = []
-        start = 0
-
-        while start < len(text):
-            end = start + self.chunk_size
-
-            # Try to break at paragraph or sentence boundary
-            if end < len(text):
-                # Look for paragraph break (double newline)
-                para_break = text.rfind('\n\n', start, end)
-                if para_break > start:
-                    end = para_break + 2
-
-                # If no paragraph, look for sentence break
-                elif '.' in text[start:end]:
-                    sentence_break = text.rfind('.', start, end)
-                    if sentence_break > start:
-                        end = sentence_break + 1
-
-            chunk_text = text[start:end].strip()
-
-            if chunk_text:
-                chunk_metadata = {
-                    **metadata,
-                    "chunk_index": len(chunks),
-                    "start_char": start,
-                    "end_char": end
-                }
-
-                chunks.append({
-                    "text": chunk_text,
-                    "metadata": chunk_metadata
-                })
-
-            # Move start position (with overlap)
-            if end >= len(text):
-                break  # Exit loop when we've processed the entire text
-            start = max(end - self.chunk_overlap, start + 1)  # Ensure we always advance
+
+        for start, end, chunk_text in self.chunker.split(text):
+            chunk_metadata = {
+                **metadata,
+                "chunk_index": len(chunks),
+                "start_char": start,
+                "end_char": end
+            }
+
+            chunks.append({
+                "text": chunk_text,
+                "metadata": chunk_metadata
+            })
 
         return chunks
 
-    def ingest_from_directory(self, directory_path: str) -> Dict[str, Any]:
+    def ingest_from_directory(
+        self,
+        directory_path: str,
+        incremental: bool = True,
+        workers: Optional[int] = None,
+        resume: bool = False
+    ) -> Dict[str, Any]:
         """
         Ingest all markdown files from a directory
 
-        Full pipeline:
-        1. Load markdown files
-        2. Chunk each document
-        3. Generate embeddings for all chunks
-        4. Store in vector store
-        5. Save vector store to disk
+        Streaming pipeline (load -> chunk -> embed -> add), in batches of at
+        most batch_size chunks and max_batch_memory_mb, so peak memory does not
+        grow with the corpus and vectors are indexed as soon as a batch is ready:
+        1. Diff files against the manifest (only added/modified ones when incremental)
+        2. Remove chunks of modified and deleted files
+        3. Load and chunk files lazily
+        4. Drop near-duplicate chunks (when dedup_threshold > 0)
+        5. Embed and add each batch to the vector store (saving the store and a
+           checkpoint every checkpoint_every batches)
+        6. Save vector store and manifest to disk
+
+        With workers > 1, files are loaded and chunked in a process pool and
+        local embeddings are computed by a multi-process encoder pool; results
+        are merged in file order, so the index is identical to a serial run.
+
+        Deduplication only compares chunks of the files processed in this run;
+        each dropped chunk is recorded (in the stats and the manifest) with a
+        pointer to the metadata of the indexed chunk that represents it.
+
+        With resume=True, the checkpoint of an interrupted run (same chunking
+        settings) is used: files it completed are not loaded again and chunks
+        it committed are not embedded again. Files modified since are
+        re-ingested from scratch. Without resume, a leftover checkpoint is
+        discarded.
 
         Args:
             directory_path: Path to directory with markdown files
+            incremental: Skip files unchanged since the last run (needs a manifest)
+            workers: Worker processes (default: self.workers; 0 = one per CPU core)
+            resume: Continue an interrupted run from its last checkpoint
 
         Returns:
             Statistics dict with keys: {
@@ -220,82 +352,151 @@ class IngestionPipeline:
                 total_chunks,
                 total_embeddings,
                 time_elapsed,
-                files_processed
+                files_processed,
+                batches,
+                workers,
+                checkpoints,
+                diff: {added, updated, removed, unchanged},
+                dedup: {enabled, chunks_dropped, embeddings_saved,
+                        exact_duplicates, near_duplicates, duplicates},
+                resumed: {files, chunks}
             }
         """
         start_time = time.time()
+        workers = resolve_workers(self.workers if workers is None else workers)
 
         print("=" * 60)
         print("RAG INGESTION PIPELINE")
         print("=" * 60)
 
-        # Step 1: Load documents
-        print("\nStep 1: Loading markdown files...")
-        documents = self.load_markdown_files(directory_path)
-
-        if not documents:
+        # Step 1: Plan
+        print("\nStep 1: Scanning markdown files...")
+        diff = self._plan_ingestion(directory_path, incremental)
+        if self.manifest is not None:
+            print(f"Manifest: {len(diff['added'])} added, {len(diff['updated'])} updated, "
+                  f"{len(diff['removed'])} removed, {len(diff['unchanged'])} unchanged")
+
+        to_load = diff["added"] + diff["updated"]
+        diff_counts = {key: len(paths) for key, paths in diff.items()}
+        detector = NearDuplicateDetector(self.dedup_threshold) if self.dedup_threshold > 0 else None
+        duplicates: List[Dict[str, Any]] = []
+
+        # Resume: files and chunks already committed by an interrupted run
+        completed, skip_ids, stale, already_removed = self._plan_resume(resume, to_load)
+        to_load = [path for path in to_load if path not in {doc["path"] for doc in completed}]
+        resumed = {"files": len(completed), "chunks": sum(len(ids) for ids in skip_ids.values())}
+        if completed or skip_ids:
+            print(f"Resuming: {resumed['files']} files and {resumed['chunks']} chunks "
+                  f"of other files already committed")
+
+        if not to_load and not diff["removed"] and not completed:
+            if self.checkpoint is not None:
+                self.checkpoint.clear()
             return {
                 "documents_loaded": 0,
                 "total_chunks": 0,
                 "total_embeddings": 0,
                 "time_elapsed": 0,
-                "files_processed": []
-            }
-
-        # Step 2: Chunk documents
-        print(f"\nStep 2: Chunking documents (size={self.chunk_size}, overlap={self.chunk_overlap})...")
-        all_chunks = []
-        files_processed = []
-
-        for doc in documents:
-            metadata = {
-                "filename": doc["filename"],
-                "source_path": doc["path"],
-                "title": doc["title"],
-                "url": doc["url"],
-                "source": doc.get("source", ""),
-                "category": doc.get("category", ""),
-                "date": doc.get("date", "")
+                "files_processed": [],
+                "batches": 0,
+                "workers": workers,
+                "checkpoints": 0,
+                "diff": diff_counts,
+                "dedup": self._dedup_stats(detector, duplicates),
+                "resumed": resumed
             }
 
-            chunks = self.chunk_text(doc["content"], metadata)
-            all_chunks.extend(chunks)
-
-            files_processed.append({
-                "filename": doc["filename"],
-                "chunks": len(chunks),
-                "chars": len(doc["content"])
-            })
-
-            print(f"   {doc['filename']}: {len(chunks)} chunks")
-
-        print(f"\nTotal chunks: {len(all_chunks)}")
+        # Step 2: Remove chunks of modified and deleted files
+        to_delete = []
+        if self.manifest is not None:
+            # A modified file may now produce fewer chunks: drop all of its old ones
+            # (a resumed run already did, unless the file changed again)
+            to_delete = [path for path in diff["updated"] + diff["removed"] if path not in already_removed]
+            to_delete += [path for path in stale if path not in to_delete]
+            for path in to_delete:
+                self.vector_store.delete_by_source(path)
+
+        if self.checkpoint is not None:
+            self.checkpoint.start(self._chunk_settings(), sorted(already_removed | set(to_delete)))
+
+        # Steps 3-4: Stream load -> chunk -> embed -> add
+        print(f"\nStep 2: Chunking, embedding and storing in batches "
+              f"(size={self.chunk_size}, overlap={self.chunk_overlap}, "
+              f"batch={self.batch_size} chunks / {self.max_batch_memory_mb} MB, workers={workers})...")
+        # {path, sha256, chunk_ids} per loaded (or already completed) file
+        ingested: List[Dict[str, Any]] = [
+            {key: doc[key] for key in ("path", "sha256", "chunk_ids")} for doc in completed
+        ]
+        committed: Dict[str, List[int]] = {doc["path"]: doc["committed"] for doc in completed}
+        committed.update({path: sorted(ids) for path, ids in skip_ids.items()})
+        for doc in completed:
+            duplicates.extend({**dup, "source_path": doc["path"]} for dup in doc["duplicates"])
 
-        # Step 3: Generate embeddings
-        print(f"\nStep 3: Generating embeddings...")
-        texts = [chunk["text"] for chunk in all_chunks]
-        embeddings = self.embeddings.embed_documents(texts, show_progress=True)
-
-        print(f"Generated {len(embeddings)} embeddings")
-
-        # Step 4: Store in vector store
-        print(f"\nStep 4: Storing in vector store...")
-        metadatas = [chunk["metadata"] for chunk in all_chunks]
-        self.vector_store.add_documents(texts, embeddings, metadatas)
+        files_processed = []
+        total_chunks = 0
+        total_embeddings = 0
+        batches = 0
+        checkpoints = 0
+
+        encoder_pool = workers > 1 and self.embeddings.start_pool(workers)
+        try:
+            chunks = self._iter_chunks(to_load, ingested, files_processed, workers)
+            if detector is not None:
+                chunks = self._iter_unique(chunks, detector, duplicates)
+            if skip_ids:
+                chunks = self._iter_uncommitted(chunks, skip_ids)
+            for batch in self._iter_batches(chunks):
+                texts = [chunk["text"] for chunk in batch]
+                metadatas = [chunk["metadata"] for chunk in batch]
+
+                embeddings = self.embeddings.embed_documents(texts, show_progress=False)
+                self.vector_store.add_documents(texts, embeddings, metadatas)
+
+                batches += 1
+                total_chunks += len(batch)
+                total_embeddings += len(embeddings)
+                print(f"   Batch {batches}: {len(batch)} chunks (total: {total_chunks})")
+
+                for text, metadata in zip(texts, metadatas):
+                    committed.setdefault(metadata.get("source_path", ""), []).append(
+                        make_chunk_id(text, metadata)
+                    )
+
+                if self.checkpoint is not None and self.checkpoint_every and batches % self.checkpoint_every == 0:
+                    self._write_checkpoint(ingested, committed, duplicates, batches)
+                    checkpoints += 1
+        finally:
+            if encoder_pool:
+                self.embeddings.stop_pool()
 
         # Step 5: Save vector store
-        print(f"\nStep 5: Saving vector store to disk...")
+        print(f"\nStep 3: Saving vector store to disk...")
         self.vector_store.save()
 
+        if self.manifest is not None:
+            # Files that failed to load are retried on the next run
+            loaded_paths = {doc["path"] for doc in ingested}
+            failed = [path for path in to_load if path not in loaded_paths]
+            self._update_manifest(ingested, diff["removed"] + failed, duplicates)
+
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+
         # Calculate stats
         elapsed_time = time.time() - start_time
 
         stats = {
-            "documents_loaded": len(documents),
-            "total_chunks": len(all_chunks),
-            "total_embeddings": len(embeddings),
+            "documents_loaded": len(ingested) - len(completed),
+            "total_chunks": total_chunks,
+            "total_embeddings": total_embeddings,
             "time_elapsed": elapsed_time,
             "files_processed": files_processed,
+            "batches": batches,
+            "workers": workers,
+            "checkpoints": checkpoints,
+            "diff": diff_counts,
+            "dedup": self._dedup_stats(detector, duplicates),
+            "resumed": resumed,
             "timestamp": datetime.now().isoformat()
         }
 
@@ -305,13 +506,311 @@ class IngestionPipeline:
         print("=" * 60)
         print(f"Documents: {stats['documents_loaded']}")
         print(f"Chunks: {stats['total_chunks']}")
-        print(f"Embeddings: {stats['total_embeddings']}")
+        print(f"Embeddings: {stats['total_embeddings']} ({batches} batches, {checkpoints} checkpoints)")
+        if detector is not None:
+            print(f"Duplicates dropped: {len(duplicates)} chunks "
+                  f"({detector.exact_duplicates} exact, {detector.near_duplicates} near)")
+        print(f"Files: {diff_counts['added']} added, {diff_counts['updated']} updated, "
+              f"{diff_counts['removed']} removed, {diff_counts['unchanged']} unchanged")
         print(f"Time: {stats['time_elapsed']:.2f} seconds")
         print(f"Avg time per document: {stats['time_elapsed'] / max(stats['documents_loaded'], 1):.2f}s")
         print("=" * 60)
 
         return stats
 
+    def _plan_resume(
+        self,
+        resume: bool,
+        to_load: List[str]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, set], List[str], set]:
+        """
+        Work out what an interrupted run already committed
+
+        Only chunks still live in the loaded vector store count as committed.
+
+        Returns:
+            Tuple of (completed files [{path, sha256, chunk_ids, committed,
+            duplicates}], committed chunk IDs of partially ingested files,
+            files modified since they were partially ingested, paths whose
+            old chunks the interrupted run already removed)
+        """
+        if self.checkpoint is None or not self.checkpoint.exists():
+            return [], {}, [], set()
+
+        if not resume:
+            print("⚠️  Discarding the checkpoint of an interrupted run (use resume to continue it)")
+            self.checkpoint.clear()
+            return [], {}, [], set()
+
+        if not self.checkpoint.compatible(self._chunk_settings()):
+            print("⚠️  Checkpoint was written with other chunking settings: starting over")
+            self.checkpoint.clear()
+            return [], {}, [], set()
+
+        completed, skip_ids, stale = [], {}, []
+        for path in to_load:
+            entry = self.checkpoint.files.get(path)
+            if entry is None:
+                continue
+            if file_sha256(Path(path)) != entry["sha256"]:
+                stale.append(path)
+                continue
+
+            live = set(self.vector_store.live_ids(entry["committed"]))
+            if entry["complete"] and len(live) == len(entry["committed"]):
+                completed.append({"path": path, **entry})
+            elif live:
+                skip_ids[path] = live
+
+        return completed, skip_ids, stale, set(self.checkpoint.removed)
+
+    def _write_checkpoint(
+        self,
+        ingested: List[Dict[str, Any]],
+        committed: Dict[str, List[int]],
+        duplicates: List[Dict[str, Any]],
+        batches: int
+    ) -> None:
+        """Save the vector store, then record what it contains in the checkpoint"""
+        print(f"   💾 Checkpoint after batch {batches}...")
+        self.vector_store.save()
+
+        by_source = self._group_duplicates(duplicates)
+        for doc in ingested:
+            self.checkpoint.record(
+                doc["path"], doc["sha256"], doc["chunk_ids"],
+                committed.get(doc["path"], []), by_source.get(doc["path"])
+            )
+        self.checkpoint.batches = batches
+        self.checkpoint.save()
+
+    def _load_and_chunk(self, path: str) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Load and chunk one file
+
+        Returns:
+            Tuple of (file summary {path, sha256, chunk_ids, filename, chars},
+            chunks), or None if the file could not be read
+        """
+        doc = self.load_markdown_file(Path(path))
+        if doc is None:
+            return None
+
+        metadata = {
+            "filename": doc["filename"],
+            "source_path": doc["path"],
+            "title": doc["title"],
+            "url": doc["url"],
+            "source": doc.get("source", ""),
+            "category": doc.get("category", ""),
+            "date": doc.get("date", "")
+        }
+
+        chunks = self.chunk_text(doc["content"], metadata)
+
+        summary = {
+            "path": doc["path"],
+            "sha256": doc["sha256"],
+            "chunk_ids": [make_chunk_id(chunk["text"], chunk["metadata"]) for chunk in chunks],
+            "filename": doc["filename"],
+            "chars": len(doc["content"])
+        }
+        return summary, chunks
+
+    def _iter_chunks(
+        self,
+        paths: List[str],
+        ingested: List[Dict[str, Any]],
+        files_processed: List[Dict[str, Any]],
+        workers: int = 1
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Load and chunk files lazily, in file order
+
+        Only per-file summaries are kept (appended to ingested and
+        files_processed); document contents are released after chunking.
+        """
+        if workers > 1 and len(paths) > 1:
+            tasks = ((path, self.chunk_size, self.chunk_overlap, self.tokenizer) for path in paths)
+            results = _ordered_pool_map(_load_and_chunk_worker, tasks, workers)
+        else:
+            results = (self._load_and_chunk(path) for path in paths)
+
+        for result in results:
+            if result is None:
+                continue  # Unreadable file (already reported)
+
+            summary, chunks = result
+            ingested.append({key: summary[key] for key in ("path", "sha256", "chunk_ids")})
+            files_processed.append({
+                "filename": summary["filename"],
+                "chunks": len(chunks),
+                "chars": summary["chars"]
+            })
+
+            print(f"   {summary['filename']}: {len(chunks)} chunks")
+            yield from chunks
+
+    def _iter_unique(
+        self,
+        chunks: Iterable[Dict[str, Any]],
+        detector: NearDuplicateDetector,
+        duplicates: List[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Drop near-duplicate chunks
+
+        Each dropped chunk is appended to duplicates with a pointer to its
+        representative: {source_path, chunk_index, chunk_id, similarity,
+        representative: {id, source_path, filename, chunk_index}}.
+        """
+        for chunk in chunks:
+            metadata = chunk["metadata"]
+            chunk_id = make_chunk_id(chunk["text"], metadata)
+            ref = {
+                "id": chunk_id,
+                "source_path": metadata.get("source_path", ""),
+                "filename": metadata.get("filename", ""),
+                "chunk_index": metadata.get("chunk_index", 0)
+            }
+
+            match = detector.add(chunk["text"], ref)
+            if match is None:
+                yield chunk
+                continue
+
+            representative, similarity = match
+            duplicates.append({
+                "source_path": ref["source_path"],
+                "chunk_index": ref["chunk_index"],
+                "chunk_id": chunk_id,
+                "similarity": similarity,
+                "representative": representative
+            })
+
+    def _iter_uncommitted(
+        self,
+        chunks: Iterable[Dict[str, Any]],
+        skip_ids: Dict[str, set]
+    ) -> Iterator[Dict[str, Any]]:
+        """Skip chunks an interrupted run already committed"""
+        for chunk in chunks:
+            skip = skip_ids.get(chunk["metadata"].get("source_path", ""))
+            if skip and make_chunk_id(chunk["text"], chunk["metadata"]) in skip:
+                continue
+            yield chunk
+
+    def _dedup_stats(
+        self,
+        detector: Optional[NearDuplicateDetector],
+        duplicates: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Deduplication statistics (each dropped chunk saves one embedding and index slot)"""
+        if detector is None:
+            return {"enabled": False, "chunks_dropped": 0, "embeddings_saved": 0}
+
+        return {
+            "enabled": True,
+            **detector.get_stats(),
+            "chunks_dropped": len(duplicates),
+            "embeddings_saved": len(duplicates),
+            "duplicates": duplicates
+        }
+
+    def _iter_batches(self, chunks: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Group chunks into batches bounded by count and estimated memory
+
+        The estimate covers the chunk text plus its float32 embedding (what
+        embed_documents returns) and the copy the vector store normalizes.
+        """
+        dimension = getattr(self.embeddings, "dimension", None)
+        vector_bytes = dimension * self.EMBEDDING_VALUE_BYTES if isinstance(dimension, int) else 0
+        max_bytes = self.max_batch_memory_mb * 1024 * 1024
+
+        batch: List[Dict[str, Any]] = []
+        batch_bytes = 0
+
+        for chunk in chunks:
+            chunk_bytes = len(chunk["text"]) * 4 + vector_bytes
+            if batch and (len(batch) >= self.batch_size or batch_bytes + chunk_bytes > max_bytes):
+                yield batch
+                batch, batch_bytes = [], 0
+
+            batch.append(chunk)
+            batch_bytes += chunk_bytes
+
+        if batch:
+            yield batch
+
+    def _plan_ingestion(self, directory_path: str, incremental: bool) -> Dict[str, List[str]]:
+        """
+        Diff the knowledge base against the manifest
+
+        Returns:
+            Dict of path lists {added, updated, removed, unchanged}; without a
+            manifest every file is reported as added
+        """
+        directory = Path(directory_path)
+        if not directory.exists():
+            raise ValueError(f"Directory does not exist: {directory_path}")
+
+        markdown_files = sorted(directory.glob("**/*.md"))
+        if not markdown_files:
+            print(f"WARNING: No markdown files found in {directory_path}")
+
+        if self.manifest is None:
+            return {"added": [str(path) for path in markdown_files], "updated": [], "removed": [], "unchanged": []}
+
+        # The manifest only describes the index it was written with
+        if self.vector_store.get_stats()["total_documents"] == 0:
+            self.manifest.clear()
+
+        if not incremental:
+            # Re-ingest everything, but still remove chunks of deleted files
+            diff = self.manifest.diff(markdown_files)
+            known = diff["updated"] + diff["unchanged"]
+            return {"added": diff["added"], "updated": known, "removed": diff["removed"], "unchanged": []}
+
+        return self.manifest.diff(markdown_files, chunk_settings=self._chunk_settings())
+
+    def _update_manifest(
+        self,
+        ingested: List[Dict[str, Any]],
+        removed: List[str],
+        duplicates: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Record ingested files, forget removed (or unreadable) ones and save the manifest"""
+        by_source = self._group_duplicates(duplicates or [])
+
+        for doc in ingested:
+            self.manifest.record(
+                Path(doc["path"]), doc["sha256"], doc["chunk_ids"], by_source.get(doc["path"])
+            )
+        for path in removed:
+            self.manifest.remove(path)
+
+        self.manifest.settings = self._chunk_settings()
+        self.manifest.save()
+
+    @staticmethod
+    def _group_duplicates(duplicates: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group dropped-chunk records by source file (without the source_path key)"""
+        by_source: Dict[str, List[Dict[str, Any]]] = {}
+        for duplicate in duplicates:
+            record = {key: value for key, value in duplicate.items() if key != "source_path"}
+            by_source.setdefault(duplicate["source_path"], []).append(record)
+        return by_source
+
+    def _chunk_settings(self) -> Dict[str, Any]:
+        """Chunking parameters recorded in the manifest"""
+        return {
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "chunk_unit": self.chunker.unit,
+            "dedup_threshold": self.dedup_threshold
+        }
+
     def ingest_single_document(
         self,
         text: str,
@@ -0,0 +1,225 @@
+"""
+ONNX Runtime Embeddings for RAG system
+
+CPU inference of a sentence-transformers model exported to ONNX and
+dynamically quantized to int8, used by EmbeddingsManager(provider="onnx"):
+
+- export_onnx_model() exports the transformer of a SentenceTransformer model
+  (one-off; needs sentence-transformers, torch and onnx) and writes the
+  int8 model, the fp32 model, the tokenizer and onnx_config.json
+- OnnxEncoder runs it with onnxruntime and the fast `tokenizers` library only
+  (no torch at runtime), with the model's mean pooling and normalization
+
+Texts are encoded in batches sorted by length, so each batch is padded only
+to its own longest text.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import json
+
+import numpy as np
+
+
+CONFIG_FILE = "onnx_config.json"
+FP32_FILE = "model.onnx"
+INT8_FILE = "model_int8.onnx"
+
+
+def model_dir_for(base_dir: Union[str, Path], model: str) -> Path:
+    """Directory of the exported model ("sentence-transformers/x" -> base_dir/x)"""
+    return Path(base_dir) / model.replace("/", "__")
+
+
+def export_onnx_model(model: str, output_dir: Union[str, Path], quantize: bool = True,
+                      opset: int = 14) -> Path:
+    """
+    Export a sentence-transformers model to ONNX (and quantize it to int8)
+
+    The graph covers the transformer only (input ids -> token embeddings);
+    pooling and normalization run in NumPy, as configured in onnx_config.json.
+
+    Args:
+        model: sentence-transformers model name or path
+        output_dir: Directory to write the model files to
+        quantize: Also write the dynamically quantized int8 model
+        opset: ONNX opset version
+
+    Returns:
+        Path of output_dir
+
+    Raises:
+        ValueError: If the model does not use mean pooling
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"🔄 Exporting {model} to ONNX: {output_dir}")
+    st_model = SentenceTransformer(model, device="cpu")
+    transformer, pooling = st_model[0], st_model[1]
+    if not getattr(pooling, "pooling_mode_mean_tokens", False):
+        raise ValueError(f"Only mean-pooling models can be exported to ONNX: {model}")
+
+    hf_model = transformer.auto_model.eval()
+    tokenizer = transformer.tokenizer
+    tokenizer.save_pretrained(str(output_dir))
+
+    sample = tokenizer(["Exemplo de requisito técnico", "NVR"], padding=True, return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+
+    class TokenEmbeddings(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.model = hf_model
+
+        def forward(self, *inputs):
+            return self.model(**dict(zip(input_names, inputs))).last_hidden_state
+
+    axes = {0: "batch", 1: "sequence"}
+    fp32_path = output_dir / FP32_FILE
+    with torch.no_grad():
+        torch.onnx.export(
+            TokenEmbeddings(),
+            tuple(sample[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["token_embeddings"],
+            dynamic_axes={name: axes for name in input_names + ["token_embeddings"]},
+            opset_version=opset
+        )
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(str(fp32_path), str(output_dir / INT8_FILE), weight_type=QuantType.QInt8)
+
+    config = {
+        "model": model,
+        "dimension": st_model.get_sentence_embedding_dimension(),
+        "max_seq_length": st_model.max_seq_length,
+        "normalize": any(type(module).__name__ == "Normalize" for module in st_model),
+        "input_names": input_names,
+        "pad_token_id": tokenizer.pad_token_id,
+        "pad_token": tokenizer.pad_token,
+        "quantized": quantize
+    }
+    with open(output_dir / CONFIG_FILE, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2)
+
+    print(f"✅ ONNX model exported ({INT8_FILE if quantize else FP32_FILE}, dimension {config['dimension']})")
+    return output_dir
+
+
+def mean_pool(token_embeddings: np.ndarray, attention_mask: np.ndarray, normalize: bool) -> np.ndarray:
+    """Mean of the non-padding token embeddings (L2-normalized if requested)"""
+    mask = attention_mask[:, :, None].astype(np.float32)
+    embeddings = (token_embeddings * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+    if normalize:
+        embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+    return embeddings
+
+
+class OnnxEncoder:
+    """
+    Sentence encoder over an exported ONNX model (CPU)
+
+    Example:
+        >>> encoder = OnnxEncoder("data/models/onnx/all-MiniLM-L6-v2")
+        >>> vectors = encoder.encode(chunks)  # float32 array, one row per chunk
+    """
+
+    device = "cpu"
+
+    def __init__(self, model_dir: Union[str, Path], quantized: bool = True, threads: int = 0):
+        """
+        Load an exported model
+
+        Args:
+            model_dir: Directory written by export_onnx_model()
+            quantized: Run the int8 model (else the fp32 export)
+            threads: ONNX Runtime intra-op threads (0: one per physical core)
+
+        Raises:
+            FileNotFoundError: If the model directory has no export
+        """
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        self.model_dir = Path(model_dir)
+        config_path = self.model_dir / CONFIG_FILE
+        if not config_path.exists():
+            raise FileNotFoundError(f"No ONNX export in {self.model_dir} (missing {CONFIG_FILE})")
+        with open(config_path, encoding="utf-8") as f:
+            self.config: Dict[str, Any] = json.load(f)
+
+        model_file = INT8_FILE if quantized and self.config.get("quantized") else FP32_FILE
+        self.model_path = self.model_dir / model_file
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(
+            str(self.model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = self.config["input_names"]
+
+        self.tokenizer = Tokenizer.from_file(str(self.model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self.config["max_seq_length"])
+        self.tokenizer.enable_padding(pad_id=self.config["pad_token_id"], pad_token=self.config["pad_token"])
+
+        self.dimension: int = self.config["dimension"]
+        self.normalize: bool = self.config["normalize"]
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """Embedding dimension (SentenceTransformer-compatible)"""
+        return self.dimension
+
+    def encode(self, texts: Union[str, List[str]], batch_size: int = 32) -> np.ndarray:
+        """
+        Embed texts
+
+        Args:
+            texts: A text or list of texts
+            batch_size: Texts per inference call
+
+        Returns:
+            float32 array of shape (len(texts), dimension), input order
+            (shape (dimension,) for a single text)
+        """
+        if isinstance(texts, str):
+            return self.encode([texts], batch_size)[0]
+
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        # Longest first: batches of similar lengths need little padding
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            embeddings[batch] = self._encode_batch([texts[i] for i in batch])
+
+        return embeddings
+
+    def hf_tokenizer(self) -> Optional[Any]:
+        """Hugging Face fast tokenizer of the export (needs transformers), or None"""
+        try:
+            from transformers import AutoTokenizer
+        except ImportError:
+            return None
+        return AutoTokenizer.from_pretrained(str(self.model_dir))
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Token embeddings of one padded batch, pooled"""
+        encodings = self.tokenizer.encode_batch(texts)
+        attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+        columns = {
+            "input_ids": lambda: np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": lambda: attention_mask,
+            "token_type_ids": lambda: np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+        }
+        feeds = {name: columns[name]() for name in self.input_names}
+
+        token_embeddings = self.session.run(None, feeds)[0]
+        return mean_pool(token_embeddings, attention_mask, self.normalize)
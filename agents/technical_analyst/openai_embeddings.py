@@ -0,0 +1,330 @@
+"""
+OpenAI Embeddings Client for RAG system
+
+Batched, concurrent client of the OpenAI embeddings endpoint used by
+EmbeddingsManager(provider="openai"):
+
+- Texts are packed into requests by token count (tiktoken), up to
+  max_batch_tokens and 2048 inputs per request
+- Up to max_concurrency requests run at once over one pooled HTTP session
+- 429/5xx responses and connection errors are retried with exponential
+  backoff and jitter, honoring Retry-After and the x-ratelimit-reset-*
+  headers; a rate limit (429) pauses every worker, other failures back off
+  only the request that hit them
+
+Talks to the REST endpoint directly (requests), so base_url can point at any
+compatible server, e.g. a local stub in tests.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+import random
+import re
+import threading
+import time
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Endpoint limits: tokens per input and inputs per request
+MAX_INPUT_TOKENS = 8191
+MAX_INPUTS_PER_REQUEST = 2048
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Seconds of an x-ratelimit-reset-* header ("20ms", "1s", "6m0s") or Retry-After ("2")"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    units = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+    parts = _DURATION.findall(value)
+    return sum(float(amount) * units[unit] for amount, unit in parts) if parts else None
+
+
+class TokenCounter:
+    """
+    Token counts and truncation with the model's tiktoken encoding
+
+    Falls back to a conservative estimate (3 characters per token) when the
+    encoding cannot be loaded, e.g. offline without a tiktoken cache.
+    """
+
+    CHARS_PER_TOKEN = 3
+
+    def __init__(self, model: str):
+        self.encoding = None
+        try:
+            import tiktoken
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            print(f"⚠️  tiktoken encoding unavailable ({type(e).__name__}): estimating token counts")
+
+    def count(self, text: str) -> int:
+        """Number of tokens of a text"""
+        if self.encoding is None:
+            return len(text) // self.CHARS_PER_TOKEN + 1
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Text cut to at most max_tokens tokens"""
+        if self.encoding is None:
+            return text[:(max_tokens - 1) * self.CHARS_PER_TOKEN]
+        return self.encoding.decode(self.encoding.encode(text, disallowed_special=())[:max_tokens])
+
+
+class OpenAIEmbeddingsClient:
+    """
+    Batched, concurrent, rate-limit aware OpenAI embeddings client
+
+    Example:
+        >>> client = OpenAIEmbeddingsClient(api_key, model="text-embedding-3-small")
+        >>> vectors = client.embed(chunks)  # float32 array, one row per chunk
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        base_url: str = "https://api.openai.com/v1",
+        max_batch_tokens: int = 100000,
+        max_concurrency: int = 4,
+        max_retries: int = 6,
+        timeout: float = 60.0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        token_counter: Optional[Callable[[str], int]] = None
+    ):
+        """
+        Initialize client
+
+        Args:
+            api_key: OpenAI API key
+            model: Embeddings model
+            base_url: API base URL (OpenAI or a compatible server)
+            max_batch_tokens: Token budget of one request
+            max_concurrency: Requests in flight at once (also the HTTP pool size)
+            max_retries: Retries of a request after 429/5xx/connection errors
+            timeout: Seconds per HTTP request
+            backoff_base: First retry delay in seconds (doubles per attempt, with jitter)
+            backoff_max: Maximum retry delay in seconds
+            token_counter: Token count function (default: tiktoken encoding of the model)
+        """
+        self.model = model
+        self.url = base_url.rstrip('/') + '/embeddings'
+        self.max_batch_tokens = max(1, max_batch_tokens)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        if token_counter is None:
+            self._tokens = TokenCounter(model)
+            self.count_tokens = self._tokens.count
+        else:
+            self._tokens = None
+            self.count_tokens = token_counter
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Shared rate-limit pause: no request starts before this time
+        self._pause_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'retries': 0, 'rate_limited': 0, 'tokens': 0, 'inputs': 0}
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts with as few, concurrent requests as the token budget allows
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dimension), input order
+
+        Raises:
+            RuntimeError: If a request fails permanently (non-retryable
+                status or retries exhausted)
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        # Inputs above the per-input limit are truncated (counted once each)
+        token_counts = [self.count_tokens(text) for text in texts]
+        if self._tokens is not None and max(token_counts) > MAX_INPUT_TOKENS:
+            texts = [self._tokens.truncate(text, MAX_INPUT_TOKENS) if count > MAX_INPUT_TOKENS else text
+                     for text, count in zip(texts, token_counts)]
+            token_counts = [min(count, MAX_INPUT_TOKENS) for count in token_counts]
+
+        batches = self.pack(token_counts)
+
+        if len(batches) == 1:
+            results = [self._request([texts[i] for i in batches[0]])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as pool:
+                results = list(pool.map(lambda batch: self._request([texts[i] for i in batch]), batches))
+
+        dimension = len(results[0][0])
+        vectors = np.empty((len(texts), dimension), dtype=np.float32)
+        for batch, embeddings in zip(batches, results):
+            vectors[batch] = embeddings
+        return vectors
+
+    def pack(self, token_counts: List[int]) -> List[List[int]]:
+        """
+        Group input indices into requests of at most max_batch_tokens tokens
+        and MAX_INPUTS_PER_REQUEST inputs (input order is kept)
+
+        Args:
+            token_counts: Token count of each input
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+
+        for i, tokens in enumerate(token_counts):
+            if current and (current_tokens + tokens > self.max_batch_tokens
+                            or len(current) >= MAX_INPUTS_PER_REQUEST):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Requests, retries, rate-limited responses, tokens and inputs so far"""
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections"""
+        self.session.close()
+
+    def _request(self, inputs: List[str]) -> np.ndarray:
+        """One embeddings request, retried on rate limits and transient errors"""
+        payload = {'input': inputs, 'model': self.model}
+
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_pause()
+            with self._lock:
+                self._stats['requests'] += 1
+
+            try:
+                response = self.session.post(self.url, json=payload, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = f"{type(e).__name__}: {e}"
+                delay = None
+                rate_limited = False
+            else:
+                if response.status_code == 200:
+                    self._observe_limits(response.headers)
+                    return self._parse(response.json(), len(inputs))
+
+                error = f"HTTP {response.status_code}: {self._error_message(response)}"
+                if response.status_code not in _RETRY_STATUS:
+                    raise RuntimeError(f"OpenAI embeddings request failed ({error})")
+
+                delay = self._retry_after(response.headers)
+                rate_limited = response.status_code == 429
+                if rate_limited:
+                    with self._lock:
+                        self._stats['rate_limited'] += 1
+
+            if attempt == self.max_retries:
+                break
+
+            if delay is None:
+                delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+            delay *= random.uniform(1.0, 1.25)
+            # A rate limit applies to the whole account: hold every worker.
+            # Server errors and dropped connections only back off this request.
+            if rate_limited:
+                self._pause(delay)
+            else:
+                time.sleep(delay)
+            with self._lock:
+                self._stats['retries'] += 1
+
+        raise RuntimeError(f"OpenAI embeddings request failed after {self.max_retries} retries ({error})")
+
+    def _parse(self, body: Dict[str, Any], expected: int) -> np.ndarray:
+        """Embeddings of a response, sorted by input index"""
+        data = sorted(body['data'], key=lambda item: item['index'])
+        if len(data) != expected:
+            raise RuntimeError(f"OpenAI embeddings response has {len(data)} embeddings, expected {expected}")
+
+        with self._lock:
+            self._stats['inputs'] += expected
+            self._stats['tokens'] += body.get('usage', {}).get('total_tokens', 0)
+        return np.asarray([item['embedding'] for item in data], dtype=np.float32)
+
+    def _retry_after(self, headers) -> Optional[float]:
+        """Server-suggested delay: Retry-After, else the longest x-ratelimit reset"""
+        retry_after = parse_reset(headers.get('retry-after'))
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        resets = [parse_reset(headers.get(name)) for name in
+                  ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens')]
+        resets = [reset for reset in resets if reset is not None]
+        return min(max(resets), self.backoff_max) if resets else None
+
+    def _observe_limits(self, headers) -> None:
+        """Pause before the budget runs out instead of waiting for a 429"""
+        try:
+            remaining_requests = int(headers.get('x-ratelimit-remaining-requests', 1))
+            remaining_tokens = int(headers.get('x-ratelimit-remaining-tokens', self.max_batch_tokens))
+        except ValueError:
+            return
+
+        if remaining_requests <= 0:
+            reset = parse_reset(headers.get('x-ratelimit-reset-requests'))
+        elif remaining_tokens < self.max_batch_tokens:
+            reset = parse_reset(headers.get('x-ratelimit-reset-tokens'))
+        else:
+            return
+
+        if reset:
+            self._pause(min(reset, self.backoff_max))
+
+    def _pause(self, seconds: float) -> None:
+        """Hold every worker for seconds from now"""
+        with self._lock:
+            self._pause_until = max(self._pause_until, time.monotonic() + seconds)
+
+    def _wait_for_pause(self) -> None:
+        """Sleep out a shared rate-limit pause"""
+        while True:
+            with self._lock:
+                remaining = self._pause_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    @staticmethod
+    def _error_message(response: requests.Response) -> str:
+        """Error message of an API error response"""
+        try:
+            return response.json()['error']['message']
+        except (ValueError, KeyError, TypeError):
+            return response.text[:200]
@@ -9,17 +9,32 @@ This module provides:
 - Integration with Document Structurer CSV outputs
 - Batch conformity analysis
 - Multi-format report generation
+- Streaming mode: CSV/JSONL rows appended as analyses complete
+- Resumable runs: per-requirement journal (see analysis_journal)
+- Cross-edital verdict cache with per-run hit rates (see verdict_cache)
+- Optional clustering of near-identical requirements (see requirement_clusters)
 """
 
-from typing import Dict, List, Any, Optional
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 import json
 import csv
 from datetime import datetime
 import time
 
-from agents.technical_analyst import QueryProcessor, RAGEngine
-from agents.technical_analyst.report import ConformityReport, ReportExporter
+import numpy as np
+
+from agents.technical_analyst import QueryProcessor, RAGEngine, RAGConfig
+from agents.technical_analyst.analysis_journal import AnalysisJournal
+from agents.technical_analyst.requirement_clusters import cluster_mapping, cluster_vectors, number_signature
+from agents.technical_analyst.verdict_cache import VerdictCache
+from agents.technical_analyst.report import (
+    ConformityReport,
+    ReportExporter,
+    RunningSummary,
+    StreamingReportWriter
+)
 
 
 class AnalysisPipeline:
@@ -38,21 +53,45 @@ class AnalysisPipeline:
 
     def __init__(
         self,
-        rag_engine: Optional[RAGEngine] = None,
-        output_dir: str = "output/analysis"
+        rag_engine: Optional[Union[RAGEngine, "Future[RAGEngine]"]] = None,
+        output_dir: str = "output/analysis",
+        verdict_cache: Optional[VerdictCache] = None,
+        cluster_threshold: Optional[float] = None,
+        show_progress: bool = True,
+        warm_up: bool = False,
+        top_k: int = 5
     ):
         """
         Initialize analysis pipeline
 
         Args:
-            rag_engine: RAG engine (will create default if not provided)
+            rag_engine: RAG engine, or a Future of one from RAGEngine.start_warm_up()
+                (will create default if not provided)
             output_dir: Directory for output files
+            verdict_cache: Cross-edital verdict cache (default: from RAG_VERDICT_CACHE_PATH,
+                disabled when empty)
+            cluster_threshold: Analyze only one representative of requirements whose
+                queries have cosine similarity >= threshold (default: RAG_CLUSTER_THRESHOLD;
+                0 disables)
+            show_progress: Print stage banners, a line per analyzed requirement
+                and the summary (warnings and errors are always printed)
+            warm_up: Build the default RAG engine and load its model in a background
+                thread, overlapping it with loading the requirements CSV
+            top_k: Evidence documents retrieved per requirement
         """
-        # Initialize components
-        self.rag = rag_engine or RAGEngine.from_config()
-        self.query_processor = QueryProcessor(self.rag)
+        # Initialize components (a warming engine is awaited on first use)
+        if rag_engine is None:
+            rag_engine = RAGEngine.start_warm_up() if warm_up else RAGEngine.from_config()
+        self._rag = rag_engine
+        self._query_processor = None
+        self.verdict_cache = verdict_cache if verdict_cache is not None else VerdictCache.from_config()
+        self.cluster_threshold = (
+            cluster_threshold if cluster_threshold is not None else RAGConfig.CLUSTER_THRESHOLD
+        )
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.show_progress = show_progress
+        self.top_k = top_k
 
         # Statistics
         self.stats = {
@@ -64,11 +103,28 @@ class AnalysisPipeline:
             'report_time': None
         }
 
+    @property
+    def rag(self) -> RAGEngine:
+        """RAG engine (waits for a background warm-up to finish)"""
+        if isinstance(self._rag, Future):
+            self._rag = self._rag.result()
+        return self._rag
+
+    @property
+    def query_processor(self) -> QueryProcessor:
+        """Query processor over the RAG engine"""
+        if self._query_processor is None:
+            self._query_processor = QueryProcessor(self.rag, verdict_cache=self.verdict_cache)
+        return self._query_processor
+
     def analyze_from_csv(
         self,
         csv_path: str,
         output_basename: Optional[str] = None,
-        export_formats: List[str] = ['json', 'csv', 'markdown']
+        export_formats: List[str] = ['json', 'csv', 'markdown'],
+        stream: bool = False,
+        resume: bool = False,
+        journal: bool = True
     ) -> ConformityReport:
         """
         Analyze requirements from Document Structurer CSV output
@@ -76,7 +132,13 @@ class AnalysisPipeline:
         Args:
             csv_path: Path to structured requirements CSV
             output_basename: Base name for output files (default: CSV filename)
-            export_formats: List of export formats ('json', 'csv', 'excel', 'markdown')
+            export_formats: List of export formats ('json', 'jsonl', 'csv', 'excel', 'markdown')
+            stream: Append each analysis to the CSV/JSONL outputs as it completes
+                instead of keeping all of them in memory (see _analyze_conformity)
+            resume: Skip requirements already recorded in this run's journal
+                (same requirement, settings and index version) and rebuild
+                the report from it
+            journal: Record each analysis in <basename>_journal.jsonl as it completes
 
         Returns:
             ConformityReport with complete analysis
@@ -87,50 +149,60 @@ class AnalysisPipeline:
         """
         self.stats['start_time'] = time.time()
 
-        print(f"\n{'='*70}")
-        print(f"🔍 ANÁLISE DE CONFORMIDADE - PIPELINE COMPLETO")
-        print(f"{'='*70}")
-        print(f"📄 CSV de Requisitos: {csv_path}")
-        print(f"{'='*70}\n")
+        self._log(f"\n{'='*70}")
+        self._log(f"🔍 ANÁLISE DE CONFORMIDADE - PIPELINE COMPLETO")
+        self._log(f"{'='*70}")
+        self._log(f"📄 CSV de Requisitos: {csv_path}")
+        self._log(f"{'='*70}\n")
 
         # Stage 1: Load requirements from CSV
-        print("📋 ETAPA 1/3: Carregamento de Requisitos")
+        self._log("📋 ETAPA 1/3: Carregamento de Requisitos")
         load_start = time.time()
         requirements, metadata = self._load_requirements_from_csv(csv_path)
         self.stats['extraction_time'] = time.time() - load_start
 
-        print(f"✅ Carregados: {len(requirements)} requisitos")
-        print(f"⏱️  Tempo: {self.stats['extraction_time']:.1f}s\n")
+        self._log(f"✅ Carregados: {len(requirements)} requisitos")
+        self._log(f"⏱️  Tempo: {self.stats['extraction_time']:.1f}s\n")
+
+        if output_basename is None:
+            output_basename = Path(csv_path).stem
 
         # Stage 2: Analyze conformity
-        print("🔍 ETAPA 2/3: Análise de Conformidade (RAG)")
+        self._log("🔍 ETAPA 2/3: Análise de Conformidade (RAG)")
         analysis_start = time.time()
-        analysis_results = self._analyze_conformity(requirements)
+        writer = self._open_stream(output_basename, export_formats) if stream else None
+        run_journal = self._open_journal(output_basename, resume) if journal else None
+        try:
+            analysis_results, summary = self._analyze_conformity(requirements, writer, run_journal)
+        finally:
+            if writer is not None:
+                writer.close()
+            if run_journal is not None:
+                run_journal.close()
+                self.stats['journal'] = run_journal.get_stats()
         self.stats['analysis_time'] = time.time() - analysis_start
 
-        print(f"✅ Analisados: {len(analysis_results)} requisitos")
-        print(f"⏱️  Tempo: {self.stats['analysis_time']:.1f}s\n")
+        self._log(f"✅ Analisados: {summary.total} requisitos")
+        self._log(f"⏱️  Tempo: {self.stats['analysis_time']:.1f}s\n")
 
         # Stage 3: Generate report
-        print("📊 ETAPA 3/3: Geração de Relatório")
+        self._log("📊 ETAPA 3/3: Geração de Relatório")
         report_start = time.time()
-        report = self._generate_report(metadata, requirements, analysis_results)
+        report = self._generate_report(metadata, requirements, analysis_results, summary)
         self.stats['report_time'] = time.time() - report_start
 
         self.stats['end_time'] = time.time()
         self.stats['total_duration'] = self.stats['end_time'] - self.stats['start_time']
 
-        print(f"✅ Relatório gerado")
-        print(f"⏱️  Tempo: {self.stats['report_time']:.1f}s\n")
+        self._log(f"✅ Relatório gerado")
+        self._log(f"⏱️  Tempo: {self.stats['report_time']:.1f}s\n")
 
         # Export
-        if output_basename is None:
-            output_basename = Path(csv_path).stem
-
-        self._export(report, output_basename, export_formats)
+        self._export(report, output_basename, export_formats, writer)
 
         # Print summary
-        self._print_summary(report)
+        if self.show_progress:
+            self._print_summary(report)
 
         return report
 
@@ -139,7 +211,10 @@ class AnalysisPipeline:
         requirements: List[Dict[str, Any]],
         metadata: Optional[Dict[str, Any]] = None,
         output_basename: str = "analysis",
-        export_formats: List[str] = ['json', 'csv', 'markdown']
+        export_formats: List[str] = ['json', 'csv', 'markdown'],
+        stream: bool = False,
+        resume: bool = False,
+        journal: bool = True
     ) -> ConformityReport:
         """
         Analyze requirements directly (without CSV file)
@@ -154,6 +229,9 @@ class AnalysisPipeline:
             metadata: Optional edital metadata
             output_basename: Base name for output files
             export_formats: List of export formats
+            stream: Append each analysis to the CSV/JSONL outputs as it completes
+            resume: Skip requirements already recorded in this run's journal
+            journal: Record each analysis in <output_basename>_journal.jsonl
 
         Returns:
             ConformityReport with complete analysis
@@ -167,38 +245,48 @@ class AnalysisPipeline:
         """
         self.stats['start_time'] = time.time()
 
-        print(f"\n{'='*70}")
-        print(f"🔍 ANÁLISE DE CONFORMIDADE - REQUISITOS DIRETOS")
-        print(f"{'='*70}")
-        print(f"📋 Total de Requisitos: {len(requirements)}")
-        print(f"{'='*70}\n")
+        self._log(f"\n{'='*70}")
+        self._log(f"🔍 ANÁLISE DE CONFORMIDADE - REQUISITOS DIRETOS")
+        self._log(f"{'='*70}")
+        self._log(f"📋 Total de Requisitos: {len(requirements)}")
+        self._log(f"{'='*70}\n")
 
         # Analyze conformity
-        print("🔍 Análise de Conformidade (RAG)")
+        self._log("🔍 Análise de Conformidade (RAG)")
         analysis_start = time.time()
-        analysis_results = self._analyze_conformity(requirements)
+        writer = self._open_stream(output_basename, export_formats) if stream else None
+        run_journal = self._open_journal(output_basename, resume) if journal else None
+        try:
+            analysis_results, summary = self._analyze_conformity(requirements, writer, run_journal)
+        finally:
+            if writer is not None:
+                writer.close()
+            if run_journal is not None:
+                run_journal.close()
+                self.stats['journal'] = run_journal.get_stats()
         self.stats['analysis_time'] = time.time() - analysis_start
 
-        print(f"✅ Analisados: {len(analysis_results)} requisitos")
-        print(f"⏱️  Tempo: {self.stats['analysis_time']:.1f}s\n")
+        self._log(f"✅ Analisados: {summary.total} requisitos")
+        self._log(f"⏱️  Tempo: {self.stats['analysis_time']:.1f}s\n")
 
         # Generate report
-        print("📊 Geração de Relatório")
+        self._log("📊 Geração de Relatório")
         report_start = time.time()
-        report = self._generate_report(metadata or {}, requirements, analysis_results)
+        report = self._generate_report(metadata or {}, requirements, analysis_results, summary)
         self.stats['report_time'] = time.time() - report_start
 
         self.stats['end_time'] = time.time()
         self.stats['total_duration'] = self.stats['end_time'] - self.stats['start_time']
 
-        print(f"✅ Relatório gerado")
-        print(f"⏱️  Tempo: {self.stats['report_time']:.1f}s\n")
+        self._log(f"✅ Relatório gerado")
+        self._log(f"⏱️  Tempo: {self.stats['report_time']:.1f}s\n")
 
         # Export
-        self._export(report, output_basename, export_formats)
+        self._export(report, output_basename, export_formats, writer)
 
         # Print summary
-        self._print_summary(report)
+        if self.show_progress:
+            self._print_summary(report)
 
         return report
 
@@ -274,26 +362,188 @@ class AnalysisPipeline:
 
         return requirements, metadata
 
-    def _analyze_conformity(self, requirements: List[Dict]) -> List[Any]:
+    def _open_stream(self, basename: str, formats: List[str]) -> StreamingReportWriter:
+        """Streaming writer for the formats that can be appended to (CSV/JSONL)"""
+        return StreamingReportWriter(
+            self.output_dir,
+            basename,
+            [fmt for fmt in formats if fmt in StreamingReportWriter.FORMATS]
+        )
+
+    def _open_journal(self, basename: str, resume: bool) -> AnalysisJournal:
+        """Open the run journal (loading its entries when resuming)"""
+        index_version = getattr(self.rag, 'index_version', None)
+        processor = self.query_processor
+        run_journal = AnalysisJournal(
+            self.output_dir / f"{basename}_journal.jsonl",
+            index_version=index_version() if callable(index_version) else "unknown",
+            settings={
+                'top_k': self.top_k,
+                'high_confidence': processor.high_confidence_threshold,
+                'low_confidence': processor.low_confidence_threshold,
+                'min_evidence': processor.min_evidence_count
+            }
+        )
+        run_journal.open(resume=resume)
+        return run_journal
+
+    def _analyze_conformity(
+        self,
+        requirements: List[Dict],
+        writer: Optional[StreamingReportWriter] = None,
+        journal: Optional[AnalysisJournal] = None
+    ) -> Tuple[List[Any], RunningSummary]:
         """
         Analyze conformity using Query Processor
 
+        The summary is aggregated as analyses complete. With a writer, each
+        analysis is appended to the streamed outputs and not kept in memory.
+        With a journal, journaled requirements are taken from it (in input
+        order) and every new analysis is journaled as soon as its batch
+        completes, so an interrupted run loses at most the batches in flight
+        (see QueryProcessor batch_size). With clustering, only cluster
+        representatives are analyzed (and journaled); members get their
+        representative's evidence and verdict.
+
         Args:
             requirements: List of requirement dictionaries
+            writer: Streaming writer (None = keep all analyses)
+            journal: Run journal (None = no journaling)
+
+        Returns:
+            Tuple of (ConformityAnalysis objects, running summary); the list
+            is empty when streaming
+        """
+        results = []
+        summary = writer.summary if writer is not None else RunningSummary()
+        cache_start = self.query_processor.get_stats()['verdict_cache'] if self.verdict_cache is not None else None
+
+        def emit(analysis):
+            if writer is not None:
+                writer.write(analysis)
+            else:
+                summary.add(analysis)
+                results.append(analysis)
+
+        labels = self._cluster_requirements(requirements)
+        if labels is None:
+            for _, analysis in self._iter_analyses(requirements, journal):
+                emit(analysis)
+        else:
+            positions = [i for i in range(len(requirements)) if labels[i] == i]
+            last_member = {label: i for i, label in enumerate(labels.tolist())}
+            # Matched by position: journaled analyses carry a deserialized
+            # copy of their requirement, not the input object
+            analyzed = (
+                (positions[k], analysis)
+                for k, analysis in self._iter_analyses([requirements[i] for i in positions], journal)
+            )
+            next_position, next_analysis = next(analyzed, (None, None))
+            done = {}  # Representative position -> analysis, until its last member
+
+            for i, req in enumerate(requirements):
+                label = int(labels[i])
+                if label == i:
+                    if next_position != i:
+                        continue  # Failed: its members are skipped too
+                    analysis = next_analysis
+                    next_position, next_analysis = next(analyzed, (None, None))
+                    if last_member[i] > i:
+                        done[i] = analysis
+                elif label in done:
+                    analysis = self.query_processor.reuse_analysis(req, done[label], top_k=self.top_k)
+                    analysis.metadata['cluster_representative'] = requirements[label].get('id')
+                    if last_member[label] == i:
+                        del done[label]
+                else:
+                    continue
+                emit(analysis)
+
+        if cache_start is not None:
+            # Hit rate of this run, from this pipeline's own lookups (the cache
+            # instance may serve several runs, concurrently in a batch)
+            cache_end = self.query_processor.get_stats()['verdict_cache']
+            hits = cache_end['hits'] - cache_start['hits']
+            misses = cache_end['misses'] - cache_start['misses']
+            self.stats['verdict_cache'] = {
+                'path': str(self.verdict_cache.path),
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0
+            }
+
+        return results, summary
+
+    def _iter_analyses(self, requirements: List[Dict], journal: Optional[AnalysisJournal] = None):
+        """
+        (position, analysis) of requirements in input order (failed ones
+        skipped), through the journal
+        """
+        journaled = [journal is not None and req in journal for req in requirements]
+        pending = [req for req, done in zip(requirements, journaled) if not done]
+        if len(pending) < len(requirements):
+            self._log(f"♻️  Retomando do journal: {len(requirements) - len(pending)} requisitos já "
+                      f"analisados, {len(pending)} pendentes")
+
+        # Fresh analyses arrive in input order; failed requirements are skipped
+        fresh = self.query_processor.iter_analyze_batch(
+            pending, top_k=self.top_k, show_progress=self.show_progress
+        )
+        next_fresh = next(fresh, None)
+
+        for i, (req, done) in enumerate(zip(requirements, journaled)):
+            if done:
+                yield i, journal.get(req)
+            elif next_fresh is not None and next_fresh.metadata.get('requirement') is req:
+                if journal is not None:
+                    journal.append(req, next_fresh)
+                yield i, next_fresh
+                next_fresh = next(fresh, None)
+
+    def _cluster_requirements(self, requirements: List[Dict]) -> Optional[Any]:
+        """
+        Cluster near-identical requirements (embedding every query once)
 
         Returns:
-            List of ConformityAnalysis objects
+            Representative position of each requirement, or None when
+            clustering is disabled or unavailable
         """
-        return self.query_processor.analyze_batch(
-            requirements,
-            show_progress=True
+        self.stats.pop('clustering', None)
+        if not self.cluster_threshold or len(requirements) < 2:
+            return None
+
+        embed_queries = getattr(self.rag, 'embed_queries', None)
+        if not callable(embed_queries):
+            print("⚠️  Agrupamento de requisitos indisponível: RAG engine sem embed_queries")
+            return None
+
+        queries = [self.query_processor._build_query(req) for req in requirements]
+        start = time.time()
+        labels = cluster_vectors(
+            embed_queries(queries),
+            self.cluster_threshold,
+            groups=[number_signature(query) for query in queries]
         )
 
+        representatives = int((labels == np.arange(len(labels))).sum())
+        self.stats['clustering'] = {
+            'threshold': self.cluster_threshold,
+            'requirements': len(requirements),
+            'representatives': representatives,
+            'time': round(time.time() - start, 3),
+            'clusters': cluster_mapping(requirements, labels)
+        }
+        self._log(f"🧩 Agrupamento: {len(requirements)} requisitos → {representatives} representantes "
+                  f"(similaridade >= {self.cluster_threshold})")
+
+        return labels
+
     def _generate_report(
         self,
         metadata: Dict,
         requirements: List[Dict],
-        analysis_results: List[Any]
+        analysis_results: List[Any],
+        summary: Optional[RunningSummary] = None
     ) -> ConformityReport:
         """
         Generate consolidated report
@@ -302,6 +552,7 @@ class AnalysisPipeline:
             metadata: Edital metadata
             requirements: List of requirements
             analysis_results: List of ConformityAnalysis objects
+            summary: Running summary of the analyses
 
         Returns:
             ConformityReport object
@@ -311,14 +562,16 @@ class AnalysisPipeline:
             requirements=requirements,
             analysis_results=analysis_results,
             timestamp=datetime.now().isoformat(),
-            pipeline_stats=self.stats
+            pipeline_stats=self.stats,
+            aggregates=summary
         )
 
     def _export(
         self,
         report: ConformityReport,
         basename: str,
-        formats: List[str]
+        formats: List[str],
+        writer: Optional[StreamingReportWriter] = None
     ):
         """
         Export report in multiple formats
@@ -327,20 +580,43 @@ class AnalysisPipeline:
             report: ConformityReport to export
             basename: Base filename
             formats: List of export formats
+            writer: Streaming writer that already wrote the CSV/JSONL outputs
         """
+        if not formats and writer is None:
+            return
+
         exporter = ReportExporter(report, self.output_dir)
 
-        print(f"💾 EXPORTANDO RESULTADOS")
-        print(f"{'='*70}")
+        self._log(f"💾 EXPORTANDO RESULTADOS")
+        self._log(f"{'='*70}")
 
         for fmt in formats:
+            if writer is not None:
+                if fmt in writer.paths:
+                    self._log(f"  ✅ {fmt.upper()}: {writer.paths[fmt]} (streaming)")
+                else:
+                    print(f"  ⚠️  {fmt.upper()}: not available in streaming mode (use csv/jsonl)")
+                continue
+
             try:
                 filepath = exporter.export(basename, fmt)
-                print(f"  ✅ {fmt.upper()}: {filepath}")
+                self._log(f"  ✅ {fmt.upper()}: {filepath}")
             except Exception as e:
                 print(f"  ❌ {fmt.upper()}: Error - {e}")
 
-        print(f"{'='*70}\n")
+        if writer is not None:
+            filepath = self.output_dir / f"{basename}_summary.json"
+            filepath.write_text(json.dumps({
+                'edital_metadata': report.edital_metadata,
+                'summary': report.get_summary(),
+                'critical_issues': report.get_critical_issues(),
+                'consolidated_recommendations': report.get_recommendations(),
+                'timestamp': report.timestamp,
+                'pipeline_stats': report.pipeline_stats
+            }, indent=2, ensure_ascii=False), encoding='utf-8')
+            self._log(f"  ✅ SUMMARY: {filepath}")
+
+        self._log(f"{'='*70}\n")
 
     def _print_summary(self, report: ConformityReport):
         """
@@ -362,9 +638,13 @@ class AnalysisPipeline:
         print(f"📈 Taxa de Conformidade Geral: {summary['overall_compliance_rate']:.1f}%")
         print(f"{'='*70}")
         print(f"⏱️  Tempo Total: {self.stats['total_duration']:.1f}s")
-        print(f"   ├─ Carregamento: {self.stats.get('extraction_time', 0):.1f}s")
-        print(f"   ├─ Análise: {self.stats.get('analysis_time', 0):.1f}s")
-        print(f"   └─ Relatório: {self.stats.get('report_time', 0):.1f}s")
+        print(f"   ├─ Carregamento: {self.stats.get('extraction_time') or 0:.1f}s")
+        print(f"   ├─ Análise: {self.stats.get('analysis_time') or 0:.1f}s")
+        print(f"   └─ Relatório: {self.stats.get('report_time') or 0:.1f}s")
+        verdict_cache = self.stats.get('verdict_cache')
+        if verdict_cache:
+            print(f"♻️  Cache de Vereditos: {verdict_cache['hits']}/"
+                  f"{verdict_cache['hits'] + verdict_cache['misses']} ({verdict_cache['hit_rate']:.0%})")
         print(f"{'='*70}\n")
 
         # Show critical issues if any
@@ -386,6 +666,11 @@ class AnalysisPipeline:
                 print(f"  • {rec}")
             print()
 
+    def _log(self, message: str) -> None:
+        """Print a progress message (silenced with show_progress=False, e.g. in batch runs)"""
+        if self.show_progress:
+            print(message)
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get pipeline execution statistics
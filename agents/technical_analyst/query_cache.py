@@ -0,0 +1,119 @@
+"""
+Query Cache for RAG system
+
+In-memory, bounded LRU caches used by RAGEngine to skip work for repeated
+queries: requirement descriptions such as "Câmeras IP 4MP" or
+"Armazenamento 30 dias" recur across editais and within a single edital.
+
+Entries can carry a version stamp. A lookup with a different version is a
+miss and drops the entry, so results cached against an older index are never
+served after documents are added, deleted or the index is reloaded.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import threading
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with hit/miss counters
+
+    A cache with max_entries <= 0 is disabled: lookups always miss and are
+    not counted, puts are ignored.
+
+    Example:
+        >>> cache = LRUCache(max_entries=1024)
+        >>> cache.put(("câmeras ip", 5, 0.7), results, version=3)
+        >>> cache.get(("câmeras ip", 5, 0.7), version=3)     # results
+        >>> cache.get(("câmeras ip", 5, 0.7), version=4)     # None (stale)
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum number of entries (<= 0 disables the cache)
+        """
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything"""
+        return self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, version: Any = None) -> Optional[Any]:
+        """
+        Look up a key
+
+        Args:
+            key: Cache key
+            version: Expected version stamp (entries stored with another one are stale)
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] != version:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, version: Any = None) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def items(self, version: Any = None) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of (key, value) pairs stored with the given version"""
+        with self._lock:
+            return [
+                (key, value) for key, (entry_version, value) in self._entries.items()
+                if entry_version == version
+            ]
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -28,14 +28,23 @@ Example:
     >>> print(f"Evidence: {len(result.evidence)} sources")
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, asdict
 from enum import Enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import json
+import threading
 from pathlib import Path
 
+import numpy as np
+
 from .rag_engine import RAGEngine
 
+if TYPE_CHECKING:
+    from .verdict_cache import VerdictCache
+
 
 class ConformityVerdict(Enum):
     """
@@ -71,6 +80,11 @@ class Evidence:
         """Convert to dictionary"""
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Evidence":
+        """Create from a to_dict() dictionary"""
+        return cls(**data)
+
 
 @dataclass
 class ConformityAnalysis:
@@ -109,6 +123,20 @@ class ConformityAnalysis:
             'metadata': self.metadata
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConformityAnalysis":
+        """Create from a to_dict() dictionary (e.g. a journal entry)"""
+        return cls(
+            requirement_id=data['requirement_id'],
+            conformity=ConformityVerdict(data['conformity']),
+            confidence=data['confidence'],
+            evidence=[Evidence.from_dict(e) for e in data['evidence']],
+            reasoning=data['reasoning'],
+            recommendations=list(data['recommendations']),
+            sources=list(data['sources']),
+            metadata=data['metadata']
+        )
+
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string"""
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
@@ -146,32 +174,42 @@ class QueryProcessor:
     def __init__(
         self,
         rag_engine: RAGEngine,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        verdict_cache: Optional["VerdictCache"] = None
     ):
         """
         Initialize Query Processor
 
         Args:
             rag_engine: RAG engine for knowledge retrieval
+            verdict_cache: Persistent cross-edital analysis cache (None = disabled)
             config: Optional configuration overrides
                 - high_confidence (float): Threshold for CONFORME verdict (default: 0.85)
                 - low_confidence (float): Threshold for NAO_CONFORME (default: 0.60)
                 - min_evidence (int): Minimum evidence sources required (default: 2)
+                - max_workers (int): analyze_batch worker threads (default: 1)
+                - batch_size (int): analyze_batch requirements searched together (default: 256)
         """
         self.rag = rag_engine
         self.config = config or {}
+        self.verdict_cache = verdict_cache
 
         # Thresholds for conformity analysis
         self.high_confidence_threshold = self.config.get('high_confidence', 0.85)
         self.low_confidence_threshold = self.config.get('low_confidence', 0.60)
         self.min_evidence_count = self.config.get('min_evidence', 2)
+        self.max_workers = self.config.get('max_workers', 1)
+        self.batch_size = self.config.get('batch_size', 256)
 
-        # Statistics
+        # Statistics (updated from analyze_batch worker threads)
+        self._stats_lock = threading.Lock()
         self._stats = {
             'total_analyzed': 0,
             'conforme_count': 0,
             'nao_conforme_count': 0,
-            'revisao_count': 0
+            'revisao_count': 0,
+            'verdict_cache_hits': 0,
+            'verdict_cache_misses': 0
         }
 
     def analyze_requirement(
@@ -208,6 +246,26 @@ class QueryProcessor:
         # 1. Extract query from requirement
         query = self._build_query(requirement)
 
+        cache_key = self._verdict_cache_key(query, top_k, similarity_threshold)
+        cached = self._cached_analysis(cache_key)
+        if cached is not None:
+            return self._reuse_analysis(requirement, query, cached, top_k)
+
+        analysis = self._analyze_query(requirement, query, top_k, similarity_threshold)
+
+        if cache_key is not None:
+            self.verdict_cache.put(cache_key[0], query, cache_key[1], analysis)
+
+        return analysis
+
+    def _analyze_query(
+        self,
+        requirement: Dict[str, Any],
+        query: str,
+        top_k: int,
+        similarity_threshold: Optional[float] = None
+    ) -> ConformityAnalysis:
+        """Search, score and build the analysis of a requirement query (no verdict cache)"""
         # 2. Search knowledge base using RAG
         search_params = {'top_k': top_k}
         if similarity_threshold is not None:
@@ -221,6 +279,116 @@ class QueryProcessor:
         # 4. Analyze conformity based on evidence
         verdict, confidence = self._analyze_conformity(requirement, evidence)
 
+        return self._build_analysis(
+            requirement, query, len(search_results), evidence, verdict, confidence, top_k
+        )
+
+    def _verdict_cache_key(
+        self,
+        query: str,
+        top_k: int,
+        similarity_threshold: Optional[float] = None
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Verdict cache key of a query
+
+        Returns:
+            Tuple of (cache key, knowledge base version), or None without a cache
+        """
+        if self.verdict_cache is None:
+            return None
+
+        if similarity_threshold is None:
+            similarity_threshold = getattr(getattr(self.rag, 'config', None), 'SIMILARITY_THRESHOLD', None)
+        index_version = getattr(self.rag, 'index_version', None)
+        kb_version = str(index_version()) if callable(index_version) else "unknown"
+
+        settings = {
+            'top_k': top_k,
+            'similarity_threshold': similarity_threshold,
+            'high_confidence': self.high_confidence_threshold,
+            'low_confidence': self.low_confidence_threshold,
+            'min_evidence': self.min_evidence_count
+        }
+        return self.verdict_cache.make_key(query, kb_version, settings), kb_version
+
+    def _cached_analysis(self, cache_key: Optional[Tuple[str, str]]) -> Optional[ConformityAnalysis]:
+        """
+        Verdict cache lookup of a _verdict_cache_key key, counted in this
+        processor's stats (the cache itself may be shared by concurrent runs)
+        """
+        if cache_key is None:
+            return None
+
+        cached = self.verdict_cache.get(cache_key[0])
+        with self._stats_lock:
+            self._stats['verdict_cache_hits' if cached is not None else 'verdict_cache_misses'] += 1
+        return cached
+
+    def reuse_analysis(
+        self,
+        requirement: Dict[str, Any],
+        analysis: ConformityAnalysis,
+        top_k: int = 5
+    ) -> ConformityAnalysis:
+        """
+        Analysis of a requirement reusing the evidence and verdict of another
+        requirement's analysis (e.g. of a near-identical requirement)
+
+        Args:
+            requirement: Requirement to analyze
+            analysis: Analysis whose evidence and verdict apply to it
+            top_k: Number of documents retrieved
+
+        Returns:
+            ConformityAnalysis of requirement (reasoning and metadata refer to it)
+        """
+        return self._reuse_analysis(requirement, self._build_query(requirement), analysis, top_k)
+
+    def _reuse_analysis(
+        self,
+        requirement: Dict[str, Any],
+        query: str,
+        cached: ConformityAnalysis,
+        top_k: int
+    ) -> ConformityAnalysis:
+        """Rebuild a cached analysis (evidence and verdict) for this requirement"""
+        return self._build_analysis(
+            requirement,
+            query,
+            cached.metadata.get('search_results_count', len(cached.evidence)),
+            cached.evidence,
+            cached.conformity,
+            cached.confidence,
+            top_k
+        )
+
+    def _build_analysis(
+        self,
+        requirement: Dict[str, Any],
+        query: str,
+        results_count: int,
+        evidence: List[Evidence],
+        verdict: ConformityVerdict,
+        confidence: float,
+        top_k: int
+    ) -> ConformityAnalysis:
+        """
+        Build the analysis of a scored requirement (shared by the serial, batch
+        and verdict cache paths)
+
+        Args:
+            requirement: Requirement being analyzed
+            query: Query used to search the knowledge base
+            results_count: Number of RAG engine search results
+            evidence: Evidence extracted from the search results
+            verdict: Conformity verdict
+            confidence: Confidence score
+            top_k: Number of documents retrieved
+
+        Returns:
+            ConformityAnalysis with reasoning and recommendations
+        """
         # 5. Generate human-readable reasoning
         reasoning = self._generate_reasoning(requirement, evidence, verdict)
 
@@ -245,7 +413,7 @@ class QueryProcessor:
             sources=list(set([e.source for e in evidence])),
             metadata={
                 'requirement': requirement,
-                'search_results_count': len(search_results),
+                'search_results_count': results_count,
                 'top_k': top_k,
                 'query': query
             }
@@ -355,6 +523,87 @@ class QueryProcessor:
 
         return verdict, confidence
 
+    def _analyze_conformity_batch(
+        self,
+        evidence_lists: List[List[Evidence]]
+    ) -> Tuple[List[ConformityVerdict], List[float]]:
+        """
+        Vectorized _analyze_conformity for many requirements
+
+        Relevances are accumulated column by column (evidence rank by rank),
+        the same left-to-right order as sum() in _analyze_conformity, so the
+        confidences are bit-identical to the serial path.
+
+        Args:
+            evidence_lists: Evidence of each requirement
+
+        Returns:
+            Tuple of (verdicts, confidence scores), one per requirement
+        """
+        counts = np.fromiter((len(evidence) for evidence in evidence_lists),
+                             dtype=np.int64, count=len(evidence_lists))
+        relevance = np.fromiter(
+            (e.relevance for evidence in evidence_lists for e in evidence),
+            dtype=np.float64, count=int(counts.sum())
+        )
+        offsets = np.cumsum(counts) - counts
+
+        total = np.zeros(len(counts))
+        best = np.full(len(counts), -np.inf)
+        for rank in range(int(counts.max()) if len(counts) else 0):
+            rows = np.flatnonzero(counts > rank)
+            values = relevance[offsets[rows] + rank]
+            total[rows] += values
+            best[rows] = np.maximum(best[rows], values)
+
+        has_evidence = counts > 0
+        confidence = np.zeros(len(counts))
+        confidence[has_evidence] = (
+            0.7 * (total[has_evidence] / counts[has_evidence]) + 0.3 * best[has_evidence]
+        )
+
+        conforme = (
+            has_evidence
+            & (confidence >= self.high_confidence_threshold)
+            & (counts >= self.min_evidence_count)
+        )
+        verdicts = [
+            ConformityVerdict.CONFORME if is_conforme else ConformityVerdict.REVISAO
+            for is_conforme in conforme.tolist()
+        ]
+
+        return verdicts, confidence.tolist()
+
+    def _score_batch(
+        self,
+        requirements: List[Dict[str, Any]],
+        top_k: int
+    ) -> Optional[List[Tuple[str, List[Dict[str, Any]], List[Evidence], ConformityVerdict, float]]]:
+        """
+        Search and score a batch of requirements at once
+
+        Builds every query first, embeds and searches them with one
+        RAG search_batch call and scores all evidence with NumPy.
+
+        Returns:
+            (query, search_results, evidence, verdict, confidence) per
+            requirement, or None when the batch cannot be searched together
+            (the caller then analyzes it one requirement at a time, isolating
+            failures exactly as before)
+        """
+        try:
+            queries = [self._build_query(requirement) for requirement in requirements]
+            batch_results = self.rag.search_batch(queries, top_k=top_k)
+            if not isinstance(batch_results, list) or len(batch_results) != len(queries):
+                return None
+
+            evidence_lists = [self._extract_evidence(results) for results in batch_results]
+            verdicts, confidences = self._analyze_conformity_batch(evidence_lists)
+        except Exception:
+            return None
+
+        return list(zip(queries, batch_results, evidence_lists, verdicts, confidences))
+
     def _generate_reasoning(
         self,
         requirement: Dict[str, Any],
@@ -461,15 +710,31 @@ class QueryProcessor:
         self,
         requirements: List[Dict[str, Any]],
         top_k: int = 5,
-        show_progress: bool = True
+        show_progress: bool = True,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None
     ) -> List[ConformityAnalysis]:
         """
         Analyze multiple requirements in batch
 
+        Requirements are embedded, searched and scored batch_size at a time
+        (see _score_batch); results are identical to calling
+        analyze_requirement() on each one. A batch that fails as a whole is
+        re-analyzed one requirement at a time, so only the failing
+        requirements are skipped.
+
+        With max_workers > 1, batches are analyzed concurrently by a thread
+        pool (overlapping embedding/search latency, e.g. of a remote
+        embeddings provider); batches shrink so every worker gets one and
+        results keep the input order.
+
         Args:
             requirements: List of technical requirements
             top_k: Number of relevant documents per requirement
             show_progress: Whether to show progress messages
+            batch_size: Requirements searched together (uses config default if None;
+                1 = one at a time)
+            max_workers: Worker threads (uses config default if None; 1 = sequential)
 
         Returns:
             List of ConformityAnalysis results
@@ -482,46 +747,176 @@ class QueryProcessor:
             >>> results = processor.analyze_batch(requirements)
             >>> print(f"Analyzed: {len(results)}/{len(requirements)}")
         """
-        results = []
+        return list(self.iter_analyze_batch(
+            requirements,
+            top_k=top_k,
+            show_progress=show_progress,
+            batch_size=batch_size,
+            max_workers=max_workers
+        ))
+
+    def iter_analyze_batch(
+        self,
+        requirements: List[Dict[str, Any]],
+        top_k: int = 5,
+        show_progress: bool = True,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[ConformityAnalysis]:
+        """
+        Generator variant of analyze_batch
+
+        Yields each analysis (in input order) as soon as its batch is done,
+        so callers can write results out without holding them all. At most
+        2 * max_workers batches are in flight at a time.
+
+        Args:
+            Same as analyze_batch()
+
+        Yields:
+            ConformityAnalysis of each successfully analyzed requirement
+
+        Example:
+            >>> for analysis in processor.iter_analyze_batch(requirements):
+            ...     writer.write(analysis)
+        """
         total = len(requirements)
+        analyzed = 0
 
         if show_progress:
             print(f"\n🔍 Analyzing {total} requirements...")
             print("=" * 60)
 
-        for i, req in enumerate(requirements, 1):
-            try:
-                if show_progress:
-                    req_id = req.get('id', 'UNKNOWN')
-                    print(f"[{i}/{total}] Analyzing {req_id}...", end=' ')
+        if batch_size is None:
+            batch_size = self.batch_size
+        if max_workers is None:
+            max_workers = self.max_workers
+        max_workers = max(1, max_workers)
+        batched = batch_size > 1
+
+        size = max(1, batch_size)
+        if max_workers > 1:
+            size = min(size, max(1, -(-total // max_workers)))
+        batches = [requirements[start:start + size] for start in range(0, total, size)]
+
+        executor = None
+        if max_workers > 1 and len(batches) > 1:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            outcomes = self._iter_concurrent(executor, batches, top_k, batched, 2 * max_workers)
+        else:
+            outcomes = (self._analyze_batch_chunk(batch, top_k, batched) for batch in batches)
+
+        # Outcomes arrive batch by batch in input order
+        i = 0
+        try:
+            for batch, batch_outcomes in zip(batches, outcomes):
+                for req, (analysis, error) in zip(batch, batch_outcomes):
+                    i += 1
+                    try:
+                        if show_progress:
+                            req_id = req.get('id', 'UNKNOWN')
+                            print(f"[{i}/{total}] Analyzing {req_id}...", end=' ')
+
+                        if error is not None:
+                            raise error
+
+                        if show_progress:
+                            print(f"✅ {analysis.conformity.value} ({analysis.confidence:.0%})")
+
+                    except Exception as e:
+                        req_id = req.get('id', 'UNKNOWN')
+                        print(f"\n❌ Error analyzing {req_id}: {e}")
+                        continue
+
+                    analyzed += 1
+                    yield analysis
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
-                analysis = self.analyze_requirement(req, top_k=top_k)
-                results.append(analysis)
+        if show_progress:
+            print("=" * 60)
+            print(f"✅ Batch analysis complete: {analyzed}/{total} successful\n")
 
-                if show_progress:
-                    print(f"✅ {analysis.conformity.value} ({analysis.confidence:.0%})")
+    def _iter_concurrent(
+        self,
+        executor: ThreadPoolExecutor,
+        batches: List[List[Dict[str, Any]]],
+        top_k: int,
+        batched: bool,
+        window: int
+    ) -> Iterator[List[Tuple[Optional[ConformityAnalysis], Optional[Exception]]]]:
+        """Batch outcomes in input order, keeping at most window batches in flight"""
+        pending = deque()
+        next_batch = iter(batches)
+
+        for batch in itertools.islice(next_batch, window):
+            pending.append(executor.submit(self._analyze_batch_chunk, batch, top_k, batched))
+
+        while pending:
+            outcomes = pending.popleft().result()
+            for batch in itertools.islice(next_batch, 1):
+                pending.append(executor.submit(self._analyze_batch_chunk, batch, top_k, batched))
+            yield outcomes
+
+    def _analyze_batch_chunk(
+        self,
+        requirements: List[Dict[str, Any]],
+        top_k: int,
+        batched: bool
+    ) -> List[Tuple[Optional[ConformityAnalysis], Optional[Exception]]]:
+        """
+        Analyze one batch of analyze_batch (runs in a worker thread when concurrent)
+
+        Returns:
+            (analysis, None) or (None, exception) per requirement, in order
+        """
+        outcomes = [None] * len(requirements)
 
+        # Verdict cache hits skip retrieval; the rest are searched together
+        pending = []
+        for offset, req in enumerate(requirements):
+            try:
+                query = self._build_query(req)
+                cache_key = self._verdict_cache_key(query, top_k)
+                cached = self._cached_analysis(cache_key)
+                if cached is not None:
+                    outcomes[offset] = (self._reuse_analysis(req, query, cached, top_k), None)
+                else:
+                    pending.append((offset, req, query, cache_key))
             except Exception as e:
-                req_id = req.get('id', 'UNKNOWN')
-                print(f"\n❌ Error analyzing {req_id}: {e}")
-                continue
+                outcomes[offset] = (None, e)
 
-        if show_progress:
-            print("=" * 60)
-            print(f"✅ Batch analysis complete: {len(results)}/{total} successful\n")
+        scored = self._score_batch([req for _, req, _, _ in pending], top_k) if batched and pending else None
 
-        return results
+        for i, (offset, req, query, cache_key) in enumerate(pending):
+            try:
+                if scored is not None:
+                    _, results, evidence, verdict, confidence = scored[i]
+                    analysis = self._build_analysis(
+                        req, query, len(results), evidence, verdict, confidence, top_k
+                    )
+                else:
+                    analysis = self._analyze_query(req, query, top_k)
+                if cache_key is not None:
+                    self.verdict_cache.put(cache_key[0], query, cache_key[1], analysis)
+                outcomes[offset] = (analysis, None)
+            except Exception as e:
+                outcomes[offset] = (None, e)
 
-    def _update_stats(self, verdict: ConformityVerdict) -> None:
-        """Update internal statistics"""
-        self._stats['total_analyzed'] += 1
+        return outcomes
 
-        if verdict == ConformityVerdict.CONFORME:
-            self._stats['conforme_count'] += 1
-        elif verdict == ConformityVerdict.NAO_CONFORME:
-            self._stats['nao_conforme_count'] += 1
-        else:
-            self._stats['revisao_count'] += 1
+    def _update_stats(self, verdict: ConformityVerdict) -> None:
+        """Update internal statistics (thread-safe)"""
+        with self._stats_lock:
+            self._stats['total_analyzed'] += 1
+
+            if verdict == ConformityVerdict.CONFORME:
+                self._stats['conforme_count'] += 1
+            elif verdict == ConformityVerdict.NAO_CONFORME:
+                self._stats['nao_conforme_count'] += 1
+            else:
+                self._stats['revisao_count'] += 1
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -530,19 +925,25 @@ class QueryProcessor:
         Returns:
             Dictionary with statistics and configuration
         """
-        total = self._stats['total_analyzed']
+        with self._stats_lock:
+            counts = dict(self._stats)
+        total = counts['total_analyzed']
 
         return {
             'total_analyzed': total,
             'verdicts': {
-                'conforme': self._stats['conforme_count'],
-                'nao_conforme': self._stats['nao_conforme_count'],
-                'revisao': self._stats['revisao_count']
+                'conforme': counts['conforme_count'],
+                'nao_conforme': counts['nao_conforme_count'],
+                'revisao': counts['revisao_count']
             },
             'percentages': {
-                'conforme': (self._stats['conforme_count'] / total * 100) if total > 0 else 0,
-                'nao_conforme': (self._stats['nao_conforme_count'] / total * 100) if total > 0 else 0,
-                'revisao': (self._stats['revisao_count'] / total * 100) if total > 0 else 0
+                'conforme': (counts['conforme_count'] / total * 100) if total > 0 else 0,
+                'nao_conforme': (counts['nao_conforme_count'] / total * 100) if total > 0 else 0,
+                'revisao': (counts['revisao_count'] / total * 100) if total > 0 else 0
+            },
+            'verdict_cache': {
+                'hits': counts['verdict_cache_hits'],
+                'misses': counts['verdict_cache_misses']
             },
             'config': {
                 'high_confidence_threshold': self.high_confidence_threshold,
@@ -553,9 +954,12 @@ class QueryProcessor:
 
     def reset_stats(self) -> None:
         """Reset statistics counters"""
-        self._stats = {
-            'total_analyzed': 0,
-            'conforme_count': 0,
-            'nao_conforme_count': 0,
-            'revisao_count': 0
-        }
+        with self._stats_lock:
+            self._stats = {
+                'total_analyzed': 0,
+                'conforme_count': 0,
+                'nao_conforme_count': 0,
+                'revisao_count': 0,
+                'verdict_cache_hits': 0,
+                'verdict_cache_misses': 0
+            }
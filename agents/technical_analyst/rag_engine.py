@@ -13,15 +13,87 @@ Provides high-level API for:
 - Managing RAG lifecycle
 """
 
+from concurrent.futures import Future
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+import hashlib
 import json
+import threading
 from datetime import datetime
 
 from .config import RAGConfig
 from .vector_store import create_vector_store
 from .embeddings_manager import EmbeddingsManager
 from .ingestion_pipeline import IngestionPipeline
+from .query_cache import LRUCache
+
+import numpy as np
+
+
+def _vector_store_kwargs(config: RAGConfig) -> Dict[str, Any]:
+    """
+    Build vector store constructor arguments from configuration
+
+    Index tuning settings fall back to RAGConfig defaults so partial config
+    objects (e.g. test doubles) keep working.
+    """
+    kwargs = {
+        "index_path": config.FAISS_INDEX_PATH if config.VECTOR_STORE == "faiss" else None,
+        "dimension": config.EMBEDDINGS_DIMENSION
+    }
+
+    if config.VECTOR_STORE == "faiss":
+        for kwarg, setting in (
+            ("index_type", "FAISS_INDEX_TYPE"),
+            ("nlist", "FAISS_IVF_NLIST"),
+            ("nprobe", "FAISS_IVF_NPROBE"),
+            ("hnsw_m", "FAISS_HNSW_M"),
+            ("ef_construction", "FAISS_HNSW_EF_CONSTRUCTION"),
+            ("ef_search", "FAISS_HNSW_EF_SEARCH"),
+            ("compact_threshold", "FAISS_COMPACT_THRESHOLD"),
+        ):
+            kwargs[kwarg] = getattr(config, setting, getattr(RAGConfig, setting))
+
+    return kwargs
+
+
+def _embeddings_cache_kwargs(config: RAGConfig) -> Dict[str, Any]:
+    """Build EmbeddingsManager cache kwargs from a config object"""
+    return {
+        "cache_dir": getattr(config, "EMBEDDINGS_CACHE_PATH", RAGConfig.EMBEDDINGS_CACHE_PATH),
+        "cache_max_entries": getattr(
+            config, "EMBEDDINGS_CACHE_MAX_ENTRIES", RAGConfig.EMBEDDINGS_CACHE_MAX_ENTRIES
+        ),
+        "cache_dtype": getattr(config, "EMBEDDINGS_CACHE_DTYPE", RAGConfig.EMBEDDINGS_CACHE_DTYPE)
+    }
+
+
+def _ingestion_kwargs(config: RAGConfig, embeddings: EmbeddingsManager) -> Dict[str, Any]:
+    """Build IngestionPipeline batching/parallelism/chunking kwargs from a config object"""
+    tokenizer = None
+    if getattr(config, "CHUNK_UNIT", RAGConfig.CHUNK_UNIT) == "tokens":
+        tokenizer = embeddings.get_tokenizer()
+        if tokenizer is None:
+            print("⚠️  CHUNK_UNIT=tokens needs a local embedding model tokenizer: chunking by characters")
+
+    return {
+        "batch_size": getattr(config, "INGEST_BATCH_SIZE", RAGConfig.INGEST_BATCH_SIZE),
+        "max_batch_memory_mb": getattr(config, "INGEST_MAX_BATCH_MB", RAGConfig.INGEST_MAX_BATCH_MB),
+        "workers": getattr(config, "INGEST_WORKERS", RAGConfig.INGEST_WORKERS),
+        "tokenizer": tokenizer,
+        "dedup_threshold": getattr(config, "INGEST_DEDUP_THRESHOLD", RAGConfig.INGEST_DEDUP_THRESHOLD),
+        "checkpoint_every": getattr(config, "INGEST_CHECKPOINT_EVERY", RAGConfig.INGEST_CHECKPOINT_EVERY)
+    }
+
+
+def _query_cache_kwargs(config: RAGConfig) -> Dict[str, Any]:
+    """Build RAGEngine query cache settings from a config object"""
+    return {
+        "max_entries": getattr(config, "QUERY_CACHE_SIZE", RAGConfig.QUERY_CACHE_SIZE),
+        "semantic_threshold": getattr(
+            config, "SEMANTIC_CACHE_THRESHOLD", RAGConfig.SEMANTIC_CACHE_THRESHOLD
+        )
+    }
 
 
 class RAGEngine:
@@ -63,6 +135,16 @@ class RAGEngine:
         self._initialized = False
         self._stats = {}
 
+        # Repeated queries skip encoding (embedding cache) and searching
+        # (results cache, keyed by query/top_k/threshold and stamped with the
+        # index version so any index change invalidates it)
+        cache_settings = _query_cache_kwargs(config)
+        self._embedding_cache = LRUCache(cache_settings["max_entries"])
+        self._results_cache = LRUCache(cache_settings["max_entries"])
+        self.semantic_cache_threshold = cache_settings["semantic_threshold"]
+        self._semantic_hits = 0
+        self._semantic_lock = threading.Lock()
+
     @classmethod
     def from_config(cls, config: Optional[RAGConfig] = None) -> "RAGEngine":
         """
@@ -88,22 +170,25 @@ class RAGEngine:
         print(f"   Vector Store: {config.VECTOR_STORE}")
         vector_store = create_vector_store(
             store_type=config.VECTOR_STORE,
-            index_path=config.FAISS_INDEX_PATH if config.VECTOR_STORE == "faiss" else None,
-            dimension=config.EMBEDDINGS_DIMENSION
+            **_vector_store_kwargs(config)
         )
 
-        # Try to load existing index
-        try:
-            vector_store.load()
+        # The store loads an existing index on construction
+        if vector_store.get_stats()["total_documents"] > 0:
             print(f"   ✅ Loaded existing index")
-        except FileNotFoundError:
+        else:
             print(f"   ⚠️  No existing index found (will create on first ingestion)")
 
         # 2. Embeddings Manager
         print(f"   Embeddings: {config.EMBEDDINGS_PROVIDER} ({config.EMBEDDINGS_MODEL})")
+        # The model loads on the first embed call (or warm_up()), so
+        # stats-only commands never pay for it
         embeddings = EmbeddingsManager(
             provider=config.EMBEDDINGS_PROVIDER,
-            model=config.EMBEDDINGS_MODEL
+            model=config.EMBEDDINGS_MODEL,
+            lazy=True,
+            config=config,
+            **_embeddings_cache_kwargs(config)
         )
 
         # 3. Ingestion Pipeline
@@ -112,7 +197,8 @@ class RAGEngine:
             vector_store=vector_store,
             embeddings_manager=embeddings,
             chunk_size=config.CHUNK_SIZE,
-            chunk_overlap=config.CHUNK_OVERLAP
+            chunk_overlap=config.CHUNK_OVERLAP,
+            **_ingestion_kwargs(config, embeddings)
         )
 
         print("✅ RAG Engine initialized successfully\n")
@@ -124,12 +210,52 @@ class RAGEngine:
             config=config
         )
 
-    def ingest_knowledge_base(self, directory_path: Optional[str] = None) -> Dict[str, Any]:
+    @classmethod
+    def start_warm_up(cls, config: Optional[RAGConfig] = None) -> "Future[RAGEngine]":
+        """
+        Build an engine (loading the FAISS index) and its embedding model in
+        a background thread, e.g. while a CLI is still parsing its CSV input
+
+        Args:
+            config: RAGConfig instance (uses default if None)
+
+        Returns:
+            Future resolving to the warm engine (re-raises loading errors)
+        """
+        future: Future = Future()
+
+        def warm_up():
+            try:
+                engine = cls.from_config(config)
+                engine.warm_up()
+                future.set_result(engine)
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=warm_up, name="rag-warm-up", daemon=True).start()
+        return future
+
+    def warm_up(self) -> None:
+        """Load the embedding model now instead of on the first search"""
+        load = getattr(self.embeddings, "load", None)
+        if callable(load):
+            load()
+
+    def ingest_knowledge_base(
+        self,
+        directory_path: Optional[str] = None,
+        incremental: bool = True,
+        workers: Optional[int] = None,
+        resume: bool = False
+    ) -> Dict[str, Any]:
         """
         Ingest all documents from knowledge base directory
 
         Args:
             directory_path: Path to knowledge base (uses config default if None)
+            incremental: Only process files added or modified since the last run
+            workers: Ingestion worker processes (uses config default if None; 0 = one per core)
+            resume: Continue an interrupted ingestion from its last checkpoint
 
         Returns:
             Statistics dict with ingestion results
@@ -139,7 +265,9 @@ class RAGEngine:
 
         print(f"📚 Ingesting knowledge base from: {directory_path}")
 
-        stats = self.ingestion.ingest_from_directory(directory_path)
+        stats = self.ingestion.ingest_from_directory(
+            directory_path, incremental=incremental, workers=workers, resume=resume
+        )
 
         self._initialized = True
         self._stats = {
@@ -180,17 +308,266 @@ class RAGEngine:
         if similarity_threshold is None:
             similarity_threshold = self.config.SIMILARITY_THRESHOLD
 
-        # Generate query embedding
-        query_embedding = self.embeddings.embed_query(query)
+        return self._cached_search([query], top_k, similarity_threshold, batch=False)[0]
+
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        similarity_threshold: Optional[float] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for documents relevant to several queries at once
+
+        Embeds all uncached queries in one batch and issues a single vector
+        store search, applying the same thresholding as search().
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query (uses config default if None)
+            similarity_threshold: Minimum similarity score (uses config default if None)
+
+        Returns:
+            One result list per query, in input order
+        """
+        if not self._initialized and self.vector_store.get_stats()["total_documents"] == 0:
+            raise RuntimeError(
+                "RAG Engine not initialized. Call ingest_knowledge_base() first."
+            )
+
+        if any(not query or not query.strip() for query in queries):
+            raise ValueError("Query cannot be empty")
+
+        if not queries:
+            return []
+
+        # Use config defaults if not specified
+        if top_k is None:
+            top_k = self.config.TOP_K
+        if similarity_threshold is None:
+            similarity_threshold = self.config.SIMILARITY_THRESHOLD
+
+        return self._cached_search(queries, top_k, similarity_threshold, batch=True)
 
-        # Search vector store
-        results = self.vector_store.search(
-            query_embedding=query_embedding,
-            top_k=top_k
+    def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        Embed queries in one batch (through the query embedding cache, so a
+        later search of the same queries does not encode them again)
+
+        Args:
+            queries: Query texts
+
+        Returns:
+            float32 array of shape (len(queries), dimension)
+        """
+        if not queries:
+            return np.zeros((0, self.embeddings.dimension or 0), dtype=np.float32)
+        return np.stack(self._embed_queries(queries, batch=True))
+
+    def index_version(self) -> str:
+        """
+        Version of the knowledge base index, for keying persisted results
+
+        Combines the vector store fingerprint with the embedding model, so
+        re-ingestion, index changes or a model switch all change it.
+        """
+        fingerprint = getattr(self.vector_store, "fingerprint", None)
+        parts = [
+            fingerprint() if fingerprint is not None else str(getattr(self.vector_store, "version", 0)),
+            str(getattr(self.vector_store, "index_path", "")),
+            str(getattr(self.config, "EMBEDDINGS_PROVIDER", "")),
+            str(getattr(self.config, "EMBEDDINGS_MODEL", ""))
+        ]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the vector store if another process saved a new one
+        (e.g. index_knowledge_base.py while a search daemon is running)
+
+        Returns:
+            True if the index was reloaded
+        """
+        changed_on_disk = getattr(self.vector_store, "changed_on_disk", None)
+        if changed_on_disk is None or not changed_on_disk():
+            return False
+
+        print("🔄 Knowledge base index changed on disk: reloading")
+        return self.vector_store.load()
+
+    def _cache_stamp(self) -> Any:
+        """Version stamp of the current index (changes on add/delete/reload/reset)"""
+        return (id(self.vector_store), getattr(self.vector_store, "version", 0))
+
+    def _cached_search(
+        self,
+        queries: List[str],
+        top_k: int,
+        similarity_threshold: float,
+        batch: bool
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Answer queries from the caches, then embed and search the misses
+
+        Misses are embedded with one encode call and searched with one index
+        search (embed_queries/search_batch when batch, else embed_query/search).
+        """
+        version = self._cache_stamp()
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+        pending: Dict[str, List[int]] = {}
+
+        for position, query in enumerate(queries):
+            entry = self._results_cache.get((query, top_k, similarity_threshold), version)
+            if entry is not None:
+                results[position] = entry[1]
+            else:
+                pending.setdefault(query, []).append(position)
+
+        if pending:
+            missing = list(pending)
+            embeddings = self._embed_queries(missing, batch)
+
+            to_search = []
+            for query, embedding in zip(missing, embeddings):
+                unit = self._unit_vector(embedding)
+                filtered = self._semantic_lookup(unit, top_k, similarity_threshold, version)
+                if filtered is None:
+                    to_search.append((query, embedding, unit))
+                else:
+                    self._store_results(query, top_k, similarity_threshold, version, unit, filtered)
+                    for position in pending[query]:
+                        results[position] = filtered
+
+            if to_search:
+                if batch:
+                    batch_results = self.vector_store.search_batch(
+                        query_embeddings=np.asarray([embedding for _, embedding, _ in to_search]),
+                        top_k=top_k
+                    )
+                else:
+                    batch_results = [self.vector_store.search(
+                        query_embedding=to_search[0][1],
+                        top_k=top_k
+                    )]
+
+                for (query, _, unit), raw in zip(to_search, batch_results):
+                    filtered = self._filter_results(raw, similarity_threshold)
+                    self._store_results(query, top_k, similarity_threshold, version, unit, filtered)
+                    for position in pending[query]:
+                        results[position] = filtered
+
+        return [self._copy_results(filtered) for filtered in results]
+
+    def _embed_queries(self, queries: List[str], batch: bool) -> List[Any]:
+        """Query embeddings, encoding only those not in the embedding cache"""
+        embeddings = [self._embedding_cache.get(query) for query in queries]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing:
+            if batch:
+                encoded = self.embeddings.embed_queries([queries[i] for i in missing])
+            else:
+                encoded = [self.embeddings.embed_query(queries[missing[0]])]
+            for i, embedding in zip(missing, encoded):
+                # Own copy: a row view would keep the whole encoded batch alive
+                embedding = np.array(embedding, dtype=np.float32)
+                embeddings[i] = embedding
+                self._embedding_cache.put(queries[i], embedding)
+
+        return embeddings
+
+    def _unit_vector(self, embedding: Any) -> Optional[np.ndarray]:
+        """L2-normalized query vector (only needed for semantic cache hits)"""
+        if not self.semantic_cache_threshold:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _semantic_lookup(
+        self,
+        unit: Optional[np.ndarray],
+        top_k: int,
+        similarity_threshold: float,
+        version: Any
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Results of the most similar cached query (same top_k/threshold/index)
+        if its cosine similarity reaches semantic_cache_threshold
+        """
+        if unit is None:
+            return None
+
+        candidates = [
+            entry for key, entry in self._results_cache.items(version)
+            if key[1:] == (top_k, similarity_threshold) and entry[0] is not None
+        ]
+        if not candidates:
+            return None
+
+        similarities = np.stack([vector for vector, _ in candidates]) @ unit
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.semantic_cache_threshold:
+            return None
+
+        with self._semantic_lock:
+            self._semantic_hits += 1
+        return candidates[best][1]
+
+    def _store_results(
+        self,
+        query: str,
+        top_k: int,
+        similarity_threshold: float,
+        version: Any,
+        unit: Optional[np.ndarray],
+        filtered: List[Dict[str, Any]]
+    ) -> None:
+        """Cache filtered results (with the query vector for semantic lookups)"""
+        self._results_cache.put((query, top_k, similarity_threshold), (unit, filtered), version)
+
+    @staticmethod
+    def _copy_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Copy cached results so callers can modify them freely"""
+        copies = []
+        for result in results:
+            result_copy = result.copy()
+            if isinstance(result_copy.get("metadata"), dict):
+                result_copy["metadata"] = dict(result_copy["metadata"])
+            copies.append(result_copy)
+        return copies
+
+    def clear_query_cache(self) -> None:
+        """Drop cached query embeddings and results"""
+        self._embedding_cache.clear()
+        self._results_cache.clear()
+
+    def _query_cache_stats(self) -> Dict[str, Any]:
+        """Query embedding/results cache statistics"""
+        results_stats = self._results_cache.get_stats()
+        lookups = results_stats["hits"] + results_stats["misses"]
+        results_stats["semantic_hits"] = self._semantic_hits
+        results_stats["semantic_threshold"] = self.semantic_cache_threshold
+        results_stats["total_hit_rate"] = (
+            round((results_stats["hits"] + self._semantic_hits) / lookups, 4) if lookups else 0.0
         )
 
-        # Filter by similarity threshold
-        # vector_store returns 'score', rename to 'similarity_score'
+        return {
+            "embeddings": self._embedding_cache.get_stats(),
+            "results": results_stats,
+            "index_version": getattr(self.vector_store, "version", 0)
+        }
+
+    @staticmethod
+    def _filter_results(
+        results: List[Dict[str, Any]],
+        similarity_threshold: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter vector store results by similarity threshold
+
+        vector_store returns 'score', renamed to 'similarity_score'
+        """
         filtered_results = []
         for result in results:
             if result["score"] >= similarity_threshold:
@@ -235,6 +612,13 @@ class RAGEngine:
             "timestamp": datetime.now().isoformat()
         }
 
+    def _embeddings_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Embedding cache statistics (None when the cache is disabled or not loaded yet)"""
+        if not getattr(self.embeddings, "is_loaded", True):
+            return None
+        cache = getattr(self.embeddings, "cache", None)
+        return cache.get_stats() if cache is not None else None
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get RAG engine statistics
@@ -243,6 +627,7 @@ class RAGEngine:
             Dict with keys: {
                 vector_store_stats,
                 embeddings_info,
+                query_cache,
                 last_ingestion,
                 initialized
             }
@@ -258,8 +643,10 @@ class RAGEngine:
             "embeddings": {
                 "provider": self.config.EMBEDDINGS_PROVIDER,
                 "model": self.config.EMBEDDINGS_MODEL,
-                "dimension": self.config.EMBEDDINGS_DIMENSION
+                "dimension": self.config.EMBEDDINGS_DIMENSION,
+                "cache": self._embeddings_cache_stats()
             },
+            "query_cache": self._query_cache_stats(),
             "search_config": {
                 "top_k": self.config.TOP_K,
                 "similarity_threshold": self.config.SIMILARITY_THRESHOLD
@@ -289,27 +676,28 @@ class RAGEngine:
         """
         Reset RAG engine (clear vector store)
 
+        The store is emptied in memory with the configured index type; the
+        index on disk is replaced by the next save (e.g. after re-ingesting).
+
         WARNING: This will delete all indexed documents!
         """
         print("⚠️  Resetting RAG Engine (clearing all data)...")
 
-        # Clear vector store
-        self.vector_store = create_vector_store(
-            store_type=self.config.VECTOR_STORE,
-            index_path=self.config.FAISS_INDEX_PATH if self.config.VECTOR_STORE == "faiss" else None,
-            dimension=self.config.EMBEDDINGS_DIMENSION
-        )
+        # Clear vector store (a fresh index of the configured type)
+        self.vector_store.delete_all()
 
         # Re-initialize ingestion pipeline with new vector store
         self.ingestion = IngestionPipeline(
             vector_store=self.vector_store,
             embeddings_manager=self.embeddings,
             chunk_size=self.config.CHUNK_SIZE,
-            chunk_overlap=self.config.CHUNK_OVERLAP
+            chunk_overlap=self.config.CHUNK_OVERLAP,
+            **_ingestion_kwargs(self.config, self.embeddings)
         )
 
         self._initialized = False
         self._stats = {}
+        self.clear_query_cache()
 
         print("✅ RAG Engine reset complete")
 
@@ -6,16 +6,110 @@ with Technical Analyst conformity analysis.
 
 This module provides:
 - ConformityReport: Data structure for consolidated analysis
-- ReportExporter: Multi-format export (JSON, CSV, Excel, Markdown)
+- ReportExporter: Multi-format export (JSON, JSONL, CSV, Excel, Markdown)
+- RunningSummary: Summary aggregates updated one analysis at a time
+- StreamingReportWriter: Appends CSV/JSONL rows as analyses complete
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 import json
 import csv
 
 
+CSV_FIELDS = [
+    'id', 'descricao', 'tipo', 'categoria', 'prioridade',
+    'veredicto', 'confianca', 'evidencias_count', 'fontes',
+    'reasoning', 'recomendacoes'
+]
+
+
+def _csv_row(req: Dict[str, Any], analysis: Any) -> Dict[str, Any]:
+    """CSV export row of a requirement and its analysis"""
+    return {
+        'id': req.get('id', ''),
+        'descricao': req.get('descricao', ''),
+        'tipo': req.get('tipo', ''),
+        'categoria': req.get('categoria', ''),
+        'prioridade': req.get('prioridade', ''),
+        'veredicto': analysis.conformity.value,
+        'confianca': f"{analysis.confidence:.2f}",
+        'evidencias_count': len(analysis.evidence),
+        'fontes': ', '.join(analysis.sources),
+        'reasoning': analysis.reasoning,
+        'recomendacoes': '; '.join(analysis.recommendations)
+    }
+
+
+class RunningSummary:
+    """
+    Report summary aggregated one analysis at a time
+
+    Produces the same summary as scanning all results, without keeping
+    them: verdict counts, unique recommendations and the (rare)
+    non-conformant requirements.
+
+    Example:
+        >>> summary = RunningSummary()
+        >>> for analysis in processor.iter_analyze_batch(requirements):
+        ...     summary.add(analysis)
+        >>> summary.get_summary()['overall_compliance_rate']
+    """
+
+    def __init__(self):
+        self.counts = {'CONFORME': 0, 'NAO_CONFORME': 0, 'REVISAO': 0}
+        self._recommendations: Dict[str, None] = {}
+        self.critical_issues: List[Dict[str, Any]] = []
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def add(self, analysis: Any, requirement: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Account for one analysis
+
+        Args:
+            analysis: ConformityAnalysis
+            requirement: Analyzed requirement (default: the one recorded in
+                the analysis metadata)
+        """
+        verdict = analysis.conformity.value
+        self.counts[verdict] = self.counts.get(verdict, 0) + 1
+        self._recommendations.update(dict.fromkeys(analysis.recommendations))
+
+        if verdict == 'NAO_CONFORME':
+            if requirement is None:
+                requirement = analysis.metadata.get('requirement', {})
+            self.critical_issues.append({
+                'requirement': requirement,
+                'analysis': analysis.to_dict()
+            })
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Summary statistics (same keys as ConformityReport.get_summary)"""
+        total = self.total
+        conforme = self.counts['CONFORME']
+        nao_conforme = self.counts['NAO_CONFORME']
+        revisao = self.counts['REVISAO']
+
+        return {
+            'total_requirements': total,
+            'conforme': conforme,
+            'nao_conforme': nao_conforme,
+            'revisao': revisao,
+            'conforme_pct': (conforme / total * 100) if total > 0 else 0,
+            'nao_conforme_pct': (nao_conforme / total * 100) if total > 0 else 0,
+            'revisao_pct': (revisao / total * 100) if total > 0 else 0,
+            'overall_compliance_rate': (conforme / total * 100) if total > 0 else 0
+        }
+
+    def get_recommendations(self) -> List[str]:
+        """Unique recommendations, in first-seen order"""
+        return list(self._recommendations)
+
+
 @dataclass
 class ConformityReport:
     """
@@ -30,6 +124,9 @@ class ConformityReport:
         analysis_results: List of ConformityAnalysis objects (Query Processor)
         timestamp: ISO timestamp of analysis
         pipeline_stats: Performance statistics from pipeline execution
+        aggregates: Running summary of the analyses (summary, recommendations
+            and critical issues come from it when set; streamed reports keep
+            no analysis_results)
     """
 
     edital_metadata: Dict[str, Any]
@@ -37,6 +134,7 @@ class ConformityReport:
     analysis_results: List[Any]  # List[ConformityAnalysis]
     timestamp: str
     pipeline_stats: Dict[str, Any] = field(default_factory=dict)
+    aggregates: Optional[RunningSummary] = None
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -48,6 +146,9 @@ class ConformityReport:
             - conforme, nao_conforme, revisao: Counts by verdict
             - Percentages for each category
         """
+        if self.aggregates is not None:
+            return self.aggregates.get_summary()
+
         total = len(self.analysis_results)
         conforme = sum(
             1 for r in self.analysis_results
@@ -80,6 +181,9 @@ class ConformityReport:
         Returns:
             List of unique recommendations across all requirements
         """
+        if self.aggregates is not None:
+            return self.aggregates.get_recommendations()
+
         all_recommendations = []
         for analysis in self.analysis_results:
             all_recommendations.extend(analysis.recommendations)
@@ -94,6 +198,9 @@ class ConformityReport:
         Returns:
             List of requirements marked as NAO_CONFORME
         """
+        if self.aggregates is not None:
+            return list(self.aggregates.critical_issues)
+
         issues = []
         for req, analysis in zip(self.requirements, self.analysis_results):
             if analysis.conformity.value == 'NAO_CONFORME':
@@ -157,6 +264,7 @@ class ReportExporter:
 
     Supports:
     - JSON: Complete structured data
+    - JSONL: One analysis per line
     - CSV: Tabular format for spreadsheets
     - Excel: Multi-sheet workbook with summary and details
     - Markdown: Human-readable report
@@ -185,7 +293,7 @@ class ReportExporter:
 
         Args:
             basename: Base filename (without extension)
-            format: Export format ('json', 'csv', 'excel', 'markdown')
+            format: Export format ('json', 'jsonl', 'csv', 'excel', 'markdown')
 
         Returns:
             Path to exported file
@@ -195,6 +303,8 @@ class ReportExporter:
         """
         if format == 'json':
             return self.to_json(basename)
+        elif format == 'jsonl':
+            return self.to_jsonl(basename)
         elif format == 'csv':
             return self.to_csv(basename)
         elif format == 'excel':
@@ -218,6 +328,24 @@ class ReportExporter:
         filepath.write_text(self.report.to_json(), encoding='utf-8')
         return filepath
 
+    def to_jsonl(self, basename: str) -> Path:
+        """
+        Export as JSON Lines (one ConformityAnalysis dict per line)
+
+        Args:
+            basename: Base filename
+
+        Returns:
+            Path to JSONL file
+        """
+        filepath = self.output_dir / f"{basename}_analysis.jsonl"
+
+        with open(filepath, 'w', encoding='utf-8') as f:
+            for analysis in self.report.analysis_results:
+                f.write(json.dumps(analysis.to_dict(), ensure_ascii=False) + '\n')
+
+        return filepath
+
     def to_csv(self, basename: str) -> Path:
         """
         Export as CSV (requirements + analysis)
@@ -235,28 +363,11 @@ class ReportExporter:
         filepath = self.output_dir / f"{basename}_analysis.csv"
 
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = [
-                'id', 'descricao', 'tipo', 'categoria', 'prioridade',
-                'veredicto', 'confianca', 'evidencias_count', 'fontes',
-                'reasoning', 'recomendacoes'
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
             writer.writeheader()
 
             for req, analysis in zip(self.report.requirements, self.report.analysis_results):
-                writer.writerow({
-                    'id': req.get('id', ''),
-                    'descricao': req.get('descricao', ''),
-                    'tipo': req.get('tipo', ''),
-                    'categoria': req.get('categoria', ''),
-                    'prioridade': req.get('prioridade', ''),
-                    'veredicto': analysis.conformity.value,
-                    'confianca': f"{analysis.confidence:.2f}",
-                    'evidencias_count': len(analysis.evidence),
-                    'fontes': ', '.join(analysis.sources),
-                    'reasoning': analysis.reasoning,
-                    'recomendacoes': '; '.join(analysis.recommendations)
-                })
+                writer.writerow(_csv_row(req, analysis))
 
         return filepath
 
@@ -302,10 +413,10 @@ class ReportExporter:
 
 | Etapa | Tempo |
 |-------|-------|
-| Extração de Requisitos | {self.report.pipeline_stats.get('extraction_time', 0):.1f}s |
-| Análise de Conformidade | {self.report.pipeline_stats.get('analysis_time', 0):.1f}s |
-| Geração de Relatório | {self.report.pipeline_stats.get('report_time', 0):.1f}s |
-| **Total** | **{self.report.pipeline_stats.get('total_duration', 0):.1f}s** |
+| Extração de Requisitos | {self.report.pipeline_stats.get('extraction_time') or 0:.1f}s |
+| Análise de Conformidade | {self.report.pipeline_stats.get('analysis_time') or 0:.1f}s |
+| Geração de Relatório | {self.report.pipeline_stats.get('report_time') or 0:.1f}s |
+| **Total** | **{self.report.pipeline_stats.get('total_duration') or 0:.1f}s** |
 
 ---
 
@@ -493,3 +604,93 @@ class ReportExporter:
 
         wb.save(filepath)
         return filepath
+
+
+class StreamingReportWriter:
+    """
+    Write analyses to CSV/JSONL outputs as they complete
+
+    Each write() appends one row per output file and flushes it, so partial
+    results are visible (and survive a crash) while the analysis runs; a
+    RunningSummary is updated along the way. Files use the same names and
+    CSV columns as ReportExporter.
+
+    Example:
+        >>> with StreamingReportWriter("output", "edital_001", ["csv", "jsonl"]) as writer:
+        ...     for analysis in processor.iter_analyze_batch(requirements):
+        ...         writer.write(analysis)
+        >>> writer.summary.get_summary()
+    """
+
+    FORMATS = ('csv', 'jsonl')
+
+    def __init__(self, output_dir: Path, basename: str, formats: List[str]):
+        """
+        Initialize writer (creates/truncates the output files)
+
+        Args:
+            output_dir: Directory for output files
+            basename: Base filename
+            formats: Streamed formats ('csv', 'jsonl')
+
+        Raises:
+            ValueError: If a format cannot be streamed
+        """
+        unsupported = [fmt for fmt in formats if fmt not in self.FORMATS]
+        if unsupported:
+            raise ValueError(f"Formats cannot be streamed: {', '.join(unsupported)}")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.summary = RunningSummary()
+        self.paths: Dict[str, Path] = {}
+
+        self._csv_file = None
+        self._csv_writer = None
+        self._jsonl_file = None
+
+        if 'csv' in formats:
+            self.paths['csv'] = self.output_dir / f"{basename}_analysis.csv"
+            self._csv_file = open(self.paths['csv'], 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDS)
+            self._csv_writer.writeheader()
+            self._csv_file.flush()
+
+        if 'jsonl' in formats:
+            self.paths['jsonl'] = self.output_dir / f"{basename}_analysis.jsonl"
+            self._jsonl_file = open(self.paths['jsonl'], 'w', encoding='utf-8')
+
+    def write(self, analysis: Any, requirement: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Append one analysis to every output and to the running summary
+
+        Args:
+            analysis: ConformityAnalysis
+            requirement: Analyzed requirement (default: the one recorded in
+                the analysis metadata)
+        """
+        if requirement is None:
+            requirement = analysis.metadata.get('requirement', {})
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(_csv_row(requirement, analysis))
+            self._csv_file.flush()
+
+        if self._jsonl_file is not None:
+            self._jsonl_file.write(json.dumps(analysis.to_dict(), ensure_ascii=False) + '\n')
+            self._jsonl_file.flush()
+
+        self.summary.add(analysis, requirement)
+
+    def close(self) -> None:
+        """Close the output files"""
+        for f in (self._csv_file, self._jsonl_file):
+            if f is not None:
+                f.close()
+        self._csv_file = self._csv_writer = self._jsonl_file = None
+
+    def __enter__(self) -> "StreamingReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
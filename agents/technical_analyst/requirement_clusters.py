@@ -0,0 +1,124 @@
+"""
+Requirement Clustering for Technical Analyst
+
+Groups near-identical requirements of an edital (e.g. per-lot copies of the
+same camera specification) so AnalysisPipeline runs retrieval and verdicts
+once per cluster representative and fans the result out to the members.
+
+Clustering is greedy in input order: each requirement joins the most similar
+earlier representative if their query embeddings have cosine similarity >=
+threshold, otherwise it becomes a representative. Only requirements with the
+same numbers (with their signs and comparison operators) can share a cluster,
+so "Câmeras 4MP" and "Câmeras 8MP", or "-10°C" and "10°C", are never merged
+however close their embeddings are.
+"""
+
+from typing import Any, Dict, List, Optional
+import re
+
+import numpy as np
+
+from .verdict_cache import normalize_text
+
+
+# Optional comparison operator and sign ("≥ 4", "-10", but "20-30" and "PoE-4"
+# carry no sign), then every part of the number ("2.0.1", "10.000,50", "IP67")
+_NUMBER = re.compile(
+    r"(?:(>=|=>|<=|=<|[≥≤<>])\s*)?((?<![\w.,])[-+])?(?<!\d)(?<!\d[.,])(\d+(?:[.,]\d+)*)"
+)
+_OPERATORS = {">=": "≥", "=>": "≥", "<=": "≤", "=<": "≤"}
+
+
+def number_signature(text: str) -> str:
+    """
+    Numbers of a requirement text, in order ("4mp 30 dias" -> "4|30")
+
+    Taken from the raw text so signs and operators survive ("≥ -10 °C" ->
+    "≥-10"); each number's format is folded as in normalize_text
+    ("1.000" -> "1000", "10.000,50" -> "10000.50", "2.0.1" kept).
+    """
+    return "|".join(
+        _OPERATORS.get(operator, operator) + sign + normalize_text(number)
+        for operator, sign, number in _NUMBER.findall(text.replace("\u2212", "-"))
+    )
+
+
+def cluster_vectors(
+    vectors: np.ndarray,
+    threshold: float,
+    groups: Optional[List[Any]] = None,
+    block_size: int = 1024
+) -> np.ndarray:
+    """
+    Greedy leader clustering of embeddings
+
+    Args:
+        vectors: Embeddings, one row per item
+        threshold: Minimum cosine similarity to a representative (0-1]
+        groups: Optional group key per item (items only cluster within a group)
+        block_size: Items compared against the representatives at once
+
+    Returns:
+        Array with the index of each item's representative (itself for
+        representatives); representatives always precede their members
+    """
+    vectors = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    units = vectors / np.where(norms > 0, norms, 1)
+
+    if groups is None:
+        groups = [None] * len(units)
+    group_ids = {}
+    group_array = np.fromiter(
+        (group_ids.setdefault(group, len(group_ids)) for group in groups), dtype=np.int64, count=len(groups)
+    )
+
+    labels = np.arange(len(units))
+    representatives: List[int] = []
+
+    for start in range(0, len(units), block_size):
+        stop = min(start + block_size, len(units))
+        block_reps = np.asarray(representatives, dtype=np.int64)
+
+        # Similarity to representatives chosen in earlier blocks
+        if len(block_reps):
+            similarities = units[start:stop] @ units[block_reps].T
+            similarities[group_array[start:stop, None] != group_array[None, block_reps]] = -np.inf
+            best = np.argmax(similarities, axis=1)
+            matched = similarities[np.arange(stop - start), best] >= threshold
+        else:
+            matched = np.zeros(stop - start, dtype=bool)
+
+        new_reps: List[int] = []
+        for offset in range(stop - start):
+            i = start + offset
+            if matched[offset]:
+                labels[i] = block_reps[best[offset]]
+                continue
+
+            # Representatives chosen earlier in this block
+            if new_reps:
+                candidates = np.asarray(new_reps, dtype=np.int64)
+                candidates = candidates[group_array[candidates] == group_array[i]]
+                if len(candidates):
+                    similarities = units[candidates] @ units[i]
+                    j = int(np.argmax(similarities))
+                    if similarities[j] >= threshold:
+                        labels[i] = candidates[j]
+                        continue
+
+            new_reps.append(i)
+
+        representatives.extend(new_reps)
+
+    return labels
+
+
+def cluster_mapping(requirements: List[Dict[str, Any]], labels: np.ndarray) -> Dict[str, List[str]]:
+    """Representative requirement ID -> member IDs, for clusters with members"""
+    mapping: Dict[str, List[str]] = {}
+    for i, label in enumerate(labels.tolist()):
+        if label != i:
+            rep_id = str(requirements[label].get('id', label))
+            mapping.setdefault(rep_id, []).append(str(requirements[i].get('id', i)))
+    return mapping
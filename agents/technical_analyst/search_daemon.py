@@ -0,0 +1,408 @@
+"""
+Local RAG Search Daemon
+
+Long-running search service over localhost HTTP that keeps one RAGEngine
+warm (embedding model and FAISS index loaded once) instead of paying
+interpreter startup and model loading on every `rag_search.py` call.
+
+Concurrent requests arriving within a few milliseconds of each other are
+coalesced by MicroBatcher into one RAGEngine.search_batch call, i.e. one
+batched encode and one index search. Before each batch the engine reloads
+the index if another process (e.g. index_knowledge_base.py) saved a new one.
+
+Endpoints:
+    GET  /health  -> {"status": "ok", "index_version": ..., "stats": {...}}
+    POST /search  {"query": str, "top_k": int?, "threshold": float?}
+                  -> {"query": str, "results": [...]}
+                  {"queries": [str, ...], "top_k": ..., "threshold": ...}
+                  -> {"results": [[...], ...]}
+
+SearchClient is the thin client used by scripts/rag_search.py and the
+orchestrator *buscar command when the daemon is running.
+"""
+
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+import json
+import queue
+import threading
+import time
+
+from .config import RAGConfig
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent searches into batched RAG engine calls
+
+    A worker thread takes the first pending request, waits up to max_wait_ms
+    for more (at most max_batch), and answers each group of requests sharing
+    top_k and threshold with a single search_batch call.
+
+    Example:
+        >>> batcher = MicroBatcher(rag, max_wait_ms=5)
+        >>> batcher.start()
+        >>> results = batcher.search("câmeras 4MP", top_k=5)  # from many threads
+    """
+
+    def __init__(self, rag_engine, max_wait_ms: float = 5.0, max_batch: int = 64):
+        """
+        Initialize micro-batcher
+
+        Args:
+            rag_engine: Engine with search_batch(queries, top_k, similarity_threshold)
+            max_wait_ms: How long the first request of a batch waits for others
+            max_batch: Maximum requests per batch
+        """
+        self.rag = rag_engine
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.max_batch = max(1, max_batch)
+
+        self._queue: "queue.Queue[Optional[Tuple[str, Optional[int], Optional[float], Future]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self._requests = 0
+        self._batches = 0
+        self._max_batch_seen = 0
+
+    def start(self) -> None:
+        """Start the batching worker thread"""
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="rag-micro-batcher", daemon=True)
+            self._worker.start()
+
+    def stop(self) -> None:
+        """Answer pending requests and stop the worker thread"""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def submit(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        similarity_threshold: Optional[float] = None
+    ) -> Future:
+        """
+        Queue a search
+
+        Raises:
+            ValueError: If query is empty (rejected alone, not with its batch)
+        """
+        if not query or not query.strip():
+            raise ValueError("Query cannot be empty")
+
+        future: Future = Future()
+        self._queue.put((query, top_k, similarity_threshold, future))
+        return future
+
+    def search(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        similarity_threshold: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Search through the next batch (blocks until it is answered)"""
+        return self.submit(query, top_k, similarity_threshold).result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Requests, batches and batch sizes so far"""
+        with self._stats_lock:
+            return {
+                'requests': self._requests,
+                'batches': self._batches,
+                'avg_batch_size': round(self._requests / self._batches, 2) if self._batches else 0.0,
+                'max_batch_size': self._max_batch_seen,
+                'max_wait_ms': self.max_wait * 1000,
+                'max_batch': self.max_batch
+            }
+
+    def _run(self) -> None:
+        """Worker loop: collect one batch, answer it, repeat"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            pending = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                pending.append(item)
+
+            self._dispatch(pending)
+
+    def _dispatch(self, pending: List[Tuple[str, Optional[int], Optional[float], Future]]) -> None:
+        """Answer a batch with one search_batch call per (top_k, threshold)"""
+        self._reload_if_changed()
+
+        groups: Dict[Tuple[Optional[int], Optional[float]], List[Tuple[str, Future]]] = {}
+        for query, top_k, threshold, future in pending:
+            groups.setdefault((top_k, threshold), []).append((query, future))
+
+        for (top_k, threshold), items in groups.items():
+            try:
+                results = self.rag.search_batch([query for query, _ in items], top_k, threshold)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(items, results):
+                future.set_result(result)
+
+        with self._stats_lock:
+            self._requests += len(pending)
+            self._batches += len(groups)
+            self._max_batch_seen = max(self._max_batch_seen, max(len(items) for items in groups.values()))
+
+
+    def _reload_if_changed(self) -> None:
+        """Pick up an index saved by another process (between batches, so no search sees it half-loaded)"""
+        reload_if_changed = getattr(self.rag, 'reload_if_changed', None)
+        if reload_if_changed is None:
+            return
+        try:
+            reload_if_changed()
+        except Exception as e:
+            print(f"⚠️  Could not reload the index, serving the loaded one: {e}")
+
+
+def _to_json(obj: Any) -> bytes:
+    """JSON-encode a response (numpy scalars included)"""
+    return json.dumps(
+        obj, ensure_ascii=False, default=lambda o: o.item() if hasattr(o, 'item') else str(o)
+    ).encode('utf-8')
+
+
+class SearchDaemon:
+    """
+    Localhost HTTP search service around one warm RAG engine
+
+    Example:
+        >>> daemon = SearchDaemon(RAGEngine.from_config(), port=8765)
+        >>> daemon.serve_forever()
+    """
+
+    def __init__(
+        self,
+        rag_engine,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_wait_ms: Optional[float] = None,
+        max_batch: Optional[int] = None
+    ):
+        """
+        Initialize daemon (binds the socket)
+
+        Args:
+            rag_engine: Warm RAG engine shared by every request
+            host: Bind address (keep it on localhost: there is no authentication)
+            port: Bind port (0 picks a free port, see url)
+            max_wait_ms: Micro-batching window (default: RAG_SEARCH_DAEMON_MAX_WAIT_MS)
+            max_batch: Maximum requests per batch (default: RAG_SEARCH_DAEMON_MAX_BATCH)
+        """
+        self.rag = rag_engine
+        self.batcher = MicroBatcher(
+            rag_engine,
+            max_wait_ms=max_wait_ms if max_wait_ms is not None else RAGConfig.SEARCH_DAEMON_MAX_WAIT_MS,
+            max_batch=max_batch if max_batch is not None else RAGConfig.SEARCH_DAEMON_MAX_BATCH
+        )
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL the daemon listens on"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown() (blocks)"""
+        self.batcher.start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.batcher.stop()
+
+    def start(self) -> None:
+        """Serve requests from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="rag-search-daemon", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop serving and release the socket"""
+        self.server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.server.server_close()
+
+    def health(self) -> Dict[str, Any]:
+        """Health payload of GET /health"""
+        index_version = getattr(self.rag, 'index_version', None)
+        return {
+            'status': 'ok',
+            'index_version': index_version() if callable(index_version) else None,
+            'stats': self.batcher.get_stats()
+        }
+
+    def handle_search(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a POST /search payload through the micro-batcher"""
+        top_k = payload.get('top_k')
+        threshold = payload.get('threshold')
+
+        if 'queries' in payload:
+            futures = [self.batcher.submit(query, top_k, threshold) for query in payload['queries']]
+            return {'results': [future.result() for future in futures]}
+
+        query = payload.get('query', '')
+        return {'query': query, 'results': self.batcher.search(query, top_k, threshold)}
+
+    def _handler_class(self):
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') == '/health':
+                    self._reply(200, daemon.health())
+                else:
+                    self._reply(404, {'error': f'Unknown endpoint: {self.path}'})
+
+            def do_POST(self):
+                if self.path.rstrip('/') != '/search':
+                    self._reply(404, {'error': f'Unknown endpoint: {self.path}'})
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    payload = json.loads(self.rfile.read(length) or b'{}')
+                    self._reply(200, daemon.handle_search(payload))
+                except (ValueError, TypeError) as e:
+                    self._reply(400, {'error': str(e)})
+                except Exception as e:
+                    self._reply(500, {'error': f'{type(e).__name__}: {e}'})
+
+            def _reply(self, status: int, body: Dict[str, Any]) -> None:
+                data = _to_json(body)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class SearchClient:
+    """
+    Thin client of the search daemon (stdlib only, no model loading)
+
+    Example:
+        >>> client = SearchClient.from_config()
+        >>> if client and client.is_available():
+        ...     results = client.search("prazo de garantia", top_k=5)
+    """
+
+    def __init__(self, url: str, timeout: float = 60.0):
+        """
+        Initialize client
+
+        Args:
+            url: Daemon base URL (e.g. http://127.0.0.1:8765)
+            timeout: Search request timeout in seconds
+        """
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+
+    @classmethod
+    def from_config(cls, config: Optional[RAGConfig] = None) -> Optional["SearchClient"]:
+        """Client of RAG_SEARCH_DAEMON_URL (None when the URL is empty)"""
+        config = config or RAGConfig()
+        url = getattr(config, 'SEARCH_DAEMON_URL', RAGConfig.SEARCH_DAEMON_URL)
+        return cls(url) if url else None
+
+    def is_available(self, timeout: float = 0.5) -> bool:
+        """Whether a daemon answers /health (quick check before falling back)"""
+        try:
+            self.health(timeout=timeout)
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def health(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Daemon health and micro-batching stats"""
+        return self._request('GET', '/health', timeout=timeout)
+
+    def search(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        similarity_threshold: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Search through the daemon (same results as RAGEngine.search)"""
+        payload = {'query': query, 'top_k': top_k, 'threshold': similarity_threshold}
+        return self._request('POST', '/search', payload)['results']
+
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        similarity_threshold: Optional[float] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several queries in one request (same results as RAGEngine.search_batch)"""
+        payload = {'queries': list(queries), 'top_k': top_k, 'threshold': similarity_threshold}
+        return self._request('POST', '/search', payload)['results']
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a request to the daemon
+
+        Raises:
+            ConnectionError: If the daemon is not reachable
+            ValueError: If the daemon rejected the request (HTTP 400)
+            RuntimeError: If the search failed in the daemon
+        """
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else None
+        request = Request(self.url + path, data=data, method=method,
+                          headers={'Content-Type': 'application/json'})
+        try:
+            with urlopen(request, timeout=timeout or self.timeout) as response:
+                return json.loads(response.read())
+        except HTTPError as e:
+            try:
+                message = json.loads(e.read()).get('error', e.reason)
+            except ValueError:
+                message = e.reason
+            if e.code == 400:
+                raise ValueError(message) from e
+            raise RuntimeError(f"Search daemon error: {message}") from e
+        except URLError as e:
+            raise ConnectionError(f"Search daemon not reachable at {self.url}: {e.reason}") from e
+
+
+def daemon_address(url: str) -> Tuple[str, int]:
+    """Host and port of a daemon URL (e.g. http://127.0.0.1:8765)"""
+    parsed = urlparse(url if '//' in url else f"http://{url}")
+    return parsed.hostname or "127.0.0.1", parsed.port or 8765
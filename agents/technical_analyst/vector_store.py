@@ -6,23 +6,42 @@ Supports:
 - Pinecone (cloud) - future migration
 
 Architecture allows easy switching between implementations by changing config.
+
+Embeddings are passed as float32 arrays (n, dimension); nested lists of floats
+are still accepted and converted once, on the way in.
 """
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Union
 import json
+import os
 import pickle
+import shutil
+import uuid
+
+import numpy as np
+
+from .chunk_store import ChunkStore, fsync_path, make_chunk_id
+
+
+# An (n, dimension) float32 array, or one row per item as a list of floats
+Embeddings = Union[np.ndarray, Sequence[Sequence[float]]]
+Embedding = Union[np.ndarray, Sequence[float]]
 
 
 class VectorStoreInterface(ABC):
     """Abstract interface for vector stores - allows easy migration between implementations"""
 
+    # Incremented whenever search results may change (documents added or
+    # deleted, index reloaded or re-tuned); lets callers invalidate caches
+    version: int = 0
+
     @abstractmethod
     def add_documents(
         self,
         texts: List[str],
-        embeddings: List[List[float]],
+        embeddings: Embeddings,
         metadatas: Optional[List[Dict[str, Any]]] = None
     ) -> None:
         """
@@ -30,7 +49,7 @@ class VectorStoreInterface(ABC):
 
         Args:
             texts: List of text chunks
-            embeddings: List of embedding vectors (same length as texts)
+            embeddings: Embedding vectors, one row per text
             metadatas: Optional metadata for each document (same length as texts)
         """
         pass
@@ -38,7 +57,7 @@ class VectorStoreInterface(ABC):
     @abstractmethod
     def search(
         self,
-        query_embedding: List[float],
+        query_embedding: Embedding,
         top_k: int = 5
     ) -> List[Dict[str, Any]]:
         """
@@ -53,6 +72,64 @@ class VectorStoreInterface(ABC):
         """
         pass
 
+    def search_batch(
+        self,
+        query_embeddings: Embeddings,
+        top_k: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar documents for several queries at once
+
+        Default implementation runs one search() per query; stores that
+        support matrix queries should override it.
+
+        Args:
+            query_embeddings: Query embedding vectors, one row per query
+            top_k: Number of results to return per query
+
+        Returns:
+            One result list per query (same format as search())
+        """
+        return [self.search(query_embedding, top_k) for query_embedding in query_embeddings]
+
+    def delete_by_source(self, source_path: str) -> int:
+        """
+        Delete every document ingested from a source file
+
+        Args:
+            source_path: The 'source_path' metadata value of the document
+
+        Returns:
+            Number of documents deleted
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support deleting by source")
+
+    def fingerprint(self) -> str:
+        """
+        Identifier of the indexed content, stable across processes when the
+        store is persisted (in-memory stores only guarantee it within a process)
+        """
+        return f"v{self.version}"
+
+    def changed_on_disk(self) -> bool:
+        """
+        Whether another process saved a different store since this one was
+        loaded or saved (stores without a shared disk copy never change)
+        """
+        return False
+
+    def live_ids(self, ids: List[int]) -> List[int]:
+        """
+        Filter chunk IDs to the ones stored and not deleted
+
+        Args:
+            ids: Stable chunk IDs
+
+        Returns:
+            IDs (of the given ones) that have a live document
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support chunk ID lookups")
+
     @abstractmethod
     def delete_all(self) -> None:
         """Clear all documents from the vector store"""
@@ -84,22 +161,72 @@ class FAISSVectorStore(VectorStoreInterface):
     FAISS implementation - Local, fast, free
 
     Uses Facebook AI Similarity Search (FAISS) for efficient vector similarity search.
-    Stores embeddings in memory and persists to disk.
+    Stores embeddings in memory and persists to disk. Chunk texts and metadata
+    live in a memory-mapped ChunkStore, so only search hits are materialized.
+
+    On-disk layout (index_path):
+    - store.json: store ID, current generation, dimension and index type
+    - index-<generation>.faiss: FAISS index
+    - chunks-<generation>/: ChunkStore columns
+
+    Index types:
+    - flat: exact brute-force search (default, best for small knowledge bases)
+    - ivf: IVF-Flat approximate search, trained on the first ingestion batch
+    - hnsw: HNSW graph approximate search, no training required
     """
 
-    def __init__(self, index_path: str, dimension: int = 384):
+    INDEX_TYPES = ("flat", "ivf", "hnsw")
+    STORE_FILE = "store.json"
+
+    def __init__(
+        self,
+        index_path: str,
+        dimension: int = 384,
+        index_type: str = "flat",
+        nlist: int = 100,
+        nprobe: int = 8,
+        hnsw_m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 64,
+        compact_threshold: float = 0.2
+    ):
         """
         Initialize FAISS vector store
 
         Args:
             index_path: Directory path to store FAISS index
             dimension: Dimension of embedding vectors (default: 384 for all-MiniLM-L6-v2)
+            index_type: "flat" (exact search), "ivf" (IVF-Flat) or "hnsw" (HNSW graph)
+            nlist: Number of IVF partitions (ivf only)
+            nprobe: IVF partitions visited per query (ivf only, runtime knob)
+            hnsw_m: Neighbors per HNSW graph node (hnsw only)
+            ef_construction: HNSW build-time candidate list size (hnsw only)
+            ef_search: HNSW query-time candidate list size (hnsw only, runtime knob)
+            compact_threshold: Fraction of deleted chunks above which save() compacts
         """
+        if index_type not in self.INDEX_TYPES:
+            raise ValueError(
+                f"Unknown index type: {index_type}. Use one of: {', '.join(self.INDEX_TYPES)}"
+            )
+
         self.index_path = Path(index_path)
         self.dimension = dimension
+        self.index_type = index_type
+        self.configured_index_type = index_type  # index_type follows the loaded index
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.compact_threshold = compact_threshold
         self.index = None
-        self.texts: List[str] = []
-        self.metadatas: List[Dict[str, Any]] = []
+        self.chunks = ChunkStore()
+        self._generation = 0
+        self.version = 0
+        self._saved_version = 0
+        # Random ID of this store's content lineage (persisted in store.json):
+        # a store rebuilt from scratch at the same path restarts at generation 1
+        self.store_id = uuid.uuid4().hex
 
         # Create directory if it doesn't exist
         self.index_path.mkdir(parents=True, exist_ok=True)
@@ -108,29 +235,138 @@ class FAISSVectorStore(VectorStoreInterface):
         if not self.load():
             self._create_index()
 
-    def _create_index(self) -> None:
-        """Create a new FAISS index"""
+    @property
+    def texts(self):
+        """Lazy, read-only sequence of chunk texts"""
+        return self.chunks.texts
+
+    @property
+    def metadatas(self):
+        """Lazy, read-only sequence of chunk metadata dicts"""
+        return self.chunks.metadatas
+
+    def _create_index(self, nlist: Optional[int] = None) -> None:
+        """
+        Create a new FAISS index of the configured type
+
+        Args:
+            nlist: Override the number of IVF partitions (used when the first
+                training batch is smaller than the configured nlist)
+        """
         try:
             import faiss
 
-            # Use IndexFlatL2 for exact search (cosine similarity via L2 distance)
-            # For large datasets, could use IndexIVFFlat for approximate search
-            self.index = faiss.IndexFlatL2(self.dimension)
+            if self.index_type == "ivf":
+                # IVF-Flat: coarse quantizer + inverted lists. Needs training
+                # before vectors can be added (done on the first batch).
+                quantizer = faiss.IndexFlatL2(self.dimension)
+                self.index = faiss.IndexIVFFlat(
+                    quantizer, self.dimension, nlist or self.nlist, faiss.METRIC_L2
+                )
+            elif self.index_type == "hnsw":
+                # HNSW: graph-based approximate search, no training required
+                self.index = faiss.IndexHNSWFlat(self.dimension, self.hnsw_m)
+                self.index.hnsw.efConstruction = self.ef_construction
+            else:
+                # IndexFlatL2 for exact search (cosine similarity via L2 distance)
+                self.index = faiss.IndexFlatL2(self.dimension)
+
+            self._apply_search_params()
 
-            print(f"✅ Created new FAISS index (dimension: {self.dimension})")
+            print(f"✅ Created new FAISS index (type: {self.index_type}, dimension: {self.dimension})")
         except ImportError:
             print("❌ FAISS not installed. Run: pip install faiss-cpu")
             raise
 
+    def _train_index(self, vectors) -> None:
+        """
+        Train an IVF index on the first batch of (normalized) vectors
+
+        FAISS needs at least one training vector per partition, so nlist is
+        reduced when the first batch is smaller than the configured value.
+        """
+        nlist = min(self.nlist, len(vectors))
+        if nlist < self.nlist:
+            print(f"⚠️  Only {len(vectors)} training vectors: reducing IVF nlist "
+                  f"from {self.nlist} to {nlist}")
+            self._create_index(nlist=nlist)
+
+        self.index.train(vectors)
+        print(f"✅ Trained IVF index on {len(vectors)} vectors (nlist: {nlist})")
+
+    def _apply_search_params(self) -> None:
+        """Apply runtime search knobs (nprobe / efSearch) to the current index"""
+        import faiss
+
+        if isinstance(self.index, faiss.IndexIVF):
+            self.index.nprobe = min(self.nprobe, self.index.nlist)
+        elif isinstance(self.index, faiss.IndexHNSW):
+            self.index.hnsw.efSearch = self.ef_search
+
+    def set_search_params(
+        self,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None
+    ) -> None:
+        """
+        Tune the recall/latency trade-off of approximate indexes at runtime
+
+        Args:
+            nprobe: IVF partitions visited per query (higher = better recall, slower)
+            ef_search: HNSW candidate list size (higher = better recall, slower)
+        """
+        if nprobe is not None:
+            self.nprobe = nprobe
+        if ef_search is not None:
+            self.ef_search = ef_search
+
+        self._apply_search_params()
+        self.version += 1
+
+    @staticmethod
+    def _detect_index_type(index) -> str:
+        """Infer the index type of an index loaded from disk"""
+        import faiss
+
+        if isinstance(index, faiss.IndexIVF):
+            return "ivf"
+        if isinstance(index, faiss.IndexHNSW):
+            return "hnsw"
+        return "flat"
+
     def add_documents(
         self,
         texts: List[str],
-        embeddings: List[List[float]],
+        embeddings: Embeddings,
         metadatas: Optional[List[Dict[str, Any]]] = None
     ) -> None:
-        """Add documents to FAISS index"""
+        """Add documents to FAISS index (chunks already indexed are replaced)"""
+        self.upsert_documents(texts, embeddings, metadatas)
+
+    def upsert_documents(
+        self,
+        texts: List[str],
+        embeddings: Embeddings,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        ids: Optional[List[int]] = None
+    ) -> Dict[str, int]:
+        """
+        Insert new chunks and replace existing ones with the same stable ID
+
+        Replaced rows are tombstoned (skipped by search) and physically removed
+        by compact(), so the cost is proportional to the batch, not the corpus.
+
+        Args:
+            texts: List of text chunks
+            embeddings: Embedding vectors, one row per text
+            metadatas: Optional metadata for each chunk (same length as texts)
+            ids: Optional stable chunk IDs (default: derived from source_path + chunk_index)
+
+        Returns:
+            Dict with counts: {inserted, updated}
+        """
         if len(texts) == 0 or len(embeddings) == 0:
-            return
+            return {"inserted": 0, "updated": 0}
 
         if len(texts) != len(embeddings):
             raise ValueError(f"Mismatch: {len(texts)} texts but {len(embeddings)} embeddings")
@@ -138,114 +374,327 @@ class FAISSVectorStore(VectorStoreInterface):
         if metadatas and len(metadatas) != len(texts):
             raise ValueError(f"Mismatch: {len(texts)} texts but {len(metadatas)} metadatas")
 
+        metadatas = list(metadatas) if metadatas else [{} for _ in texts]
+        if ids is None:
+            ids = [make_chunk_id(text, meta) for text, meta in zip(texts, metadatas)]
+        elif len(ids) != len(texts):
+            raise ValueError(f"Mismatch: {len(texts)} texts but {len(ids)} ids")
+
         try:
             import faiss
             import numpy as np
 
-            # Convert embeddings to numpy array
-            embeddings_array = np.array(embeddings, dtype=np.float32)
+            # Within one batch the last occurrence of an ID wins
+            last_position = {int(chunk_id): i for i, chunk_id in enumerate(ids)}
+            positions = sorted(last_position.values())
+
+            # Own float32 copy (normalized in place below); lists are converted here
+            embeddings_array = np.array(embeddings, dtype=np.float32).reshape(-1, self.dimension)
+            if len(positions) != len(embeddings_array):
+                embeddings_array = embeddings_array[positions]
 
             # Normalize vectors for cosine similarity (L2 distance of normalized vectors = cosine distance)
             faiss.normalize_L2(embeddings_array)
 
+            # IVF indexes are trained on the first batch they receive
+            if not self.index.is_trained:
+                self._train_index(embeddings_array)
+
+            # Tombstone the current version of chunks being replaced
+            replaced = self.chunks.delete_rows(self.chunks.rows_for_ids(last_position))
+
             # Add to index
             self.index.add(embeddings_array)
 
-            # Store texts and metadatas
-            self.texts.extend(texts)
-
-            if metadatas:
-                self.metadatas.extend(metadatas)
-            else:
-                self.metadatas.extend([{}] * len(texts))
+            # Store texts, metadatas and IDs (row position == FAISS position)
+            self.chunks.append(
+                [texts[i] for i in positions],
+                [metadatas[i] for i in positions],
+                [int(ids[i]) for i in positions]
+            )
 
-            print(f"✅ Added {len(texts)} documents to FAISS index (total: {len(self.texts)})")
+            self.version += 1
+            counts = {"inserted": len(positions) - replaced, "updated": replaced}
+            print(f"✅ Upserted {len(positions)} documents into FAISS index "
+                  f"({counts['inserted']} new, {counts['updated']} updated, "
+                  f"total: {self.chunks.live_count})")
+            return counts
 
         except ImportError:
             print("❌ FAISS or numpy not installed")
             raise
 
+    def delete_by_source(self, source_path: str) -> int:
+        """
+        Delete every chunk ingested from a source document
+
+        Args:
+            source_path: The 'source_path' metadata value of the document
+
+        Returns:
+            Number of chunks deleted
+        """
+        rows = self.chunks.find_rows("source_path", source_path)
+        deleted = self.chunks.delete_rows(rows)
+
+        if deleted:
+            self.version += 1
+            print(f"✅ Deleted {deleted} chunks of {source_path} from FAISS index")
+        return deleted
+
+    def delete_ids(self, ids: List[int]) -> int:
+        """
+        Delete chunks by stable ID
+
+        Returns:
+            Number of chunks deleted
+        """
+        deleted = self.chunks.delete_rows(self.chunks.rows_for_ids(ids))
+        if deleted:
+            self.version += 1
+        return deleted
+
+    def live_ids(self, ids: List[int]) -> List[int]:
+        """Filter chunk IDs to the ones stored and not deleted"""
+        return [self.chunks.chunk_id(row) for row in self.chunks.rows_for_ids(ids)]
+
+    def compact(self) -> None:
+        """
+        Rebuild the index without deleted chunks and save it
+
+        The live vectors are read back from the current index, so nothing is
+        re-embedded. IVF indexes are retrained on the remaining vectors.
+        """
+        if self.chunks.deleted_count == 0:
+            return
+
+        import faiss
+        import numpy as np
+
+        keep = ~self.chunks.deleted_mask()
+
+        if isinstance(self.index, faiss.IndexIVF):
+            self.index.make_direct_map()
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)[keep]
+
+        removed = self.chunks.deleted_count
+        self._create_index()
+        if len(vectors):
+            if not self.index.is_trained:
+                self._train_index(vectors)
+            self.index.add(vectors)
+
+        self._write_generation(keep)
+        print(f"✅ Compacted FAISS index: removed {removed} deleted chunks "
+              f"(total: {len(self.chunks)})")
+
     def search(
         self,
-        query_embedding: List[float],
+        query_embedding: Embedding,
         top_k: int = 5
     ) -> List[Dict[str, Any]]:
         """Search FAISS index for similar documents"""
+        return self.search_batch(np.asarray(query_embedding, dtype=np.float32).reshape(1, -1), top_k)[0]
+
+    def search_batch(
+        self,
+        query_embeddings: Embeddings,
+        top_k: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """Search FAISS index for several queries with a single matrix search"""
+        if len(query_embeddings) == 0:
+            return []
+
         if self.index.ntotal == 0:
             print("⚠️  Index is empty. No documents to search.")
-            return []
+            return [[] for _ in range(len(query_embeddings))]
 
         try:
             import faiss
             import numpy as np
 
-            # Convert query to numpy array and normalize
-            query_array = np.array([query_embedding], dtype=np.float32)
+            # Own (n_queries, dimension) float32 copy, normalized in place
+            query_array = np.array(query_embeddings, dtype=np.float32).reshape(-1, self.dimension)
             faiss.normalize_L2(query_array)
 
-            # Search
-            top_k = min(top_k, self.index.ntotal)  # Don't request more than available
-            distances, indices = self.index.search(query_array, top_k)
+            # Search (over-fetch so deleted chunks can be skipped)
+            fetch_k = min(top_k + self.chunks.deleted_count, self.index.ntotal)
+            distances, indices = self.index.search(query_array, fetch_k)
 
             # Convert L2 distances to similarity scores (1 - distance)
             # Normalized L2 distance ranges from 0 (identical) to 2 (opposite)
             # Convert to similarity score: 1 - (distance / 2)
-            similarities = 1 - (distances[0] / 2)
+            similarities = 1 - (distances / 2)
 
             # Build results
-            results = []
-            for idx, score in zip(indices[0], similarities):
-                if idx < len(self.texts):  # Valid index
-                    results.append({
-                        "text": self.texts[idx],
-                        "score": float(score),  # Convert numpy float to Python float
-                        "metadata": self.metadatas[idx] if idx < len(self.metadatas) else {}
-                    })
-
-            return results
+            batch_results = []
+            for row_indices, row_scores in zip(indices, similarities):
+                results = []
+                for idx, score in zip(row_indices, row_scores):
+                    if len(results) == top_k:
+                        break
+                    # Valid index (-1 = no result for IVF), not deleted
+                    if 0 <= idx < len(self.chunks) and not self.chunks.is_deleted(int(idx)):
+                        results.append({
+                            "id": self.chunks.chunk_id(int(idx)),
+                            "text": self.chunks.text(int(idx)),
+                            "score": float(score),  # Convert numpy float to Python float
+                            "metadata": self.chunks.metadata(int(idx))
+                        })
+                batch_results.append(results)
+
+            return batch_results
 
         except ImportError:
             print("❌ FAISS or numpy not installed")
             raise
 
     def delete_all(self) -> None:
-        """Clear all documents from FAISS index"""
+        """
+        Clear all documents from FAISS index
+
+        The fresh index has the configured index type, so clearing and
+        re-ingesting is how a persisted index switches type (the next
+        save() replaces the files on disk).
+        """
+        self.index_type = self.configured_index_type
         self._create_index()  # Create fresh index
-        self.texts = []
-        self.metadatas = []
+        self.chunks = ChunkStore()
+        self.store_id = uuid.uuid4().hex
+        self.version += 1
         print("✅ Deleted all documents from FAISS index")
 
     def save(self) -> None:
-        """Save FAISS index and metadata to disk"""
+        """
+        Save FAISS index and chunk store to disk
+
+        Each save writes a new generation (index-<n>.faiss + chunks-<n>/) and then
+        atomically switches store.json to it, so a crash mid-save leaves the
+        previous generation intact. The index is compacted first when more than
+        compact_threshold of its rows are deleted.
+        """
+        total = len(self.chunks)
+        if total and self.chunks.deleted_count / total > self.compact_threshold:
+            self.compact()
+        else:
+            self._write_generation()
+
+    def _write_generation(self, keep=None) -> None:
+        """
+        Write the index and chunk store as a new generation
+
+        Args:
+            keep: Optional boolean mask of chunk rows to keep (the index must
+                already contain only those rows)
+        """
         try:
             import faiss
 
+            generation = self._generation + 1
+            index_file = self.index_path / f"index-{generation}.faiss"
+            chunks_dir = self.index_path / f"chunks-{generation}"
+
+            # Leftovers from an interrupted save
+            if chunks_dir.exists():
+                shutil.rmtree(chunks_dir)
+
             # Save FAISS index
-            index_file = self.index_path / "index.faiss"
             faiss.write_index(self.index, str(index_file))
+            fsync_path(index_file)
 
-            # Save texts and metadatas
-            data = {
-                "texts": self.texts,
-                "metadatas": self.metadatas,
-                "dimension": self.dimension
-            }
+            # Save texts, metadatas and IDs (columnar, memory-mappable; fsynced)
+            self.chunks.write(chunks_dir, keep=keep)
 
-            metadata_file = self.index_path / "metadata.pkl"
-            with open(metadata_file, "wb") as f:
-                pickle.dump(data, f)
+            # The new generation's entries must be durable before store.json points at them
+            fsync_path(self.index_path)
+
+            self._write_store_file({
+                "format": 1,
+                "store_id": self.store_id,
+                "generation": generation,
+                "dimension": self.dimension,
+                "index_type": self.index_type,
+                "total_documents": self.chunks.live_count if keep is None else int(keep.sum())
+            })
+
+            # Re-open from disk: pending rows are released from memory
+            self._generation = generation
+            self._saved_version = self.version
+            self.chunks = ChunkStore(chunks_dir)
+            self._remove_stale_files()
 
             print(f"✅ Saved FAISS index to {self.index_path}")
             print(f"   - Index: {index_file}")
-            print(f"   - Metadata: {metadata_file}")
-            print(f"   - Documents: {len(self.texts)}")
+            print(f"   - Chunks: {chunks_dir}")
+            print(f"   - Documents: {self.chunks.live_count}")
 
         except Exception as e:
             print(f"❌ Error saving FAISS index: {e}")
             raise
 
+    def _write_store_file(self, data: Dict[str, Any]) -> None:
+        """Atomically replace store.json"""
+        store_file = self.index_path / self.STORE_FILE
+        tmp_file = store_file.with_suffix(".json.tmp")
+
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_file, store_file)
+        fsync_path(self.index_path)
+
+    def _remove_stale_files(self) -> None:
+        """Remove older generations and legacy pickle files"""
+        current = {f"index-{self._generation}.faiss", f"chunks-{self._generation}"}
+
+        for path in self.index_path.iterdir():
+            is_generation = path.name.startswith(("index-", "chunks-"))
+            is_legacy = path.name in ("index.faiss", "metadata.pkl")
+
+            if (is_generation and path.name not in current) or is_legacy:
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+
     def load(self) -> bool:
-        """Load FAISS index from disk"""
+        """Load FAISS index from disk (chunk store is memory-mapped, not read)"""
+        store_file = self.index_path / self.STORE_FILE
+
+        if not store_file.exists():
+            return self._load_legacy()
+
+        try:
+            import faiss
+
+            with open(store_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            generation = data["generation"]
+            index_file = self.index_path / f"index-{generation}.faiss"
+
+            # Load FAISS index
+            self.index = faiss.read_index(str(index_file))
+            self.chunks = ChunkStore(self.index_path / f"chunks-{generation}")
+            self.dimension = data["dimension"]
+            self._generation = generation
+            # Stores saved before store IDs: identified by their index file until the next save
+            self.store_id = data.get("store_id") or f"legacy-{index_file.stat().st_mtime_ns}"
+
+            if self.index.ntotal != len(self.chunks):
+                print(f"⚠️  Index has {self.index.ntotal} vectors but {len(self.chunks)} chunks")
+
+            self._after_load()
+            return True
+
+        except Exception as e:
+            print(f"⚠️  Could not load FAISS index: {e}")
+            return False
+
+    def _load_legacy(self) -> bool:
+        """Load the pre-ChunkStore layout (index.faiss + metadata.pkl)"""
         index_file = self.index_path / "index.faiss"
         metadata_file = self.index_path / "metadata.pkl"
 
@@ -258,35 +707,85 @@ class FAISSVectorStore(VectorStoreInterface):
             # Load FAISS index
             self.index = faiss.read_index(str(index_file))
 
-            # Load texts and metadatas
+            # Load texts and metadatas (converted to the columnar layout on next save)
             with open(metadata_file, "rb") as f:
                 data = pickle.load(f)
 
-            self.texts = data["texts"]
-            self.metadatas = data["metadatas"]
+            self.chunks = ChunkStore.from_lists(data["texts"], data["metadatas"])
             self.dimension = data["dimension"]
+            self._generation = 0
+            self.store_id = f"legacy-{index_file.stat().st_mtime_ns}"
 
-            print(f"✅ Loaded FAISS index from {self.index_path}")
-            print(f"   - Documents: {len(self.texts)}")
-            print(f"   - Dimension: {self.dimension}")
+            print("⚠️  Legacy metadata.pkl found: it will be converted on the next save()")
 
+            self._after_load()
             return True
 
         except Exception as e:
             print(f"⚠️  Could not load FAISS index: {e}")
             return False
 
+    def _after_load(self) -> None:
+        """Reconcile index type and runtime knobs after loading"""
+        # The persisted index wins over the configured type
+        loaded_type = self._detect_index_type(self.index)
+        if loaded_type != self.index_type:
+            print(f"⚠️  Index on disk is '{loaded_type}' but '{self.index_type}' was requested. "
+                  f"Rebuild it (index_knowledge_base.py --force) to switch index type.")
+            self.index_type = loaded_type
+        self._apply_search_params()
+        self.version += 1
+        self._saved_version = self.version
+
+        print(f"✅ Loaded FAISS index from {self.index_path}")
+        print(f"   - Documents: {self.chunks.live_count}")
+        print(f"   - Dimension: {self.dimension}")
+        print(f"   - Index type: {self.index_type}")
+
+    def fingerprint(self) -> str:
+        """
+        Store ID and saved generation, plus changes since it was saved or loaded
+
+        Two processes that load the same saved generation agree on it; any
+        add/delete/reload/re-tune afterwards changes it, and so does
+        rebuilding the store from scratch (a new store ID).
+        """
+        return f"{self.store_id}.g{self._generation}.{self.version - self._saved_version}"
+
+    def changed_on_disk(self) -> bool:
+        """Whether store.json names another store ID or generation than the one in memory"""
+        try:
+            with open(self.index_path / self.STORE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        # Legacy store.json (no store ID) keeps its mtime-based ID until rewritten
+        store_id = data.get("store_id") or self.store_id
+        return (store_id, data.get("generation")) != (self.store_id, self._generation)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about FAISS index"""
-        return {
+        stats = {
             "type": "FAISS",
+            "index_type": self.index_type,
             "dimension": self.dimension,
-            "total_documents": len(self.texts),
+            "total_documents": self.chunks.live_count,
+            "deleted_documents": self.chunks.deleted_count,
             "index_size": self.index.ntotal if self.index else 0,
             "index_path": str(self.index_path),
             "is_trained": self.index.is_trained if self.index else False
         }
 
+        if self.index_type == "ivf":
+            stats["nlist"] = self.index.nlist if self.index else self.nlist
+            stats["nprobe"] = self.nprobe
+        elif self.index_type == "hnsw":
+            stats["hnsw_m"] = self.hnsw_m
+            stats["ef_search"] = self.ef_search
+
+        return stats
+
 
 class PineconeVectorStore(VectorStoreInterface):
     """
@@ -317,6 +816,9 @@ class PineconeVectorStore(VectorStoreInterface):
     def search(self, query_embedding, top_k=5):
         raise NotImplementedError("Pinecone not implemented yet")
 
+    def search_batch(self, query_embeddings, top_k=5):
+        raise NotImplementedError("Pinecone not implemented yet")
+
     def delete_all(self):
         raise NotImplementedError("Pinecone not implemented yet")
 
@@ -0,0 +1,236 @@
+"""
+Verdict Cache for Technical Analyst
+
+Persistent cache of conformity analyses shared across editais: the same
+technical requirement ("Câmeras IP com resolução mínima de 4 MP") shows up
+in edital after edital with trivial wording differences, and each copy would
+otherwise go through retrieval and verdict generation again.
+
+Entries are keyed by the normalized requirement query (case, accents,
+punctuation, whitespace and number formats folded; see normalize_text),
+top_k, the similarity/verdict thresholds and the knowledge base index
+version, so a re-ingested knowledge base or new thresholds never reuse an
+old verdict. Entries older than the TTL are misses.
+
+Storage is a single SQLite file (safe to share between threads and
+concurrent pipeline runs). Manage it with scripts/verdict_cache.py.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from .config import RAGConfig
+from .query_processor import ConformityAnalysis
+
+
+# "1.000" and the integer part of "10.000,50" (not "1.5" or "1.000.5")
+_THOUSANDS = re.compile(r"(?<![\d.,])\d{1,3}(?:\.\d{3})+(?=,\d|(?![\d.,]?\d))")
+_DECIMAL_COMMA = re.compile(r"(?<=\d),(?=\d)")
+# "30.0" but not the ".0" inside dotted numbers ("2.0.1", "192.168.0.1")
+_ZERO_DECIMAL = re.compile(r"(?<![\d.])(\d+)\.0+(?![.\d])")
+_NUMBER_UNIT = re.compile(r"(?<=\d)\s+(?!(?:e|ou|a|o|de|da|do|em|x)\b)(?=[a-z%])")
+_OPERATOR = re.compile(r"\s*(>=|=>|<=|=<|[≥≤<>])\s*")
+_OPERATORS = {">=": "≥", "=>": "≥", "<=": "≤", "=<": "≤"}
+# Separators keep comparison operators and a leading sign ("-10", not "a-10" or "20-30")
+_SEPARATORS = re.compile(r"(?:(?!(?<![\w.])[-+]\d)[^\w%.≥≤<>])+|(?<!\d)\.|\.(?!\d)")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize requirement text for cache lookups
+
+    Folds case and accents, Brazilian number formats ("1.000" -> "1000",
+    "2,5" -> "2.5", "10.000,50" -> "10000.50", "30,0" -> "30"), number/unit spacing ("4 MP" -> "4mp"),
+    punctuation and whitespace. Signs ("-10"), comparison operators
+    (">=" -> "≥") and dotted versions/addresses ("2.0.1") are kept.
+
+    Example:
+        >>> normalize_text("Câmeras IP, resolução mínima de 4 MP.")
+        'cameras ip resolucao minima de 4mp'
+    """
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    text = text.replace("\u2212", "-")  # Unicode minus sign
+
+    text = _THOUSANDS.sub(lambda m: m.group(0).replace(".", ""), text)
+    text = _DECIMAL_COMMA.sub(".", text)
+    text = _ZERO_DECIMAL.sub(r"\1", text)
+    text = _NUMBER_UNIT.sub("", text)
+    text = _OPERATOR.sub(lambda m: f" {_OPERATORS.get(m.group(1), m.group(1))} ", text)
+
+    return " ".join(_SEPARATORS.sub(" ", text).split())
+
+
+class VerdictCache:
+    """
+    Persistent (normalized requirement, settings, KB version) -> analysis cache
+
+    Example:
+        >>> cache = VerdictCache("data/verdict_cache/verdicts.sqlite", ttl_days=30)
+        >>> key = cache.make_key(query, kb_version, {"top_k": 5, "high_confidence": 0.85})
+        >>> cached = cache.get(key)               # ConformityAnalysis or None
+        >>> cache.put(key, query, kb_version, analysis)
+    """
+
+    def __init__(self, path: str, ttl_days: float = 30):
+        """
+        Initialize cache (creates the database if needed)
+
+        Args:
+            path: SQLite database file
+            ttl_days: Entry lifetime in days (<= 0 = never expire)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_days * 86400 if ttl_days > 0 else 0
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            " key TEXT PRIMARY KEY,"
+            " normalized_text TEXT NOT NULL,"
+            " kb_version TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " analysis TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS verdicts_text ON verdicts (normalized_text)")
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: Optional[RAGConfig] = None) -> Optional["VerdictCache"]:
+        """Create the configured cache, or None when RAG_VERDICT_CACHE_PATH is empty"""
+        config = config or RAGConfig()
+        path = getattr(config, "VERDICT_CACHE_PATH", RAGConfig.VERDICT_CACHE_PATH)
+        if not path:
+            return None
+        return cls(path, ttl_days=getattr(config, "VERDICT_CACHE_TTL_DAYS", RAGConfig.VERDICT_CACHE_TTL_DAYS))
+
+    @staticmethod
+    def make_key(text: str, kb_version: str, settings: Dict[str, Any]) -> str:
+        """Cache key of a requirement query analyzed with the given settings"""
+        payload = json.dumps(
+            {"text": normalize_text(text), "kb_version": kb_version, "settings": settings},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ConformityAnalysis]:
+        """Cached analysis for a key, or None (missing or expired)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, analysis FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.ttl_seconds and time.time() - row[0] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM verdicts WHERE key = ?", (key,))
+                self._conn.commit()
+                self.expired += 1
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return ConformityAnalysis.from_dict(json.loads(row[1]))
+
+    def put(self, key: str, text: str, kb_version: str, analysis: ConformityAnalysis) -> None:
+        """Store (or refresh) the analysis of a key"""
+        data = json.dumps(analysis.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, normalized_text, kb_version, created_at, analysis) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, normalize_text(text), kb_version, time.time(), data)
+            )
+            self._conn.commit()
+
+    def invalidate(
+        self,
+        text: Optional[str] = None,
+        kb_version: Optional[str] = None,
+        older_than_days: Optional[float] = None
+    ) -> int:
+        """
+        Delete entries matching every given filter (no filter = everything)
+
+        Args:
+            text: Requirement query, or its leading description (normalized
+                before matching)
+            kb_version: Knowledge base index version
+            older_than_days: Entries created more than this many days ago
+
+        Returns:
+            Number of entries deleted
+        """
+        clauses, params = [], []
+        if text is not None:
+            normalized = normalize_text(text)
+            escaped = normalized.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("(normalized_text = ? OR normalized_text LIKE ? ESCAPE '\\')")
+            params.extend([normalized, escaped + " %"])
+        if kb_version is not None:
+            clauses.append("kb_version = ?")
+            params.append(kb_version)
+        if older_than_days is not None:
+            clauses.append("created_at < ?")
+            params.append(time.time() - older_than_days * 86400)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            deleted = self._conn.execute(f"DELETE FROM verdicts{where}", params).rowcount
+            self._conn.commit()
+        return deleted
+
+    def purge_expired(self) -> int:
+        """Delete entries older than the TTL"""
+        if not self.ttl_seconds:
+            return 0
+        return self.invalidate(older_than_days=self.ttl_seconds / 86400)
+
+    def clear(self) -> int:
+        """Delete every entry"""
+        return self.invalidate()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics (lookups since this instance was opened)"""
+        with self._lock:
+            versions = dict(self._conn.execute(
+                "SELECT kb_version, COUNT(*) FROM verdicts GROUP BY kb_version"
+            ).fetchall())
+
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": sum(versions.values()),
+            "kb_versions": versions,
+            "ttl_days": self.ttl_seconds / 86400,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Multi-Edital Batch Analysis Script
+
+Analyzes every requirements CSV of a directory or glob (e.g. the weekly batch
+of new public tenders) with one shared, warm RAG engine, exporting reports in
+the background and writing a consolidated throughput report.
+
+Usage:
+    python3 scripts/analyze_batch.py <dir|glob> [--output-dir DIR] [--workers N]
+
+Examples:
+    python3 scripts/analyze_batch.py data/weekly/
+    python3 scripts/analyze_batch.py "data/deliveries/*/outputs/requirements.csv" --workers 4
+
+Options:
+    --output-dir DIR          Outputs and batch_report.json (default: output/analysis/batch)
+    --workers N               Editais analyzed concurrently (default: 2)
+    --export-workers N        Background export threads (default: 1)
+    --formats F [F ...]       Report formats (default: json csv markdown)
+    --cluster-threshold X     Analyze one representative of near-identical requirements
+    --resume                  Resume each edital from its journal
+    --warm-up                 Load the RAG engine in the background while CSVs are read
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.technical_analyst.batch_pipeline import BatchPipeline, find_requirement_csvs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Analyze a batch of requirement CSVs with one shared RAG engine"
+    )
+    parser.add_argument("source", help="Directory of requirement CSVs or glob pattern")
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="output/analysis/batch",
+        help="Directory for every edital's outputs and the batch report"
+    )
+    parser.add_argument("--workers", type=int, default=2, help="Editais analyzed concurrently")
+    parser.add_argument("--export-workers", type=int, default=1, help="Background export threads")
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        default=["json", "csv", "markdown"],
+        choices=["json", "jsonl", "csv", "excel", "markdown"],
+        help="Report formats of each edital"
+    )
+    parser.add_argument(
+        "--cluster-threshold",
+        type=float,
+        default=None,
+        help="Analyze one representative of requirements with query cosine >= threshold "
+             "(default: RAG_CLUSTER_THRESHOLD)"
+    )
+    parser.add_argument("--resume", action="store_true", help="Resume each edital from its journal")
+    parser.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="Load the embedding model and FAISS index in a background thread while CSVs are read"
+    )
+
+    args = parser.parse_args()
+
+    if not find_requirement_csvs(args.source):
+        print(f"❌ Nenhum CSV de requisitos encontrado em: {args.source}")
+        return 1
+
+    batch = BatchPipeline(
+        output_dir=args.output_dir,
+        workers=args.workers,
+        export_workers=args.export_workers,
+        cluster_threshold=args.cluster_threshold,
+        warm_up=args.warm_up
+    )
+    report = batch.run(args.source, export_formats=args.formats, resume=args.resume)
+
+    return 1 if report['throughput']['editais_failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
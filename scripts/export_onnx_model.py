@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+ONNX Model Export Script
+
+Exports the embedding model to ONNX and quantizes it to int8 for the
+RAG_EMBEDDINGS_PROVIDER=onnx provider. The onnx provider exports on first use
+anyway; this script does it ahead of time, e.g. on a machine with torch, so
+the CPU hosts only need onnxruntime and tokenizers.
+
+Usage:
+    python3 scripts/export_onnx_model.py [--model NAME] [--output DIR] [--no-quantize]
+
+Options:
+    --model NAME     sentence-transformers model (default: RAG_EMBEDDINGS_MODEL)
+    --output DIR     Export directory (default: RAG_ONNX_MODEL_PATH/<model>)
+    --no-quantize    Export the fp32 model only
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.technical_analyst.config import RAGConfig
+from agents.technical_analyst.onnx_embeddings import export_onnx_model, model_dir_for
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the embedding model to int8 ONNX")
+    parser.add_argument("--model", type=str, default=RAGConfig.EMBEDDINGS_MODEL,
+                        help="sentence-transformers model (default: RAG_EMBEDDINGS_MODEL)")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Export directory (default: RAG_ONNX_MODEL_PATH/<model>)")
+    parser.add_argument("--no-quantize", action="store_true", help="Export the fp32 model only")
+
+    args = parser.parse_args()
+
+    output = args.output or model_dir_for(RAGConfig.ONNX_MODEL_PATH, args.model)
+    try:
+        export_onnx_model(args.model, output, quantize=not args.no_quantize)
+    except ImportError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        print("HINT: pip install sentence-transformers onnx onnxruntime", file=sys.stderr)
+        return 1
+
+    print(f"\nUse it with: RAG_EMBEDDINGS_PROVIDER=onnx RAG_EMBEDDINGS_MODEL={args.model}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
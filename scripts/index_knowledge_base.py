@@ -5,12 +5,18 @@ Knowledge Base Indexing Script
 Indexes all documents from the knowledge base directory into FAISS vector store.
 Creates embeddings using sentence-transformers and stores them for RAG search.
 
+Re-runs are incremental: only files added or modified since the last run are
+re-embedded, and chunks of deleted files are removed. Progress is checkpointed
+periodically; --resume continues an interrupted run.
+
 Usage:
     python3 scripts/index_knowledge_base.py [--kb-path PATH] [--force]
 
 Options:
     --kb-path PATH    Path to knowledge base directory (default: data/knowledge_base/mock)
-    --force           Force re-indexing even if index exists
+    --force           Rebuild the index from scratch (switches to the configured index type)
+    --workers N       Parallel ingestion processes (0 = one per CPU core)
+    --resume          Continue an interrupted run from its last checkpoint
     --stats           Export statistics to JSON file
 
 This is a prerequisite for using the Technical Analyst Agent's RAG search.
@@ -39,7 +45,19 @@ def main():
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Force re-indexing even if index already exists"
+        help="Rebuild the index from scratch (every file re-embedded, configured index type)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parallel processes for parsing, chunking and embedding "
+             "(default: RAG_INGEST_WORKERS; 0 = one per CPU core)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run, skipping chunks it already committed"
     )
     parser.add_argument(
         "--stats",
@@ -96,29 +114,41 @@ def main():
 
         if index_exists and not args.force:
             print(f"✅ Index already exists ({stats['vector_store']['total_documents']} documents)")
-            print("💡 Use --force to re-index")
-            print()
+            print("🔄 Updating incrementally (use --force to re-index everything)...")
+        elif args.force and index_exists:
+            print("⚠️  Force re-indexing (clearing existing index, every file is re-embedded)...")
+            rag.reset()
         else:
-            if args.force and index_exists:
-                print("⚠️  Force re-indexing (clearing existing index)...")
-                rag.reset()
-                print()
-
-            # Ingest knowledge base
             print("🚀 Starting indexing process...")
             print("   This may take a few minutes depending on KB size...")
-            print()
+        print()
 
-            ingest_stats = rag.ingest_knowledge_base(kb_path)
+        # Ingest knowledge base
+        ingest_stats = rag.ingest_knowledge_base(
+            kb_path, incremental=not args.force, workers=args.workers, resume=args.resume
+        )
+        diff = ingest_stats.get('diff', {})
 
-            print()
-            print("=" * 70)
-            print("✅ INDEXING COMPLETE")
-            print("=" * 70)
-            print(f"📄 Documents loaded: {ingest_stats['documents_loaded']}")
-            print(f"📦 Total chunks: {ingest_stats['total_chunks']}")
-            print(f"⏱️  Time elapsed: {ingest_stats['time_elapsed']:.2f}s")
-            print()
+        print()
+        print("=" * 70)
+        print("✅ INDEXING COMPLETE")
+        print("=" * 70)
+        print(f"📄 Documents loaded: {ingest_stats['documents_loaded']}")
+        print(f"📦 Total chunks: {ingest_stats['total_chunks']}")
+        if diff:
+            print(f"🔄 Files: {diff['added']} added, {diff['updated']} updated, "
+                  f"{diff['removed']} removed, {diff['unchanged']} unchanged")
+        resumed = ingest_stats.get('resumed', {})
+        if resumed.get('files') or resumed.get('chunks'):
+            print(f"⏯️  Resumed: {resumed['files']} files and {resumed['chunks']} chunks "
+                  f"already committed")
+        dedup = ingest_stats.get('dedup', {})
+        if dedup.get('enabled'):
+            print(f"♻️  Duplicates skipped: {dedup['chunks_dropped']} chunks "
+                  f"({dedup['embeddings_saved']} embeddings saved)")
+        print(f"⏱️  Time elapsed: {ingest_stats['time_elapsed']:.2f}s "
+              f"({ingest_stats.get('workers', 1)} workers)")
+        print()
 
         # Verify with test queries
         if args.verify:
@@ -9,6 +9,28 @@ import sys
 import subprocess
 from pathlib import Path
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def search_via_daemon(query: str, top_k: int) -> bool:
+    """
+    Busca pelo daemon de busca RAG (scripts/rag_search_daemon.py), se ativo
+
+    Returns:
+        False se o daemon não estiver rodando (use o script RAG)
+    """
+    from agents.technical_analyst.search_daemon import SearchClient
+    from scripts.rag_search import DEFAULT_THRESHOLD, print_results
+
+    client = SearchClient.from_config()
+    if client is None or not client.is_available():
+        return False
+
+    results = client.search(query, top_k=top_k, similarity_threshold=DEFAULT_THRESHOLD)
+    print_results(query, top_k, DEFAULT_THRESHOLD, results)
+    return True
+
 
 def search_knowledge_base(query: str, top_k: int = 5):
     """
@@ -28,20 +50,21 @@ def search_knowledge_base(query: str, top_k: int = 5):
     print(f"\n🔍 Buscando: \"{query}\"\n")
     print("═" * 80)
 
-    # Executar busca RAG
+    # Executar busca RAG (daemon ativo evita carregar o modelo a cada busca)
     try:
-        result = subprocess.run(
-            ["python3", str(rag_script), "--requirement", query, "--top-k", str(top_k)],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        if result.returncode == 0:
-            # Formatar output do RAG
-            print(result.stdout)
-        else:
-            print(f"❌ Erro na busca:\n{result.stderr}")
+        if not search_via_daemon(query, top_k):
+            result = subprocess.run(
+                ["python3", str(rag_script), "--requirement", query, "--top-k", str(top_k)],
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
+
+            if result.returncode == 0:
+                # Formatar output do RAG
+                print(result.stdout)
+            else:
+                print(f"❌ Erro na busca:\n{result.stderr}")
 
     except subprocess.TimeoutExpired:
         print("❌ Erro: Busca excedeu tempo limite de 60 segundos")
@@ -7,32 +7,249 @@ and returns relevant evidence for requirement analysis.
 
 Usage:
     python3 scripts/rag_search.py --requirement "text" --top-k 5
+    python3 scripts/rag_search.py --input requirements.csv --output results.jsonl [--batch-size 64]
+
+Bulk mode (--input) loads the engine once, streams requirements from a JSONL
+or Document Structurer CSV file through the batched search path in batches
+of --batch-size, appends one JSON line per requirement to --output as each
+batch completes, and prints per-batch throughput and p50/p95 latency.
+
+When the search daemon (scripts/rag_search_daemon.py) is running, searches
+go through it and skip loading the embedding model and the FAISS index.
 
 This script is used by the Technical Analyst Agent (Claude Code)
 during conformity analysis.
 """
 
 import argparse
+import csv
 import json
 import sys
+import time
 from pathlib import Path
+from typing import Any, Dict, Iterator, List
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agents.technical_analyst import RAGEngine
+# Only the stdlib client is imported up front: --help and daemon searches
+# never load NumPy, FAISS or the embedding model
+from agents.technical_analyst.search_daemon import SearchClient
+
+DEFAULT_THRESHOLD = 0.7
+
+# Requirement ID and text columns/keys of CSV and JSONL inputs, in priority order
+ID_FIELDS = ('id', 'ID')
+TEXT_FIELDS = ('requirement', 'query', 'descricao', 'Descrição', 'Descricao', 'text')
+
+
+def get_searcher(use_daemon: bool = True):
+    """
+    Search backend: the search daemon when it is running, otherwise a RAG
+    engine loaded in this process (both provide search and search_batch)
+    """
+    client = SearchClient.from_config() if use_daemon else None
+    if client is not None and client.is_available():
+        return client
+
+    from agents.technical_analyst import RAGEngine
+    return RAGEngine.from_config()
+
+
+def search(query: str, top_k: int, threshold: float, use_daemon: bool = True):
+    """Search the knowledge base, through the search daemon when it is running"""
+    return get_searcher(use_daemon).search(query, top_k=top_k, similarity_threshold=threshold)
+
+
+def iter_requirements(input_path: str) -> Iterator[Dict[str, str]]:
+    """
+    Stream requirements of a JSONL or CSV file
+
+    JSONL lines are either strings or objects; CSV rows follow the Document
+    Structurer format. Rows without requirement text are skipped.
+
+    Yields:
+        Dicts with keys: {id, requirement}
+    """
+    path = Path(input_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.suffix.lower() == '.csv':
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+
+        for number, row in enumerate(rows, 1):
+            if isinstance(row, str):
+                row = {'requirement': row}
+            text = next((row[key] for key in TEXT_FIELDS if row.get(key)), '')
+            if not str(text).strip():
+                continue
+            req_id = next((row[key] for key in ID_FIELDS if row.get(key)), number)
+            yield {'id': str(req_id), 'requirement': str(text)}
+
+
+def _batches(items: Iterator[Dict[str, str]], batch_size: int) -> Iterator[List[Dict[str, str]]]:
+    """Group a stream into lists of batch_size"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Linearly interpolated percentile (same as numpy.percentile), 0.0 if empty"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback for numpy scalars in search results"""
+    return obj.item() if hasattr(obj, 'item') else str(obj)
+
+
+def run_bulk(
+    input_path: str,
+    output_path: str,
+    top_k: int,
+    threshold: float,
+    batch_size: int = 64,
+    use_daemon: bool = True
+) -> Dict[str, Any]:
+    """
+    Search every requirement of a file, writing results.jsonl incrementally
+
+    Returns:
+        Run stats: requirements, batches, wall time, throughput and
+        p50/p95 batch latency
+    """
+    searcher = get_searcher(use_daemon)
+    batch_size = max(1, batch_size)
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    latencies = []
+    total = 0
+    start = time.time()
+
+    with open(output, 'w', encoding='utf-8') as f:
+        for number, batch in enumerate(_batches(iter_requirements(input_path), batch_size), 1):
+            batch_start = time.time()
+            results = searcher.search_batch(
+                [item['requirement'] for item in batch], top_k=top_k, similarity_threshold=threshold
+            )
+            latency = time.time() - batch_start
+            latencies.append(latency)
+            total += len(batch)
+
+            for item, item_results in zip(batch, results):
+                line = {**item, 'results_count': len(item_results), 'results': item_results}
+                f.write(json.dumps(line, ensure_ascii=False, default=_json_default) + '\n')
+            f.flush()
+
+            rate = len(batch) / latency if latency else 0.0
+            print(f"📦 Lote {number}: {len(batch)} requisitos em {latency * 1000:.0f} ms "
+                  f"({rate:.1f} req/s, total {total})", file=sys.stderr)
+
+    wall_time = time.time() - start
+    return {
+        'requirements': total,
+        'batches': len(latencies),
+        'batch_size': batch_size,
+        'wall_time': wall_time,
+        'requirements_per_second': total / wall_time if wall_time else 0.0,
+        'p50_batch_latency_ms': _percentile(latencies, 50) * 1000,
+        'p95_batch_latency_ms': _percentile(latencies, 95) * 1000,
+        'output': str(output)
+    }
+
+
+def print_results(query: str, top_k: int, threshold: float, results):
+    """Print search results in human-readable form"""
+    print(f"\n{'='*70}")
+    print(f"RAG SEARCH RESULTS")
+    print(f"{'='*70}")
+    print(f"Query: {query}")
+    print(f"Top-K: {top_k}")
+    print(f"Threshold: {threshold}")
+    print(f"Results: {len(results)}")
+    print(f"{'='*70}\n")
+
+    if not results:
+        print("WARNING: No evidence found. Consider:")
+        print("  - Lowering similarity threshold")
+        print("  - Rephrasing query")
+        print("  - Using broader search terms")
+        print()
+    else:
+        for i, result in enumerate(results, 1):
+            metadata = result.get('metadata', {})
+            title = metadata.get('title', metadata.get('filename', 'unknown'))
+            url = metadata.get('url', '')
+            filename = metadata.get('filename', 'unknown')
+            chunk_idx = metadata.get('chunk_index', 0)
+            similarity = result.get('similarity_score', 0.0)
+            text = result.get('text', '')
+
+            print(f"[{i}] {title}")
+            if url:
+                print(f"    URL: {url}")
+            print(f"    File: {filename} (chunk {chunk_idx}) | Similarity: {similarity:.2f}")
+            print(f"    Text: {text[:200]}...")
+            print()
+
+
+def print_bulk_stats(stats: Dict[str, Any]):
+    """Print the bulk mode summary"""
+    print(f"\n{'='*70}")
+    print(f"RAG BULK SEARCH")
+    print(f"{'='*70}")
+    print(f"Requirements: {stats['requirements']} in {stats['batches']} batches of {stats['batch_size']}")
+    print(f"Wall time: {stats['wall_time']:.2f}s ({stats['requirements_per_second']:.1f} req/s)")
+    print(f"Batch latency: p50 {stats['p50_batch_latency_ms']:.0f} ms | "
+          f"p95 {stats['p95_batch_latency_ms']:.0f} ms")
+    print(f"Output: {stats['output']}")
+    print(f"{'='*70}\n")
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Search knowledge base using RAG for requirement analysis"
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--requirement",
         type=str,
-        required=True,
         help="Requirement text to search for"
     )
+    source.add_argument(
+        "--input",
+        type=str,
+        help="Bulk mode: requirements file (.jsonl or Document Structurer .csv)"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Bulk mode: results file (JSONL, one line per requirement)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=64,
+        help="Bulk mode: requirements per batched search (default: 64)"
+    )
     parser.add_argument(
         "--top-k",
         type=int,
@@ -42,27 +259,32 @@ def main():
     parser.add_argument(
         "--threshold",
         type=float,
-        default=0.7,
-        help="Minimum similarity threshold (default: 0.7)"
+        default=DEFAULT_THRESHOLD,
+        help=f"Minimum similarity threshold (default: {DEFAULT_THRESHOLD})"
     )
     parser.add_argument(
         "--output-json",
         action="store_true",
         help="Output in JSON format (default: human-readable)"
     )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Load the RAG engine in this process even if the search daemon is running"
+    )
 
     args = parser.parse_args()
+    if args.input and not args.output:
+        parser.error("--output is required with --input")
 
     try:
-        # Initialize RAG Engine
-        rag = RAGEngine.from_config()
+        if args.input:
+            stats = run_bulk(args.input, args.output, args.top_k, args.threshold,
+                             batch_size=args.batch_size, use_daemon=not args.no_daemon)
+            print_bulk_stats(stats)
+            return 0
 
-        # Search knowledge base
-        results = rag.search(
-            query=args.requirement,
-            top_k=args.top_k,
-            similarity_threshold=args.threshold
-        )
+        results = search(args.requirement, args.top_k, args.threshold, use_daemon=not args.no_daemon)
 
         if args.output_json:
             # JSON output for programmatic use
@@ -75,38 +297,7 @@ def main():
             }
             print(json.dumps(output, indent=2, ensure_ascii=False))
         else:
-            # Human-readable output
-            print(f"\n{'='*70}")
-            print(f"RAG SEARCH RESULTS")
-            print(f"{'='*70}")
-            print(f"Query: {args.requirement}")
-            print(f"Top-K: {args.top_k}")
-            print(f"Threshold: {args.threshold}")
-            print(f"Results: {len(results)}")
-            print(f"{'='*70}\n")
-
-            if not results:
-                print("WARNING: No evidence found. Consider:")
-                print("  - Lowering similarity threshold")
-                print("  - Rephrasing query")
-                print("  - Using broader search terms")
-                print()
-            else:
-                for i, result in enumerate(results, 1):
-                    metadata = result.get('metadata', {})
-                    title = metadata.get('title', metadata.get('filename', 'unknown'))
-                    url = metadata.get('url', '')
-                    filename = metadata.get('filename', 'unknown')
-                    chunk_idx = metadata.get('chunk_index', 0)
-                    similarity = result.get('similarity_score', 0.0)
-                    text = result.get('text', '')
-
-                    print(f"[{i}] {title}")
-                    if url:
-                        print(f"    URL: {url}")
-                    print(f"    File: {filename} (chunk {chunk_idx}) | Similarity: {similarity:.2f}")
-                    print(f"    Text: {text[:200]}...")
-                    print()
+            print_results(args.requirement, args.top_k, args.threshold, results)
 
         return 0
 
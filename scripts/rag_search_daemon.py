@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+RAG Search Daemon Script
+
+Starts the local search daemon: one warm RAG engine (embedding model and
+FAISS index loaded once) answering searches over localhost HTTP, with
+concurrent requests micro-batched into one encode and one index search.
+
+While it runs, scripts/rag_search.py and the orchestrator *buscar command
+search through it instead of loading the engine themselves.
+
+Usage:
+    python3 scripts/rag_search_daemon.py [--url URL] [--max-wait-ms MS] [--max-batch N]
+    python3 scripts/rag_search_daemon.py --status
+
+Options:
+    --url URL           Listen address (default: RAG_SEARCH_DAEMON_URL)
+    --max-wait-ms MS    Micro-batching window (default: RAG_SEARCH_DAEMON_MAX_WAIT_MS)
+    --max-batch N       Maximum searches per batch (default: RAG_SEARCH_DAEMON_MAX_BATCH)
+    --status            Print the running daemon's health and batching stats
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.technical_analyst.config import RAGConfig
+from agents.technical_analyst.search_daemon import SearchClient, SearchDaemon, daemon_address
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve RAG searches from one warm engine over localhost HTTP"
+    )
+    parser.add_argument(
+        "--url",
+        type=str,
+        default=RAGConfig.SEARCH_DAEMON_URL or "http://127.0.0.1:8765",
+        help="Listen address (default: RAG_SEARCH_DAEMON_URL)"
+    )
+    parser.add_argument("--max-wait-ms", type=float, default=None, help="Micro-batching window in ms")
+    parser.add_argument("--max-batch", type=int, default=None, help="Maximum searches per batch")
+    parser.add_argument("--status", action="store_true", help="Show the running daemon's stats")
+
+    args = parser.parse_args()
+
+    client = SearchClient(args.url)
+    if args.status:
+        if not client.is_available():
+            print(f"❌ Nenhum daemon respondendo em {args.url}")
+            return 1
+        print(json.dumps(client.health(), indent=2, ensure_ascii=False))
+        return 0
+
+    if client.is_available():
+        print(f"⚠️  Daemon já em execução em {args.url}")
+        return 1
+
+    from agents.technical_analyst import RAGEngine
+
+    try:
+        rag = RAGEngine.from_config()
+        # Load the embedding model now rather than on the first request
+        rag.search_batch(["warm-up"], top_k=1)
+    except FileNotFoundError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        print("HINT: Run knowledge base ingestion first", file=sys.stderr)
+        return 1
+
+    host, port = daemon_address(args.url)
+    daemon = SearchDaemon(rag, host=host, port=port,
+                          max_wait_ms=args.max_wait_ms, max_batch=args.max_batch)
+
+    print(f"\n🚀 RAG search daemon em {daemon.url}")
+    print(f"   Micro-batching: {daemon.batcher.max_wait * 1000:g} ms / {daemon.batcher.max_batch} por lote")
+    print("   Ctrl+C para encerrar\n")
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Encerrando daemon")
+    finally:
+        daemon.server.server_close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
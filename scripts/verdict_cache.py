@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Verdict Cache Management Script
+
+Inspects and invalidates the persistent cross-edital verdict cache used by
+AnalysisPipeline (RAG_VERDICT_CACHE_PATH).
+
+Usage:
+    python3 scripts/verdict_cache.py stats
+    python3 scripts/verdict_cache.py invalidate --text "Câmeras IP 4MP"
+    python3 scripts/verdict_cache.py invalidate --kb-version 3f2a9c0d1b7e4a55
+    python3 scripts/verdict_cache.py invalidate --older-than 7
+    python3 scripts/verdict_cache.py purge-expired
+    python3 scripts/verdict_cache.py clear
+
+Options:
+    --path PATH       Cache database (default: RAG_VERDICT_CACHE_PATH)
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.technical_analyst.config import RAGConfig
+from agents.technical_analyst.verdict_cache import VerdictCache
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Inspect and invalidate the cross-edital verdict cache"
+    )
+    parser.add_argument(
+        "--path",
+        type=str,
+        default=None,
+        help="Verdict cache database (default: RAG_VERDICT_CACHE_PATH)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="Show entries per knowledge base version")
+
+    invalidate = subparsers.add_parser(
+        "invalidate", help="Delete entries matching every given filter"
+    )
+    invalidate.add_argument("--text", type=str, default=None,
+                            help="Requirement text (normalized before matching)")
+    invalidate.add_argument("--kb-version", type=str, default=None,
+                            help="Knowledge base index version")
+    invalidate.add_argument("--older-than", type=float, default=None, metavar="DAYS",
+                            help="Entries created more than DAYS days ago")
+
+    subparsers.add_parser("purge-expired", help="Delete entries older than the TTL")
+    subparsers.add_parser("clear", help="Delete every entry")
+
+    args = parser.parse_args()
+
+    path = args.path or RAGConfig.VERDICT_CACHE_PATH
+    if not path:
+        print("❌ Verdict cache is disabled: set RAG_VERDICT_CACHE_PATH or pass --path")
+        return 1
+    if not Path(path).exists():
+        print(f"❌ Verdict cache not found: {path}")
+        return 1
+
+    cache = VerdictCache(path, ttl_days=RAGConfig.VERDICT_CACHE_TTL_DAYS)
+    try:
+        if args.command == "stats":
+            stats = cache.get_stats()
+            print(f"📦 Verdict cache: {stats['path']}")
+            print(f"   Entries: {stats['entries']}")
+            ttl = f"{stats['ttl_days']:g} days" if stats['ttl_days'] else "never expires"
+            print(f"   TTL: {ttl}")
+            for kb_version, count in sorted(stats['kb_versions'].items()):
+                print(f"   KB {kb_version}: {count} entries")
+
+        elif args.command == "invalidate":
+            if args.text is None and args.kb_version is None and args.older_than is None:
+                print("❌ Give --text, --kb-version and/or --older-than (or use 'clear')")
+                return 1
+            deleted = cache.invalidate(
+                text=args.text, kb_version=args.kb_version, older_than_days=args.older_than
+            )
+            print(f"🗑️  Invalidated {deleted} entries")
+
+        elif args.command == "purge-expired":
+            print(f"🗑️  Purged {cache.purge_expired()} expired entries")
+
+        elif args.command == "clear":
+            print(f"🗑️  Cleared {cache.clear()} entries")
+    finally:
+        cache.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
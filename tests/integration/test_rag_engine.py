@@ -50,6 +50,10 @@ class MockEmbeddingsManager:
         embedding = np.random.rand(self.dimension).astype('float32')
         return (embedding / np.linalg.norm(embedding)).tolist()
 
+    def embed_queries(self, texts):
+        """Generate mock embeddings for a batch of queries"""
+        return [self.embed_query(text) for text in texts]
+
     def get_dimension(self):
         return self.dimension
 
@@ -229,6 +233,36 @@ da isonomia e a selecionar a proposta mais vantajosa para a Administração.
         # Note: With mock embeddings, relevance depends on text hash similarity
         assert any('ISO' in r['text'] for r in results)
 
+    def test_search_batch_matches_single_search(self, rag_engine, knowledge_base_dir):
+        """Test that search_batch returns the same results as one search() per query"""
+        rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
+
+        queries = ["certificação ISO 27001", "requisitos de qualificação", "licitação"]
+        batch_results = rag_engine.search_batch(queries, top_k=3, similarity_threshold=0.0)
+
+        assert len(batch_results) == len(queries)
+        for query, results in zip(queries, batch_results):
+            single = rag_engine.search(query, top_k=3, similarity_threshold=0.0)
+            assert [r['text'] for r in results] == [r['text'] for r in single]
+            assert all('similarity_score' in r for r in results)
+
+    def test_search_batch_applies_threshold(self, rag_engine, knowledge_base_dir):
+        """Test that search_batch filters each query by the similarity threshold"""
+        rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
+
+        batch_results = rag_engine.search_batch(["licitação", "hardware"], top_k=10,
+                                                similarity_threshold=0.99)
+
+        for results in batch_results:
+            assert all(r['similarity_score'] >= 0.99 for r in results)
+
+    def test_search_batch_empty_query(self, rag_engine, knowledge_base_dir):
+        """Test that search_batch rejects empty queries"""
+        rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
+
+        with pytest.raises(ValueError):
+            rag_engine.search_batch(["licitação", "  "])
+
     def test_search_with_context(self, rag_engine, knowledge_base_dir):
         """Test search_with_context method"""
         rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
@@ -355,6 +389,24 @@ da isonomia e a selecionar a proposta mais vantajosa para a Administração.
         results = new_engine.search("licitação", top_k=3)
         assert len(results) > 0
 
+    def test_reload_if_changed(self, rag_engine, knowledge_base_dir, temp_dir):
+        """Test that a long-running engine picks up an index saved by another process"""
+        rag_engine.vector_store.save()
+        reader_store = FAISSVectorStore(index_path=temp_dir, dimension=384)
+        reader_store.load()
+        reader = RAGEngine(reader_store, MockEmbeddingsManager(dimension=384),
+                           IngestionPipeline(reader_store, MockEmbeddingsManager(dimension=384)),
+                           rag_engine.config)
+        assert not reader.reload_if_changed()
+        version = reader.index_version()
+
+        rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
+        rag_engine.vector_store.save()
+
+        assert reader.reload_if_changed()
+        assert reader.index_version() == rag_engine.index_version() != version
+        assert len(reader.search("licitação", top_k=3)) > 0
+
     def test_empty_query(self, rag_engine, knowledge_base_dir):
         """Test handling of empty query"""
         rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
@@ -370,18 +422,178 @@ da isonomia e a selecionar a proposta mais vantajosa para a Administração.
             rag_engine.search("test query", top_k=5)
 
     def test_multiple_ingestions(self, rag_engine, knowledge_base_dir):
-        """Test multiple ingestions accumulate documents"""
+        """Test re-ingesting the same files replaces their chunks (stable IDs)"""
         # First ingestion
         stats1 = rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
         docs_first = stats1['total_chunks']
 
         # Second ingestion (same files)
-        stats2 = rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
-        docs_second = stats2['total_chunks']
+        rag_engine.ingest_knowledge_base(str(knowledge_base_dir))
 
-        # Total should be doubled
+        # Chunks are upserted, not duplicated
         total_stats = rag_engine.get_stats()
-        assert total_stats['vector_store']['total_documents'] == docs_first + docs_second
+        assert total_stats['vector_store']['total_documents'] == docs_first
+
+
+class CountingEmbeddingsManager(MockEmbeddingsManager):
+    """Mock embeddings manager that counts encoded queries"""
+
+    def __init__(self, dimension=384):
+        super().__init__(dimension)
+        self.encoded_queries = 0
+
+    def embed_query(self, text):
+        self.encoded_queries += 1
+        return super().embed_query(text)
+
+    def embed_queries(self, texts):
+        self.encoded_queries += len(texts)
+        return [super(CountingEmbeddingsManager, self).embed_query(text) for text in texts]
+
+
+class TestRAGEngineQueryCache:
+    """Test the query embedding/results caches of RAGEngine"""
+
+    @pytest.fixture
+    def knowledge_base_dir(self, tmp_path):
+        """Small knowledge base"""
+        kb_dir = tmp_path / "kb"
+        kb_dir.mkdir()
+        for i in range(3):
+            (kb_dir / f"doc_{i}.md").write_text(
+                f"# Documento {i}\n\nCâmeras IP {i} MP com armazenamento de {i * 10} dias.",
+                encoding="utf-8"
+            )
+        return kb_dir
+
+    def make_engine(self, tmp_path, knowledge_base_dir, cache_size=1024, semantic=0.0):
+        """Engine over an ingested FAISS store with counting embeddings"""
+        class MockConfig:
+            TOP_K = 5
+            SIMILARITY_THRESHOLD = 0.0
+            VECTOR_STORE = "faiss"
+            EMBEDDINGS_PROVIDER = "mock"
+            EMBEDDINGS_MODEL = "mock-model"
+            EMBEDDINGS_DIMENSION = 384
+            QUERY_CACHE_SIZE = cache_size
+            SEMANTIC_CACHE_THRESHOLD = semantic
+
+        vector_store = FAISSVectorStore(index_path=str(tmp_path / "index"), dimension=384)
+        embeddings = CountingEmbeddingsManager(384)
+        ingestion = IngestionPipeline(vector_store, embeddings)
+        engine = RAGEngine(vector_store, embeddings, ingestion, MockConfig())
+        engine.ingest_knowledge_base(str(knowledge_base_dir))
+        return engine
+
+    def test_repeated_query_is_cached(self, tmp_path, knowledge_base_dir):
+        """Test that a repeated query is neither re-encoded nor re-searched"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir)
+        first = engine.search("Câmeras IP 4MP", top_k=3)
+
+        with patch.object(engine.vector_store, "search", wraps=engine.vector_store.search) as search:
+            second = engine.search("Câmeras IP 4MP", top_k=3)
+
+        assert second == first
+        assert engine.embeddings.encoded_queries == 1
+        assert search.call_count == 0
+
+        stats = engine.get_stats()["query_cache"]
+        assert stats["results"]["hits"] == 1
+        assert stats["results"]["misses"] == 1
+        assert stats["results"]["hit_rate"] == 0.5
+
+    def test_embed_queries_warms_cache(self, tmp_path, knowledge_base_dir):
+        """Test that queries embedded up front are not encoded again by search"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir)
+        vectors = engine.embed_queries(["Câmeras IP 4MP", "Armazenamento 30 dias"])
+
+        engine.search_batch(["Câmeras IP 4MP", "Armazenamento 30 dias"], top_k=3)
+
+        assert vectors.shape == (2, 384) and vectors.dtype == np.float32
+        assert engine.embeddings.encoded_queries == 2
+
+    def test_cached_results_are_copies(self, tmp_path, knowledge_base_dir):
+        """Test that modifying returned results does not corrupt the cache"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir)
+        first = engine.search("Câmeras IP 4MP", top_k=3)
+        first[0]["metadata"]["filename"] = "changed"
+        first.clear()
+
+        second = engine.search("Câmeras IP 4MP", top_k=3)
+
+        assert len(second) == 3
+        assert second[0]["metadata"]["filename"] != "changed"
+
+    def test_key_includes_top_k_and_threshold(self, tmp_path, knowledge_base_dir):
+        """Test that other top_k/threshold values are searched again, reusing the embedding"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir)
+        engine.search("Câmeras IP 4MP", top_k=3)
+
+        assert len(engine.search("Câmeras IP 4MP", top_k=1)) == 1
+        assert engine.search("Câmeras IP 4MP", top_k=3, similarity_threshold=0.99) == []
+        assert engine.embeddings.encoded_queries == 1
+        assert engine.get_stats()["query_cache"]["embeddings"]["hits"] == 2
+
+    def test_index_change_invalidates_results(self, tmp_path, knowledge_base_dir):
+        """Test that adding documents bumps the index version and drops cached results"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir)
+        engine.search("Câmeras IP 4MP", top_k=10)
+        version = engine.get_stats()["query_cache"]["index_version"]
+
+        engine.vector_store.add_documents(
+            ["Câmeras IP 4MP"], engine.embeddings.embed_documents(["Câmeras IP 4MP"]),
+            [{"filename": "new.md"}]
+        )
+        results = engine.search("Câmeras IP 4MP", top_k=10)
+
+        assert engine.get_stats()["query_cache"]["index_version"] > version
+        assert any(r["metadata"]["filename"] == "new.md" for r in results)
+        assert engine.embeddings.encoded_queries == 1  # Embeddings stay valid
+
+    def test_batch_uses_cache(self, tmp_path, knowledge_base_dir):
+        """Test that search_batch only encodes queries not seen before"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir)
+        single = engine.search("Câmeras IP 4MP", top_k=3)
+
+        batch = engine.search_batch(["Câmeras IP 4MP", "Armazenamento 30 dias"], top_k=3)
+
+        assert batch[0] == single
+        assert engine.embeddings.encoded_queries == 2
+
+    def test_cache_disabled(self, tmp_path, knowledge_base_dir):
+        """Test that QUERY_CACHE_SIZE = 0 searches every time"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir, cache_size=0)
+        engine.search("Câmeras IP 4MP")
+        engine.search("Câmeras IP 4MP")
+
+        stats = engine.get_stats()["query_cache"]
+        assert engine.embeddings.encoded_queries == 2
+        assert not stats["results"]["enabled"]
+        assert stats["results"]["hits"] == 0
+
+    def test_semantic_hit(self, tmp_path, knowledge_base_dir):
+        """Test that a query with a near-identical vector reuses cached results"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir, semantic=0.95)
+        base = engine.embeddings.embed_query("Câmeras IP 4MP")
+        engine.embeddings.embed_query = lambda text: base  # Every query maps to the same vector
+
+        first = engine.search("Câmeras IP 4MP", top_k=3)
+        with patch.object(engine.vector_store, "search", wraps=engine.vector_store.search) as search:
+            second = engine.search("Câmeras IP de 4 MP", top_k=3)
+
+        assert second == first
+        assert search.call_count == 0
+        stats = engine.get_stats()["query_cache"]["results"]
+        assert stats["semantic_hits"] == 1
+        assert stats["total_hit_rate"] == 0.5
+
+    def test_semantic_miss_below_cutoff(self, tmp_path, knowledge_base_dir):
+        """Test that dissimilar queries are searched normally in semantic mode"""
+        engine = self.make_engine(tmp_path, knowledge_base_dir, semantic=0.999)
+        engine.search("Câmeras IP 4MP", top_k=3)
+        engine.search("Armazenamento 30 dias", top_k=3)
+
+        assert engine.get_stats()["query_cache"]["results"]["semantic_hits"] == 0
 
 
 class TestRAGEnginePerformance:
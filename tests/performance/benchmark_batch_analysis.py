@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks for Technical Analyst Batch Analysis
+
+Measures QueryProcessor.analyze_batch throughput (requirements/s) of the
+serial path (analyze_requirement per requirement: one encode call and one
+index search each) against the batched path (all queries of a batch encoded
+in one call, one FAISS search, NumPy scoring), and checks that both produce
+identical ConformityAnalysis results.
+
+No model is loaded: a simulated encoder returns deterministic vectors and
+sleeps --call-ms per encode call plus --text-ms per text, standing in for
+model dispatch and inference cost. The RAGEngine query cache is disabled.
+
+Usage:
+    python3 tests/performance/benchmark_batch_analysis.py [--sizes 100 1000 10000] [--docs 20000]
+
+Author: BidAnalyzee Team
+Date: 2026-10-16
+Version: 1.0.0
+"""
+
+import argparse
+import hashlib
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.query_processor import QueryProcessor
+from agents.technical_analyst.rag_engine import RAGEngine
+from agents.technical_analyst.vector_store import FAISSVectorStore
+
+
+class SimulatedEncoder:
+    """Deterministic query encoder with a fixed cost per call and per text"""
+
+    def __init__(self, dimension: int, call_ms: float, text_ms: float):
+        self.dimension = dimension
+        self.call_seconds = call_ms / 1000
+        self.text_seconds = text_ms / 1000
+
+    def _vector(self, text: str) -> np.ndarray:
+        seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+        return np.random.default_rng(seed).standard_normal(self.dimension).astype(np.float32)
+
+    def embed_query(self, text: str) -> np.ndarray:
+        time.sleep(self.call_seconds + self.text_seconds)
+        return self._vector(text)
+
+    def embed_queries(self, texts):
+        time.sleep(self.call_seconds + self.text_seconds * len(texts))
+        return np.stack([self._vector(text) for text in texts])
+
+
+def build_engine(index_dir: str, n_docs: int, dimension: int, encoder: SimulatedEncoder) -> RAGEngine:
+    """RAG engine over a flat FAISS index of clustered random documents"""
+    class BenchmarkConfig:
+        TOP_K = 5
+        SIMILARITY_THRESHOLD = 0.0
+        VECTOR_STORE = "faiss"
+        EMBEDDINGS_PROVIDER = "simulated"
+        EMBEDDINGS_MODEL = "simulated"
+        EMBEDDINGS_DIMENSION = dimension
+        QUERY_CACHE_SIZE = 0
+
+    rng = np.random.default_rng(42)
+    centers = rng.standard_normal((max(n_docs // 200, 8), dimension)).astype(np.float32)
+    docs = centers[rng.integers(0, len(centers), n_docs)]
+    docs = docs + 0.5 * rng.standard_normal((n_docs, dimension)).astype(np.float32)
+
+    store = FAISSVectorStore(index_path=index_dir, dimension=dimension)
+    store.add_documents(
+        [f"Trecho {i} da base de conhecimento" for i in range(n_docs)],
+        docs,
+        [{"filename": f"doc_{i % 97}.md", "chunk_index": i} for i in range(n_docs)]
+    )
+    return RAGEngine(store, encoder, None, BenchmarkConfig())
+
+
+def make_requirements(n: int):
+    """Unique requirements (no query cache effects)"""
+    return [
+        {"id": f"REQ-{i:05d}", "descricao": f"Câmeras IP {i} com resolução mínima 4MP",
+         "tipo": "Técnico", "categoria": "Hardware"}
+        for i in range(n)
+    ]
+
+
+def benchmark(sizes, engine: RAGEngine, batch_size: int):
+    print("=" * 72)
+    print(f"analyze_batch throughput (batch_size={batch_size})")
+    print("=" * 72)
+    print(f"{'Reqs':>7} {'Serial s':>9} {'Batch s':>8} {'Serial req/s':>13} "
+          f"{'Batch req/s':>12} {'Speedup':>8} {'Identical':>10}")
+
+    for n in sizes:
+        requirements = make_requirements(n)
+
+        start = time.perf_counter()
+        serial = QueryProcessor(engine).analyze_batch(requirements, show_progress=False, batch_size=1)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = QueryProcessor(engine).analyze_batch(
+            requirements, show_progress=False, batch_size=batch_size
+        )
+        batch_time = time.perf_counter() - start
+
+        identical = [a.to_dict() for a in serial] == [a.to_dict() for a in batched]
+        print(f"{n:>7} {serial_time:>9.2f} {batch_time:>8.2f} {n / serial_time:>13.0f} "
+              f"{n / batch_time:>12.0f} {serial_time / batch_time:>7.1f}x {str(identical):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serial vs batched conformity analysis")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="Requirements per run")
+    parser.add_argument("--docs", type=int, default=20000, help="Indexed chunks")
+    parser.add_argument("--dimension", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--batch-size", type=int, default=256, help="analyze_batch batch size")
+    parser.add_argument("--call-ms", type=float, default=2.0, help="Simulated cost per encode call")
+    parser.add_argument("--text-ms", type=float, default=0.2, help="Simulated cost per encoded text")
+    args = parser.parse_args()
+
+    index_dir = tempfile.mkdtemp()
+    try:
+        encoder = SimulatedEncoder(args.dimension, args.call_ms, args.text_ms)
+        engine = build_engine(index_dir, args.docs, args.dimension, encoder)
+        benchmark(args.sizes, engine, args.batch_size)
+    finally:
+        shutil.rmtree(index_dir)
+
+
+if __name__ == "__main__":
+    main()
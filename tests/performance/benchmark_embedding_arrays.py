@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks for Technical Analyst Embedding Hand-off
+
+Measures the cost of moving encoder output into the FAISS index:
+- legacy: ndarray -> .tolist() (embed_documents) -> np.array(float32) (add_documents)
+- arrays: contiguous float32 ndarray end to end (one copy, normalized in place)
+
+for document batches (latency, and peak Python memory via tracemalloc) and for
+single queries (embed_query -> search round-trip overhead per query).
+No model is loaded: random vectors stand in for the encoder output.
+
+Usage:
+    python3 tests/performance/benchmark_embedding_arrays.py [--docs 200000] [--dims 384 768]
+
+Author: BidAnalyzee Team
+Date: 2026-10-16
+Version: 1.0.0
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.embeddings_manager import as_float32
+
+
+def legacy_documents(encoded: np.ndarray) -> np.ndarray:
+    """Previous hand-off: nested lists between the embeddings manager and the store"""
+    as_lists = encoded.tolist()
+    return np.array(as_lists, dtype=np.float32)
+
+
+def array_documents(encoded: np.ndarray) -> np.ndarray:
+    """Current hand-off: float32 array, copied once by the store before normalizing"""
+    return np.array(as_float32(encoded), dtype=np.float32)
+
+
+def elapsed(fn, encoded: np.ndarray) -> float:
+    """Wall time of one hand-off"""
+    gc.collect()
+    start = time.perf_counter()
+    fn(encoded)
+    return time.perf_counter() - start
+
+
+def peak_mb(fn, encoded: np.ndarray) -> float:
+    """Peak traced memory (MB) of one hand-off (tracing slows it down: timed separately)"""
+    gc.collect()
+    tracemalloc.start()
+    result = fn(encoded)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / (1024 * 1024)
+
+
+def benchmark_documents(n_docs: int, memory_docs: int, dims):
+    print("=" * 72)
+    print(f"Document embeddings hand-off ({n_docs} vectors timed, "
+          f"memory scaled from {memory_docs})")
+    print("=" * 72)
+    print(f"{'Dim':>5} {'Legacy s':>10} {'Array s':>9} {'Speedup':>8} "
+          f"{'Legacy MB':>10} {'Array MB':>9} {'Saved':>7}")
+
+    rng = np.random.default_rng(0)
+    scale = n_docs / memory_docs
+    for dim in dims:
+        encoded = rng.random((n_docs, dim), dtype=np.float32)
+
+        legacy_time = elapsed(legacy_documents, encoded)
+        array_time = elapsed(array_documents, encoded)
+        legacy_mb = peak_mb(legacy_documents, encoded[:memory_docs]) * scale
+        array_mb = peak_mb(array_documents, encoded[:memory_docs]) * scale
+
+        print(f"{dim:>5} {legacy_time:>10.3f} {array_time:>9.3f} {legacy_time / array_time:>7.1f}x "
+              f"{legacy_mb:>10.1f} {array_mb:>9.1f} {1 - array_mb / legacy_mb:>6.0%}")
+
+
+def benchmark_queries(n_queries: int, dims):
+    print()
+    print("=" * 72)
+    print(f"Query embedding round-trip ({n_queries} single queries)")
+    print("=" * 72)
+    print(f"{'Dim':>5} {'Legacy us/query':>16} {'Array us/query':>15} {'Speedup':>8}")
+
+    rng = np.random.default_rng(1)
+    for dim in dims:
+        queries = list(rng.random((n_queries, dim), dtype=np.float32))
+
+        start = time.perf_counter()
+        for query in queries:
+            np.array([query.tolist()], dtype=np.float32).reshape(-1, dim)
+        legacy = (time.perf_counter() - start) / n_queries * 1e6
+
+        start = time.perf_counter()
+        for query in queries:
+            np.array(as_float32(query), dtype=np.float32).reshape(1, -1)
+        array = (time.perf_counter() - start) / n_queries * 1e6
+
+        print(f"{dim:>5} {legacy:>16.1f} {array:>15.1f} {legacy / array:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding hand-off (lists vs float32 arrays)")
+    parser.add_argument("--docs", type=int, default=200000, help="Document vectors per batch")
+    parser.add_argument("--memory-docs", type=int, default=20000,
+                        help="Vectors traced for peak memory (scaled to --docs)")
+    parser.add_argument("--queries", type=int, default=10000, help="Single queries")
+    parser.add_argument("--dims", type=int, nargs="+", default=[384, 768], help="Embedding dimensions")
+    args = parser.parse_args()
+
+    benchmark_documents(args.docs, min(args.memory_docs, args.docs), args.dims)
+    benchmark_queries(args.queries, args.dims)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks for Technical Analyst Startup
+
+Measures CLI startup cost with `python -X importtime`, each case in a fresh
+interpreter:
+- package: `import agents.technical_analyst` (lazy __getattr__, nothing loaded)
+- client: the stdlib search daemon client used by rag_search.py
+- eager: `from agents.technical_analyst import *` (every submodule, i.e. what
+  the package import cost before lazy attribute loading)
+- rag_search --help: wall time of the whole CLI
+
+Import times are the cumulative microseconds of the top-level imports (site
+excluded); the slowest modules of the eager case are listed. No embedding
+model is loaded by any case: RAGEngine.from_config defers it to the first
+embed call.
+
+Usage:
+    python3 tests/performance/benchmark_import_time.py [--runs 5]
+
+Author: BidAnalyzee Team
+Date: 2026-10-17
+Version: 1.0.0
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent.parent
+
+CASES = {
+    "package": "import agents.technical_analyst",
+    "client": "from agents.technical_analyst.search_daemon import SearchClient",
+    "eager": "from agents.technical_analyst import *",
+}
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(statement: str) -> Tuple[float, Dict[str, int]]:
+    """
+    Run one statement under -X importtime in a fresh interpreter
+
+    Returns:
+        (total ms of top-level imports except site, cumulative us per module)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    total_us = 0
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        _, cum_us, indent, module = match.groups()
+        cumulative[module] = int(cum_us)
+        if len(indent) == 1 and module != "site":
+            total_us += int(cum_us)
+    return total_us / 1000, cumulative
+
+
+def wall_time(command: List[str]) -> float:
+    """Wall time (ms) of a command in a fresh interpreter"""
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Technical Analyst import/startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per case (median reported)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest modules listed for the eager case")
+    args = parser.parse_args()
+
+    print(f"\n{'='*70}")
+    print(f"STARTUP BENCHMARK (-X importtime, median of {args.runs} runs)")
+    print(f"{'='*70}")
+
+    medians = {}
+    for name, statement in CASES.items():
+        runs = [import_times(statement) for _ in range(args.runs)]
+        medians[name] = statistics.median(total for total, _ in runs)
+        print(f"{name:<10} {medians[name]:>8.1f} ms   {statement}")
+
+    if medians["package"]:
+        print(f"\nLazy package import: {medians['eager'] / medians['package']:.0f}x faster than eager "
+              f"({medians['eager'] - medians['package']:.0f} ms saved per CLI start)")
+
+    _, eager = import_times(CASES["eager"])
+    modules = sorted(
+        ((module, us) for module, us in eager.items()
+         if module.startswith("agents.") or module in ("numpy", "faiss", "dotenv")),
+        key=lambda item: -item[1]
+    )
+    print(f"\nSlowest imports of the eager case:")
+    for module, us in modules[:args.top]:
+        print(f"  {us / 1000:>8.1f} ms  {module}")
+
+    help_ms = statistics.median(
+        wall_time([sys.executable, "scripts/rag_search.py", "--help"]) for _ in range(args.runs)
+    )
+    baseline_ms = statistics.median(wall_time([sys.executable, "-c", "pass"]) for _ in range(args.runs))
+    print(f"\nrag_search.py --help: {help_ms:.0f} ms wall ({baseline_ms:.0f} ms bare interpreter)")
+    print(f"{'='*70}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks for ONNX Runtime Embeddings
+
+Measures CPU embedding throughput (texts/s) of the current path,
+SentenceTransformer.encode (PyTorch), against the onnx provider's
+OnnxEncoder on the fp32 export and on the int8 dynamically quantized export,
+and reports the cosine agreement of each ONNX variant with the PyTorch
+vectors (mean and minimum over all texts).
+
+Texts are synthetic requirement/chunk-like Portuguese sentences of mixed
+lengths (short requirements up to ~chunk-size paragraphs). Every case is run
+once untimed as warm-up. The model is exported to a temporary directory
+unless --model-dir points at an existing export.
+
+Needs sentence-transformers, torch, onnx, onnxruntime and tokenizers.
+
+Usage:
+    python3 tests/performance/benchmark_onnx_embeddings.py [--model all-MiniLM-L6-v2] [--texts 2000]
+    python3 tests/performance/benchmark_onnx_embeddings.py --model paraphrase-multilingual-mpnet-base-v2
+
+Author: BidAnalyzee Team
+Date: 2026-10-17
+Version: 1.0.0
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.onnx_embeddings import OnnxEncoder, export_onnx_model
+
+
+WORDS = (
+    "câmera ip resolução mínima 4mp nvr gravação contínua switch poe gerenciável portas vlan qos "
+    "garantia meses suporte técnico instalação configuração licença software armazenamento dias "
+    "fornecimento equipamentos compatível protocolo onvif criptografia acesso remoto monitoramento "
+    "edital licitação proposta habilitação técnica atestado capacidade registro crea prazo entrega "
+    "infraestrutura cabeamento estruturado rack nobreak autonomia minutos sensor alarme integração"
+).split()
+
+
+def make_texts(n_texts: int, seed: int = 0):
+    """Requirement- and chunk-like texts: 60% short (5-25 words), 40% long (60-200 words)"""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n_texts):
+        n_words = rng.randint(5, 25) if rng.random() < 0.6 else rng.randint(60, 200)
+        texts.append(" ".join(rng.choice(WORDS) for _ in range(n_words)).capitalize() + ".")
+    return texts
+
+
+def throughput(encode, texts, runs: int):
+    """Best texts/s over runs (after one untimed warm-up) and the vectors"""
+    vectors = encode(texts[:64])
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        vectors = encode(texts)
+        best = min(best, time.perf_counter() - start)
+    return len(texts) / best, np.asarray(vectors, dtype=np.float32)
+
+
+def cosines(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity"""
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return (a * b).sum(axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ONNX Runtime (int8) vs PyTorch embeddings on CPU")
+    parser.add_argument("--model", type=str, default="all-MiniLM-L6-v2", help="sentence-transformers model")
+    parser.add_argument("--model-dir", type=str, default=None, help="Existing ONNX export (default: export now)")
+    parser.add_argument("--texts", type=int, default=2000, help="Texts embedded per run")
+    parser.add_argument("--batch-size", type=int, default=32, help="Texts per inference call")
+    parser.add_argument("--threads", type=int, default=0, help="ONNX Runtime intra-op threads (0: per core)")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per case (best reported)")
+    args = parser.parse_args()
+
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        print(f"❌ {e}: pip install sentence-transformers onnx onnxruntime")
+        return 1
+
+    texts = make_texts(args.texts)
+    print(f"\n{'='*72}")
+    print(f"ONNX EMBEDDINGS BENCHMARK: {args.model}")
+    print(f"{args.texts} texts, batch {args.batch_size}, torch threads {torch.get_num_threads()}, "
+          f"best of {args.runs} runs")
+    print(f"{'='*72}")
+
+    reference = SentenceTransformer(args.model, device="cpu")
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = args.model_dir or export_onnx_model(args.model, Path(tmp) / "onnx")
+
+        rate, expected = throughput(
+            lambda batch: reference.encode(batch, batch_size=args.batch_size, convert_to_numpy=True,
+                                           show_progress_bar=False),
+            texts, args.runs
+        )
+        print(f"\n{'Case':<22} {'Texts/s':>10} {'Speedup':>8} {'Cos mean':>9} {'Cos min':>9}")
+        print(f"{'PyTorch encode':<22} {rate:>10.1f} {'1.0x':>8} {'-':>9} {'-':>9}")
+
+        for name, quantized in (("ONNX fp32", False), ("ONNX int8", True)):
+            encoder = OnnxEncoder(model_dir, quantized=quantized, threads=args.threads)
+            onnx_rate, vectors = throughput(
+                lambda batch: encoder.encode(batch, batch_size=args.batch_size), texts, args.runs
+            )
+            agreement = cosines(vectors, expected)
+            print(f"{name:<22} {onnx_rate:>10.1f} {onnx_rate / rate:>7.1f}x "
+                  f"{agreement.mean():>9.4f} {agreement.min():>9.4f}")
+
+        model_files = sorted(Path(model_dir).glob("*.onnx"))
+        print("\n" + "   ".join(f"{path.name}: {path.stat().st_size / 1024 ** 2:.0f} MB" for path in model_files))
+    print(f"{'='*72}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
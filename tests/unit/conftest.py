@@ -0,0 +1,109 @@
+"""
+Pytest fixtures for unit tests
+
+Provides the RAG engine double shared by the query processor, pipeline,
+journal, cache, clustering, batch, daemon and bulk-search tests
+"""
+
+import pytest
+import random
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.verdict_cache import normalize_text
+
+
+class FakeRAG:
+    """
+    Thread-safe RAG engine double whose results depend only on the query text
+
+    Records every searched query (queries), every search_batch call as
+    (queries, top_k, threshold) (batches) and the number of embedded queries
+    (embedded, bag-of-words vectors).
+    """
+
+    def __init__(
+        self,
+        version="fake-index",
+        min_results=1,
+        min_score=0.7,
+        normalize=False,
+        fail_on=None,
+        crash_after=None,
+        latency=0.0
+    ):
+        """
+        Args:
+            version: Value of index_version()
+            min_results: Fewest results per query (None: always top_k)
+            min_score: Lowest similarity score
+            normalize: Derive results from normalize_text(query), so queries
+                differing only in case/accents/number format get the same ones
+            fail_on: Substring of queries whose search raises RuntimeError
+            crash_after: Raise KeyboardInterrupt after this many searches
+            latency: Seconds each search takes (a latency-bound engine)
+        """
+        self.version = version
+        self.min_results = min_results
+        self.min_score = min_score
+        self.normalize = normalize
+        self.fail_on = fail_on
+        self.crash_after = crash_after
+        self.latency = latency
+        self.queries = []
+        self.batches = []
+        self.embedded = 0
+        self._lock = threading.Lock()
+
+    def index_version(self):
+        return self.version
+
+    def embed_queries(self, queries):
+        with self._lock:
+            self.embedded += len(queries)
+        vectors = np.zeros((len(queries), 64), dtype=np.float32)
+        for row, query in enumerate(queries):
+            for word in normalize_text(query).split():
+                vectors[row, zlib.crc32(word.encode("utf-8")) % 64] += 1
+        return vectors
+
+    def search(self, query, top_k=5, similarity_threshold=None):
+        with self._lock:
+            self.queries.append(query)
+            searches = len(self.queries)
+        if self.crash_after is not None and searches > self.crash_after:
+            raise KeyboardInterrupt
+        if self.fail_on is not None and self.fail_on in query:
+            raise RuntimeError("index unavailable")
+        if self.latency:
+            time.sleep(self.latency)
+
+        key = normalize_text(query) if self.normalize else query
+        rng = random.Random(key)
+        count = top_k if self.min_results is None else rng.randint(self.min_results, top_k)
+        return [
+            {
+                'text': f'{key} #{rank}',
+                'similarity_score': rng.uniform(self.min_score, 1.0),
+                'metadata': {'filename': f'doc_{rng.randint(0, 3)}.md', 'chunk_index': rank}
+            }
+            for rank in range(count)
+        ]
+
+    def search_batch(self, queries, top_k=None, similarity_threshold=None):
+        with self._lock:
+            self.batches.append((list(queries), top_k, similarity_threshold))
+        return [self.search(query, top_k or 5, similarity_threshold) for query in queries]
+
+
+@pytest.fixture
+def make_rag():
+    """Factory of FakeRAG doubles (keyword arguments as FakeRAG)"""
+    return FakeRAG
@@ -0,0 +1,167 @@
+"""
+Unit Tests for Analysis Journal
+
+Tests AnalysisJournal (round trip, truncated and stale lines) and resuming
+an interrupted AnalysisPipeline run from its journal.
+"""
+
+import pytest
+import functools
+import json
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.analysis_journal import AnalysisJournal, requirement_hash
+from agents.technical_analyst.pipeline import AnalysisPipeline
+from agents.technical_analyst.query_processor import QueryProcessor
+
+
+@pytest.fixture
+def make_rag(make_rag):
+    """FakeRAG doubles leaving some requirements without evidence"""
+    return functools.partial(make_rag, min_results=0)
+
+
+@pytest.fixture
+def requirements():
+    return [
+        {'id': f'REQ-{i:03d}', 'descricao': f'Requisito {i}', 'tipo': 'Técnico',
+         'categoria': 'Hardware', 'prioridade': 'Alta'}
+        for i in range(30)
+    ]
+
+
+@pytest.fixture
+def analyses(requirements, make_rag):
+    return QueryProcessor(make_rag()).analyze_batch(requirements, show_progress=False)
+
+
+class TestAnalysisJournal:
+    """Test suite for AnalysisJournal"""
+
+    def test_round_trip(self, tmp_path, requirements, analyses):
+        """Test that journaled analyses are restored on resume"""
+        path = tmp_path / "run_journal.jsonl"
+        journal = AnalysisJournal(path, index_version="idx-1", settings={'top_k': 5})
+        journal.open()
+        for req, analysis in zip(requirements, analyses):
+            journal.append(req, analysis)
+        journal.close()
+
+        resumed = AnalysisJournal(path, index_version="idx-1", settings={'top_k': 5})
+        assert resumed.open(resume=True) == len(requirements)
+        resumed.close()
+
+        assert requirements[3] in resumed
+        assert resumed.get(requirements[3]).to_dict() == analyses[3].to_dict()
+        assert resumed.get_stats()['resumed'] == len(requirements)
+
+    def test_truncated_line_ignored(self, tmp_path, requirements, analyses):
+        """Test that a line cut short by a crash is dropped and appends start clean"""
+        path = tmp_path / "run_journal.jsonl"
+        journal = AnalysisJournal(path, index_version="idx-1")
+        journal.open()
+        journal.append(requirements[0], analyses[0])
+        journal.close()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"requirement_id": "REQ-001", "requirem')
+
+        journal.open(resume=True)
+        journal.append(requirements[1], analyses[1])
+        journal.close()
+
+        assert journal.corrupt == 1
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)['requirement_id'] for line in lines] == ['REQ-000', 'REQ-001']
+
+    def test_stale_entries_not_reused(self, tmp_path, requirements, analyses):
+        """Test that another index version or an edited requirement is a miss"""
+        path = tmp_path / "run_journal.jsonl"
+        journal = AnalysisJournal(path, index_version="idx-1")
+        journal.open()
+        journal.append(requirements[0], analyses[0])
+        journal.append(requirements[1], analyses[1])
+        journal.close()
+
+        reindexed = AnalysisJournal(path, index_version="idx-2")
+        assert reindexed.open(resume=True) == 0
+        reindexed.close()
+        assert reindexed.stale == 2
+
+        journal = AnalysisJournal(path, index_version="idx-1")
+        journal.open()
+        journal.append(requirements[0], analyses[0])
+        journal.close()
+        journal.open(resume=True)
+        journal.close()
+
+        edited = dict(requirements[0], descricao='Requisito 0 alterado')
+        assert journal.get(requirements[0]) is not None
+        assert journal.get(edited) is None
+
+    def test_hash_covers_settings(self, requirements):
+        """Test that analysis settings are part of the requirement hash"""
+        assert requirement_hash(requirements[0], {'top_k': 5}) != requirement_hash(requirements[0], {'top_k': 10})
+        assert requirement_hash(requirements[0]) == requirement_hash(dict(reversed(requirements[0].items())))
+
+
+class TestPipelineResume:
+    """Test resuming an interrupted AnalysisPipeline run"""
+
+    def test_resume_after_crash(self, tmp_path, requirements, make_rag):
+        """Test that a restarted run skips journaled requirements and matches a clean run"""
+        clean = AnalysisPipeline(rag_engine=make_rag(), output_dir=str(tmp_path / "clean"))
+        expected = clean.analyze_requirements(requirements, export_formats=['jsonl'])
+
+        output_dir = str(tmp_path / "crash")
+        crashing = AnalysisPipeline(rag_engine=make_rag(crash_after=14), output_dir=output_dir)
+        crashing.query_processor.batch_size = 4
+        with pytest.raises(KeyboardInterrupt):
+            crashing.analyze_requirements(requirements, export_formats=['jsonl'])
+
+        journal_path = tmp_path / "crash" / "analysis_journal.jsonl"
+        assert len(journal_path.read_text(encoding="utf-8").splitlines()) == 12
+
+        rag = make_rag()
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=output_dir)
+        report = pipeline.analyze_requirements(requirements, export_formats=['jsonl'], resume=True)
+
+        assert len(rag.queries) == len(requirements) - 12
+        assert pipeline.stats['journal']['resumed'] == 12
+        assert pipeline.stats['journal']['appended'] == len(requirements) - 12
+        assert report.get_summary() == expected.get_summary()
+        assert (tmp_path / "crash" / "analysis_analysis.jsonl").read_text(encoding="utf-8") == \
+            (tmp_path / "clean" / "analysis_analysis.jsonl").read_text(encoding="utf-8")
+        assert len(journal_path.read_text(encoding="utf-8").splitlines()) == len(requirements)
+
+    def test_new_index_reanalyzes(self, tmp_path, requirements, make_rag):
+        """Test that a journal from another index version is not reused"""
+        AnalysisPipeline(rag_engine=make_rag(), output_dir=str(tmp_path)).analyze_requirements(
+            requirements, export_formats=['jsonl']
+        )
+
+        rag = make_rag(version="idx-2")
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path))
+        pipeline.analyze_requirements(requirements, export_formats=['jsonl'], resume=True)
+
+        assert len(rag.queries) == len(requirements)
+        assert pipeline.stats['journal']['stale'] == len(requirements)
+
+    def test_other_top_k_reanalyzes(self, tmp_path, requirements, make_rag):
+        """Test that a journal written with another top_k is not reused"""
+        AnalysisPipeline(rag_engine=make_rag(), output_dir=str(tmp_path)).analyze_requirements(
+            requirements, export_formats=['jsonl']
+        )
+
+        rag = make_rag()
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path), top_k=2)
+        report = pipeline.analyze_requirements(requirements, export_formats=['jsonl'], resume=True)
+
+        assert len(rag.queries) == len(requirements)
+        assert all(a.metadata['top_k'] == 2 for a in report.analysis_results)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
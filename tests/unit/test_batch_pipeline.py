@@ -0,0 +1,108 @@
+"""
+Unit Tests for Batch Pipeline
+
+Tests CSV discovery, output basenames and multi-edital runs of
+BatchPipeline sharing one RAG engine double.
+"""
+
+import pytest
+import csv
+import json
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.batch_pipeline import (
+    BatchPipeline,
+    find_requirement_csvs,
+    output_basenames
+)
+
+
+def write_csv(path, n, prefix):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['ID', 'Item', 'Descrição', 'Categoria', 'Prioridade'])
+        writer.writeheader()
+        for i in range(n):
+            writer.writerow({'ID': f'{prefix}-{i:03d}', 'Item': str(i),
+                             'Descrição': f'{prefix} requisito {i}', 'Categoria': 'Hardware',
+                             'Prioridade': 'Alta'})
+
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    batch = tmp_path / "weekly"
+    for name, n in (("edital_a", 12), ("edital_b", 7), ("edital_c", 20)):
+        write_csv(batch / f"{name}.csv", n, name)
+    return batch
+
+
+class TestDiscovery:
+    """Test CSV discovery and output basenames"""
+
+    def test_directory_and_glob(self, batch_dir):
+        """Test that a directory and a glob find the same CSVs"""
+        assert [p.name for p in find_requirement_csvs(str(batch_dir))] == \
+            ['edital_a.csv', 'edital_b.csv', 'edital_c.csv']
+        assert find_requirement_csvs(str(batch_dir / "edital_[ab].csv")) == \
+            find_requirement_csvs(str(batch_dir))[:2]
+
+    def test_repeated_stems(self, tmp_path):
+        """Test that delivery folders disambiguate repeated CSV names"""
+        paths = [
+            tmp_path / "deliveries" / "analysis_001" / "outputs" / "requirements.csv",
+            tmp_path / "deliveries" / "analysis_002" / "outputs" / "requirements.csv",
+            tmp_path / "other" / "edital.csv",
+        ]
+        assert output_basenames(paths) == [
+            'analysis_001_requirements', 'analysis_002_requirements', 'edital'
+        ]
+
+
+class TestBatchPipeline:
+    """Test multi-edital runs"""
+
+    def test_shared_engine_run(self, tmp_path, batch_dir, capsys, make_rag):
+        """Test that every edital is analyzed with one engine and exported"""
+        rag = make_rag()
+        batch = BatchPipeline(rag_engine=rag, output_dir=str(tmp_path / "out"), workers=2)
+        report = batch.run(str(batch_dir), export_formats=['json', 'csv'])
+
+        # Concurrent editais print one line each, not interleaved stage banners
+        output = capsys.readouterr().out
+        assert 'ETAPA' not in output and 'RESUMO DA ANÁLISE' not in output
+        assert output.count('requisitos em') == 3
+
+        assert len(rag.queries) == 12 + 7 + 20
+        throughput = report['throughput']
+        assert throughput['editais_completed'] == 3
+        assert throughput['requirements'] == 39
+        assert throughput['requirements_per_second'] > 0
+        assert throughput['editais_per_hour'] > 0
+
+        for name in ('edital_a', 'edital_b', 'edital_c'):
+            assert (tmp_path / "out" / f"{name}_analysis.json").exists()
+            assert (tmp_path / "out" / f"{name}_analysis.csv").exists()
+
+        saved = json.loads((tmp_path / "out" / "batch_report.json").read_text(encoding='utf-8'))
+        assert [e['analyzed'] for e in saved['editais']] == [12, 7, 20]
+        assert all(len(e['outputs']) == 2 for e in saved['editais'])
+
+    def test_failed_edital_recorded(self, tmp_path, batch_dir, make_rag):
+        """Test that an unreadable CSV fails alone"""
+        (batch_dir / "edital_bad.csv").write_bytes(b"ID,Descri\xe7\xe3o\n1,\xff\xfe\n")
+
+        batch = BatchPipeline(rag_engine=make_rag(), output_dir=str(tmp_path / "out"), workers=3)
+        report = batch.run(str(batch_dir), export_formats=['json'])
+
+        assert report['throughput']['editais_completed'] == 3
+        assert report['throughput']['editais_failed'] == 1
+        failed = [e for e in report['editais'] if e['error']]
+        assert failed[0]['basename'] == 'edital_bad'
+        assert 'UnicodeDecodeError' in failed[0]['error']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,191 @@
+"""
+Unit Tests for Chunk Store
+
+Tests the columnar, memory-mapped storage of chunk texts and metadata.
+"""
+
+import pytest
+import numpy as np
+import tempfile
+import shutil
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.chunk_store import ChunkStore, make_chunk_id
+
+
+class TestChunkStore:
+    """Test suite for ChunkStore"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for test files"""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def texts(self):
+        """Chunk texts including non-ASCII characters"""
+        return [
+            "Câmeras IP com resolução mínima de 4MP",
+            "Armazenamento de 30 dias",
+            "",
+            "Certificação ISO 27001 — conformidade",
+        ]
+
+    @pytest.fixture
+    def metadatas(self):
+        """Chunk metadata with repeated, missing and mixed-type values"""
+        return [
+            {"filename": "a.md", "chunk_index": 0, "title": "Câmeras"},
+            {"filename": "a.md", "chunk_index": 1, "title": "Câmeras"},
+            {"filename": "b.md", "chunk_index": 0},
+            {"filename": "c.md", "chunk_index": 0, "tags": ["iso", "soc2"]},
+        ]
+
+    def test_in_memory_rows(self, texts, metadatas):
+        """Test reading rows that were never written"""
+        store = ChunkStore.from_lists(texts, metadatas)
+
+        assert len(store) == 4
+        assert store.pending_count == 4
+        assert store.text(0) == texts[0]
+        assert store.metadata(3) == metadatas[3]
+
+    def test_write_and_open_roundtrip(self, temp_dir, texts, metadatas):
+        """Test that written rows read back identically"""
+        ChunkStore.from_lists(texts, metadatas).write(temp_dir / "gen")
+
+        store = ChunkStore(temp_dir / "gen")
+
+        assert len(store) == 4
+        assert store.pending_count == 0
+        assert list(store.texts) == texts
+        assert list(store.metadatas) == metadatas
+
+    def test_columns_are_memory_mapped(self, temp_dir, texts, metadatas):
+        """Test that loading maps the arrays instead of reading them"""
+        ChunkStore.from_lists(texts, metadatas).write(temp_dir / "gen")
+
+        store = ChunkStore(temp_dir / "gen")
+
+        assert isinstance(store._base_texts.blob, np.memmap)
+        assert isinstance(store._base_texts.offsets, np.memmap)
+        assert all(isinstance(c["data"], np.memmap) for c in store._columns.values())
+
+    def test_int_and_dict_columns(self, temp_dir, texts, metadatas):
+        """Test column kinds: ints stay native, strings are dictionary-encoded"""
+        ChunkStore.from_lists(texts, metadatas).write(temp_dir / "gen")
+
+        store = ChunkStore(temp_dir / "gen")
+
+        assert store._columns["chunk_index"]["kind"] == "int"
+        assert store._columns["filename"]["kind"] == "dict"
+        # 3 distinct filenames for 4 rows
+        assert len(store._columns["filename"]["values"]) == 3
+
+    def test_append_after_open(self, temp_dir, texts, metadatas):
+        """Test appending rows on top of a mapped store and writing a new generation"""
+        ChunkStore.from_lists(texts[:2], metadatas[:2]).write(temp_dir / "gen1")
+
+        store = ChunkStore(temp_dir / "gen1")
+        store.append(texts[2:], metadatas[2:])
+        assert len(store) == 4
+        assert store.text(3) == texts[3]
+
+        store.write(temp_dir / "gen2")
+        reopened = ChunkStore(temp_dir / "gen2")
+
+        assert list(reopened.texts) == texts
+        assert list(reopened.metadatas) == metadatas
+
+    def test_column_kind_upgrade(self, temp_dir):
+        """Test that an int column holding a string later becomes a dict column"""
+        ChunkStore.from_lists(["a", "b"], [{"page": 1}, {"page": 2}]).write(temp_dir / "gen1")
+
+        store = ChunkStore(temp_dir / "gen1")
+        store.append(["c"], [{"page": "iv"}])
+        store.write(temp_dir / "gen2")
+
+        reopened = ChunkStore(temp_dir / "gen2")
+        assert [m["page"] for m in reopened.metadatas] == [1, 2, "iv"]
+
+    def test_write_with_keep_mask(self, temp_dir, texts, metadatas):
+        """Test compaction through a keep mask"""
+        ChunkStore.from_lists(texts[:3], metadatas[:3]).write(temp_dir / "gen1")
+        store = ChunkStore(temp_dir / "gen1")
+        store.append(texts[3:], metadatas[3:])
+
+        store.write(temp_dir / "gen2", keep=np.array([True, False, False, True]))
+        reopened = ChunkStore(temp_dir / "gen2")
+
+        assert list(reopened.texts) == [texts[0], texts[3]]
+        assert list(reopened.metadatas) == [metadatas[0], metadatas[3]]
+
+    def test_empty_store_roundtrip(self, temp_dir):
+        """Test writing and opening an empty store"""
+        ChunkStore().write(temp_dir / "gen")
+
+        store = ChunkStore(temp_dir / "gen")
+
+        assert len(store) == 0
+        assert list(store.texts) == []
+
+    def test_stable_ids(self, temp_dir):
+        """Test that IDs depend on source_path + chunk_index, not on the text"""
+        meta = {"source_path": "kb/a.md", "chunk_index": 3}
+
+        assert make_chunk_id("old text", meta) == make_chunk_id("new text", meta)
+        assert make_chunk_id("old text", meta) != make_chunk_id("old text", {**meta, "chunk_index": 4})
+        assert 0 <= make_chunk_id("no source", {}) < 2 ** 63
+
+    def test_ids_and_tombstones_roundtrip(self, temp_dir, texts, metadatas):
+        """Test ID lookup and deleted rows across writes"""
+        ids = [10, 20, 30, 40]
+        ChunkStore.from_lists(texts[:3], metadatas[:3], ids[:3]).write(temp_dir / "gen1")
+
+        store = ChunkStore(temp_dir / "gen1")
+        store.append(texts[3:], metadatas[3:], ids[3:])
+        assert list(store.rows_for_ids([40, 20, 99])) == [1, 3]
+
+        assert store.delete_rows(store.rows_for_ids([20])) == 1
+        assert store.live_count == 3
+        assert list(store.rows_for_ids([20])) == []
+
+        store.write(temp_dir / "gen2")
+        reopened = ChunkStore(temp_dir / "gen2")
+        assert reopened.is_deleted(1)
+        assert reopened.chunk_id(3) == 40
+        assert list(reopened.rows_for_ids([10, 20, 40])) == [0, 3]
+
+        # Compaction drops tombstoned rows and remaps IDs
+        reopened.write(temp_dir / "gen3", keep=~reopened.deleted_mask())
+        compacted = ChunkStore(temp_dir / "gen3")
+        assert compacted.deleted_count == 0
+        assert [compacted.chunk_id(i) for i in range(3)] == [10, 30, 40]
+
+    def test_find_rows(self, temp_dir, texts, metadatas):
+        """Test metadata lookup on written and pending rows"""
+        ChunkStore.from_lists(texts[:3], metadatas[:3]).write(temp_dir / "gen")
+        store = ChunkStore(temp_dir / "gen")
+        store.append(texts[3:], [{"filename": "a.md", "chunk_index": 2}])
+
+        assert list(store.find_rows("filename", "a.md")) == [0, 1, 3]
+        assert list(store.find_rows("chunk_index", 0)) == [0, 2]
+        assert list(store.find_rows("filename", "zzz.md")) == []
+
+    def test_row_view_indexing(self, texts, metadatas):
+        """Test negative indexes, slices and out-of-range access"""
+        store = ChunkStore.from_lists(texts, metadatas)
+
+        assert store.texts[-1] == texts[-1]
+        assert store.texts[1:3] == texts[1:3]
+        with pytest.raises(IndexError):
+            store.texts[10]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
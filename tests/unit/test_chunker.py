@@ -0,0 +1,127 @@
+"""
+Unit Tests for Text Chunker
+
+Tests the linear-time chunker: chunk budgets, boundary snapping and strict
+progress in character mode, and the token budget in token mode (with a
+whitespace tokenizer standing in for the model's).
+"""
+
+import pytest
+import random
+import re
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.chunker import TextChunker, hf_token_starts
+from agents.technical_analyst.ingestion_pipeline import IngestionPipeline
+
+
+def whitespace_token_starts(text):
+    """Start offsets of whitespace-separated words"""
+    return np.array([m.start() for m in re.finditer(r"\S+", text)], dtype=np.int64)
+
+
+class TestTextChunker:
+    """Test suite for TextChunker"""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_char_mode_invariants(self, seed):
+        """Test budget, coverage and strict progress on random texts"""
+        rng = random.Random(seed)
+        pieces = ["Requisito técnico", ".", " ", "\n", "\n\n", "\n\n\n", "câmera IP", ". "]
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 600)))
+        chunk_size = rng.randint(5, 120)
+        chunk_overlap = rng.randint(0, chunk_size + 10)
+
+        spans = TextChunker(chunk_size, chunk_overlap).spans(text)
+
+        assert spans[0][0] == 0
+        assert spans[-1][1] >= len(text)
+        for (start, end), (next_start, next_end) in zip(spans, spans[1:]):
+            assert end - start <= chunk_size
+            assert start < next_start <= end  # No gaps
+            assert next_end > end
+
+    def test_no_duplicate_chunks_after_boundary(self):
+        """Test that a paragraph break inside the overlap is not re-used"""
+        # One early paragraph break, then a long unpunctuated run
+        text = "Title\n\n" + "x" * 5000
+        chunks = TextChunker(chunk_size=1000, chunk_overlap=200).split(text)
+
+        # The original loop crawled one character at a time here (~200 extra chunks)
+        assert len(chunks) <= 8
+        assert chunks[0][2] == "Title"
+
+    def test_paragraph_boundary_preferred(self):
+        """Test that a paragraph break wins over a later sentence end"""
+        text = "First paragraph.\n\nSecond sentence. Third sentence. Fourth"
+        chunks = TextChunker(chunk_size=40, chunk_overlap=0).split(text)
+
+        assert chunks[0][2] == "First paragraph."
+
+    def test_token_budget(self):
+        """Test that no chunk exceeds the token budget and overlap is in tokens"""
+        words = [f"palavra{i}" for i in range(500)]
+        text = " ".join(words)
+        chunker = TextChunker(chunk_size=50, chunk_overlap=10, token_starts=whitespace_token_starts)
+
+        chunks = chunker.split(text)
+
+        assert chunker.unit == "tokens"
+        assert len(chunks) > 1
+        for _, _, chunk in chunks:
+            assert len(chunk.split()) <= 50
+        # Consecutive chunks share the last 10 tokens
+        assert chunks[0][2].split()[-10:] == chunks[1][2].split()[:10]
+        assert chunks[-1][2].split()[-1] == words[-1]
+
+    def test_token_mode_snaps_to_sentences(self):
+        """Test that token budgets still end chunks at sentence boundaries"""
+        text = " ".join(f"Frase numero {i} do edital." for i in range(100))
+        chunker = TextChunker(chunk_size=22, chunk_overlap=0, token_starts=whitespace_token_starts)
+
+        for _, _, chunk in chunker.split(text)[:-1]:
+            assert chunk.endswith(".")
+
+    def test_hf_token_starts(self):
+        """Test adapting a Hugging Face tokenizer's offset mapping"""
+        tokenizer = Mock(return_value={"offset_mapping": [(0, 3), (4, 8), (8, 9)]})
+
+        starts = hf_token_starts(tokenizer)("abc defg.")
+
+        np.testing.assert_array_equal(starts, [0, 4, 8])
+        assert tokenizer.call_args.kwargs["return_offsets_mapping"] is True
+
+    def test_empty_text(self):
+        """Test that empty or blank text yields no chunks"""
+        chunker = TextChunker(chunk_size=10, chunk_overlap=2)
+
+        assert chunker.split("") == []
+        assert chunker.split("   \n\n  ") == []
+
+    def test_invalid_chunk_size(self):
+        """Test that a non-positive chunk size is rejected"""
+        with pytest.raises(ValueError):
+            TextChunker(chunk_size=0)
+
+    def test_pipeline_uses_tokenizer(self):
+        """Test that IngestionPipeline chunks by tokens when given a tokenizer"""
+        tokenizer = Mock(side_effect=lambda text, **kwargs: {
+            "offset_mapping": [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]
+        })
+        pipeline = IngestionPipeline(Mock(), Mock(), chunk_size=20, chunk_overlap=5, tokenizer=tokenizer)
+
+        chunks = pipeline.chunk_text(" ".join(["token"] * 100), {"filename": "a.md"})
+
+        assert pipeline._chunk_settings()["chunk_unit"] == "tokens"
+        assert all(len(chunk["text"].split()) <= 20 for chunk in chunks)
+        assert chunks[1]["metadata"]["chunk_index"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
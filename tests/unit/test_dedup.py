@@ -0,0 +1,219 @@
+"""
+Unit Tests for Near-Duplicate Detection
+
+Tests the MinHash/LSH detector and the deduplication stage of
+IngestionPipeline (real FAISS store, mocked embeddings).
+"""
+
+import pytest
+import json
+import random
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.dedup import NearDuplicateDetector, number_signature
+from agents.technical_analyst.ingestion_pipeline import IngestionPipeline
+
+
+BOILERPLATE = (
+    "Utilizamos cookies para melhorar sua experiência de navegação. Ao continuar "
+    "navegando você concorda com a nossa política de privacidade e com os termos de "
+    "uso do portal. Todos os direitos reservados. Suporte técnico disponível em "
+    "horário comercial, de segunda a sexta-feira, exceto feriados nacionais."
+)
+
+
+def random_text(seed, words=80):
+    """Unrelated text of random words"""
+    rng = random.Random(seed)
+    vocabulary = [f"termo{i}" for i in range(2000)]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+class TestNearDuplicateDetector:
+    """Test suite for NearDuplicateDetector"""
+
+    def test_first_occurrence_is_representative(self):
+        """Test that new texts are kept"""
+        detector = NearDuplicateDetector(threshold=0.9)
+
+        assert detector.add(BOILERPLATE, ref="a") is None
+        assert detector.add(random_text(1), ref="b") is None
+        assert len(detector) == 2
+
+    def test_exact_duplicate_after_normalization(self):
+        """Test that case and whitespace differences are exact duplicates"""
+        detector = NearDuplicateDetector(threshold=0.9)
+        detector.add(BOILERPLATE, ref="a")
+
+        match = detector.add("  " + BOILERPLATE.upper().replace(" ", "  \n"), ref="b")
+
+        assert match == ("a", 1.0)
+        assert detector.get_stats()["exact_duplicates"] == 1
+
+    def test_near_duplicate(self):
+        """Test that a one-word edit of a long text is a near duplicate"""
+        detector = NearDuplicateDetector(threshold=0.8)
+        text = random_text(2, words=300)
+        detector.add(text, ref="a")
+
+        words = text.split()
+        words[150] = "alterado"
+        ref, similarity = detector.add(" ".join(words), ref="b")
+
+        assert ref == "a"
+        assert 0.8 <= similarity < 1.0
+        assert detector.get_stats()["near_duplicates"] == 1
+
+    def test_different_texts_are_kept(self):
+        """Test that unrelated texts are never collapsed"""
+        detector = NearDuplicateDetector(threshold=0.9)
+
+        matches = [detector.add(random_text(seed), ref=seed) for seed in range(200)]
+
+        assert matches == [None] * 200
+
+    def test_threshold_respected(self):
+        """Test that half-overlapping texts are kept at a high threshold"""
+        detector = NearDuplicateDetector(threshold=0.9)
+        first = random_text(3, words=200)
+        detector.add(first, ref="a")
+
+        half = " ".join(first.split()[:100]) + " " + random_text(4, words=100)
+
+        assert detector.add(half, ref="b") is None
+
+    def test_different_numbers_are_kept(self):
+        """Test that datasheets differing only in a value are never collapsed"""
+        detector = NearDuplicateDetector(threshold=0.9)
+        datasheet = random_text(5, words=130)
+        detector.add(f"Câmera IP 4 MP {datasheet}", ref="4mp")
+
+        assert detector.add(f"Câmera IP 8 MP {datasheet}", ref="8mp") is None
+        assert detector.add(f"Câmera IP 4 MP {datasheet} ", ref="copy") == ("4mp", 1.0)
+
+    def test_signs_operators_and_decimals_are_kept(self):
+        """Test that exact-word matches differing in a sign, operator or decimal separator are kept"""
+        detector = NearDuplicateDetector(threshold=0.9)
+        detector.add("Faixa de temperatura de operação: 20 °C a 60 °C", ref="a")
+        detector.add("Resolução ≥ 4,5 MP", ref="b")
+
+        assert detector.add("Faixa de temperatura de operação: -20 °C a 60 °C", ref="c") is None
+        assert detector.add("Faixa de temperatura de operação: −20 °C a 60 °C", ref="d") == ("c", 1.0)
+        assert detector.add("Resolução ≤ 4,5 MP", ref="e") is None
+        assert detector.add("Resolução ≥ 4.5 MP", ref="f") is None
+        assert detector.add("Resolução >= 4,5 MP", ref="g") == ("b", 1.0)
+
+    def test_number_signature(self):
+        """Test that numbers keep sign, operator and separator, and ranges split"""
+        assert number_signature("4 MP, -20 °C, ≥ 30 dias") == ("4", "-20", "≥30")
+        assert number_signature("20-30 metros, 4,5 MP") == ("20", "30", "4,5")
+        assert number_signature("Câmera 4MP H.265") == ("4",)
+
+    def test_invalid_settings(self):
+        """Test rejected parameters"""
+        with pytest.raises(ValueError):
+            NearDuplicateDetector(threshold=0)
+        with pytest.raises(ValueError):
+            NearDuplicateDetector(num_perm=100, bands=16)
+
+
+class TestIngestionDedup:
+    """Test the deduplication stage of IngestionPipeline"""
+
+    @pytest.fixture
+    def kb_dir(self, tmp_path):
+        """Three scraped pages sharing a boilerplate footer"""
+        kb_dir = tmp_path / "kb"
+        kb_dir.mkdir()
+        for i in range(3):
+            (kb_dir / f"page_{i}.md").write_text(
+                f"# Página {i}\n\n{random_text(10 + i, words=60)}\n\n{BOILERPLATE}",
+                encoding="utf-8"
+            )
+        return kb_dir
+
+    @pytest.fixture
+    def embeddings_manager(self):
+        """Mock embeddings manager that counts embedded texts"""
+        mock_embeddings = Mock()
+        mock_embeddings.embedded = 0
+
+        def mock_embed(texts, show_progress=True):
+            mock_embeddings.embedded += len(texts)
+            return np.random.rand(len(texts), 32).astype('float32').tolist()
+        mock_embeddings.embed_documents = mock_embed
+        return mock_embeddings
+
+    def make_pipeline(self, tmp_path, embeddings_manager, dedup_threshold=0.9):
+        """Create a pipeline over a FAISS store in tmp_path/index"""
+        from agents.technical_analyst.vector_store import FAISSVectorStore
+
+        store = FAISSVectorStore(index_path=str(tmp_path / "index"), dimension=32)
+        return IngestionPipeline(
+            store, embeddings_manager, chunk_size=400, chunk_overlap=0,
+            dedup_threshold=dedup_threshold
+        )
+
+    def test_boilerplate_embedded_once(self, tmp_path, kb_dir, embeddings_manager):
+        """Test that repeated footers are dropped before embedding"""
+        baseline = self.make_pipeline(tmp_path / "baseline", Mock(
+            embed_documents=lambda texts, show_progress=True: np.zeros((len(texts), 32)).tolist()
+        ), dedup_threshold=0.0)
+        baseline_stats = baseline.ingest_from_directory(str(kb_dir))
+
+        pipeline = self.make_pipeline(tmp_path, embeddings_manager)
+        stats = pipeline.ingest_from_directory(str(kb_dir))
+
+        assert stats["dedup"]["chunks_dropped"] == 2
+        assert stats["dedup"]["embeddings_saved"] == 2
+        assert stats["total_chunks"] == baseline_stats["total_chunks"] - 2
+        assert embeddings_manager.embedded == stats["total_chunks"]
+        assert not baseline_stats["dedup"]["enabled"]
+
+    def test_duplicate_points_to_representative(self, tmp_path, kb_dir, embeddings_manager):
+        """Test that dropped chunks reference the indexed chunk's metadata"""
+        pipeline = self.make_pipeline(tmp_path, embeddings_manager)
+        stats = pipeline.ingest_from_directory(str(kb_dir))
+
+        duplicate = stats["dedup"]["duplicates"][0]
+        representative = duplicate["representative"]
+
+        assert duplicate["source_path"].endswith("page_1.md")
+        assert representative["filename"] == "page_0.md"
+        assert pipeline.vector_store.chunks.rows_for_ids([representative["id"]]).size == 1
+
+        manifest = json.loads((tmp_path / "index" / "manifest.json").read_text(encoding="utf-8"))
+        recorded = manifest["files"][duplicate["source_path"]]["duplicates"]
+        assert recorded[0]["representative"] == representative
+
+    def test_representative_change_reprocesses_dependents(self, tmp_path, kb_dir, embeddings_manager):
+        """Test that files pointing at a modified file are re-ingested"""
+        self.make_pipeline(tmp_path, embeddings_manager).ingest_from_directory(str(kb_dir))
+
+        (kb_dir / "page_0.md").write_text("# Página 0\n\nSem rodapé.", encoding="utf-8")
+        stats = self.make_pipeline(tmp_path, embeddings_manager).ingest_from_directory(str(kb_dir))
+
+        # page_1 and page_2 deduplicated their footer against page_0
+        assert stats["diff"]["updated"] == 3
+        assert stats["dedup"]["chunks_dropped"] == 1
+
+        # The footer is still indexed exactly once
+        store = self.make_pipeline(tmp_path, embeddings_manager).vector_store
+        footers = [row for row in range(len(store.chunks))
+                   if not store.chunks.is_deleted(row) and "cookies" in store.chunks.text(row)]
+        assert len(footers) == 1
+
+    def test_invalid_threshold(self):
+        """Test that an out-of-range threshold is rejected"""
+        with pytest.raises(ValueError):
+            IngestionPipeline(Mock(), Mock(), dedup_threshold=1.5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,232 @@
+"""
+Unit Tests for Embedding Cache
+
+Tests the persistent, content-addressed cache of document embeddings and its
+use by EmbeddingsManager (with a mocked embedding model).
+"""
+
+import pytest
+import numpy as np
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.embedding_cache import EmbeddingCache
+from agents.technical_analyst.embeddings_manager import EmbeddingsManager
+
+
+class TestEmbeddingCache:
+    """Test suite for EmbeddingCache"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for cache files"""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def vectors(self):
+        """Random embeddings for 10 texts"""
+        np.random.seed(3)
+        return np.random.rand(10, 16).astype('float32')
+
+    @pytest.fixture
+    def texts(self):
+        """Chunk texts"""
+        return [f"Requisito técnico {i}" for i in range(10)]
+
+    def make_cache(self, temp_dir, **kwargs):
+        """Create a cache for a fixed provider/model"""
+        return EmbeddingCache(temp_dir, "local", "all-MiniLM-L6-v2", dimension=16, **kwargs)
+
+    def test_miss_then_hit(self, temp_dir, texts, vectors):
+        """Test lookups before and after storing embeddings"""
+        cache = self.make_cache(temp_dir)
+
+        _, missing = cache.get_many(texts)
+        assert missing == list(range(10))
+
+        cache.put_many(texts, vectors)
+        found, missing = cache.get_many(texts)
+
+        assert missing == []
+        np.testing.assert_allclose(found, vectors, atol=1e-3)  # float16 storage
+        assert cache.get_stats()['hits'] == 10
+        assert cache.get_stats()['misses'] == 10
+
+    def test_persists_across_instances(self, temp_dir, texts, vectors):
+        """Test that saved embeddings are found by a new instance"""
+        cache = self.make_cache(temp_dir, dtype="float32")
+        cache.put_many(texts, vectors)
+        cache.save()
+
+        reopened = self.make_cache(temp_dir, dtype="float32")
+        found, missing = reopened.get_many(texts[::-1])
+
+        assert missing == []
+        np.testing.assert_array_equal(found, vectors[::-1])
+
+    def test_unsaved_entries_are_not_persisted(self, temp_dir, texts, vectors):
+        """Test that only save() publishes entries"""
+        cache = self.make_cache(temp_dir)
+        cache.put_many(texts[:5], vectors[:5])
+        cache.save()
+        cache.put_many(texts[5:], vectors[5:])
+
+        reopened = self.make_cache(temp_dir)
+        _, missing = reopened.get_many(texts)
+
+        assert missing == list(range(5, 10))
+
+    def test_keyed_by_model(self, temp_dir, texts, vectors):
+        """Test that another model does not see cached embeddings"""
+        cache = self.make_cache(temp_dir)
+        cache.put_many(texts, vectors)
+        cache.save()
+
+        other = EmbeddingCache(temp_dir, "local", "paraphrase-multilingual", dimension=16)
+        _, missing = other.get_many(texts)
+
+        assert len(missing) == 10
+
+    def test_incompatible_dimension_starts_over(self, temp_dir, texts, vectors):
+        """Test that a dimension change discards the cache instead of misreading it"""
+        cache = self.make_cache(temp_dir)
+        cache.put_many(texts, vectors)
+        cache.save()
+
+        resized = EmbeddingCache(temp_dir, "local", "all-MiniLM-L6-v2", dimension=8)
+
+        assert len(resized) == 0
+
+    def test_lru_eviction(self, temp_dir, texts, vectors):
+        """Test that the least recently used entries are evicted when full"""
+        cache = self.make_cache(temp_dir, max_entries=5)
+        cache.put_many(texts[:5], vectors[:5])
+
+        # Touch 0 and 1 so 2, 3, 4 are the oldest
+        cache.get_many(texts[:2])
+        cache.put_many(texts[5:7], vectors[5:7])
+
+        assert len(cache) == 5
+        assert cache.get_stats()['evictions'] == 2
+        _, missing = cache.get_many(texts[:7])
+        assert missing == [2, 3]
+
+        found, _ = cache.get_many(texts[5:7])
+        np.testing.assert_allclose(found, vectors[5:7], atol=1e-3)
+
+    def test_eviction_survives_reopen(self, temp_dir, texts, vectors):
+        """Test that reused slots never serve another text's vector after a reopen"""
+        cache = self.make_cache(temp_dir, max_entries=5, dtype="float32")
+        cache.put_many(texts[:5], vectors[:5])
+        cache.save()
+        cache.put_many(texts[5:], vectors[5:])
+        cache.save()
+
+        reopened = self.make_cache(temp_dir, max_entries=5, dtype="float32")
+        found, missing = reopened.get_many(texts)
+
+        hits = [i for i in range(10) if i not in missing]
+        assert len(hits) == 5
+        np.testing.assert_array_equal(found[hits], vectors[hits])
+
+    def test_clear(self, temp_dir, texts, vectors):
+        """Test clearing the cache"""
+        cache = self.make_cache(temp_dir)
+        cache.put_many(texts, vectors)
+        cache.save()
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert len(self.make_cache(temp_dir)) == 0
+
+
+class TestEmbeddingsManagerCache:
+    """Test EmbeddingsManager with the embedding cache enabled"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for cache files"""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def make_manager(self, cache_dir):
+        """Create a local EmbeddingsManager with a mocked model"""
+        def fake_init(manager):
+            manager.embedder = Mock()
+            manager.embedder.encode = Mock(
+                side_effect=lambda texts, **kwargs: np.array(
+                    [[len(t), 1.0, 0.0, 0.5] for t in texts], dtype='float32'
+                )
+            )
+            manager.dimension = 4
+
+        with patch.object(EmbeddingsManager, "_initialize_local", fake_init):
+            return EmbeddingsManager(provider="local", cache_dir=cache_dir)
+
+    def test_only_misses_are_embedded(self, temp_dir):
+        """Test that cached texts skip the model"""
+        manager = self.make_manager(temp_dir)
+        manager.embed_documents(["a", "bb"], show_progress=False)
+
+        reopened = self.make_manager(temp_dir)
+        vectors = reopened.embed_documents(["bb", "ccc", "a"], show_progress=False)
+
+        encoded = reopened.embedder.encode.call_args[0][0]
+        assert encoded == ["ccc"]
+        assert [v[0] for v in vectors] == [2.0, 3.0, 1.0]
+        assert reopened.get_info()['cache']['hits'] == 2
+
+    def test_returns_float32_arrays(self, temp_dir):
+        """Test that embeddings come back as contiguous float32 arrays, cached or not"""
+        for cache_dir in (None, temp_dir):
+            manager = self.make_manager(cache_dir)
+            manager.embedder.encode.side_effect = lambda texts, **kwargs: np.ones(
+                (len(texts), 4) if isinstance(texts, list) else 4, dtype='float64'
+            )
+
+            documents = manager.embed_documents(["a", "bb"], show_progress=False)
+            queries = manager.embed_queries(["a", "bb"])
+            query = manager.embed_query("a")
+
+            for vectors in (documents, queries, query):
+                assert isinstance(vectors, np.ndarray)
+                assert vectors.dtype == np.float32 and vectors.flags['C_CONTIGUOUS']
+            assert documents.shape == queries.shape == (2, 4)
+            assert query.shape == (4,)
+            assert manager.embed_documents([]).shape == (0, 4)
+
+    def test_encoder_pool(self, temp_dir):
+        """Test that a running encoder pool is used for document embeddings"""
+        manager = self.make_manager(None)
+        manager.embedder.encode_multi_process = Mock(
+            side_effect=lambda texts, pool, **kwargs: np.ones((len(texts), 4), dtype='float32')
+        )
+
+        assert manager.start_pool(4)
+        manager.embed_documents(["a", "b"], show_progress=False)
+        manager.stop_pool()
+
+        manager.embedder.start_multi_process_pool.assert_called_once_with(target_devices=["cpu"] * 4)
+        manager.embedder.encode_multi_process.assert_called_once()
+        manager.embedder.stop_multi_process_pool.assert_called_once()
+        assert not manager.start_pool(1)
+
+    def test_cache_disabled_by_default(self):
+        """Test that no cache is created without cache_dir"""
+        with patch.object(EmbeddingsManager, "_initialize_local", lambda m: setattr(m, "dimension", 4)):
+            manager = EmbeddingsManager(provider="local")
+
+        assert manager.cache is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
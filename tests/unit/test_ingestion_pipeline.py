@@ -6,6 +6,7 @@ Validates text chunking, metadata handling, and pipeline orchestration.
 """
 
 import pytest
+import json
 import tempfile
 import shutil
 from pathlib import Path
@@ -277,6 +278,329 @@ class TestIngestionPipeline:
         assert stats['time_elapsed'] < 60  # Should take less than 60 seconds
 
 
+class TestIncrementalIngestion:
+    """Test manifest-driven incremental ingestion against a real FAISS store"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for test files"""
+        temp_dir = tempfile.mkdtemp()
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def kb_dir(self, temp_dir):
+        """Knowledge base with 4 markdown files"""
+        kb_dir = temp_dir / "kb"
+        kb_dir.mkdir()
+        for i in range(4):
+            (kb_dir / f"doc_{i}.md").write_text(
+                f"# Document {i}\n\n" + f"Paragraph about topic {i}. " * 80, encoding='utf-8'
+            )
+        return kb_dir
+
+    @pytest.fixture
+    def embeddings_manager(self):
+        """Mock embeddings manager that counts embedded texts"""
+        mock_embeddings = Mock()
+        mock_embeddings.embedded = 0
+
+        def mock_embed(texts, show_progress=True):
+            mock_embeddings.embedded += len(texts)
+            return np.random.rand(len(texts), 32).astype('float32').tolist()
+        mock_embeddings.embed_documents = mock_embed
+        return mock_embeddings
+
+    def make_pipeline(self, temp_dir, embeddings_manager, chunk_size=500):
+        """Create a pipeline over a (re)loaded FAISS store in temp_dir/index"""
+        from agents.technical_analyst.vector_store import FAISSVectorStore
+
+        store = FAISSVectorStore(index_path=str(temp_dir / "index"), dimension=32)
+        return IngestionPipeline(store, embeddings_manager, chunk_size=chunk_size, chunk_overlap=50)
+
+    def test_first_run_writes_manifest(self, temp_dir, kb_dir, embeddings_manager):
+        """Test that the first run ingests everything and writes the manifest"""
+        pipeline = self.make_pipeline(temp_dir, embeddings_manager)
+
+        stats = pipeline.ingest_from_directory(str(kb_dir))
+
+        assert stats['diff'] == {"added": 4, "updated": 0, "removed": 0, "unchanged": 0}
+        assert (temp_dir / "index" / "manifest.json").exists()
+        entry = pipeline.manifest.files[str(kb_dir / "doc_0.md")]
+        assert len(entry['chunk_ids']) == stats['files_processed'][0]['chunks']
+
+    def test_rerun_skips_unchanged_files(self, temp_dir, kb_dir, embeddings_manager):
+        """Test that a re-run without changes embeds nothing"""
+        self.make_pipeline(temp_dir, embeddings_manager).ingest_from_directory(str(kb_dir))
+        embedded_first = embeddings_manager.embedded
+
+        pipeline = self.make_pipeline(temp_dir, embeddings_manager)
+        stats = pipeline.ingest_from_directory(str(kb_dir))
+
+        assert stats['diff'] == {"added": 0, "updated": 0, "removed": 0, "unchanged": 4}
+        assert stats['total_embeddings'] == 0
+        assert embeddings_manager.embedded == embedded_first
+
+    def test_rerun_applies_diff(self, temp_dir, kb_dir, embeddings_manager):
+        """Test added, modified (shorter) and deleted files"""
+        pipeline = self.make_pipeline(temp_dir, embeddings_manager)
+        pipeline.ingest_from_directory(str(kb_dir))
+
+        (kb_dir / "doc_1.md").write_text("# Document 1\n\nShort new version.", encoding='utf-8')
+        (kb_dir / "doc_2.md").unlink()
+        (kb_dir / "doc_9.md").write_text("# Document 9\n\nBrand new file.", encoding='utf-8')
+        embedded_before = embeddings_manager.embedded
+
+        pipeline = self.make_pipeline(temp_dir, embeddings_manager)
+        stats = pipeline.ingest_from_directory(str(kb_dir))
+
+        assert stats['diff'] == {"added": 1, "updated": 1, "removed": 1, "unchanged": 2}
+        assert embeddings_manager.embedded - embedded_before == 2
+
+        store = pipeline.vector_store
+        sources = {meta['source_path'] for meta in (
+            store.chunks.metadata(row) for row in range(len(store.chunks))
+            if not store.chunks.is_deleted(row)
+        )}
+        assert str(kb_dir / "doc_2.md") not in sources
+        live_doc1 = [
+            row for row in store.chunks.find_rows("source_path", str(kb_dir / "doc_1.md"))
+            if not store.chunks.is_deleted(int(row))
+        ]
+        assert len(live_doc1) == 1
+        assert str(kb_dir / "doc_2.md") not in pipeline.manifest.files
+
+    def test_touched_file_is_unchanged(self, temp_dir, kb_dir, embeddings_manager):
+        """Test that a new mtime with identical content is not re-embedded"""
+        import os
+
+        self.make_pipeline(temp_dir, embeddings_manager).ingest_from_directory(str(kb_dir))
+        path = kb_dir / "doc_0.md"
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+
+        stats = self.make_pipeline(temp_dir, embeddings_manager).ingest_from_directory(str(kb_dir))
+
+        assert stats['diff']['unchanged'] == 4
+
+    def test_chunk_settings_change_reprocesses(self, temp_dir, kb_dir, embeddings_manager):
+        """Test that changing chunk_size re-chunks every file"""
+        self.make_pipeline(temp_dir, embeddings_manager).ingest_from_directory(str(kb_dir))
+
+        pipeline = self.make_pipeline(temp_dir, embeddings_manager, chunk_size=800)
+        stats = pipeline.ingest_from_directory(str(kb_dir))
+
+        assert stats['diff']['updated'] == 4
+        total_chunks = sum(f['chunks'] for f in stats['files_processed'])
+        assert pipeline.vector_store.get_stats()['total_documents'] == total_chunks
+
+    def test_full_mode_reprocesses_everything(self, temp_dir, kb_dir, embeddings_manager):
+        """Test incremental=False re-embeds every file without duplicating chunks"""
+        pipeline = self.make_pipeline(temp_dir, embeddings_manager)
+        first = pipeline.ingest_from_directory(str(kb_dir))
+
+        stats = pipeline.ingest_from_directory(str(kb_dir), incremental=False)
+
+        assert stats['diff']['updated'] == 4
+        assert stats['total_embeddings'] == first['total_embeddings']
+        assert pipeline.vector_store.get_stats()['total_documents'] == first['total_chunks']
+
+
+class TestStreamingIngestion:
+    """Test batched, bounded-memory ingestion"""
+
+    @pytest.fixture
+    def kb_dir(self, tmp_path):
+        """Knowledge base with 5 markdown files of several chunks each"""
+        for i in range(5):
+            (tmp_path / f"doc_{i}.md").write_text(
+                f"# Document {i}\n\n" + "\n\n".join(
+                    f"Paragraph {j}: " + "Lorem ipsum " * 30 for j in range(6)
+                ), encoding='utf-8'
+            )
+        return tmp_path
+
+    def make_pipeline(self, **kwargs):
+        """Pipeline with a mock store and an embeddings mock recording batch sizes"""
+        embeddings = Mock()
+        embeddings.dimension = 384
+        embeddings.batches = []
+
+        def mock_embed(texts, show_progress=True):
+            embeddings.batches.append(len(texts))
+            return np.random.rand(len(texts), 384).astype('float32').tolist()
+        embeddings.embed_documents = mock_embed
+
+        return IngestionPipeline(Mock(), embeddings, chunk_size=300, chunk_overlap=50, **kwargs)
+
+    def test_batches_respect_batch_size(self, kb_dir):
+        """Test that chunks are embedded and added in batches of at most batch_size"""
+        pipeline = self.make_pipeline(batch_size=7)
+
+        stats = pipeline.ingest_from_directory(str(kb_dir))
+
+        assert max(pipeline.embeddings.batches) <= 7
+        assert stats['batches'] == len(pipeline.embeddings.batches) > 1
+        assert pipeline.vector_store.add_documents.call_count == stats['batches']
+        assert pipeline.vector_store.save.call_count == 1
+
+    def test_same_stats_as_single_batch(self, kb_dir):
+        """Test that batching does not change the final stats"""
+        batched = self.make_pipeline(batch_size=3).ingest_from_directory(str(kb_dir))
+        single = self.make_pipeline(batch_size=10000).ingest_from_directory(str(kb_dir))
+
+        assert single['batches'] == 1
+        for key in ('documents_loaded', 'total_chunks', 'total_embeddings', 'files_processed'):
+            assert batched[key] == single[key]
+
+    def test_memory_ceiling_splits_batches(self, kb_dir):
+        """Test that the memory ceiling caps batches before batch_size does"""
+        # A ~300-char chunk with its 384-dim float32 embedding is ~4.3 KB: 0.018 MB fits 4
+        pipeline = self.make_pipeline(batch_size=1000, max_batch_memory_mb=0.018)
+
+        stats = pipeline.ingest_from_directory(str(kb_dir))
+
+        assert max(pipeline.embeddings.batches) == 4
+        assert sum(pipeline.embeddings.batches) == stats['total_chunks']
+
+    def test_parallel_matches_serial(self, kb_dir):
+        """Test that the process pool yields the same chunks, in the same order"""
+        serial = self.make_pipeline(batch_size=5)
+        serial_stats = serial.ingest_from_directory(str(kb_dir))
+
+        parallel = self.make_pipeline(batch_size=5, workers=2)
+        parallel_stats = parallel.ingest_from_directory(str(kb_dir))
+
+        assert parallel_stats['workers'] == 2
+        assert parallel_stats['files_processed'] == serial_stats['files_processed']
+
+        def added(pipeline):
+            return [
+                (text, meta) for call in pipeline.vector_store.add_documents.call_args_list
+                for text, meta in zip(call[0][0], call[0][2])
+            ]
+        assert added(parallel) == added(serial)
+
+        # The encoder pool is started for the run and always stopped
+        parallel.embeddings.start_pool.assert_called_once_with(2)
+        parallel.embeddings.stop_pool.assert_called_once()
+
+    def test_invalid_batch_settings(self):
+        """Test that non-positive batch settings are rejected"""
+        with pytest.raises(ValueError):
+            self.make_pipeline(batch_size=0)
+
+
+class TestCheckpointResume:
+    """Test checkpointing and resuming of interrupted ingestion runs (real FAISS store)"""
+
+    @pytest.fixture
+    def kb_dir(self, tmp_path):
+        """Knowledge base with 4 markdown files of several chunks each"""
+        kb_dir = tmp_path / "kb"
+        kb_dir.mkdir()
+        for i in range(4):
+            (kb_dir / f"doc_{i}.md").write_text(
+                f"# Document {i}\n\n" + "\n\n".join(
+                    f"Doc {i} paragraph {j}: " + f"conteúdo {i}-{j} " * 20 for j in range(6)
+                ), encoding='utf-8'
+            )
+        return kb_dir
+
+    def make_pipeline(self, tmp_path, fail_after=None):
+        """Pipeline over a (re)loaded FAISS store; embedding fails after fail_after batches"""
+        from agents.technical_analyst.vector_store import FAISSVectorStore
+
+        embeddings = Mock()
+        embeddings.embedded = 0
+        embeddings.calls = 0
+
+        def mock_embed(texts, show_progress=True):
+            if fail_after is not None and embeddings.calls >= fail_after:
+                raise MemoryError("simulated crash")
+            embeddings.calls += 1
+            embeddings.embedded += len(texts)
+            return np.random.rand(len(texts), 32).astype('float32').tolist()
+        embeddings.embed_documents = mock_embed
+
+        store = FAISSVectorStore(index_path=str(tmp_path / "index"), dimension=32)
+        return IngestionPipeline(
+            store, embeddings, chunk_size=300, chunk_overlap=0, batch_size=4, checkpoint_every=2
+        )
+
+    def live_ids(self, pipeline):
+        """Stable IDs of the live chunks in the store"""
+        chunks = pipeline.vector_store.chunks
+        return sorted(chunks.chunk_id(row) for row in range(len(chunks)) if not chunks.is_deleted(row))
+
+    def test_crash_leaves_checkpoint(self, tmp_path, kb_dir):
+        """Test that committed batches survive a crash"""
+        with pytest.raises(MemoryError):
+            self.make_pipeline(tmp_path, fail_after=5).ingest_from_directory(str(kb_dir))
+
+        checkpoint = json.loads((tmp_path / "index" / "checkpoint.json").read_text(encoding="utf-8"))
+        committed = [i for entry in checkpoint["files"].values() for i in entry["committed"]]
+
+        assert checkpoint["batches"] == 4
+        assert len(committed) == 16
+        reloaded = self.make_pipeline(tmp_path)
+        assert reloaded.vector_store.get_stats()["total_documents"] == 16
+        assert not (tmp_path / "index" / "manifest.json").exists()
+
+    def test_resume_skips_committed_work(self, tmp_path, kb_dir):
+        """Test that a resumed run only embeds what was not committed"""
+        reference = self.make_pipeline(tmp_path / "reference")
+        reference_stats = reference.ingest_from_directory(str(kb_dir))
+
+        with pytest.raises(MemoryError):
+            self.make_pipeline(tmp_path, fail_after=5).ingest_from_directory(str(kb_dir))
+
+        resumed = self.make_pipeline(tmp_path)
+        stats = resumed.ingest_from_directory(str(kb_dir), resume=True)
+
+        assert resumed.embeddings.embedded == reference_stats['total_chunks'] - 16
+        # 16 chunks = doc_0 and doc_1 (6 each) + 4 of doc_2
+        assert stats['resumed'] == {"files": 2, "chunks": 4}
+        assert stats['documents_loaded'] == 2
+        assert self.live_ids(resumed) == self.live_ids(reference)
+        assert not (tmp_path / "index" / "checkpoint.json").exists()
+
+        # The manifest covers every file, including those completed before the crash
+        rerun = self.make_pipeline(tmp_path).ingest_from_directory(str(kb_dir))
+        assert rerun['diff']['unchanged'] == 4
+
+    def test_without_resume_checkpoint_is_discarded(self, tmp_path, kb_dir):
+        """Test that a normal run starts over"""
+        reference_chunks = self.make_pipeline(tmp_path / "reference").ingest_from_directory(
+            str(kb_dir))['total_chunks']
+        with pytest.raises(MemoryError):
+            self.make_pipeline(tmp_path, fail_after=5).ingest_from_directory(str(kb_dir))
+
+        pipeline = self.make_pipeline(tmp_path)
+        pipeline.ingest_from_directory(str(kb_dir))
+
+        assert pipeline.embeddings.embedded == reference_chunks
+        assert pipeline.vector_store.get_stats()["total_documents"] == reference_chunks
+
+    def test_file_modified_after_crash_is_reingested(self, tmp_path, kb_dir):
+        """Test that committed chunks of a file changed since the crash are replaced"""
+        with pytest.raises(MemoryError):
+            self.make_pipeline(tmp_path, fail_after=5).ingest_from_directory(str(kb_dir))
+
+        (kb_dir / "doc_0.md").write_text("# Document 0\n\nNovo conteúdo.", encoding='utf-8')
+        resumed = self.make_pipeline(tmp_path)
+        resumed.ingest_from_directory(str(kb_dir), resume=True)
+
+        texts = [resumed.vector_store.chunks.text(row) for row in range(len(resumed.vector_store.chunks))
+                 if not resumed.vector_store.chunks.is_deleted(row)]
+        assert not any("Doc 0 paragraph" in text for text in texts)
+        assert any("Novo conteúdo" in text for text in texts)
+
+    def test_invalid_checkpoint_setting(self):
+        """Test that a negative checkpoint interval is rejected"""
+        with pytest.raises(ValueError):
+            IngestionPipeline(Mock(), Mock(), checkpoint_every=-1)
+
+
 class TestChunkingEdgeCases:
     """Test edge cases in text chunking"""
 
@@ -0,0 +1,108 @@
+"""
+Unit Tests for Lazy Loading
+
+Tests lazy package attributes, deferred EmbeddingsManager model loading and
+AnalysisPipeline with a warming RAG engine (mocked model, engine double).
+"""
+
+import pytest
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import agents.technical_analyst as technical_analyst
+from agents.technical_analyst.embeddings_manager import EmbeddingsManager
+from agents.technical_analyst.pipeline import AnalysisPipeline
+
+
+class TestLazyPackage:
+    """Test module-level lazy attributes of agents.technical_analyst"""
+
+    def test_import_loads_no_submodule(self):
+        """Test that importing the package imports none of its submodules or NumPy"""
+        code = (
+            "import sys, agents.technical_analyst; "
+            "print(sorted(m for m in sys.modules if m.startswith('agents.') or m == 'numpy'))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent.parent,
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "['agents.technical_analyst']"
+
+    def test_public_names_resolve(self):
+        """Test that every name in __all__ resolves to its defining module"""
+        for name in technical_analyst.__all__:
+            assert getattr(technical_analyst, name).__name__ == name
+        assert technical_analyst.AnalysisPipeline is AnalysisPipeline
+        assert 'RAGEngine' in dir(technical_analyst)
+
+    def test_unknown_name(self):
+        """Test that unknown attributes still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            technical_analyst.NotAComponent
+
+
+class TestDeferredModel:
+    """Test EmbeddingsManager(lazy=True)"""
+
+    @staticmethod
+    def fake_init(loads):
+        def init(manager):
+            time.sleep(0.05)
+            loads.append(threading.current_thread().name)
+            manager.embedder = Mock()
+            manager.embedder.encode = Mock(
+                side_effect=lambda texts, **kwargs: np.ones((len(texts), 4), dtype='float32')
+            )
+            manager.dimension = 4
+        return init
+
+    def test_loaded_on_first_embed(self):
+        """Test that the model loads on the first embed call, not in the constructor"""
+        loads = []
+        with patch.object(EmbeddingsManager, "_initialize_local", self.fake_init(loads)):
+            manager = EmbeddingsManager(provider="local", lazy=True)
+            assert loads == [] and not manager.is_loaded
+
+            assert manager.embed_queries(["a", "b"]).shape == (2, 4)
+            assert len(loads) == 1 and manager.is_loaded
+
+    def test_concurrent_first_use_loads_once(self):
+        """Test that a warm-up thread and a first embed call share one load"""
+        loads = []
+        with patch.object(EmbeddingsManager, "_initialize_local", self.fake_init(loads)):
+            manager = EmbeddingsManager(provider="local", lazy=True)
+            warm_up = threading.Thread(target=manager.load)
+            warm_up.start()
+            manager.embed_query("a")
+            warm_up.join()
+
+        assert len(loads) == 1
+
+
+class TestPipelineWarmUp:
+    """Test AnalysisPipeline with a RAG engine still warming up"""
+
+    def test_future_engine(self, tmp_path, make_rag):
+        """Test that the pipeline waits for the engine only when analyzing"""
+        future, rag = Future(), make_rag()
+        pipeline = AnalysisPipeline(rag_engine=future, output_dir=str(tmp_path))
+
+        threading.Timer(0.05, future.set_result, args=(rag,)).start()
+        report = pipeline.analyze_requirements(
+            [{'id': 'REQ-1', 'descricao': 'Câmeras IP 4MP'}], export_formats=['json'], journal=False
+        )
+
+        assert pipeline.rag is rag
+        assert report.get_summary()['total_requirements'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
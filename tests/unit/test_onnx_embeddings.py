@@ -0,0 +1,195 @@
+"""
+Unit Tests for ONNX Embeddings
+
+Tests pooling, batch reassembly and the EmbeddingsManager onnx provider
+(encoder double), plus cosine parity of the int8 ONNX export with the
+PyTorch sentence-transformers vectors (skipped without onnxruntime and
+sentence-transformers, or offline).
+"""
+
+import pytest
+import json
+from pathlib import Path
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst import onnx_embeddings
+from agents.technical_analyst.config import RAGConfig
+from agents.technical_analyst.embeddings_manager import EmbeddingsManager
+from agents.technical_analyst.onnx_embeddings import OnnxEncoder, mean_pool, model_dir_for
+
+
+TEXTS = [
+    "Câmeras IP com resolução mínima de 4MP",
+    "NVR",
+    "Switch PoE gerenciável de 24 portas com suporte a VLAN e QoS",
+    "Garantia de 36 meses",
+    "Armazenamento de 30 dias de gravação contínua em todas as câmeras",
+]
+
+
+class FakeEncoder:
+    """OnnxEncoder double: embeddings from text lengths"""
+
+    device = "cpu"
+
+    def __init__(self, model_dir, quantized=True, threads=0):
+        self.model_path = Path(model_dir) / "model_int8.onnx"
+
+    def get_sentence_embedding_dimension(self):
+        return 4
+
+    def encode(self, texts, batch_size=32):
+        if isinstance(texts, str):
+            return self.encode([texts])[0]
+        return np.array([[len(text), 1, 0, 0] for text in texts], dtype=np.float32)
+
+    def hf_tokenizer(self):
+        return None
+
+
+class TestPooling:
+    """Test mean pooling"""
+
+    def test_padding_ignored(self):
+        """Test that padded positions do not contribute to the mean"""
+        tokens = np.array([[[1, 2], [3, 4], [100, 100]],
+                           [[2, 0], [100, 100], [100, 100]]], dtype=np.float32)
+        mask = np.array([[1, 1, 0], [1, 0, 0]])
+
+        np.testing.assert_allclose(mean_pool(tokens, mask, normalize=False), [[2, 3], [2, 0]])
+        pooled = mean_pool(tokens, mask, normalize=True)
+        np.testing.assert_allclose(np.linalg.norm(pooled, axis=1), 1.0, rtol=1e-6)
+        assert pooled.dtype == np.float32
+
+
+class TestOnnxEncoderBatching:
+    """Test length-sorted batching of OnnxEncoder.encode"""
+
+    def test_input_order_restored(self):
+        """Test that length-sorted batches come back in input order"""
+        encoder = object.__new__(OnnxEncoder)
+        encoder.dimension = 1
+        batches = []
+
+        def encode_batch(texts):
+            batches.append(texts)
+            return np.array([[len(text)] for text in texts], dtype=np.float32)
+
+        encoder._encode_batch = encode_batch
+        vectors = encoder.encode(TEXTS, batch_size=2)
+
+        np.testing.assert_array_equal(vectors[:, 0], [len(text) for text in TEXTS])
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert batches[0][0] == max(TEXTS, key=len)  # longest first
+        assert encoder.encode("NVR")[0] == 3
+
+
+class TestEmbeddingsManagerOnnx:
+    """Test EmbeddingsManager(provider="onnx") over an encoder double"""
+
+    MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+    @pytest.fixture
+    def config(self, tmp_path, monkeypatch):
+        """Config pointing at an existing export (encoder double)"""
+        monkeypatch.setattr(onnx_embeddings, "OnnxEncoder", FakeEncoder)
+        model_dir = model_dir_for(tmp_path, self.MODEL)
+        model_dir.mkdir()
+        (model_dir / onnx_embeddings.CONFIG_FILE).write_text(json.dumps({}), encoding="utf-8")
+
+        class MockConfig:
+            ONNX_MODEL_PATH = str(tmp_path)
+            ONNX_QUANTIZE = True
+
+        return MockConfig()
+
+    def test_documents_and_queries(self, config):
+        """Test document and query embeddings through the export of the given config"""
+        assert RAGConfig.ONNX_MODEL_PATH != config.ONNX_MODEL_PATH
+
+        manager = EmbeddingsManager(provider="onnx", model=self.MODEL, config=config)
+        documents = manager.embed_documents(TEXTS, show_progress=False)
+
+        assert manager.dimension == 4
+        assert documents.shape == (5, 4) and documents.dtype == np.float32
+        np.testing.assert_array_equal(manager.embed_queries(TEXTS[:2]), documents[:2])
+        np.testing.assert_array_equal(manager.embed_query(TEXTS[1]), documents[1])
+        assert manager.get_info()["device"] == "cpu"
+        assert manager.get_tokenizer() is None
+
+    def test_cache_keyed_by_quantization(self, config, tmp_path, monkeypatch):
+        """Test that int8 and fp32 vectors never share embedding cache entries"""
+        class Fp32Encoder(FakeEncoder):
+            def __init__(self, model_dir, quantized=True, threads=0):
+                self.model_path = Path(model_dir) / onnx_embeddings.FP32_FILE
+
+            def encode(self, texts, batch_size=32):
+                return super().encode(texts, batch_size) * 2
+
+        cache_dir = str(tmp_path / "cache")
+        int8 = EmbeddingsManager(provider="onnx", model=self.MODEL, cache_dir=cache_dir, config=config)
+        int8_vectors = int8.embed_documents(TEXTS, show_progress=False)
+
+        config.ONNX_QUANTIZE = False
+        monkeypatch.setattr(onnx_embeddings, "OnnxEncoder", Fp32Encoder)
+        fp32 = EmbeddingsManager(provider="onnx", model=self.MODEL, cache_dir=cache_dir, config=config)
+
+        assert int8.cache.model != fp32.cache.model
+        np.testing.assert_array_equal(fp32.embed_documents(TEXTS, show_progress=False), int8_vectors * 2)
+
+
+PARITY_MODEL = "all-MiniLM-L6-v2"
+
+
+@pytest.fixture(scope="module")
+def parity_models(tmp_path_factory):
+    """PyTorch reference model and its ONNX export"""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("tokenizers")
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+    try:
+        reference = sentence_transformers.SentenceTransformer(PARITY_MODEL, device="cpu")
+    except OSError as e:
+        pytest.skip(f"Model unavailable (offline?): {e}")
+
+    model_dir = onnx_embeddings.export_onnx_model(PARITY_MODEL, tmp_path_factory.mktemp("onnx"))
+    return reference, model_dir
+
+
+class TestParity:
+    """Test cosine agreement of the int8 ONNX export with PyTorch"""
+
+    @staticmethod
+    def cosines(a, b):
+        a = a / np.linalg.norm(a, axis=1, keepdims=True)
+        b = b / np.linalg.norm(b, axis=1, keepdims=True)
+        return (a * b).sum(axis=1)
+
+    def test_fp32_matches(self, parity_models):
+        """Test that the fp32 export reproduces the PyTorch vectors"""
+        reference, model_dir = parity_models
+        expected = reference.encode(TEXTS, convert_to_numpy=True)
+        vectors = OnnxEncoder(model_dir, quantized=False).encode(TEXTS, batch_size=2)
+        assert self.cosines(vectors, expected).min() > 0.9999
+
+    def test_int8_cosine_agreement(self, parity_models):
+        """Test that int8 vectors stay close to PyTorch and keep the ranking"""
+        reference, model_dir = parity_models
+        expected = reference.encode(TEXTS, convert_to_numpy=True)
+        vectors = OnnxEncoder(model_dir).encode(TEXTS, batch_size=2)
+
+        cosines = self.cosines(vectors, expected)
+        assert cosines.mean() > 0.99
+        assert cosines.min() > 0.97
+
+        query = reference.encode("câmeras de vigilância IP", convert_to_numpy=True)
+        onnx_query = OnnxEncoder(model_dir).encode("câmeras de vigilância IP")
+        assert np.argmax(expected @ query) == np.argmax(vectors @ onnx_query)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,251 @@
+"""
+Unit Tests for OpenAI Embeddings Client
+
+Tests token packing, bounded concurrency, retries and rate-limit handling of
+OpenAIEmbeddingsClient against a local stub of the embeddings endpoint.
+"""
+
+import pytest
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.embeddings_manager import EmbeddingsManager
+from agents.technical_analyst.openai_embeddings import OpenAIEmbeddingsClient, TokenCounter, parse_reset
+
+
+def word_count(text):
+    return len(text.split())
+
+
+def fake_embedding(text):
+    """Deterministic 3-d embedding of a text"""
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+class StubServer:
+    """
+    Local stand-in for POST /v1/embeddings
+
+    Replies with shuffled data items (like the real API may), tracks
+    requests in flight, and can answer scripted error statuses first.
+    """
+
+    def __init__(self, delay=0.0, failures=None, headers=None):
+        self.delay = delay
+        self.failures = list(failures or [])  # (status, headers) answered before succeeding
+        self.headers = headers or {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with stub.lock:
+                    stub.requests.append({'input': body['input'], 'auth': self.headers['Authorization']})
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    failure = stub.failures.pop(0) if stub.failures else None
+                try:
+                    time.sleep(stub.delay)
+                    if failure:
+                        status, headers = failure
+                        self._reply(status, {'error': {'message': f'stub error {status}'}}, headers)
+                        return
+                    data = [{'index': i, 'embedding': fake_embedding(text), 'object': 'embedding'}
+                            for i, text in enumerate(body['input'])]
+                    random.shuffle(data)
+                    usage = {'total_tokens': sum(word_count(text) for text in body['input'])}
+                    self._reply(200, {'data': data, 'model': body['model'], 'usage': usage}, stub.headers)
+                finally:
+                    with stub.lock:
+                        stub.in_flight -= 1
+
+            def _reply(self, status, body, headers):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_factory():
+    servers = []
+
+    def make(**kwargs):
+        servers.append(StubServer(**kwargs))
+        return servers[-1]
+
+    yield make
+    for server in servers:
+        server.close()
+
+
+def make_client(stub, **kwargs):
+    options = {'max_batch_tokens': 10, 'max_concurrency': 4, 'backoff_base': 0.01,
+               'token_counter': word_count}
+    options.update(kwargs)
+    return OpenAIEmbeddingsClient("sk-test", base_url=stub.url, **options)
+
+
+TEXTS = [f"requisito técnico número {i}" for i in range(30)]  # 4 tokens each
+
+
+class TestPacking:
+    """Test token-aware request packing"""
+
+    def test_pack_by_tokens(self, stub_factory):
+        """Test that requests respect the token budget and keep input order"""
+        client = make_client(stub_factory())
+        assert client.pack([4, 4, 4, 9, 1, 12, 2]) == [[0, 1], [2], [3, 4], [5], [6]]
+
+    def test_embed_in_input_order(self, stub_factory):
+        """Test that packed, shuffled responses come back in input order"""
+        stub = stub_factory()
+        vectors = make_client(stub).embed(TEXTS)
+
+        assert vectors.dtype == np.float32 and vectors.shape == (30, 3)
+        np.testing.assert_array_equal(vectors, np.array([fake_embedding(t) for t in TEXTS], dtype=np.float32))
+        assert len(stub.requests) == 15
+        assert all(len(request['input']) == 2 for request in stub.requests)
+        assert stub.requests[0]['auth'] == "Bearer sk-test"
+
+
+class TestConcurrency:
+    """Test bounded concurrent requests"""
+
+    def test_bounded_in_flight(self, stub_factory):
+        """Test that at most max_concurrency requests run at once"""
+        stub = stub_factory(delay=0.05)
+        make_client(stub, max_concurrency=3).embed(TEXTS)
+
+        assert stub.max_in_flight == 3
+
+
+class TestRetries:
+    """Test retry, backoff and rate-limit handling"""
+
+    def test_rate_limit_retried(self, stub_factory):
+        """Test that 429 and 5xx responses are retried until success"""
+        stub = stub_factory(failures=[(429, {'Retry-After': '0.05'}), (503, {})])
+        client = make_client(stub, max_batch_tokens=1000)
+
+        vectors = client.embed(TEXTS[:3])
+
+        assert vectors.shape == (3, 3)
+        stats = client.get_stats()
+        assert stats['requests'] == 3
+        assert stats['retries'] == 2
+        assert stats['rate_limited'] == 1
+        assert stats['inputs'] == 3
+
+    def test_retry_after_pauses(self, stub_factory):
+        """Test that Retry-After delays the retry"""
+        stub = stub_factory(failures=[(429, {'Retry-After': '0.3'})])
+        start = time.monotonic()
+        make_client(stub, max_batch_tokens=1000).embed(TEXTS[:2])
+        assert time.monotonic() - start >= 0.3
+
+    def test_only_rate_limits_pause_all_workers(self, stub_factory):
+        """Test that 5xx and connection errors back off the failing request only"""
+        stub = stub_factory(failures=[(503, {'Retry-After': '0.05'}), (429, {'Retry-After': '0.05'})])
+        client = make_client(stub, max_batch_tokens=1000)
+        pauses = []
+        client._pause = pauses.append
+
+        client.embed(TEXTS[:3])
+        client.url = "http://127.0.0.1:9/v1/embeddings"  # nothing listens on the discard port
+        with pytest.raises(RuntimeError, match="ConnectionError"):
+            client.embed(TEXTS[:3])
+
+        assert len(pauses) == 1
+        assert client.get_stats()['retries'] == 2 + client.max_retries
+
+    def test_client_error_not_retried(self, stub_factory):
+        """Test that other 4xx responses fail at once with the API message"""
+        stub = stub_factory(failures=[(400, {})])
+        with pytest.raises(RuntimeError, match="stub error 400"):
+            make_client(stub).embed(TEXTS[:2])
+        assert len(stub.requests) == 1
+
+    def test_retries_exhausted(self, stub_factory):
+        """Test that persistent failures raise after max_retries"""
+        stub = stub_factory(failures=[(500, {})] * 10)
+        with pytest.raises(RuntimeError, match="after 2 retries"):
+            make_client(stub, max_retries=2).embed(TEXTS[:2])
+        assert len(stub.requests) == 3
+
+    def test_low_remaining_budget_pauses(self, stub_factory):
+        """Test that a nearly exhausted token budget pauses the next request"""
+        stub = stub_factory(headers={'x-ratelimit-remaining-tokens': '5', 'x-ratelimit-reset-tokens': '200ms'})
+        start = time.monotonic()
+        make_client(stub, max_concurrency=1).embed(TEXTS[:4])
+        assert time.monotonic() - start >= 0.2
+
+    def test_parse_reset(self):
+        """Test the rate-limit reset header formats"""
+        assert parse_reset("2") == 2.0
+        assert parse_reset("20ms") == pytest.approx(0.02)
+        assert parse_reset("6m0s") == 360.0
+        assert parse_reset("1m30.5s") == 90.5
+        assert parse_reset(None) is None
+
+
+class TestEmbeddingsManagerOpenAI:
+    """Test EmbeddingsManager(provider="openai") over the client"""
+
+    def test_documents_and_queries(self, stub_factory):
+        """Test document and query embeddings through the stub endpoint of the given config"""
+        stub = stub_factory()
+
+        class MockConfig:
+            OPENAI_API_KEY = "sk-test"
+            OPENAI_BASE_URL = stub.url
+            OPENAI_EMBEDDINGS_CONCURRENCY = 2
+
+        # Offline: skip loading the tiktoken encoding, use the estimate
+        with patch.object(TokenCounter, "__init__", lambda counter, model: setattr(counter, "encoding", None)):
+            manager = EmbeddingsManager(provider="openai", model="text-embedding-3-small", config=MockConfig())
+            documents = manager.embed_documents(TEXTS, show_progress=False)
+            queries = manager.embed_queries(TEXTS[:2])
+            query = manager.embed_query(TEXTS[0])
+
+        assert documents.shape == (30, 3)
+        np.testing.assert_array_equal(queries, documents[:2])
+        np.testing.assert_array_equal(query, documents[0])
+        assert manager.dimension == 1536
+        assert manager.embedder.url == stub.url.rstrip("/") + "/embeddings"
+        assert manager.embedder.max_concurrency == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,97 @@
+"""
+Unit Tests for Query Cache
+
+Tests the thread-safe LRU cache used by RAGEngine for query embeddings and
+search results.
+"""
+
+import pytest
+import threading
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.query_cache import LRUCache
+
+
+class TestLRUCache:
+    """Test suite for LRUCache"""
+
+    def test_hit_and_miss(self):
+        """Test lookups and hit-rate counters"""
+        cache = LRUCache(max_entries=4)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_least_recently_used_evicted(self):
+        """Test that lookups refresh entries and the oldest one is evicted"""
+        cache = LRUCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_stale_version_is_a_miss(self):
+        """Test that entries stored under another version are dropped"""
+        cache = LRUCache(max_entries=4)
+        cache.put("a", 1, version=1)
+
+        assert cache.get("a", version=1) == 1
+        assert cache.get("a", version=2) is None
+        assert cache.get("a", version=1) is None
+        assert len(cache) == 0
+
+    def test_items_filters_by_version(self):
+        """Test the snapshot used for semantic lookups"""
+        cache = LRUCache(max_entries=4)
+        cache.put("a", 1, version=1)
+        cache.put("b", 2, version=2)
+
+        assert cache.items(version=2) == [("b", 2)]
+
+    def test_disabled(self):
+        """Test that max_entries = 0 stores and counts nothing"""
+        cache = LRUCache(max_entries=0)
+        cache.put("a", 1)
+
+        assert cache.get("a") is None
+        assert cache.get_stats() == {
+            "enabled": False, "entries": 0, "max_entries": 0,
+            "hits": 0, "misses": 0, "evictions": 0, "hit_rate": 0.0
+        }
+
+    def test_concurrent_access(self):
+        """Test that concurrent puts/gets keep the size bound and counters consistent"""
+        cache = LRUCache(max_entries=50)
+
+        def worker(offset):
+            for i in range(1000):
+                cache.put((offset, i % 100), i)
+                cache.get((offset, (i * 7) % 100))
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert len(cache) == 50
+        assert stats["hits"] + stats["misses"] == 8000
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -5,6 +5,8 @@ Tests the Query Processor component in isolation using mocked RAG Engine.
 """
 
 import pytest
+import functools
+import random
 from unittest.mock import Mock, MagicMock
 from agents.technical_analyst.query_processor import (
     QueryProcessor,
@@ -494,3 +496,118 @@ class TestQueryProcessor:
 
         # Should have 2 results (skipped the error)
         assert len(results) == 2
+
+
+@pytest.fixture
+def make_rag(make_rag):
+    """FakeRAG doubles leaving some requirements without evidence, failing on 'erro'"""
+    return functools.partial(make_rag, min_results=0, min_score=0.5, fail_on="erro")
+
+
+class TestBatchAnalysis:
+    """Tests for the vectorized analyze_batch path"""
+
+    @pytest.fixture
+    def requirements(self):
+        return [
+            {'id': f'REQ-{i:03d}', 'descricao': f'Requisito {i}', 'categoria': 'Hardware'}
+            for i in range(50)
+        ]
+
+    def test_batch_matches_serial(self, requirements, make_rag):
+        """Test that batched analyses are identical to analyze_requirement()"""
+        serial_processor = QueryProcessor(make_rag())
+        serial = [serial_processor.analyze_requirement(req) for req in requirements]
+
+        rag = make_rag()
+        processor = QueryProcessor(rag)
+        batched = processor.analyze_batch(requirements, show_progress=False, batch_size=16)
+
+        assert [a.to_dict() for a in batched] == [a.to_dict() for a in serial]
+        assert processor.get_stats() == serial_processor.get_stats()
+        assert len(rag.batches) == 4
+
+    def test_conformity_batch_matches_serial(self, make_rag):
+        """Test that vectorized scoring is bit-identical to _analyze_conformity"""
+        rng = random.Random(7)
+        processor = QueryProcessor(make_rag(), config={'high_confidence': 0.8})
+        evidence_lists = [
+            [Evidence(source='a.md', text='', relevance=rng.random()) for _ in range(rng.randint(0, 10))]
+            for _ in range(500)
+        ]
+
+        verdicts, confidences = processor._analyze_conformity_batch(evidence_lists)
+
+        assert list(zip(verdicts, confidences)) == [
+            processor._analyze_conformity({}, evidence) for evidence in evidence_lists
+        ]
+
+    def test_failed_batch_falls_back_to_serial(self, requirements, make_rag):
+        """Test that a failing batch only skips the failing requirements"""
+        requirements[3]['descricao'] = 'Requisito com erro'
+        rag = make_rag()
+        processor = QueryProcessor(rag)
+
+        results = processor.analyze_batch(requirements, show_progress=False, batch_size=16)
+
+        assert len(results) == 49
+        assert 'REQ-003' not in [r.requirement_id for r in results]
+        assert len(rag.batches) == 4
+
+    def test_batch_size_one_is_serial(self, requirements, make_rag):
+        """Test that batch_size=1 never uses search_batch"""
+        rag = make_rag()
+
+        QueryProcessor(rag).analyze_batch(requirements, show_progress=False, batch_size=1)
+
+        assert len(rag.batches) == 0
+        assert len(rag.queries) == 50
+
+    def test_concurrent_matches_sequential(self, requirements, make_rag):
+        """Test that max_workers > 1 keeps input order, results and stats"""
+        sequential_processor = QueryProcessor(make_rag())
+        sequential = sequential_processor.analyze_batch(requirements, show_progress=False)
+
+        for batch_size in (1, 16):
+            processor = QueryProcessor(make_rag())
+            concurrent = processor.analyze_batch(
+                requirements, show_progress=False, batch_size=batch_size, max_workers=4
+            )
+
+            assert [a.to_dict() for a in concurrent] == [a.to_dict() for a in sequential]
+            assert processor.get_stats() == sequential_processor.get_stats()
+
+    def test_concurrent_failures_skipped(self, requirements, capsys, make_rag):
+        """Test that concurrent analysis skips failing requirements like the serial path"""
+        requirements[10]['descricao'] = 'Requisito com erro'
+        requirements[40]['descricao'] = 'Outro erro'
+
+        results = QueryProcessor(make_rag()).analyze_batch(
+            requirements, show_progress=False, batch_size=1, max_workers=8
+        )
+
+        ids = [r.requirement_id for r in results]
+        assert len(results) == 48
+        assert ids == sorted(ids)
+        assert 'Error analyzing REQ-010' in capsys.readouterr().out
+
+    def test_concurrent_overlaps_latency(self, requirements, make_rag):
+        """Test that worker threads overlap a latency-bound RAG engine"""
+        import time
+
+        start = time.perf_counter()
+        QueryProcessor(make_rag(latency=0.01)).analyze_batch(requirements, show_progress=False, batch_size=1)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        QueryProcessor(make_rag(latency=0.01)).analyze_batch(
+            requirements, show_progress=False, batch_size=1, max_workers=10
+        )
+        concurrent = time.perf_counter() - start
+
+        assert concurrent < sequential / 3
+
+    def test_max_workers_from_config(self, make_rag):
+        """Test the max_workers config default"""
+        assert QueryProcessor(make_rag()).max_workers == 1
+        assert QueryProcessor(make_rag(), config={'max_workers': 4}).max_workers == 4
@@ -0,0 +1,86 @@
+"""
+Unit Tests for rag_search.py Bulk Mode
+
+Tests requirement streaming from JSONL/CSV and incremental batched
+searches of run_bulk (RAG engine double).
+"""
+
+import pytest
+import csv
+import json
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts import rag_search
+
+
+@pytest.fixture
+def fake_rag(make_rag, monkeypatch):
+    rag = make_rag(min_results=None)
+    monkeypatch.setattr(rag_search, 'get_searcher', lambda use_daemon=True: rag)
+    return rag
+
+
+class TestIterRequirements:
+    """Test input streaming"""
+
+    def test_jsonl(self, tmp_path):
+        """Test string and object lines, skipping empty requirements"""
+        path = tmp_path / "reqs.jsonl"
+        path.write_text(
+            '"Câmeras IP 4MP"\n'
+            '{"id": "REQ-2", "requirement": "NVR 16 canais"}\n'
+            '\n'
+            '{"id": "REQ-3", "descricao": ""}\n'
+            '{"query": "Switch PoE"}\n',
+            encoding='utf-8'
+        )
+        assert list(rag_search.iter_requirements(str(path))) == [
+            {'id': '1', 'requirement': 'Câmeras IP 4MP'},
+            {'id': 'REQ-2', 'requirement': 'NVR 16 canais'},
+            {'id': '4', 'requirement': 'Switch PoE'},
+        ]
+
+    def test_document_structurer_csv(self, tmp_path):
+        """Test the Document Structurer CSV columns"""
+        path = tmp_path / "requirements.csv"
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['ID', 'Descrição', 'Categoria'])
+            writer.writeheader()
+            writer.writerow({'ID': '7', 'Descrição': 'Garantia de 36 meses', 'Categoria': 'Serviço'})
+        assert list(rag_search.iter_requirements(str(path))) == [
+            {'id': '7', 'requirement': 'Garantia de 36 meses'}
+        ]
+
+
+class TestRunBulk:
+    """Test bulk searches"""
+
+    def test_batched_incremental_output(self, tmp_path, fake_rag):
+        """Test that inputs stream in batches and every result is written in order"""
+        path = tmp_path / "reqs.jsonl"
+        path.write_text(''.join(json.dumps(f"requisito {i}") + '\n' for i in range(25)), encoding='utf-8')
+        output = tmp_path / "out" / "results.jsonl"
+
+        stats = rag_search.run_bulk(str(path), str(output), top_k=2, threshold=0.7, batch_size=10)
+
+        assert [len(queries) for queries, _, _ in fake_rag.batches] == [10, 10, 5]
+        lines = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert [line['requirement'] for line in lines] == [f"requisito {i}" for i in range(25)]
+        assert lines[3]['results_count'] == 2
+        assert lines[3]['results'][0]['text'] == "requisito 3 #0"
+
+        assert stats['requirements'] == 25
+        assert stats['batches'] == 3
+        assert stats['p95_batch_latency_ms'] >= stats['p50_batch_latency_ms']
+
+    def test_missing_input(self, tmp_path, fake_rag):
+        """Test that a missing input file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            rag_search.run_bulk(str(tmp_path / "missing.jsonl"), str(tmp_path / "out.jsonl"), 5, 0.7)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
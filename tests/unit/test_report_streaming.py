@@ -0,0 +1,143 @@
+"""
+Unit Tests for Streaming Reports
+
+Tests RunningSummary, StreamingReportWriter and the streaming mode of
+AnalysisPipeline (RAG engine double, real QueryProcessor).
+"""
+
+import pytest
+import functools
+import csv
+import json
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.pipeline import AnalysisPipeline
+from agents.technical_analyst.query_processor import QueryProcessor
+from agents.technical_analyst.report import (
+    ConformityReport,
+    ReportExporter,
+    RunningSummary,
+    StreamingReportWriter
+)
+
+
+@pytest.fixture
+def make_rag(make_rag):
+    """FakeRAG doubles leaving some requirements without evidence, failing on 'erro'"""
+    return functools.partial(make_rag, min_results=0, min_score=0.6, fail_on="erro")
+
+
+@pytest.fixture
+def requirements():
+    return [
+        {'id': f'REQ-{i:03d}', 'descricao': f'Requisito {i}', 'tipo': 'Técnico',
+         'categoria': 'Hardware', 'prioridade': 'Alta'}
+        for i in range(40)
+    ]
+
+
+@pytest.fixture
+def analyses(requirements, make_rag):
+    return QueryProcessor(make_rag(), config={'high_confidence': 0.8}).analyze_batch(
+        requirements, show_progress=False
+    )
+
+
+class TestRunningSummary:
+    """Test suite for RunningSummary"""
+
+    def test_matches_full_scan(self, requirements, analyses):
+        """Test that running aggregates equal the report's scan of all results"""
+        summary = RunningSummary()
+        for analysis in analyses:
+            summary.add(analysis)
+
+        report = ConformityReport({}, requirements, analyses, "2026-10-16T00:00:00")
+
+        assert summary.get_summary() == report.get_summary()
+        assert sorted(summary.get_recommendations()) == sorted(report.get_recommendations())
+        assert 0 < summary.counts['CONFORME'] < len(analyses)
+
+    def test_report_uses_aggregates(self, requirements, analyses):
+        """Test that a report with aggregates does not need analysis_results"""
+        summary = RunningSummary()
+        for analysis in analyses:
+            summary.add(analysis)
+
+        report = ConformityReport({}, requirements, [], "2026-10-16T00:00:00", aggregates=summary)
+
+        assert report.get_summary()['total_requirements'] == len(analyses)
+
+    def test_empty(self):
+        """Test the summary of no analyses"""
+        assert RunningSummary().get_summary()['overall_compliance_rate'] == 0
+
+
+class TestStreamingReportWriter:
+    """Test suite for StreamingReportWriter"""
+
+    def test_rows_visible_while_writing(self, tmp_path, analyses):
+        """Test that each write is flushed to the outputs"""
+        with StreamingReportWriter(tmp_path, "edital", ["csv", "jsonl"]) as writer:
+            writer.write(analyses[0])
+            writer.write(analyses[1])
+
+            lines = writer.paths["jsonl"].read_text(encoding="utf-8").splitlines()
+            assert [json.loads(line)["requirement_id"] for line in lines] == ["REQ-000", "REQ-001"]
+
+        assert writer.summary.total == 2
+
+    def test_csv_matches_exporter(self, tmp_path, requirements, analyses):
+        """Test that the streamed CSV equals ReportExporter's CSV"""
+        report = ConformityReport({}, requirements, analyses, "2026-10-16T00:00:00")
+        exported = ReportExporter(report, tmp_path / "exported").export("edital", "csv")
+
+        with StreamingReportWriter(tmp_path / "streamed", "edital", ["csv"]) as writer:
+            for analysis in analyses:
+                writer.write(analysis)
+
+        assert writer.paths["csv"].read_text(encoding="utf-8") == exported.read_text(encoding="utf-8")
+
+    def test_unsupported_format(self, tmp_path):
+        """Test that whole-report formats cannot be streamed"""
+        with pytest.raises(ValueError):
+            StreamingReportWriter(tmp_path, "edital", ["markdown"])
+
+
+class TestPipelineStreaming:
+    """Test the streaming mode of AnalysisPipeline"""
+
+    def test_stream_matches_in_memory(self, tmp_path, requirements, make_rag):
+        """Test that streamed outputs and summary match the in-memory run"""
+        requirements[5]['descricao'] = 'Requisito com erro'
+
+        in_memory = AnalysisPipeline(rag_engine=make_rag(), output_dir=str(tmp_path / "memory"))
+        report = in_memory.analyze_requirements(requirements, export_formats=['csv', 'jsonl'])
+
+        streaming = AnalysisPipeline(rag_engine=make_rag(), output_dir=str(tmp_path / "stream"))
+        streamed = streaming.analyze_requirements(
+            requirements, export_formats=['csv', 'jsonl', 'markdown'], stream=True
+        )
+
+        assert streamed.analysis_results == []
+        assert streamed.get_summary() == report.get_summary()
+        assert streamed.get_summary()['total_requirements'] == 39
+
+        memory_rows = (tmp_path / "memory" / "analysis_analysis.jsonl").read_text(encoding="utf-8")
+        stream_rows = (tmp_path / "stream" / "analysis_analysis.jsonl").read_text(encoding="utf-8")
+        assert stream_rows == memory_rows
+
+        with open(tmp_path / "stream" / "analysis_analysis.csv", encoding="utf-8") as f:
+            ids = [row['id'] for row in csv.DictReader(f)]
+        assert 'REQ-005' not in ids and len(ids) == 39
+
+        summary = json.loads((tmp_path / "stream" / "analysis_summary.json").read_text(encoding="utf-8"))
+        assert summary['summary'] == report.get_summary()
+        assert not (tmp_path / "stream" / "analysis_report.md").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
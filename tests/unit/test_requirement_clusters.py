@@ -0,0 +1,173 @@
+"""
+Unit Tests for Requirement Clustering
+
+Tests cluster_vectors, number_signature and the clustering pre-pass of
+AnalysisPipeline (RAG engine double, real QueryProcessor).
+"""
+
+import pytest
+from pathlib import Path
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.pipeline import AnalysisPipeline
+from agents.technical_analyst.requirement_clusters import cluster_vectors, number_signature
+
+
+DESCRIPTIONS = [
+    'Câmeras IP com resolução mínima de 4MP e IR de 30 metros',
+    'Gravador de vídeo em rede NVR com 16 canais',
+    'Switch gerenciável PoE com 24 portas gigabit',
+    'Licenças de software de monitoramento por câmera',
+]
+
+
+@pytest.fixture
+def requirements():
+    """Per-lot copies of four specifications"""
+    return [
+        {'id': f'L{lot}-{i}', 'descricao': desc, 'tipo': 'Técnico', 'categoria': 'Hardware'}
+        for lot in range(1, 6)
+        for i, desc in enumerate(DESCRIPTIONS)
+    ]
+
+
+class TestClusterVectors:
+    """Test suite for cluster_vectors"""
+
+    def test_greedy_clusters(self):
+        """Test that near vectors share the first representative"""
+        vectors = np.array([[1, 0], [0, 1], [0.99, 0.05], [0.05, 0.99], [0.7, 0.7]])
+        labels = cluster_vectors(vectors, threshold=0.95)
+        assert labels.tolist() == [0, 1, 0, 1, 4]
+
+    def test_groups_never_merge(self):
+        """Test that items of different groups stay apart"""
+        vectors = np.ones((4, 3))
+        labels = cluster_vectors(vectors, threshold=0.9, groups=['4', '8', '4', '8'])
+        assert labels.tolist() == [0, 1, 0, 1]
+
+    def test_block_size_independent(self):
+        """Test that representatives precede members across blocks"""
+        rng = np.random.default_rng(0)
+        centers = rng.standard_normal((10, 32))
+        vectors = centers[rng.integers(0, 10, 200)] + 0.05 * rng.standard_normal((200, 32))
+
+        labels = cluster_vectors(vectors, threshold=0.95, block_size=7)
+
+        assert (labels <= np.arange(200)).all()
+        assert (labels[labels] == labels).all()
+        assert len(set(labels.tolist())) == 10
+        assert labels.tolist() == cluster_vectors(vectors, threshold=0.95).tolist()
+
+    def test_number_signature(self):
+        """Test that number formats are folded before comparing numbers"""
+        assert number_signature("Armazenamento de 1.000 GB por 30 dias") == "1000|30"
+        assert number_signature("armazenamento de 1000gb por 30 dias") == "1000|30"
+        assert number_signature("Câmeras 4MP") != number_signature("Câmeras 8MP")
+        assert number_signature("Potência de 10.000,50 W") == "10000.50"
+        assert number_signature("Potência de 10.000,50 W") != number_signature("Potência de 10,50 W")
+
+    @pytest.mark.parametrize("first,second", [
+        ("Temperatura de operação -10°C a 50°C", "Temperatura de operação 10°C a 50°C"),
+        ("Firmware 2.0.1", "Firmware 2.1"),
+        ("Resolução >= 4 MP", "Resolução <= 4 MP"),
+        ("Latência < 50 ms", "Latência > 50 ms"),
+    ])
+    def test_number_signature_keeps_signs_operators_and_dotted_numbers(self, first, second):
+        """Test that signs, comparison operators and dotted number parts are kept"""
+        assert number_signature(first) != number_signature(second)
+
+    def test_number_signature_folds_signs_and_operators(self):
+        """Test that Unicode minus and ASCII operators match their usual forms"""
+        assert number_signature("Temperatura de \u221210 °C a 50 °C") == "-10|50"
+        assert number_signature("Resolução >= 4 MP") == number_signature("Resolução ≥4MP") == "≥4"
+        assert number_signature("Wi-Fi PoE-4, alcance de 20-30 m") == "4|20|30"
+
+
+class TestPipelineClustering:
+    """Test the clustering pre-pass of AnalysisPipeline"""
+
+    def test_representatives_only(self, tmp_path, requirements, make_rag):
+        """Test that retrieval runs once per cluster and results fan out in order"""
+        plain = AnalysisPipeline(rag_engine=make_rag(), output_dir=str(tmp_path / "plain"))
+        expected = plain.analyze_requirements(requirements, export_formats=['json'])
+
+        rag = make_rag()
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path / "clustered"),
+                                    cluster_threshold=0.95)
+        report = pipeline.analyze_requirements(requirements, export_formats=['json'])
+
+        assert len(rag.queries) == len(DESCRIPTIONS)
+        assert rag.embedded == len(requirements)
+        assert report.get_summary() == expected.get_summary()
+
+        clustered = [a.to_dict() for a in report.analysis_results]
+        for analysis in clustered:
+            analysis['metadata'] = {k: v for k, v in analysis['metadata'].items()
+                                    if k != 'cluster_representative'}
+        assert clustered == [a.to_dict() for a in expected.analysis_results]
+
+        clustering = report.pipeline_stats['clustering']
+        assert clustering['representatives'] == len(DESCRIPTIONS)
+        assert clustering['clusters']['L1-0'] == ['L2-0', 'L3-0', 'L4-0', 'L5-0']
+        assert report.analysis_results[4].metadata['cluster_representative'] == 'L1-0'
+
+    def test_different_numbers_not_merged(self, tmp_path, make_rag):
+        """Test that requirements differing only in a number are analyzed separately"""
+        requirements = [
+            {'id': 'REQ-1', 'descricao': 'Câmeras IP com resolução mínima de 4MP'},
+            {'id': 'REQ-2', 'descricao': 'Câmeras IP com resolução mínima de 8MP'},
+            {'id': 'REQ-3', 'descricao': 'Câmeras IP com resolução mínima de 4 MP'},
+        ]
+
+        rag = make_rag()
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path), cluster_threshold=0.5)
+        pipeline.analyze_requirements(requirements, export_formats=['json'])
+
+        assert len(rag.queries) == 2
+        assert pipeline.stats['clustering']['clusters'] == {'REQ-1': ['REQ-3']}
+
+    def test_different_signs_not_merged(self, tmp_path, make_rag):
+        """Test that requirements differing only in a sign are analyzed separately"""
+        requirements = [
+            {'id': 'REQ-1', 'descricao': 'Temperatura de operação de -10°C a 50°C'},
+            {'id': 'REQ-2', 'descricao': 'Temperatura de operação de 10°C a 50°C'},
+        ]
+
+        rag = make_rag()
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path), cluster_threshold=0.5)
+        pipeline.analyze_requirements(requirements, export_formats=['json'])
+
+        assert len(rag.queries) == 2
+        assert pipeline.stats['clustering']['clusters'] == {}
+
+    def test_resume_from_journal(self, tmp_path, requirements, make_rag):
+        """Test that a resumed clustered run restores every analysis from the journal"""
+        first = AnalysisPipeline(rag_engine=make_rag(), output_dir=str(tmp_path), cluster_threshold=0.95)
+        expected = first.analyze_requirements(requirements, export_formats=['json'])
+
+        rag = make_rag()
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path), cluster_threshold=0.95)
+        report = pipeline.analyze_requirements(requirements, export_formats=['json'], resume=True)
+
+        assert rag.queries == []
+        assert len(report.analysis_results) == len(requirements)
+        assert report.get_summary() == expected.get_summary()
+        assert [a.requirement_id for a in report.analysis_results] == [r['id'] for r in requirements]
+
+    def test_disabled_by_default(self, tmp_path, requirements, make_rag):
+        """Test that clustering is off unless a threshold is set"""
+        rag = make_rag()
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path))
+        pipeline.analyze_requirements(requirements, export_formats=['json'])
+
+        assert rag.embedded == 0
+        assert 'clustering' not in pipeline.stats
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,173 @@
+"""
+Unit Tests for Search Daemon
+
+Tests MicroBatcher coalescing and the SearchDaemon/SearchClient round trip
+over localhost HTTP (RAG engine double).
+"""
+
+import pytest
+import functools
+import socket
+import threading
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst.search_daemon import (
+    MicroBatcher,
+    SearchClient,
+    SearchDaemon,
+    daemon_address
+)
+
+
+@pytest.fixture
+def make_rag(make_rag):
+    """FakeRAG doubles returning exactly top_k results, failing on 'boom'"""
+    return functools.partial(make_rag, min_results=None, fail_on="boom")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def daemon(make_rag):
+    """Daemon on a free port with a wide batching window"""
+    daemon = SearchDaemon(make_rag(), port=0, max_wait_ms=100, max_batch=64)
+    daemon.start()
+    yield daemon
+    daemon.shutdown()
+
+
+def concurrent(n, fn):
+    """Run fn(i) from n threads released together"""
+    barrier = threading.Barrier(n)
+    results = [None] * n
+
+    def worker(i):
+        barrier.wait()
+        results[i] = fn(i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestMicroBatcher:
+    """Test request coalescing"""
+
+    def test_concurrent_requests_coalesced(self, make_rag):
+        """Test that concurrent searches share batches and get their own results"""
+        rag = make_rag()
+        batcher = MicroBatcher(rag, max_wait_ms=100, max_batch=64)
+        batcher.start()
+        try:
+            results = concurrent(16, lambda i: batcher.search(f"requisito {i}", top_k=3))
+        finally:
+            batcher.stop()
+
+        assert len(rag.batches) < 16
+        assert sum(len(queries) for queries, _, _ in rag.batches) == 16
+        for i, result in enumerate(results):
+            assert len(result) == 3
+            assert result[0]['text'] == f"requisito {i} #0"
+        assert batcher.get_stats()['requests'] == 16
+
+    def test_groups_by_parameters(self, make_rag):
+        """Test that one window issues one call per (top_k, threshold)"""
+        rag = make_rag()
+        batcher = MicroBatcher(rag, max_wait_ms=10_000, max_batch=4)
+        futures = [batcher.submit(f"q{i}", top_k=1 + i % 2) for i in range(4)]
+        batcher.start()
+        try:
+            results = [future.result(timeout=5) for future in futures]
+        finally:
+            batcher.stop()
+
+        assert sorted((queries, top_k) for queries, top_k, _ in rag.batches) == \
+            [(['q0', 'q2'], 1), (['q1', 'q3'], 2)]
+        assert [len(result) for result in results] == [1, 2, 1, 2]
+
+    def test_reload_checked_before_each_batch(self, make_rag):
+        """Test that every batch first lets the engine pick up a new index"""
+        rag = make_rag()
+        checks = []
+
+        def reload_if_changed():
+            checks.append(len(rag.batches))
+            if len(checks) == 2:
+                raise OSError("store.json unreadable")
+            return False
+
+        rag.reload_if_changed = reload_if_changed
+        batcher = MicroBatcher(rag, max_wait_ms=0)
+        batcher.start()
+        try:
+            results = [batcher.search(f"q{i}", top_k=1) for i in range(3)]
+        finally:
+            batcher.stop()
+
+        # A failed reload check keeps serving the loaded index
+        assert checks == [0, 1, 2]
+        assert [result[0]['text'] for result in results] == ["q0 #0", "q1 #0", "q2 #0"]
+
+    def test_empty_query_rejected_alone(self, make_rag):
+        """Test that an empty query fails at submit time"""
+        batcher = MicroBatcher(make_rag())
+        with pytest.raises(ValueError):
+            batcher.submit("   ")
+
+
+class TestSearchDaemon:
+    """Test the HTTP daemon and its client"""
+
+    def test_client_round_trip(self, daemon):
+        """Test that concurrent clients get their results through shared batches"""
+        client = SearchClient(daemon.url)
+        assert client.is_available()
+        assert client.health()['index_version'] == "fake-index"
+
+        results = concurrent(8, lambda i: client.search(f"câmera {i}", top_k=2, similarity_threshold=0.7))
+
+        assert [result[1]['text'] for result in results] == [f"câmera {i} #1" for i in range(8)]
+        assert len(daemon.rag.batches) < 8
+        assert all(threshold == 0.7 for _, _, threshold in daemon.rag.batches)
+
+    def test_search_batch(self, daemon):
+        """Test that a multi-query request keeps input order"""
+        results = SearchClient(daemon.url).search_batch(["a", "b", "c"], top_k=1)
+        assert [result[0]['text'] for result in results] == ["a #0", "b #0", "c #0"]
+
+    def test_errors(self, daemon):
+        """Test that bad requests and engine failures surface as exceptions"""
+        client = SearchClient(daemon.url)
+        with pytest.raises(ValueError):
+            client.search("")
+        with pytest.raises(RuntimeError, match="index unavailable"):
+            client.search("boom")
+
+        # The daemon keeps serving after a failed batch
+        assert client.search("ok", top_k=1)[0]['text'] == "ok #0"
+
+    def test_daemon_not_running(self):
+        """Test that the client reports an unreachable daemon"""
+        client = SearchClient(f"http://127.0.0.1:{free_port()}")
+        assert not client.is_available()
+        with pytest.raises(ConnectionError):
+            client.search("câmeras")
+
+    def test_daemon_address(self):
+        """Test URL parsing of the listen address"""
+        assert daemon_address("http://127.0.0.1:9000") == ("127.0.0.1", 9000)
+        assert daemon_address("localhost:8123") == ("localhost", 8123)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
@@ -101,6 +101,39 @@ class TestFAISSVectorStore:
         # First result should have highest score (query matches first doc)
         assert results[0]['score'] >= results[1]['score']
 
+    def test_search_batch(self, vector_store, mock_texts, mock_embeddings, mock_metadata):
+        """Test that one matrix search returns the same results as per-query searches"""
+        vector_store.add_documents(mock_texts, mock_embeddings, mock_metadata)
+
+        batch_results = vector_store.search_batch(mock_embeddings[:4], top_k=3)
+
+        assert len(batch_results) == 4
+        for query_vector, results in zip(mock_embeddings[:4], batch_results):
+            single = vector_store.search(query_vector, top_k=3)
+            assert [r['text'] for r in results] == [r['text'] for r in single]
+            assert [r['score'] for r in results] == pytest.approx([r['score'] for r in single])
+
+    def test_array_and_list_inputs_match(self, vector_store, mock_texts, mock_embeddings,
+                                         mock_metadata, temp_dir):
+        """Test that float32 arrays are used as-is and lists still work at the edge"""
+        original = mock_embeddings.copy()
+        vector_store.add_documents(mock_texts, mock_embeddings, mock_metadata)
+
+        # The caller's array is not normalized in place
+        np.testing.assert_array_equal(mock_embeddings, original)
+
+        list_store = FAISSVectorStore(index_path=str(Path(temp_dir) / "lists"), dimension=384)
+        list_store.add_documents(mock_texts, mock_embeddings.tolist(), mock_metadata)
+
+        from_array = vector_store.search(mock_embeddings[3], top_k=3)
+        from_list = list_store.search(mock_embeddings[3].tolist(), top_k=3)
+        assert [r['id'] for r in from_array] == [r['id'] for r in from_list]
+
+    def test_search_batch_empty_index(self, vector_store, mock_embeddings):
+        """Test batch search on empty index returns one empty list per query"""
+        assert vector_store.search_batch(mock_embeddings[:2], top_k=3) == [[], []]
+        assert vector_store.search_batch([], top_k=3) == []
+
     def test_search_with_threshold(self, vector_store, mock_texts, mock_embeddings, mock_metadata):
         """Test search with similarity threshold"""
         vector_store.add_documents(mock_texts, mock_embeddings, mock_metadata)
@@ -141,6 +174,43 @@ class TestFAISSVectorStore:
         results = new_store.search(query_vector, top_k=3)
         assert len(results) == 3
 
+    def test_save_writes_columnar_generation(self, vector_store, mock_texts, mock_embeddings,
+                                             mock_metadata, temp_dir):
+        """Test that save() writes a new generation and drops the previous one"""
+        vector_store.add_documents(mock_texts, mock_embeddings, mock_metadata)
+        vector_store.save()
+        vector_store.add_documents(["extra"], mock_embeddings[:1], [{"filename": "extra.md"}])
+        vector_store.save()
+
+        files = sorted(p.name for p in Path(temp_dir).iterdir())
+        assert files == ["chunks-2", "index-2.faiss", "store.json"]
+
+        reloaded = FAISSVectorStore(index_path=temp_dir, dimension=384)
+        assert reloaded.get_stats()['total_documents'] == 11
+        assert reloaded.texts[10] == "extra"
+        assert reloaded.metadatas[0] == mock_metadata[0]
+
+    def test_load_legacy_pickle(self, mock_texts, mock_embeddings, mock_metadata, temp_dir):
+        """Test that a legacy index.faiss + metadata.pkl is loaded and converted on save"""
+        import faiss
+        import pickle
+
+        index = faiss.IndexFlatL2(384)
+        vectors = mock_embeddings.copy()
+        faiss.normalize_L2(vectors)
+        index.add(vectors)
+        faiss.write_index(index, str(Path(temp_dir) / "index.faiss"))
+        with open(Path(temp_dir) / "metadata.pkl", "wb") as f:
+            pickle.dump({"texts": mock_texts, "metadatas": mock_metadata, "dimension": 384}, f)
+
+        store = FAISSVectorStore(index_path=temp_dir, dimension=384)
+        assert store.get_stats()['total_documents'] == 10
+        assert store.search(mock_embeddings[2], top_k=1)[0]['text'] == mock_texts[2]
+
+        store.save()
+        assert not (Path(temp_dir) / "metadata.pkl").exists()
+        assert FAISSVectorStore(index_path=temp_dir, dimension=384).texts[2] == mock_texts[2]
+
     def test_get_stats(self, vector_store, mock_texts, mock_embeddings, mock_metadata):
         """Test getting statistics"""
         vector_store.add_documents(mock_texts, mock_embeddings, mock_metadata)
@@ -210,6 +280,290 @@ class TestFAISSVectorStore:
         assert results[0]['score'] > 0.99
 
 
+class TestFAISSIndexTypes:
+    """Test suite for approximate index types (IVF / HNSW)"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for test files"""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def embeddings(self):
+        """Generate mock embeddings (random vectors)"""
+        np.random.seed(7)
+        return np.random.rand(200, 64).astype('float32')
+
+    @pytest.fixture
+    def texts(self):
+        """Generate mock text documents"""
+        return [f"Documento {i}" for i in range(200)]
+
+    def test_invalid_index_type(self, temp_dir):
+        """Test that unknown index types are rejected"""
+        with pytest.raises(ValueError, match="Unknown index type"):
+            FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="pq")
+
+    def test_ivf_trains_on_first_batch(self, temp_dir, texts, embeddings):
+        """Test that IVF index is trained on the first batch and finds exact matches"""
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="ivf", nlist=8, nprobe=8)
+        assert not store.index.is_trained
+
+        store.add_documents(texts, embeddings)
+
+        assert store.index.is_trained
+        assert store.get_stats()['total_documents'] == 200
+        assert store.get_stats()['index_type'] == "ivf"
+
+        results = store.search(embeddings[42], top_k=3)
+        assert results[0]['text'] == "Documento 42"
+        assert results[0]['score'] > 0.99
+
+    def test_ivf_small_first_batch_reduces_nlist(self, temp_dir, texts, embeddings):
+        """Test that nlist is reduced when the first batch is smaller than nlist"""
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="ivf", nlist=100)
+
+        store.add_documents(texts[:10], embeddings[:10])
+
+        assert store.index.nlist == 10
+        assert store.get_stats()['total_documents'] == 10
+
+    def test_hnsw_search(self, temp_dir, texts, embeddings):
+        """Test HNSW index search"""
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="hnsw", hnsw_m=16)
+        store.add_documents(texts, embeddings)
+
+        results = store.search(embeddings[17], top_k=5)
+
+        assert len(results) == 5
+        assert results[0]['text'] == "Documento 17"
+
+    def test_set_search_params(self, temp_dir, texts, embeddings):
+        """Test runtime nprobe / efSearch knobs"""
+        ivf = FAISSVectorStore(index_path=temp_dir + "/ivf", dimension=64, index_type="ivf", nlist=8)
+        ivf.add_documents(texts, embeddings)
+        ivf.set_search_params(nprobe=4)
+        assert ivf.index.nprobe == 4
+        assert ivf.get_stats()['nprobe'] == 4
+
+        hnsw = FAISSVectorStore(index_path=temp_dir + "/hnsw", dimension=64, index_type="hnsw")
+        hnsw.set_search_params(ef_search=128)
+        assert hnsw.index.hnsw.efSearch == 128
+
+    def test_save_and_load_keeps_index_type(self, temp_dir, texts, embeddings):
+        """Test that the persisted index type wins on load"""
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="hnsw")
+        store.add_documents(texts, embeddings)
+        store.save()
+
+        reloaded = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="flat", ef_search=100)
+
+        assert reloaded.index_type == "hnsw"
+        assert reloaded.index.hnsw.efSearch == 100
+        assert reloaded.search(embeddings[3], top_k=1)[0]['text'] == "Documento 3"
+
+    def test_fingerprint_identifies_content_lineage(self, temp_dir, texts, embeddings):
+        """Test that reloads agree on the fingerprint and a rebuild from scratch changes it"""
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        store.add_documents(texts, embeddings)
+        store.save()
+        reloaded = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        assert reloaded.fingerprint() == store.fingerprint()
+
+        shutil.rmtree(temp_dir)
+        rebuilt = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        rebuilt.add_documents(texts[:2], embeddings[:2])
+        rebuilt.save()
+        assert rebuilt.fingerprint() != store.fingerprint()
+
+        reloaded.delete_all()
+        reloaded.add_documents(texts, embeddings)
+        reloaded.save()
+        assert reloaded.fingerprint() != store.fingerprint()
+
+    def test_changed_on_disk(self, temp_dir, texts, embeddings):
+        """Test that a reader notices a generation saved by another writer"""
+        writer = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        writer.add_documents(texts[:2], embeddings[:2])
+        writer.save()
+        reader = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        assert not reader.changed_on_disk()
+
+        writer.add_documents(texts[2:], embeddings[2:])
+        writer.save()
+        assert reader.changed_on_disk()
+        assert not writer.changed_on_disk()
+
+        reader.load()
+        assert not reader.changed_on_disk()
+        assert reader.get_stats()['total_documents'] == len(texts)
+
+    def test_save_fsyncs_generation_before_swap(self, temp_dir, texts, embeddings, monkeypatch):
+        """Test that every generation file is fsynced before store.json is replaced"""
+        from agents.technical_analyst import chunk_store, vector_store
+
+        events = []
+        real_fsync, real_replace = chunk_store.fsync_path, vector_store.os.replace
+
+        def fsync_path(path):
+            events.append(("fsync", Path(path).name))
+            real_fsync(path)
+
+        def replace(src, dst):
+            events.append(("replace", Path(dst).name))
+            real_replace(src, dst)
+
+        monkeypatch.setattr(chunk_store, "fsync_path", fsync_path)
+        monkeypatch.setattr(vector_store, "fsync_path", fsync_path)
+        monkeypatch.setattr(vector_store.os, "replace", replace)
+
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        store.add_documents(texts, embeddings)
+        store.save()
+
+        swap = events.index(("replace", "store.json"))
+        synced = {name for kind, name in events[:swap] if kind == "fsync"}
+        generation_files = {path.name for path in (Path(temp_dir) / "chunks-1").iterdir()}
+        assert generation_files | {"index-1.faiss", "chunks-1", Path(temp_dir).name} <= synced
+        assert ("fsync", Path(temp_dir).name) in events[swap:]
+
+    def test_delete_all_switches_to_configured_type(self, temp_dir, texts, embeddings):
+        """Test that clearing and re-adding rebuilds the index with the configured type"""
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="hnsw")
+        store.add_documents(texts, embeddings)
+        store.save()
+
+        reloaded = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="flat")
+        reloaded.delete_all()
+        reloaded.add_documents(texts, embeddings)
+        reloaded.save()
+
+        rebuilt = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type="flat")
+        assert rebuilt.index_type == "flat"
+        assert rebuilt.get_stats()['total_documents'] == len(texts)
+
+
+class TestFAISSUpsertAndDelete:
+    """Test suite for stable chunk IDs, upsert, delete and compaction"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary directory for test files"""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def embeddings(self):
+        """Generate mock embeddings (random vectors)"""
+        np.random.seed(11)
+        return np.random.rand(40, 64).astype('float32')
+
+    @pytest.fixture
+    def documents(self):
+        """Two sources with 20 chunks each"""
+        texts = [f"Documento {i}" for i in range(40)]
+        metadatas = [
+            {"source_path": f"kb/doc_{i // 20}.md", "chunk_index": i % 20}
+            for i in range(40)
+        ]
+        return texts, metadatas
+
+    @pytest.mark.parametrize("index_type", ["flat", "ivf", "hnsw"])
+    def test_upsert_replaces_existing_chunks(self, temp_dir, embeddings, documents, index_type):
+        """Test that re-upserting a source replaces its chunks instead of duplicating them"""
+        texts, metadatas = documents
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type=index_type, nlist=4)
+
+        counts = store.upsert_documents(texts, embeddings, metadatas)
+        assert counts == {"inserted": 40, "updated": 0}
+
+        # New version of chunk 5 of doc_0, with a different vector
+        counts = store.upsert_documents(["Documento 5 v2"], [embeddings[30]], [metadatas[5]])
+        assert counts == {"inserted": 0, "updated": 1}
+
+        stats = store.get_stats()
+        assert stats['total_documents'] == 40
+        assert stats['deleted_documents'] == 1
+
+        texts_found = [r['text'] for r in store.search(embeddings[5], top_k=40)]
+        assert "Documento 5" not in texts_found
+        assert "Documento 5 v2" in texts_found
+
+    def test_search_returns_stable_ids(self, temp_dir, embeddings, documents):
+        """Test that search results carry the chunk ID derived from source_path + chunk_index"""
+        from agents.technical_analyst.chunk_store import make_chunk_id
+
+        texts, metadatas = documents
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        store.add_documents(texts, embeddings, metadatas)
+
+        result = store.search(embeddings[7], top_k=1)[0]
+        assert result['id'] == make_chunk_id(texts[7], metadatas[7])
+
+    def test_delete_by_source(self, temp_dir, embeddings, documents):
+        """Test deleting every chunk of one source"""
+        texts, metadatas = documents
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        store.add_documents(texts, embeddings, metadatas)
+
+        assert store.delete_by_source("kb/doc_0.md") == 20
+        assert store.delete_by_source("kb/doc_0.md") == 0
+
+        results = store.search(embeddings[3], top_k=5)
+        assert len(results) == 5
+        assert all(r['metadata']['source_path'] == "kb/doc_1.md" for r in results)
+
+    def test_delete_persists_until_compaction(self, temp_dir, embeddings, documents):
+        """Test that tombstones survive save/load below the compaction threshold"""
+        texts, metadatas = documents
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, compact_threshold=0.5)
+        store.add_documents(texts, embeddings, metadatas)
+        store.delete_by_source("kb/doc_1.md")
+        store.save()
+
+        reloaded = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        stats = reloaded.get_stats()
+        assert stats['total_documents'] == 20
+        assert stats['deleted_documents'] == 20
+        assert stats['index_size'] == 40
+
+    @pytest.mark.parametrize("index_type", ["flat", "ivf", "hnsw"])
+    def test_compact(self, temp_dir, embeddings, documents, index_type):
+        """Test that compaction drops deleted vectors without re-embedding"""
+        texts, metadatas = documents
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, index_type=index_type, nlist=4)
+        store.add_documents(texts, embeddings, metadatas)
+        store.save()
+
+        store.delete_by_source("kb/doc_0.md")
+        store.compact()
+
+        stats = store.get_stats()
+        assert stats['total_documents'] == 20
+        assert stats['deleted_documents'] == 0
+        assert stats['index_size'] == 20
+
+        reloaded = FAISSVectorStore(index_path=temp_dir, dimension=64)
+        assert reloaded.get_stats()['index_size'] == 20
+        result = reloaded.search(embeddings[25], top_k=1)[0]
+        assert result['text'] == "Documento 25"
+        assert result['score'] > 0.99
+
+    def test_save_compacts_above_threshold(self, temp_dir, embeddings, documents):
+        """Test that save() compacts automatically once enough chunks are deleted"""
+        texts, metadatas = documents
+        store = FAISSVectorStore(index_path=temp_dir, dimension=64, compact_threshold=0.2)
+        store.add_documents(texts, embeddings, metadatas)
+        store.delete_by_source("kb/doc_0.md")
+        store.save()
+
+        assert store.get_stats()['index_size'] == 20
+        assert store.get_stats()['deleted_documents'] == 0
+
+
 class TestVectorStoreInterface:
     """Test that FAISS implements the interface correctly"""
 
@@ -222,6 +576,7 @@ class TestVectorStoreInterface:
         required_methods = [
             'add_documents',
             'search',
+            'search_batch',
             'save',
             'load',
             'get_stats',
@@ -0,0 +1,229 @@
+"""
+Unit Tests for Verdict Cache
+
+Tests requirement text normalization, VerdictCache persistence, TTL and
+invalidation, and its use by QueryProcessor and AnalysisPipeline.
+"""
+
+import pytest
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.technical_analyst import verdict_cache as verdict_cache_module
+from agents.technical_analyst.pipeline import AnalysisPipeline
+from agents.technical_analyst.query_processor import QueryProcessor
+from agents.technical_analyst.verdict_cache import VerdictCache, normalize_text
+
+
+@pytest.fixture
+def make_rag(make_rag):
+    """FakeRAG doubles answering alike for queries that normalize alike"""
+    return functools.partial(make_rag, normalize=True)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = VerdictCache(tmp_path / "verdicts.sqlite", ttl_days=30)
+    yield cache
+    cache.close()
+
+
+def requirement(req_id, descricao):
+    return {'id': req_id, 'descricao': descricao, 'tipo': 'Técnico', 'categoria': 'Hardware'}
+
+
+class TestNormalizeText:
+    """Test suite for normalize_text"""
+
+    @pytest.mark.parametrize("a, b", [
+        ("Câmeras IP, resolução mínima de 4 MP.", "CAMERAS  ip resolucao minima de 4MP"),
+        ("Armazenamento de 1.000 GB", "armazenamento de 1000gb"),
+        ("Taxa de 2,5 Mbps a 30,0 fps", "taxa de 2.5 mbps a 30 fps"),
+        ("Potência de 10.000,50 W", "potencia de 10000,50w"),
+        ("Valor de 1.000.000,00 reais", "valor de 1000000 reais"),
+        ("Temperatura de −10 °C", "temperatura de -10°C"),
+        ("Resolução >= 4 MP", "Resolução ≥4MP"),
+    ])
+    def test_equivalent_wording(self, a, b):
+        """Test that trivial wording differences normalize to the same text"""
+        assert normalize_text(a) == normalize_text(b)
+
+    @pytest.mark.parametrize("a, b", [
+        ("Câmeras IP 4MP", "Câmeras IP 8MP"),
+        ("Armazenamento de 1.000 GB", "Armazenamento de 1 GB"),
+        ("Taxa de 2,5 Mbps", "Taxa de 25 Mbps"),
+        ("Potência de 10.000,50 W", "Potência de 10,50 W"),
+        ("Carga de 1.234,5 kg", "Carga de 1.234 kg"),
+        ("Firmware 2.0.1", "Firmware 2.1"),
+        ("IP 192.168.0.1", "IP 192.168.1"),
+        ("Temperatura de operação -10°C a 50°C", "Temperatura de operação 10°C a 50°C"),
+        ("Resolução ≥ 4MP", "Resolução ≤ 4MP"),
+        ("Latência < 50 ms", "Latência > 50 ms"),
+    ])
+    def test_different_requirements(self, a, b):
+        """Test that different values stay different"""
+        assert normalize_text(a) != normalize_text(b)
+
+    def test_mixed_brazilian_numbers(self):
+        """Test that thousands groups are folded before a decimal comma"""
+        assert normalize_text("1.234,5") == "1234.5"
+        assert normalize_text("Potência de 10.000,50 W") == "potencia de 10000.50w"
+
+
+class TestVerdictCache:
+    """Test suite for VerdictCache"""
+
+    @pytest.fixture
+    def analysis(self, make_rag):
+        return QueryProcessor(make_rag()).analyze_requirement(requirement('REQ-001', 'Câmeras IP 4MP'))
+
+    def test_persists_across_instances(self, tmp_path, analysis):
+        """Test that entries survive reopening the database"""
+        path = tmp_path / "verdicts.sqlite"
+        key = VerdictCache.make_key("Câmeras IP 4MP", "idx-1", {'top_k': 5})
+
+        first = VerdictCache(path)
+        first.put(key, "Câmeras IP 4MP", "idx-1", analysis)
+        first.close()
+
+        second = VerdictCache(path)
+        assert second.get(key).to_dict() == analysis.to_dict()
+        assert second.get_stats()['hit_rate'] == 1.0
+        second.close()
+
+    def test_key_covers_settings_and_version(self):
+        """Test that thresholds and KB version are part of the key"""
+        key = VerdictCache.make_key("Câmeras IP 4MP", "idx-1", {'top_k': 5})
+        assert key == VerdictCache.make_key("câmeras ip 4 MP", "idx-1", {'top_k': 5})
+        assert key != VerdictCache.make_key("Câmeras IP 4MP", "idx-2", {'top_k': 5})
+        assert key != VerdictCache.make_key("Câmeras IP 4MP", "idx-1", {'top_k': 10})
+
+    @pytest.mark.parametrize("a, b", [
+        ("Firmware 2.0.1", "Firmware 2.1"),
+        ("Temperatura de operação -10°C a 50°C", "Temperatura de operação 10°C a 50°C"),
+        ("Resolução ≥ 4MP", "Resolução ≤ 4MP"),
+    ])
+    def test_key_keeps_versions_signs_and_operators(self, a, b):
+        """Test that requirements differing in a version, sign or operator never share a verdict"""
+        assert VerdictCache.make_key(a, "idx-1", {'top_k': 5}) != VerdictCache.make_key(b, "idx-1", {'top_k': 5})
+
+    def test_ttl(self, cache, analysis, monkeypatch):
+        """Test that entries older than the TTL are misses and purged"""
+        cache.put("a", "Câmeras IP 4MP", "idx-1", analysis)
+        cache.put("b", "Armazenamento 30 dias", "idx-1", analysis)
+
+        now = verdict_cache_module.time.time()
+        monkeypatch.setattr(verdict_cache_module.time, "time", lambda: now + 31 * 86400)
+
+        assert cache.get("a") is None
+        assert cache.expired == 1
+        assert cache.purge_expired() == 1
+        assert len(cache) == 0
+
+    def test_invalidate(self, cache, analysis):
+        """Test invalidation by requirement text and KB version"""
+        cache.put("a", "Câmeras IP 4MP categoria: Hardware", "idx-1", analysis)
+        cache.put("b", "Câmeras IP 4MPX categoria: Hardware", "idx-1", analysis)
+        cache.put("c", "Armazenamento 30 dias", "idx-2", analysis)
+
+        assert cache.invalidate(text="câmeras ip 4 mp") == 1
+        assert cache.get("b") is not None
+        assert cache.invalidate(kb_version="idx-2") == 1
+        assert cache.clear() == 1
+
+
+class TestQueryProcessorVerdictCache:
+    """Test QueryProcessor with a verdict cache"""
+
+    def test_reworded_requirement_hits(self, cache, make_rag):
+        """Test that a reworded requirement reuses retrieval and verdict"""
+        rag = make_rag()
+        processor = QueryProcessor(rag, verdict_cache=cache)
+
+        first = processor.analyze_requirement(requirement('REQ-001', 'Câmeras IP, resolução 4 MP'))
+        second = processor.analyze_requirement(requirement('LOTE2-07', 'câmeras ip resolução 4MP'))
+
+        assert len(rag.queries) == 1
+        assert second.requirement_id == 'LOTE2-07'
+        assert second.metadata['requirement']['id'] == 'LOTE2-07'
+        assert 'câmeras ip resolução 4MP' in second.reasoning
+        assert (second.conformity, second.confidence) == (first.conformity, first.confidence)
+        assert [e.to_dict() for e in second.evidence] == [e.to_dict() for e in first.evidence]
+
+    def test_batch_matches_uncached(self, cache, make_rag):
+        """Test that cached batch results equal an uncached run"""
+        requirements = [requirement(f'REQ-{i:03d}', f'Requisito {i % 7}') for i in range(30)]
+
+        expected = QueryProcessor(make_rag()).analyze_batch(requirements, show_progress=False)
+
+        rag = make_rag()
+        processor = QueryProcessor(rag, verdict_cache=cache)
+        processor.analyze_batch(requirements[:10], show_progress=False)
+        results = processor.analyze_batch(requirements, show_progress=False)
+
+        assert [a.to_dict() for a in results] == [a.to_dict() for a in expected]
+        assert len(rag.queries) == 10  # lookups precede the batch search
+        assert cache.hits == 30
+
+    def test_new_kb_version_misses(self, cache, make_rag):
+        """Test that a re-ingested knowledge base is analyzed again"""
+        req = requirement('REQ-001', 'Câmeras IP 4MP')
+        QueryProcessor(make_rag(), verdict_cache=cache).analyze_requirement(req)
+
+        rag = make_rag(version="idx-2")
+        QueryProcessor(rag, verdict_cache=cache).analyze_requirement(req)
+
+        assert len(rag.queries) == 1
+
+
+class TestPipelineVerdictCache:
+    """Test per-run verdict cache hit rates of AnalysisPipeline"""
+
+    def test_hit_rate_per_run(self, tmp_path, cache, make_rag):
+        """Test that a second edital with the same requirements is served from cache"""
+        edital_a = [requirement(f'A-{i}', f'Câmeras IP {i} MP') for i in range(10)]
+        edital_b = [requirement(f'B-{i}', f'câmeras ip {i}MP.') for i in range(5)] + \
+            [requirement('B-9', 'Switch PoE 24 portas')]
+
+        rag = make_rag()
+        pipeline = AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path), verdict_cache=cache)
+        pipeline.analyze_requirements(edital_a, export_formats=['json'], journal=False)
+        assert pipeline.stats['verdict_cache']['hit_rate'] == 0.0
+
+        report = pipeline.analyze_requirements(edital_b, export_formats=['json'], journal=False)
+        assert pipeline.stats['verdict_cache']['hits'] == 5
+        assert pipeline.stats['verdict_cache']['misses'] == 1
+        assert report.pipeline_stats['verdict_cache']['hit_rate'] == round(5 / 6, 4)
+        assert len(rag.queries) == 11
+
+    def test_hit_rate_of_concurrent_runs(self, tmp_path, cache, make_rag):
+        """Test that concurrent editais sharing a cache each count only their own lookups"""
+        editais = {
+            'a': [requirement(f'A-{i}', f'Câmeras IP {i} MP') for i in range(10)],
+            'b': [requirement(f'B-{i}', f'Switch PoE {i} portas') for i in range(5)],
+        }
+        rag = make_rag(latency=0.01)
+        pipelines = {
+            name: AnalysisPipeline(rag_engine=rag, output_dir=str(tmp_path / name),
+                                   verdict_cache=cache, show_progress=False)
+            for name in editais
+        }
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [
+                executor.submit(pipelines[name].analyze_requirements, reqs, export_formats=[], journal=False)
+                for name, reqs in editais.items()
+            ]:
+                future.result()
+
+        assert pipelines['a'].stats['verdict_cache']['misses'] == 10
+        assert pipelines['b'].stats['verdict_cache']['misses'] == 5
+        assert cache.misses == 15
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])